@@ -5,6 +5,11 @@ import argparse
 from egg_n_bacon_housing.config import settings
 from egg_n_bacon_housing.pipeline import STAGE_VARS, build_pipeline, run_pipeline
 from egg_n_bacon_housing.utils.logging_config import LEVEL_MAP, get_logger, setup_logging
+from egg_n_bacon_housing.utils.profiling import (
+    PROFILE_REPORT_FILENAME,
+    format_top_nodes,
+    load_profile,
+)
 
 
 def _log_results(logger, results: dict):
@@ -39,6 +44,20 @@ def main():
         default="INFO",
         help="Logging level",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Ingestion nodes to run concurrently (default: PIPELINE__INGEST_WORKERS)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=15,
+        type=int,
+        metavar="N",
+        help="Print the N slowest nodes (default 15) from this run's profile",
+    )
     parser.add_argument(
         "--visualize",
         action="store_true",
@@ -52,7 +71,7 @@ def main():
 
     logger.info(f"Stage: {args.stage} | Data: {settings.data_dir}")
 
-    dr = build_pipeline(settings)
+    dr = build_pipeline(settings, ingest_workers=args.workers, profile=bool(args.profile) or None)
 
     if args.visualize:
         logger.info(f"DAG nodes: {len(dr.list_available_variables())}")
@@ -71,6 +90,10 @@ def main():
     logger.info(f"Pipeline complete. Results: {list(results.keys())}")
     _log_results(logger, results)
 
+    if args.profile:
+        report = load_profile(settings.data_dir / PROFILE_REPORT_FILENAME)
+        logger.info(f"Slowest nodes:\n{format_top_nodes(report, args.profile)}")
+
 
 if __name__ == "__main__":
     main()
@@ -190,9 +190,46 @@ def collect_parquet_stats(pipeline_dir: Path) -> dict[str, dict]:
                 dataset_name = f"external__{pq_file.stem}"
                 _accumulate_parquet_stats(result, dataset_name, layer, pq_file, pq)
 
+        # Hive-partitioned datasets (e.g. gold/transactions_enriched/month=.../)
+        for dataset_dir in sorted(p for p in layer_path.iterdir() if p.is_dir()):
+            part_files = sorted(dataset_dir.glob("*=*/*.parquet"))
+            if part_files:
+                _accumulate_partitioned_stats(result, dataset_dir, layer, part_files, pq)
+
     return result
 
 
+def _accumulate_partitioned_stats(
+    result: dict,
+    dataset_dir: Path,
+    layer: str,
+    part_files: list[Path],
+    pq: Any,
+) -> None:
+    """Helper: summarise a partitioned dataset from its latest partition file.
+
+    Column stats and samples come from the last partition; row count and
+    size are totalled across all partitions.
+    """
+    dataset_name = dataset_dir.name
+    _accumulate_parquet_stats(result, dataset_name, layer, part_files[-1], pq)
+    entry = result[dataset_name]
+    entry["file"] = f"{dataset_name}/"
+    if entry["status"] != "available":
+        return
+    try:
+        entry["row_count"] = sum(pq.read_metadata(f).num_rows for f in part_files)
+        entry["file_size_bytes"] = sum(f.stat().st_size for f in part_files)
+        entry["partition_count"] = len({f.parent for f in part_files})
+    except Exception as exc:
+        result[dataset_name] = {
+            "layer": layer,
+            "file": entry["file"],
+            "status": "error",
+            "error": str(exc),
+        }
+
+
 def _accumulate_parquet_stats(
     result: dict,
     dataset_name: str,
@@ -0,0 +1,120 @@
+"""Benchmark serial vs concurrent data.gov.sg pagination.
+
+Fetches one dataset with ``fetch_datagovsg_dataset`` twice: walking the
+``_links.next`` pages serially, then with ``--workers`` concurrent page
+requests once the first page reports the total. By default the dataset is
+served by a local stand-in of ``datastore_search`` (``--rows`` records in
+pages of ``--page-size``, ``--latency`` seconds per response); with
+``--dataset ID`` it is fetched from data.gov.sg (no response cache).
+
+Both fetches must return the same frame; the script exits non-zero if they
+do not.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import pandas as pd  # noqa: E402
+
+from egg_n_bacon_housing.adapters import datagovsg  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dataset", help="data.gov.sg resource id (default: local stand-in)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent page requests")
+    parser.add_argument("--rows", type=int, default=2000, help="Stand-in dataset size")
+    parser.add_argument("--page-size", type=int, default=100, help="Records per page")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stand-in seconds per response")
+    return parser.parse_args()
+
+
+def serve_datastore(rows: int, latency: float) -> ThreadingHTTPServer:
+    """Local paginated ``datastore_search`` returning ``rows`` records."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            limit = int(query["limit"][0])
+            offset = int(query.get("offset", ["0"])[0])
+            time.sleep(latency)
+            end = min(offset + limit, rows)
+            result = {
+                "records": [{"_id": i, "value": f"row-{i}"} for i in range(offset, end)],
+                "total": rows,
+                "_links": {"next": f"{base_url}stub&limit={limit}&offset={offset + limit}"},
+            }
+            body = json.dumps({"result": result}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    host, port = server.server_address[:2]
+    base_url = f"http://{host}:{port}/api/action/datastore_search?resource_id="
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timed(label: str, fn) -> pd.DataFrame:
+    started = time.perf_counter()
+    result = fn()
+    print(f"{label:<28} {time.perf_counter() - started:>9.3f}s")
+    return result
+
+
+def main() -> int:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+
+    server = None
+    if args.dataset:
+        url = datagovsg.DATAGOVSG_BASE_URL + "?resource_id="
+        dataset_id = args.dataset
+    else:
+        server = serve_datastore(args.rows, args.latency)
+        host, port = server.server_address[:2]
+        url = f"http://{host}:{port}/api/action/datastore_search?resource_id="
+        dataset_id = f"stub&limit={args.page_size}"
+        print(f"stand-in: {args.rows:,} rows, {args.page_size} per page, {args.latency}s latency")
+
+    try:
+        serial = timed(
+            "serial",
+            lambda: datagovsg.fetch_datagovsg_dataset(url, dataset_id, use_cache=False),
+        )
+        concurrent = timed(
+            f"concurrent ({args.workers} workers)",
+            lambda: datagovsg.fetch_datagovsg_dataset(
+                url, dataset_id, use_cache=False, max_workers=args.workers
+            ),
+        )
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    agree = concurrent.equals(serial)
+    print(f"results agree: {agree} ({len(serial):,} rows)")
+    return 0 if agree else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
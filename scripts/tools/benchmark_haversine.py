@@ -0,0 +1,74 @@
+"""Benchmark the vectorized haversine kernel against the scalar one.
+
+Computes distances between ``--pairs`` random coordinate pairs over
+Singapore with ``haversine_many`` and times ``haversine_distance`` in a
+Python loop over the first ``--scalar-pairs`` of them, extrapolating the
+loop's time to all pairs.
+
+Both must agree on the shared pairs; the script exits non-zero if they do
+not.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from egg_n_bacon_housing.utils.geo import haversine_distance, haversine_many  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pairs", type=int, default=1_000_000, help="Coordinate pairs")
+    parser.add_argument(
+        "--scalar-pairs", type=int, default=20_000, help="Pairs timed with the scalar loop"
+    )
+    return parser.parse_args()
+
+
+def timed(label: str, fn):
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed:>9.3f}s")
+    return result, elapsed
+
+
+def main() -> int:
+    args = parse_args()
+    rng = np.random.default_rng(42)
+    lat1, lat2 = rng.uniform(1.2, 1.5, (2, args.pairs))
+    lon1, lon2 = rng.uniform(103.6, 104.0, (2, args.pairs))
+    n_scalar = min(args.scalar_pairs, args.pairs)
+    print(f"{args.pairs:,} pairs ({n_scalar:,} through the scalar loop)")
+
+    distances, vector_seconds = timed(
+        "haversine_many", lambda: haversine_many(lat1, lon1, lat2, lon2)
+    )
+    scalar, scalar_seconds = timed(
+        "haversine_distance loop",
+        lambda: [
+            haversine_distance(a, b, c, d)
+            for a, b, c, d in zip(
+                lat1[:n_scalar], lon1[:n_scalar], lat2[:n_scalar], lon2[:n_scalar], strict=True
+            )
+        ],
+    )
+    extrapolated = scalar_seconds * args.pairs / n_scalar
+    print(f"{'loop (extrapolated)':<28} {extrapolated:>9.3f}s")
+    print(f"speedup: {extrapolated / vector_seconds:.0f}x")
+
+    agree = bool(np.allclose(distances[:n_scalar], scalar, rtol=1e-12, atol=0))
+    print(f"results agree: {agree}")
+    return 0 if agree else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
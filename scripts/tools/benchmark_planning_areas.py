@@ -0,0 +1,156 @@
+"""Benchmark planning-area assignment for many points.
+
+Compares three ways of assigning random points inside the planning areas'
+bounding box to a planning area:
+
+- ``geopandas.sjoin`` of a points GeoDataFrame with the polygons (the old
+  batch path);
+- one vectorized ``STRtree.query(points, predicate="within")``
+  (``get_planning_areas_for_points``);
+- the rasterized lookup grid with exact fallback at polygon boundaries
+  (``get_planning_areas_for_points(..., grid_cell_m=...)``), timed with and
+  without its one-off build.
+
+All three must agree; the script exits non-zero if they do not. Without
+the OneMap planning-area GeoJSON, ``--synthetic N`` benchmarks N jagged
+Voronoi cells over Singapore instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import geopandas as gpd  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import shapely  # noqa: E402
+
+from egg_n_bacon_housing.utils import data_loader  # noqa: E402
+
+GEOJSON_NAME = "onemap_planning_area_polygon.geojson"
+SINGAPORE_BOUNDS = (103.6, 1.2, 104.05, 1.48)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--geojson-dir",
+        type=Path,
+        default=REPO_ROOT / "data" / "manual" / "geojsons",
+        help=f"Directory containing {GEOJSON_NAME}",
+    )
+    parser.add_argument("--points", type=int, default=1_000_000, help="Random points to assign")
+    parser.add_argument("--cell-m", type=float, default=20.0, help="Grid cell size in metres")
+    parser.add_argument(
+        "--synthetic", type=int, default=0, help="Benchmark N synthetic polygons instead"
+    )
+    return parser.parse_args()
+
+
+def write_synthetic(directory: Path, count: int, seed: int = 0) -> None:
+    """Voronoi cells over Singapore with jittered (densified) boundaries."""
+    rng = np.random.default_rng(seed)
+    minx, miny, maxx, maxy = SINGAPORE_BOUNDS
+    seeds = shapely.multipoints(
+        np.column_stack([rng.uniform(minx, maxx, count), rng.uniform(miny, maxy, count)])
+    )
+    box = shapely.box(*SINGAPORE_BOUNDS)
+    cells = shapely.get_parts(shapely.voronoi_polygons(seeds, extend_to=box))
+    features = []
+    for i, cell in enumerate(shapely.intersection(cells, box)):
+        ring = shapely.get_coordinates(shapely.segmentize(cell.exterior, 0.0005))
+        ring[1:-1] += rng.normal(0, 0.00005, ring[1:-1].shape)
+        features.append(
+            {
+                "type": "Feature",
+                "properties": {"pln_area_n": f"AREA {i}"},
+                "geometry": {"type": "Polygon", "coordinates": [ring.round(7).tolist()]},
+            }
+        )
+    (directory / GEOJSON_NAME).write_text(json.dumps({"features": features}))
+
+
+def sjoin_areas(lat: pd.Series, lon: pd.Series) -> pd.Series:
+    """The geopandas spatial join formerly behind get_planning_areas_for_points."""
+    polys = [p for p in data_loader.load_planning_areas() if p["geometry"] is not None]
+    poly_gdf = gpd.GeoDataFrame(
+        {"planning_area": [p["name"] for p in polys]},
+        geometry=[p["geometry"] for p in polys],
+        crs="EPSG:4326",
+    )
+    points = gpd.GeoDataFrame(
+        {"_idx": lat.index.to_numpy()},
+        geometry=gpd.points_from_xy(lon.to_numpy(), lat.to_numpy()),
+        crs="EPSG:4326",
+    )
+    joined = gpd.sjoin(points, poly_gdf, how="left", predicate="within")
+    joined = joined.sort_values(["_idx", "index_right"]).drop_duplicates("_idx")
+    return pd.Series(
+        joined["planning_area"]
+        .astype(object)
+        .where(joined["planning_area"].notna(), None)
+        .to_numpy(),
+        index=lat.index,
+        dtype=object,
+    )
+
+
+def timed(label: str, fn) -> pd.Series:
+    started = time.perf_counter()
+    result = fn()
+    print(f"{label:<28} {time.perf_counter() - started:>9.3f}s")
+    return result
+
+
+def main() -> int:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        geojson_dir = args.geojson_dir
+        if args.synthetic:
+            geojson_dir = Path(tmp)
+            write_synthetic(geojson_dir, args.synthetic)
+        if not (geojson_dir / GEOJSON_NAME).exists():
+            print(f"{GEOJSON_NAME} not found in {geojson_dir}; try --synthetic 55")
+            return 1
+
+        data_loader.configure(REPO_ROOT / "data")
+        data_loader._paths["raw_data_dir"] = geojson_dir
+        polygons = timed("load polygons", data_loader.load_planning_areas)
+
+        rng = np.random.default_rng(1)
+        minx, miny, maxx, maxy = shapely.total_bounds(
+            [p["geometry"] for p in polygons if p["geometry"] is not None]
+        )
+        lat = pd.Series(rng.uniform(miny, maxy, args.points))
+        lon = pd.Series(rng.uniform(minx, maxx, args.points))
+        print(f"{len(polygons)} polygons, {args.points:,} points, {args.cell_m:g} m cells")
+
+        joined = timed("geopandas sjoin", lambda: sjoin_areas(lat, lon))
+        exact = timed(
+            "STRtree within (vectorized)",
+            lambda: data_loader.get_planning_areas_for_points(lat, lon),
+        )
+        timed("grid build", lambda: data_loader.planning_area_grid(args.cell_m))
+        grid = timed(
+            "grid lookup",
+            lambda: data_loader.get_planning_areas_for_points(lat, lon, grid_cell_m=args.cell_m),
+        )
+
+    agree = exact.equals(joined) and exact.equals(grid)
+    print(f"results agree: {agree} ({exact.notna().mean():.1%} of points matched)")
+    return 0 if agree else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
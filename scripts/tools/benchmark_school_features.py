@@ -0,0 +1,115 @@
+"""Benchmark batched vs per-row school feature calculation.
+
+Runs ``calculate_school_features`` over synthetic schools (``--schools`` per
+level) and properties (``--locations`` unique coordinates, each repeated
+``--repeats`` times, every 50th row without coordinates), once batched
+(one KDTree query per level over the unique locations) and once with the
+reference per-row loop (``batched=False``).
+
+Both must agree; the script exits non-zero if they do not. School tiers
+are read from ``--data-dir`` as in the pipeline (none found means no tier
+bonuses).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from egg_n_bacon_housing.utils import school_features  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--data-dir", type=Path, default=REPO_ROOT / "data", help="Data dir with school tiers"
+    )
+    parser.add_argument("--schools", type=int, default=150, help="Synthetic schools per level")
+    parser.add_argument("--locations", type=int, default=1500, help="Unique property locations")
+    parser.add_argument("--repeats", type=int, default=2, help="Rows per property location")
+    return parser.parse_args()
+
+
+def synthetic_schools(n_per_level: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for level in school_features.SCHOOL_LEVELS:
+        for i in range(n_per_level):
+            rows.append(
+                {
+                    "school_name": f"{level.split()[0]} SCHOOL {i}",
+                    "latitude": rng.uniform(1.25, 1.45),
+                    "longitude": rng.uniform(103.65, 104.0),
+                    "mainlevel_code": level,
+                    "type_code": rng.choice(["GOV", "GOV-AIDED"]),
+                    "dgp_code": rng.choice(["NORTH", "EAST", "WEST"]),
+                    "zone_code": rng.choice(["Z1", "Z2"]),
+                    "nature_code": "CO-ED",
+                    "mrt_desc": f"MRT {i}",
+                    "sap_ind": ("Yes", "No", None)[rng.integers(3)],
+                    "autonomous_ind": rng.choice(["Yes", "No"]),
+                    "gifted_ind": ("Yes", "No", None)[rng.integers(3)],
+                    "ip_ind": rng.choice(["Yes", "No"]),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def synthetic_properties(n_locations: int, repeats: int, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(1.27, 1.43, n_locations)
+    lon = rng.uniform(103.68, 103.98, n_locations)
+    props = pd.DataFrame({"lat": np.repeat(lat, repeats), "lon": np.repeat(lon, repeats)})
+    props.loc[props.index[::50], ["lat", "lon"]] = np.nan
+    return props.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def same_features(batched: pd.DataFrame, loop: pd.DataFrame) -> bool:
+    """Batched output is float-typed where the reference loop leaves object columns."""
+    dist_cols = [c for c in loop.columns if c.startswith("nearest_school") and c.endswith("_dist")]
+    loop = loop.assign(**{c: pd.to_numeric(loop[c]) for c in dist_cols})
+    try:
+        pd.testing.assert_frame_equal(batched, loop, check_dtype=False, rtol=1e-9)
+    except AssertionError:
+        return False
+    return True
+
+
+def timed(label: str, fn) -> pd.DataFrame:
+    started = time.perf_counter()
+    result = fn()
+    print(f"{label:<28} {time.perf_counter() - started:>9.3f}s")
+    return result
+
+
+def main() -> int:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    school_features.configure(args.data_dir / "pipeline" / "01_bronze", args.data_dir)
+
+    schools = synthetic_schools(args.schools)
+    props = synthetic_properties(args.locations, args.repeats)
+    print(f"{len(schools)} schools, {len(props):,} property rows ({args.locations:,} locations)")
+
+    batched = timed("batched", lambda: school_features.calculate_school_features(props, schools))
+    loop = timed(
+        "per-row loop",
+        lambda: school_features.calculate_school_features(props, schools, batched=False),
+    )
+
+    agree = same_features(batched, loop)
+    print(f"results agree: {agree}")
+    return 0 if agree else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
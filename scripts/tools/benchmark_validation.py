@@ -0,0 +1,123 @@
+"""Benchmark cached validation plans against per-call plan compilation.
+
+For every schema in ``schemas/clean_models.py`` and
+``schemas/feature_models.py`` this times:
+
+- building a ``ValidationPlan`` with all its TypeAdapters (what every call
+  paid before plans were cached) against fetching the cached plan;
+- one precheck + ``validate_schema`` call on a small synthetic frame, with
+  the plan cache cleared before every call and with the cached plan. Small
+  frames make the fixed per-call cost visible.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import logging
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import pandas as pd  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from egg_n_bacon_housing.schemas import clean_models, feature_models  # noqa: E402
+from egg_n_bacon_housing.utils.validation import (  # noqa: E402
+    ValidationPlan,
+    validate_schema,
+    validation_plan,
+)
+from egg_n_bacon_housing.utils.validation_gateway import vectorized_precheck  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100, help="Rows per synthetic frame")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls timed per schema")
+    return parser.parse_args()
+
+
+def schema_models() -> list[type[BaseModel]]:
+    return [
+        cls
+        for module in (clean_models, feature_models)
+        for _, cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(cls, BaseModel) and cls.__module__ == module.__name__
+    ]
+
+
+def synthetic_frame(plan: ValidationPlan, rows: int) -> pd.DataFrame:
+    """A frame of valid values for every field the plan knows how to fill."""
+    columns = {}
+    for check in plan.checks:
+        lower = max((b for op, b in check.bounds if op in ("gt", "ge")), default=0)
+        if check.kind in ("float", "int"):
+            columns[check.name] = [lower + 1] * rows
+        elif check.kind == "str":
+            columns[check.name] = ["x"] * rows
+        elif check.kind == "datetime":
+            columns[check.name] = [pd.Timestamp("2024-01-01")] * rows
+    return pd.DataFrame(columns)
+
+
+def time_plan(model: type[BaseModel], repeat: int, cached: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        if not cached:
+            validation_plan.cache_clear()
+        plan = validation_plan(model)
+        plan.rows_adapter
+        for check in plan.checks:
+            check.adapter
+    return (time.perf_counter() - started) / repeat
+
+
+def time_calls(model: type[BaseModel], df: pd.DataFrame, repeat: int, cached: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        if not cached:
+            validation_plan.cache_clear()
+        vectorized_precheck(df, model, model.__name__)
+        validate_schema(df, model, model.__name__)
+    return (time.perf_counter() - started) / repeat
+
+
+def _row(name: str, timings: list[float]) -> str:
+    build, lookup, call, cached_call = (t * 1e3 for t in timings)
+    return (
+        f"{name:<24} {build:>9.2f} {lookup:>10.4f} "
+        f"{call:>9.2f} {cached_call:>10.2f} {call / cached_call:>7.2f}x"
+    )
+
+
+def main() -> int:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+
+    header = (
+        f"{'schema':<24} {'build ms':>9} {'cached ms':>10} "
+        f"{'call ms':>9} {'cached ms':>10} {'speedup':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    totals = [0.0, 0.0, 0.0, 0.0]
+    for model in schema_models():
+        df = synthetic_frame(validation_plan(model), args.rows)
+        timings = [
+            time_plan(model, args.repeat, cached=False),
+            time_plan(model, args.repeat, cached=True),
+            time_calls(model, df, args.repeat, cached=False),
+            time_calls(model, df, args.repeat, cached=True),
+        ]
+        totals = [t + new for t, new in zip(totals, timings, strict=True)]
+        print(_row(model.__name__, timings))
+    print(_row("total", totals))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
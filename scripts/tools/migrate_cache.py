@@ -0,0 +1,59 @@
+"""Migrate the file-per-key API cache into the single-file SQLite backend.
+
+Reads ``<sha256>.json`` / ``.parquet`` files from the cache directory and
+writes them as rows of ``cache.sqlite3`` in the same directory, keeping each
+file's mtime as the entry's creation time. Legacy ``.pkl`` files are skipped.
+
+Afterwards set ``PIPELINE__CACHE_BACKEND=sqlite`` so the pipeline reads from
+the database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from egg_n_bacon_housing.utils.cache import migrate_file_cache  # noqa: E402
+
+DEFAULT_CACHE_DIR = REPO_ROOT / "data" / "cache"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--cache-dir", default=str(DEFAULT_CACHE_DIR), help="File cache directory to migrate"
+    )
+    parser.add_argument(
+        "--cache-duration-hours",
+        type=int,
+        default=24,
+        help="TTL recorded for migrated entries (counted from each file's mtime)",
+    )
+    parser.add_argument(
+        "--delete", action="store_true", help="Remove cache files once they are migrated"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    cache_dir = Path(args.cache_dir)
+    if not cache_dir.is_dir():
+        print(f"✗ Cache directory not found: {cache_dir}")
+        return 1
+
+    counts = migrate_file_cache(
+        cache_dir, cache_duration_hours=args.cache_duration_hours, delete=args.delete
+    )
+    print(f"✓ Migrated {counts['migrated']} entries ({counts['skipped']} skipped).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 """data.gov.sg API adapter for fetching Singapore government datasets.
 
 This module provides:
-- Dataset fetching with pagination support
+- Dataset fetching with pagination support (serial or concurrent pages)
 - Rate limiting and retry logic
 - Cache integration for API responses
 
@@ -11,7 +11,11 @@ data.gov.sg is Singapore's official open data portal.
 import json
 import logging
 import re
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 
 import pandas as pd
 import requests
@@ -28,13 +32,201 @@ logger = logging.getLogger(__name__)
 DATAGOVSG_BASE_URL = "https://data.gov.sg/api/action/datastore_search"
 
 
-def fetch_datagovsg_dataset(url: str, dataset_id: str, use_cache: bool = True) -> pd.DataFrame:
+MAX_RETRY_ATTEMPTS = 5
+
+
+class RateLimiter:
+    """Rate-limit state shared by all page requests of one or more fetches.
+
+    After a 429, every worker holds off until the server's ``Retry-After``
+    has elapsed instead of each discovering the limit on its own. With
+    ``max_in_flight`` at most that many requests are open at once, however
+    many fetches and page workers share the limiter.
+    """
+
+    def __init__(self, max_in_flight: int | None = None) -> None:
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Block all workers for ``seconds``; the caller sleeps it out itself."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        time.sleep(seconds)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the ``max_in_flight`` request slots."""
+        if self._slots is None:
+            yield
+            return
+        with self._slots:
+            yield
+
+
+_host_limiter = RateLimiter()
+
+
+def configure(max_in_flight: int | None = None) -> RateLimiter:
+    """Set up the data.gov.sg limiter shared by every fetch (call once at startup).
+
+    ``max_in_flight`` caps concurrent requests to data.gov.sg across all
+    ingestion nodes and their page/indicator workers.
+    """
+    global _host_limiter
+    _host_limiter = RateLimiter(max_in_flight)
+    return _host_limiter
+
+
+def host_limiter() -> RateLimiter:
+    """The limiter every fetch goes through."""
+    return _host_limiter
+
+
+def _get_page(request_url: str, dataset_id: str, limiter: RateLimiter) -> dict:
+    """GET one page, retrying 429 (honouring Retry-After), 5xx and network errors.
+
+    Raises the last ``requests`` exception once retries are exhausted; the
+    caller decides whether that is a failed or an incomplete fetch.
+    """
+    retry_attempts = 0
+    paused = False
+    while True:
+        if not paused:
+            limiter.wait()
+        paused = False
+        try:
+            with limiter.slot():
+                response = requests.get(request_url, timeout=60)
+                response.raise_for_status()
+                return response.json()
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status == 429 and retry_attempts < MAX_RETRY_ATTEMPTS:
+                retry_after = 0
+                if e.response is not None:
+                    retry_after = int(e.response.headers.get("Retry-After", "0") or 0)
+                retry_attempts += 1
+                sleep_seconds = retry_after or min(2**retry_attempts, 30)
+                logger.warning(
+                    "Rate limited fetching dataset %s (attempt %s/%s, sleeping %ss, url=%s)",
+                    dataset_id,
+                    retry_attempts,
+                    MAX_RETRY_ATTEMPTS,
+                    sleep_seconds,
+                    request_url,
+                )
+                limiter.pause(sleep_seconds)
+                paused = True
+                continue
+            if status is not None and 500 <= status < 600 and retry_attempts < MAX_RETRY_ATTEMPTS:
+                retry_attempts += 1
+                _sleep_for_retry(dataset_id, retry_attempts)
+                continue
+            raise
+        except RequestException:
+            if retry_attempts < MAX_RETRY_ATTEMPTS:
+                retry_attempts += 1
+                _sleep_for_retry(dataset_id, retry_attempts)
+                continue
+            raise
+
+
+def _sleep_for_retry(dataset_id: str, retry_attempts: int) -> None:
+    sleep_seconds = min(2**retry_attempts, 30)
+    logger.warning(
+        "Retrying dataset %s after transient failure (attempt %s/%s, sleeping %ss)",
+        dataset_id,
+        retry_attempts,
+        MAX_RETRY_ATTEMPTS,
+        sleep_seconds,
+    )
+    time.sleep(sleep_seconds)
+
+
+def _page_url(next_url: str, offset: int) -> str:
+    return re.sub(r"offset=\d+", f"offset={offset}", next_url)
+
+
+def _fetch_remaining_pages(
+    next_url: str,
+    total_records: int,
+    dataset_id: str,
+    limiter: RateLimiter,
+    max_workers: int,
+    fetched_rows: int,
+) -> list[pd.DataFrame]:
+    """Fetch every page after the first concurrently, returned in offset order.
+
+    The page size is read from the ``offset=`` of the first ``next`` link, so
+    all remaining offsets are known up front.
+    """
+    match = re.search(r"offset=(\d+)", next_url)
+    page_size = int(match.group(1)) if match else 0
+    if page_size <= 0:
+        raise DatasetFetchError(f"Cannot derive page size for {dataset_id} from {next_url}")
+    offsets = list(range(page_size, total_records, page_size))
+    logger.info(
+        "Fetching %s remaining pages of dataset %s with %s workers",
+        len(offsets),
+        dataset_id,
+        max_workers,
+    )
+
+    pages: list[pd.DataFrame | None] = [None] * len(offsets)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_get_page, _page_url(next_url, offset), dataset_id, limiter): i
+            for i, offset in enumerate(offsets)
+        }
+        try:
+            for future in as_completed(futures):
+                i = futures[future]
+                response_json = future.result()
+                records = response_json.get("result", {}).get("records")
+                if records is None:
+                    raise KeyError(f"no records in page at offset {offsets[i]}")
+                pages[i] = pd.DataFrame(records)
+        except (RequestException, ValueError, KeyError, TypeError) as e:
+            pool.shutdown(wait=True, cancel_futures=True)
+            retrieved = fetched_rows + sum(len(p) for p in pages if p is not None)
+            logger.error(
+                "Error fetching dataset %s page at offset %s: %s", dataset_id, offsets[i], e
+            )
+            raise IncompleteDatasetFetchError(
+                f"Incomplete paginated fetch for {dataset_id}: retrieved {retrieved:,} "
+                f"of expected {total_records:,} rows before error at offset {offsets[i]}"
+            ) from e
+    return [p for p in pages if p is not None]
+
+
+def fetch_datagovsg_dataset(
+    url: str,
+    dataset_id: str,
+    use_cache: bool = True,
+    max_workers: int = 1,
+) -> pd.DataFrame:
     """Fetch data from data.gov.sg API with pagination support.
 
+    With ``max_workers > 1``, the first page's ``total`` and ``next`` link
+    are used to request all remaining offsets concurrently over a bounded
+    thread pool and reassembled in offset order, so the result matches the
+    serial ``_links.next`` walk. Every request goes through the data.gov.sg
+    limiter shared by all fetches (``configure``): a 429 ``Retry-After``
+    pauses every worker, and the per-host request cap holds across nodes.
+
     Args:
         url: Base URL for the API request
         dataset_id: Dataset ID to fetch
         use_cache: Whether to use caching (default: True)
+        max_workers: Concurrent page requests after the first (default: 1, serial)
 
     Returns:
         DataFrame with fetched data, or empty DataFrame if no data
@@ -46,19 +238,6 @@ def fetch_datagovsg_dataset(url: str, dataset_id: str, use_cache: bool = True) -
         ... )
     """
 
-    max_retry_attempts = 5
-
-    def _sleep_for_retry(retry_attempts: int) -> None:
-        sleep_seconds = min(2**retry_attempts, 30)
-        logger.warning(
-            "Retrying dataset %s after transient failure (attempt %s/%s, sleeping %ss)",
-            dataset_id,
-            retry_attempts,
-            max_retry_attempts,
-            sleep_seconds,
-        )
-        time.sleep(sleep_seconds)
-
     def _fetch_from_api():
         response_agg = []
         offset_value = 0
@@ -66,14 +245,11 @@ def fetch_datagovsg_dataset(url: str, dataset_id: str, use_cache: bool = True) -
         request_url = f"{url}{dataset_id}"
         if "datastore_search" in request_url and "limit=" not in request_url:
             request_url = f"{request_url}&limit=10000"
-        retry_attempts = 0
+        page_limiter = host_limiter()
 
         while True:
             try:
-                response = requests.get(request_url, timeout=60)
-                response.raise_for_status()
-                response_text = response.json()
-                retry_attempts = 0
+                response_text = _get_page(request_url, dataset_id, page_limiter)
 
                 if "result" not in response_text or "records" not in response_text["result"]:
                     logger.warning(
@@ -101,32 +277,21 @@ def fetch_datagovsg_dataset(url: str, dataset_id: str, use_cache: bool = True) -
                     if offset_value > total_records:
                         break
 
+                    if max_workers > 1 and len(response_agg) == 1:
+                        response_agg.extend(
+                            _fetch_remaining_pages(
+                                request_url,
+                                total_records,
+                                dataset_id,
+                                page_limiter,
+                                max_workers,
+                                fetched_rows=len(response_agg[0]),
+                            )
+                        )
+                        break
+
             except requests.HTTPError as e:
                 status = e.response.status_code if e.response is not None else None
-                if status == 429 and retry_attempts < max_retry_attempts:
-                    retry_after = 0
-                    if e.response is not None:
-                        retry_after = int(e.response.headers.get("Retry-After", "0") or 0)
-                    retry_attempts += 1
-                    sleep_seconds = retry_after or min(2**retry_attempts, 30)
-                    logger.warning(
-                        "Rate limited fetching dataset %s (attempt %s/%s, sleeping %ss, url=%s)",
-                        dataset_id,
-                        retry_attempts,
-                        max_retry_attempts,
-                        sleep_seconds,
-                        request_url,
-                    )
-                    time.sleep(sleep_seconds)
-                    continue
-                if (
-                    status is not None
-                    and 500 <= status < 600
-                    and retry_attempts < max_retry_attempts
-                ):
-                    retry_attempts += 1
-                    _sleep_for_retry(retry_attempts)
-                    continue
                 logger.error("Error fetching dataset %s (url=%s): %s", dataset_id, request_url, e)
                 if response_agg and total_records and offset_value < total_records:
                     raise IncompleteDatasetFetchError(
@@ -137,10 +302,6 @@ def fetch_datagovsg_dataset(url: str, dataset_id: str, use_cache: bool = True) -
                     f"Failed to fetch dataset {dataset_id} from {request_url} (status={status})"
                 ) from e
             except RequestException as e:
-                if retry_attempts < max_retry_attempts:
-                    retry_attempts += 1
-                    _sleep_for_retry(retry_attempts)
-                    continue
                 logger.error(
                     "Request error fetching dataset %s (url=%s): %s",
                     dataset_id,
@@ -124,6 +124,23 @@ def _request_new_token(settings: Settings) -> dict[str, str]:
 initial_backoff = 1
 max_backoff = 32
 
+ONEMAP_SEARCH_URL = "https://www.onemap.gov.sg/api/common/elastic/search"
+
+
+def search_url(search_string: str, base_url: str = ONEMAP_SEARCH_URL) -> str:
+    """Build the OneMap elastic search URL for one address."""
+    encoded_search = quote(search_string, safe="")
+    return f"{base_url}?searchVal={encoded_search}&returnGeom=Y&getAddrDetails=Y&pageNum=1"
+
+
+def parse_search_response(text: str) -> pd.DataFrame:
+    """Turn a OneMap search response body into the results DataFrame."""
+    return (
+        pd.DataFrame(json.loads(text)["results"])
+        .reset_index()
+        .rename({"index": "search_result"}, axis=1)
+    )
+
 
 @retry(
     wait=wait_exponential(multiplier=1, min=initial_backoff, max=max_backoff),
@@ -149,15 +166,9 @@ def fetch_data(search_string: str, headers: dict[str, str], timeout: int = 30) -
         requests.RequestException: If API call fails after retries
         requests.Timeout: If request times out
     """
-    encoded_search = quote(search_string, safe="")
-    url = f"https://www.onemap.gov.sg/api/common/elastic/search?searchVal={encoded_search}&returnGeom=Y&getAddrDetails=Y&pageNum=1"
-    response = requests.get(url, headers=headers, timeout=timeout)
+    response = requests.get(search_url(search_string), headers=headers, timeout=timeout)
     response.raise_for_status()
-    return (
-        pd.DataFrame(json.loads(response.text)["results"])
-        .reset_index()
-        .rename({"index": "search_result"}, axis=1)
-    )
+    return parse_search_response(response.text)
 
 
 def fetch_data_cached(
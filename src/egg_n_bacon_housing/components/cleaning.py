@@ -14,7 +14,16 @@ from egg_n_bacon_housing.schemas.clean_models import (
     HCleanCondoTransaction,
     HCleanHDBTransaction,
 )
+from egg_n_bacon_housing.utils.address_normalization import normalize_addresses
 from egg_n_bacon_housing.utils.contracts import require_columns
+from egg_n_bacon_housing.utils.gazetteer import (
+    GAZETTEER_FILENAME,
+    build_gazetteer,
+    hdb_block_addresses,
+    load_gazetteer,
+    update_gazetteer,
+    write_gazetteer,
+)
 from egg_n_bacon_housing.utils.geocoding import Geocoder
 from egg_n_bacon_housing.utils.layer_writer import LayerWriter
 from egg_n_bacon_housing.utils.validation_gateway import validate_and_quarantine
@@ -155,18 +164,32 @@ def condo_validated(cleaned_condo_transactions: pd.DataFrame, silver_dir: Path)
     )
 
 
+def _representative_addresses(raw: pd.Series, normalized: pd.Series) -> pd.Series:
+    """Most frequent raw spelling of each normalized address (first seen on ties)."""
+    pairs = pd.DataFrame({"normalized_address": normalized, "raw": raw}).dropna()
+    counts = pairs.groupby(["normalized_address", "raw"], sort=False).size()
+    top = counts.sort_values(ascending=False, kind="stable").reset_index()
+    return top.drop_duplicates("normalized_address").set_index("normalized_address")["raw"]
+
+
 def geocoded_properties(
     hdb_validated: pd.DataFrame,
     condo_validated: pd.DataFrame,
     writer: LayerWriter,
     geocoder: Geocoder,
     min_coordinate_coverage: float = 0.7,
+    silver_dir: Path | None = None,
 ) -> pd.DataFrame:
     """Merge validated transactions and geocode addresses via OneMap.
 
-    Always geocodes the full unique-address set; the geocoder itself is
-    cache-first (OneMap address cache, ``utils/geocoding.py``), so repeat
-    runs only hit the API for addresses not seen before. The silver parquet
+    Addresses are normalized first (``utils/address_normalization.py``) so
+    spelling variants of one address share a single lookup. Normalized
+    addresses already resolved in the address gazetteer
+    (``silver_dir/address_gazetteer.parquet``, ``utils/gazetteer.py``) are
+    taken from it and newly resolved ones are added to it; for
+    every other one, its most frequent raw spelling goes to the geocoder
+    (OneMap indexes some streets and projects only in full form), which is
+    itself cache-first (OneMap address cache, ``utils/geocoding.py``). The silver parquet
     written here is a pure output snapshot -- it is never used as a gate to
     skip geocoding, so re-ingestion with new transactions always geocodes
     them (regression: a stale-parquet short-circuit previously suppressed
@@ -175,6 +198,7 @@ def geocoded_properties(
     Args:
         hdb_validated: Validated HDB transactions.
         condo_validated: Validated condo transactions.
+        silver_dir: Where the gazetteer lives; ``None`` disables it.
 
     Returns:
         DataFrame with lat/lon coordinates.
@@ -201,14 +225,43 @@ def geocoded_properties(
         writer.write(combined, "geocoded_properties", "silver")
         return combined
 
-    unique_addresses = combined[address_col].dropna().astype(str).unique().tolist()
-    logger.info("Geocoding %s unique addresses...", len(unique_addresses))
+    normalized = normalize_addresses(combined[address_col])
+    unique_addresses = normalized.dropna().unique().tolist()
 
-    lookup = geocoder.geocode(pd.Series(unique_addresses, name=address_col))
+    gazetteer_path = silver_dir / GAZETTEER_FILENAME if silver_dir is not None else None
+    gazetteer = load_gazetteer(gazetteer_path) if gazetteer_path is not None else None
+    known = (
+        gazetteer[gazetteer["key"].isin(unique_addresses)].rename(
+            columns={"key": "normalized_address"}
+        )
+        if gazetteer is not None
+        else pd.DataFrame(columns=["normalized_address", "lat", "lon"])
+    )
+    known_set = set(known["normalized_address"])
+    to_geocode = [a for a in unique_addresses if a not in known_set]
+    logger.info(
+        "Geocoding %s unique addresses (%s raw variants, %s from gazetteer)...",
+        len(to_geocode),
+        combined[address_col].nunique(),
+        len(known_set),
+    )
+
+    coords = [known[["normalized_address", "lat", "lon"]]]
+    if to_geocode:
+        raw_inputs = _representative_addresses(combined[address_col], normalized).loc[to_geocode]
+        lookup = geocoder.geocode(pd.Series(raw_inputs.to_numpy(), name=address_col))
+        lookup["normalized_address"] = lookup["input"].map(
+            pd.Series(raw_inputs.index, index=raw_inputs.to_numpy())
+        )
+        coords.append(lookup[["normalized_address", "lat", "lon"]].dropna(subset=["lat", "lon"]))
+        if gazetteer_path is not None and gazetteer is not None:
+            update_gazetteer(gazetteer_path, gazetteer, lookup)
 
-    coord_map = lookup.set_index("input")[["lat", "lon"]]
-    combined["lat"] = combined[address_col].map(coord_map["lat"])
-    combined["lon"] = combined[address_col].map(coord_map["lon"])
+    coord_map = pd.concat(
+        [c for c in coords if not c.empty] or coords[:1], ignore_index=True
+    ).set_index("normalized_address")
+    combined["lat"] = normalized.map(coord_map["lat"])
+    combined["lon"] = normalized.map(coord_map["lon"])
 
     coverage = combined[["lat", "lon"]].notna().all(axis=1).mean()
     logger.info("Geocoding coverage: %.1f%%", coverage * 100)
@@ -233,3 +286,39 @@ def geocoded_validated(geocoded_properties: pd.DataFrame, silver_dir: Path) -> p
         layer_dir=silver_dir,
         filename="validated_geocoded_properties.parquet",
     )
+
+
+def address_gazetteer(
+    geocoded_properties: pd.DataFrame,
+    raw_hdb_property_info: pd.DataFrame,
+    silver_dir: Path,
+    geocoder: Geocoder,
+    gazetteer_prefetch_hdb_blocks: bool = False,
+) -> pd.DataFrame:
+    """Extend the offline address gazetteer with this run's results.
+
+    ``geocoded_properties`` already records the addresses it resolves; this
+    merges the gazetteer with the geocoded properties snapshot, keyed by
+    normalized address and postal code, and reports how many HDB blocks
+    (``raw_hdb_property_info``) are covered.
+    With ``gazetteer_prefetch_hdb_blocks`` the uncovered blocks are geocoded
+    once through ``geocoder``. The next run's default geocoder consults the
+    gazetteer before OneMap.
+    """
+    gazetteer_path = silver_dir / GAZETTEER_FILENAME
+    past_results = [load_gazetteer(gazetteer_path)]
+    if {"address", "lat", "lon"} <= set(geocoded_properties.columns):
+        past_results.append(
+            geocoded_properties[["address", "lat", "lon"]].rename(
+                columns={"address": "normalized_address"}
+            )
+        )
+
+    gazetteer = build_gazetteer(
+        past_results,
+        hdb_blocks=hdb_block_addresses(raw_hdb_property_info),
+        geocoder=geocoder if gazetteer_prefetch_hdb_blocks else None,
+    )
+    if not gazetteer.empty:
+        write_gazetteer(gazetteer, gazetteer_path)
+    return gazetteer
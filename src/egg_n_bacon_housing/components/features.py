@@ -4,7 +4,10 @@ This module provides Hamilton-compatible functions for computing features
 from silver data into the gold layer.
 """
 
+import hashlib
+import json
 import logging
+from collections.abc import Callable
 from pathlib import Path
 
 import numpy as np
@@ -20,9 +23,22 @@ from egg_n_bacon_housing.schemas.feature_models import (
 )
 from egg_n_bacon_housing.utils.contracts import require_columns
 from egg_n_bacon_housing.utils.geocoding import Geocoder
-from egg_n_bacon_housing.utils.proximity import compute_proximity_features
+from egg_n_bacon_housing.utils.partitioned_parquet import (
+    drop_partitions,
+    list_partitions,
+    read_partitions,
+)
+from egg_n_bacon_housing.utils.proximity import (
+    cached_proximity_index,
+    compute_proximity_features,
+    poi_fingerprint,
+)
 from egg_n_bacon_housing.utils.regional_mapping import get_region_for_planning_area
-from egg_n_bacon_housing.utils.school_features import _geocode_schools, calculate_school_features
+from egg_n_bacon_housing.utils.school_features import (
+    _geocode_schools,
+    calculate_school_features,
+    load_school_tiers,
+)
 from egg_n_bacon_housing.utils.time_index import ensure_month_column
 from egg_n_bacon_housing.utils.validation_gateway import validate_and_quarantine
 
@@ -236,50 +252,119 @@ def _add_planning_area(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def location_dim(
-    geocoded_validated: pd.DataFrame,
-    raw_mrt_stations: pd.DataFrame,
+_LOCATION_DIM_FILENAME = "location_dim.parquet"
+_LOCATION_DIM_FINGERPRINT_VERSION = 1
+
+
+def _location_dim_fingerprint_path(gold_dir: Path) -> Path:
+    return gold_dir / "location_dim.fingerprint"
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame's columns and values (index ignored)."""
+    if df.empty:
+        return "empty"
+    try:
+        hashed = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        hashed = pd.util.hash_pandas_object(df.astype(str), index=False)
+    digest = hashlib.sha256("|".join(map(str, df.columns)).encode())
+    digest.update(hashed.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _planning_areas_fingerprint() -> str:
+    try:
+        from egg_n_bacon_housing.utils.data_loader import planning_areas_fingerprint
+    except ImportError:
+        return "unavailable"
+    return planning_areas_fingerprint()
+
+
+def _location_dim_fingerprint(
+    proximity_pois: dict[str, pd.DataFrame | None],
     raw_school_directory: pd.DataFrame,
-    raw_shopping_malls: pd.DataFrame,
-    raw_hawker_centres: pd.DataFrame,
-    raw_supermarkets: pd.DataFrame,
-    raw_parks: pd.DataFrame,
-    raw_childcare: pd.DataFrame,
-    raw_kindergartens: pd.DataFrame,
-    raw_bus_stops: pd.DataFrame,
-    raw_chas_clinics: pd.DataFrame,
-    raw_sports_facilities: pd.DataFrame,
-    raw_community_clubs: pd.DataFrame,
-    geocoded_green_mark_buildings: pd.DataFrame,
     raw_hdb_property_info: pd.DataFrame,
-    gold_dir: Path,
-    geocoder: Geocoder,
+) -> str:
+    """Fingerprint every non-coordinate input that location features depend on.
+
+    Besides the DAG inputs this covers the school tier reference data and the
+    planning-area GeoJSON, which location features read from disk.
+    """
+    primary_tiers, secondary_tiers = load_school_tiers()
+    parts = [
+        f"v{_LOCATION_DIM_FINGERPRINT_VERSION}",
+        poi_fingerprint(**proximity_pois),
+        _frame_fingerprint(raw_school_directory),
+        _frame_fingerprint(raw_hdb_property_info),
+        _frame_fingerprint(primary_tiers),
+        _frame_fingerprint(secondary_tiers),
+        _planning_areas_fingerprint(),
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def _load_previous_location_dim(gold_dir: Path, fingerprint: str) -> pd.DataFrame | None:
+    """Return the last persisted location_dim if it was built from the same inputs."""
+    parquet_path = gold_dir / _LOCATION_DIM_FILENAME
+    fingerprint_path = _location_dim_fingerprint_path(gold_dir)
+    if not parquet_path.exists() or not fingerprint_path.exists():
+        logger.info("location_dim: no previous build with fingerprint — full recompute")
+        return None
+    if fingerprint_path.read_text(encoding="utf-8").strip() != fingerprint:
+        logger.info("location_dim: POI/reference inputs changed — full recompute")
+        return None
+    try:
+        previous = pd.read_parquet(parquet_path)
+    except (OSError, ValueError) as exc:
+        logger.warning("location_dim: failed to read previous build (%s) — full recompute", exc)
+        return None
+    if not {"lat", "lon"}.issubset(previous.columns):
+        return None
+    return previous
+
+
+def _extend_location_dim(
+    loc: pd.DataFrame,
+    previous: pd.DataFrame,
+    compute_features: Callable[[pd.DataFrame], pd.DataFrame],
 ) -> pd.DataFrame:
-    """Build the location dimension table — one row per unique (lat, lon).
+    """Reuse ``previous`` rows for known coordinates and compute only the rest.
 
-    Computes ALL proximity features, school scores, block metadata, and
-    planning_area on ~10K unique locations instead of 1M transactions.
+    Rows come back in ``loc`` order; coordinates no longer present in ``loc``
+    are dropped. Falls back to a full recompute if the freshly computed rows
+    do not have the same columns as the previous build.
     """
-    if geocoded_validated.empty:
-        return pd.DataFrame()
+    keys = ["lat", "lon"]
+    previous = previous.drop_duplicates(subset=keys, keep="first")
+    known = loc[keys].merge(previous[keys], on=keys, how="left", indicator=True)["_merge"]
+    new_loc = loc.loc[(known == "left_only").to_numpy()].reset_index(drop=True)
+    logger.info(
+        "location_dim incremental: %s reused, %s new locations",
+        len(loc) - len(new_loc),
+        len(new_loc),
+    )
 
-    df = geocoded_validated.copy()
-    require_columns(df, {"lat", "lon"}, "geocoded_validated")
-    df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
-    df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
-    df = df.dropna(subset=["lat", "lon"])
+    if new_loc.empty:
+        return loc[keys].merge(previous, on=keys, how="inner")
 
-    if df.empty:
-        return pd.DataFrame()
+    new_features = compute_features(new_loc)
+    if set(new_features.columns) != set(previous.columns):
+        logger.info("location_dim: feature columns changed since last build — full recompute")
+        return compute_features(loc)
+
+    combined = pd.concat([previous, new_features[previous.columns]], ignore_index=True)
+    return loc[keys].merge(combined, on=keys, how="inner")
 
-    carry_cols = [c for c in ("block", "street_name", "town") if c in df.columns]
-    loc = (
-        df.drop_duplicates(subset=["lat", "lon"], keep="first")[["lat", "lon", *carry_cols]]
-        .reset_index(drop=True)
-        .copy()
-    )
-    logger.info("location_dim: %s unique (lat, lon) pairs", len(loc))
 
+def _compute_location_features(
+    loc: pd.DataFrame,
+    raw_school_directory: pd.DataFrame,
+    proximity_pois: dict[str, pd.DataFrame | None],
+    raw_hdb_property_info: pd.DataFrame,
+    geocoder: Geocoder,
+) -> pd.DataFrame:
+    """Add school, proximity, block metadata and planning-area features to ``loc``."""
     # --- School features ---
     if not raw_school_directory.empty:
         schools = raw_school_directory
@@ -301,23 +386,8 @@ def location_dim(
 
     # --- Proximity features (all 14 POI types) ---
     try:
-        loc = compute_proximity_features(
-            loc,
-            mrt_stations=raw_mrt_stations if not raw_mrt_stations.empty else None,
-            malls=raw_shopping_malls if not raw_shopping_malls.empty else None,
-            hawkers=raw_hawker_centres if not raw_hawker_centres.empty else None,
-            supermarkets=raw_supermarkets if not raw_supermarkets.empty else None,
-            parks=raw_parks if not raw_parks.empty else None,
-            childcare=raw_childcare if not raw_childcare.empty else None,
-            kindergartens=raw_kindergartens if not raw_kindergartens.empty else None,
-            bus_stops=raw_bus_stops if not raw_bus_stops.empty else None,
-            chas_clinics=raw_chas_clinics if not raw_chas_clinics.empty else None,
-            sports_facilities=raw_sports_facilities if not raw_sports_facilities.empty else None,
-            community_clubs=raw_community_clubs if not raw_community_clubs.empty else None,
-            green_mark_buildings=(
-                geocoded_green_mark_buildings if not geocoded_green_mark_buildings.empty else None
-            ),
-        )
+        proximity_index = cached_proximity_index(**proximity_pois)
+        loc = compute_proximity_features(loc, index=proximity_index)
     except (OSError, ValueError, KeyError, RuntimeError) as exc:
         logger.warning("Skipping proximity features: %s", exc)
         loc["dist_to_nearest_mrt"] = pd.NA
@@ -400,19 +470,141 @@ def location_dim(
             lambda pa: get_region_for_planning_area(str(pa)) if pd.notna(pa) else None
         )
 
+    return loc
+
+
+def location_dim(
+    geocoded_validated: pd.DataFrame,
+    raw_mrt_stations: pd.DataFrame,
+    raw_school_directory: pd.DataFrame,
+    raw_shopping_malls: pd.DataFrame,
+    raw_hawker_centres: pd.DataFrame,
+    raw_supermarkets: pd.DataFrame,
+    raw_parks: pd.DataFrame,
+    raw_childcare: pd.DataFrame,
+    raw_kindergartens: pd.DataFrame,
+    raw_bus_stops: pd.DataFrame,
+    raw_chas_clinics: pd.DataFrame,
+    raw_sports_facilities: pd.DataFrame,
+    raw_community_clubs: pd.DataFrame,
+    geocoded_green_mark_buildings: pd.DataFrame,
+    raw_hdb_property_info: pd.DataFrame,
+    gold_dir: Path,
+    geocoder: Geocoder,
+    incremental_location_dim: bool = False,
+) -> pd.DataFrame:
+    """Build the location dimension table — one row per unique (lat, lon).
+
+    Computes ALL proximity features, school scores, block metadata, and
+    planning_area on ~10K unique locations instead of 1M transactions.
+
+    With ``incremental_location_dim``, the previous ``location_dim.parquet``
+    is reused and only (lat, lon) pairs missing from it are computed, as long
+    as the POI, school, school tier, HDB property and planning-area inputs
+    hash to the same fingerprint recorded alongside it (written on every
+    run). Any input change triggers a full recompute.
+    """
+    if geocoded_validated.empty:
+        return pd.DataFrame()
+
+    df = geocoded_validated.copy()
+    require_columns(df, {"lat", "lon"}, "geocoded_validated")
+    df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
+    df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+    df = df.dropna(subset=["lat", "lon"])
+
+    if df.empty:
+        return pd.DataFrame()
+
+    carry_cols = [c for c in ("block", "street_name", "town") if c in df.columns]
+    loc = (
+        df.drop_duplicates(subset=["lat", "lon"], keep="first")[["lat", "lon", *carry_cols]]
+        .reset_index(drop=True)
+        .copy()
+    )
+    logger.info("location_dim: %s unique (lat, lon) pairs", len(loc))
+
+    proximity_pois = {
+        "mrt_stations": raw_mrt_stations if not raw_mrt_stations.empty else None,
+        "malls": raw_shopping_malls if not raw_shopping_malls.empty else None,
+        "hawkers": raw_hawker_centres if not raw_hawker_centres.empty else None,
+        "supermarkets": raw_supermarkets if not raw_supermarkets.empty else None,
+        "parks": raw_parks if not raw_parks.empty else None,
+        "childcare": raw_childcare if not raw_childcare.empty else None,
+        "kindergartens": raw_kindergartens if not raw_kindergartens.empty else None,
+        "bus_stops": raw_bus_stops if not raw_bus_stops.empty else None,
+        "chas_clinics": raw_chas_clinics if not raw_chas_clinics.empty else None,
+        "sports_facilities": raw_sports_facilities if not raw_sports_facilities.empty else None,
+        "community_clubs": raw_community_clubs if not raw_community_clubs.empty else None,
+        "green_mark_buildings": (
+            geocoded_green_mark_buildings if not geocoded_green_mark_buildings.empty else None
+        ),
+    }
+
+    fingerprint = _location_dim_fingerprint(
+        proximity_pois, raw_school_directory, raw_hdb_property_info
+    )
+    previous = (
+        _load_previous_location_dim(gold_dir, fingerprint) if incremental_location_dim else None
+    )
+
+    if previous is None:
+        loc = _compute_location_features(
+            loc, raw_school_directory, proximity_pois, raw_hdb_property_info, geocoder
+        )
+    else:
+        loc = _extend_location_dim(
+            loc,
+            previous,
+            lambda new_loc: _compute_location_features(
+                new_loc, raw_school_directory, proximity_pois, raw_hdb_property_info, geocoder
+            ),
+        )
+
     loc = validate_and_quarantine(
         loc,
         LocationDimRecord,
         "location_dim",
         layer_dir=gold_dir,
-        filename="location_dim.parquet",
+        filename=_LOCATION_DIM_FILENAME,
     )
+    # Recorded on every run, so a later incremental run never trusts a
+    # fingerprint older than the parquet it sits next to.
+    fingerprint_path = _location_dim_fingerprint_path(gold_dir)
+    if loc.empty:
+        fingerprint_path.unlink(missing_ok=True)
+    else:
+        fingerprint_path.write_text(fingerprint, encoding="utf-8")
 
     return loc
 
 
-def transactions_enriched(
-    geocoded_validated: pd.DataFrame,
+_TRANSACTIONS_ENRICHED_DATASET = "transactions_enriched"
+_TRANSACTIONS_ENRICHED_FINGERPRINT_VERSION = 1
+
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Per-row uint64 content hashes (index ignored)."""
+    try:
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        return pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy()
+
+
+def _sum_by_key(hashes: np.ndarray, keys: pd.Series) -> dict[str, tuple[int, int]]:
+    """Order-insensitive (wrapping sum, count) of row hashes per key."""
+    codes, uniques = pd.factorize(keys.astype(str))
+    sums = np.zeros(len(uniques), dtype=np.uint64)
+    np.add.at(sums, codes, hashes.astype(np.uint64))
+    counts = np.bincount(codes, minlength=len(uniques))
+    return {
+        key: (int(total), int(count))
+        for key, total, count in zip(uniques, sums, counts, strict=True)
+    }
+
+
+def _transaction_partition_fingerprints(
+    df: pd.DataFrame,
     location_dim: pd.DataFrame,
     rental_yield: pd.DataFrame,
     raw_macro_data: dict[str, pd.DataFrame],
@@ -420,21 +612,162 @@ def transactions_enriched(
     raw_hdb_resident_population: pd.DataFrame,
     raw_median_annual_value: pd.DataFrame,
     raw_income_by_planning_area: pd.DataFrame,
-    gold_dir: Path,
-) -> pd.DataFrame:
-    """Join location_dim onto transactions + merge macro + yield + supply.
+) -> dict[str, str]:
+    """Fingerprint each month partition of ``transactions_enriched``.
 
-    Fast merge: location_dim (10K) → transactions (1M) by (lat, lon),
-    then macro indicators, rental yield, town supply, income, and annual value.
+    A month's fingerprint covers its source rows, the location_dim row each
+    of them joins to, the rental yield rows and macro values for that month,
+    and the town/income reference tables (which apply to every month).
     """
-    if geocoded_validated.empty:
-        return pd.DataFrame()
+    row_hashes = _row_hashes(df)
+
+    if not location_dim.empty and {"lat", "lon"}.issubset(location_dim.columns):
+        loc = location_dim.drop_duplicates(subset=["lat", "lon"]).reset_index(drop=True)
+        loc_hashes = _row_hashes(loc)
+        positions = (
+            df[["lat", "lon"]]
+            .merge(loc[["lat", "lon"]].reset_index(names="_pos"), on=["lat", "lon"], how="left")[
+                "_pos"
+            ]
+            .fillna(-1)
+            .to_numpy(dtype=np.int64)
+        )
+        joined = np.where(positions >= 0, loc_hashes[np.clip(positions, 0, None)], 0)
+        row_hashes = row_hashes * np.uint64(31) + joined.astype(np.uint64)
 
-    df = geocoded_validated.copy()
-    require_columns(df, {"lat", "lon", "price"}, "geocoded_validated")
-    df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
-    df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+    source = _sum_by_key(row_hashes, df["month"])
+
+    global_parts = [
+        f"v{_TRANSACTIONS_ENRICHED_FINGERPRINT_VERSION}",
+        _frame_fingerprint(raw_dwelling_units_by_town),
+        _frame_fingerprint(raw_hdb_resident_population),
+        _frame_fingerprint(raw_median_annual_value),
+        _frame_fingerprint(raw_income_by_planning_area),
+    ]
+    rental: dict[str, tuple[int, int]] = {}
+    if not rental_yield.empty and "month" in rental_yield.columns:
+        rental = _sum_by_key(_row_hashes(rental_yield), rental_yield["month"])
+    else:
+        global_parts.append(_frame_fingerprint(rental_yield))
+
+    months = pd.DataFrame({"month": list(source)})
+    months["_month_ts"] = pd.to_datetime(months["month"], errors="coerce")
+    months["_month"] = months["_month_ts"].dt.to_period("M").astype(str)
+    months["_quarter"] = months["_month_ts"].dt.to_period("Q")
+    monthly_combined, quarterly_combined = _macro_lookups(raw_macro_data)
+    if monthly_combined is not None:
+        months = months.merge(monthly_combined, on="_month", how="left")
+    if quarterly_combined is not None:
+        months = months.merge(quarterly_combined, on="_quarter", how="left")
+    macro = dict(
+        zip(
+            months["month"],
+            _row_hashes(months.drop(columns=["_month_ts", "_month", "_quarter"])),
+            strict=True,
+        )
+    )
+
+    global_fp = "|".join(global_parts)
+    return {
+        month: hashlib.sha256(
+            f"{global_fp}|{source[month]}|{rental.get(month)}|{macro[month]}".encode()
+        ).hexdigest()
+        for month in source
+    }
+
+
+def _read_partition_manifest(dataset_dir: Path) -> dict[str, str]:
+    manifest_path = dataset_dir / "_manifest.json"
+    if not manifest_path.exists():
+        return {}
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable partition manifest %s: %s", manifest_path, exc)
+        return {}
+    return manifest.get("partitions", {})
+
+
+def _write_partition_manifest(dataset_dir: Path, fingerprints: dict[str, str]) -> None:
+    if not dataset_dir.is_dir():
+        return
+    manifest = {"partitions": dict(sorted(fingerprints.items()))}
+    (dataset_dir / "_manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+_MONTHLY_INDICATORS = {
+    "cpi": ("date", "cpi"),
+    "sora": ("date", "sora_rate"),
+    "bank_rates": ("date", "sora_3m"),
+}
+
+_QUARTERLY_INDICATORS = {
+    "unemployment": ("quarter", "unemployment_rate"),
+    "gdp": ("quarter", "gdp"),
+    "hdb_rpi": ("quarter", "hdb_rpi"),
+    "ura_ppi": ("quarter", "ura_ppi"),
+    "wage_growth": ("quarter", "wage_growth"),
+}
 
+
+def _macro_lookups(
+    raw_macro_data: dict[str, pd.DataFrame],
+) -> tuple[pd.DataFrame | None, pd.DataFrame | None]:
+    """Combine macro indicators into one ``_month`` and one ``_quarter`` lookup frame.
+
+    The indicator value columns are mutually distinct, so a single left merge
+    per frame is equivalent to merging each indicator separately.
+    """
+    monthly_lookups: list[pd.DataFrame] = []
+    for key, (date_col, value_col) in _MONTHLY_INDICATORS.items():
+        macro_df = raw_macro_data.get(key, pd.DataFrame())
+        if macro_df.empty or date_col not in macro_df.columns:
+            continue
+        lookup = macro_df[[date_col, value_col]].copy()
+        lookup[date_col] = pd.to_datetime(lookup[date_col], errors="coerce")
+        lookup["_month"] = lookup[date_col].dt.to_period("M").astype(str)
+        lookup = lookup.dropna(subset=["_month", value_col])
+        lookup = lookup.sort_values("_month").drop_duplicates(subset="_month", keep="last")
+        monthly_lookups.append(lookup[["_month", value_col]])
+
+    quarterly_lookups: list[pd.DataFrame] = []
+    for key, (qtr_col, value_col) in _QUARTERLY_INDICATORS.items():
+        macro_df = raw_macro_data.get(key, pd.DataFrame())
+        if macro_df.empty or qtr_col not in macro_df.columns:
+            continue
+        lookup = macro_df[[qtr_col, value_col]].copy()
+        lookup[qtr_col] = pd.to_datetime(lookup[qtr_col], errors="coerce")
+        lookup["_quarter"] = lookup[qtr_col].dt.to_period("Q")
+        lookup = lookup.dropna(subset=["_quarter", value_col])
+        lookup = lookup.sort_values("_quarter").drop_duplicates(subset="_quarter", keep="last")
+        quarterly_lookups.append(lookup[["_quarter", value_col]])
+
+    def combine(lookups: list[pd.DataFrame], key: str) -> pd.DataFrame | None:
+        if not lookups:
+            return None
+        combined = lookups[0]
+        for nxt in lookups[1:]:
+            combined = combined.merge(nxt, on=key, how="outer")
+        return combined
+
+    return combine(monthly_lookups, "_month"), combine(quarterly_lookups, "_quarter")
+
+
+def _enrich_transactions(
+    df: pd.DataFrame,
+    location_dim: pd.DataFrame,
+    rental_yield: pd.DataFrame,
+    raw_macro_data: dict[str, pd.DataFrame],
+    raw_dwelling_units_by_town: pd.DataFrame,
+    raw_hdb_resident_population: pd.DataFrame,
+    raw_median_annual_value: pd.DataFrame,
+    raw_income_by_planning_area: pd.DataFrame,
+) -> pd.DataFrame:
+    """Row-wise enrichment of transactions with location, yield, macro and supply lookups.
+
+    Every lookup is a left merge keyed on the row itself, so enriching a
+    subset of rows yields exactly the same rows as enriching the full frame.
+    """
     # --- Derived columns ---
     if "price" in df.columns and "floor_area_sqft" in df.columns:
         price = pd.to_numeric(df["price"], errors="coerce")
@@ -491,61 +824,20 @@ def transactions_enriched(
     df["_month_ts"] = pd.to_datetime(df["month"], errors="coerce")
     df["_month"] = df["_month_ts"].dt.to_period("M").astype(str)
 
-    monthly_indicators = {
-        "cpi": ("date", "cpi"),
-        "sora": ("date", "sora_rate"),
-        "bank_rates": ("date", "sora_3m"),
-    }
-    monthly_lookups: list[pd.DataFrame] = []
+    monthly_combined, quarterly_combined = _macro_lookups(raw_macro_data)
     monthly_present: set[str] = set()
-    for key, (date_col, value_col) in monthly_indicators.items():
-        macro_df = raw_macro_data.get(key, pd.DataFrame())
-        if macro_df.empty or date_col not in macro_df.columns:
-            continue
-        lookup = macro_df[[date_col, value_col]].copy()
-        lookup[date_col] = pd.to_datetime(lookup[date_col], errors="coerce")
-        lookup["_month"] = lookup[date_col].dt.to_period("M").astype(str)
-        lookup = lookup.dropna(subset=["_month", value_col])
-        lookup = lookup.sort_values("_month").drop_duplicates(subset="_month", keep="last")
-        monthly_lookups.append(lookup[["_month", value_col]])
-        monthly_present.add(value_col)
-
-    if monthly_lookups:
-        monthly_combined = monthly_lookups[0]
-        for nxt in monthly_lookups[1:]:
-            monthly_combined = monthly_combined.merge(nxt, on="_month", how="outer")
+    if monthly_combined is not None:
         df = df.merge(monthly_combined, on="_month", how="left")
-    for value_col in (v for _, v in monthly_indicators.values() if v not in monthly_present):
+        monthly_present = set(monthly_combined.columns)
+    for value_col in (v for _, v in _MONTHLY_INDICATORS.values() if v not in monthly_present):
         df[value_col] = pd.NA
 
-    quarterly_indicators = {
-        "unemployment": ("quarter", "unemployment_rate"),
-        "gdp": ("quarter", "gdp"),
-        "hdb_rpi": ("quarter", "hdb_rpi"),
-        "ura_ppi": ("quarter", "ura_ppi"),
-        "wage_growth": ("quarter", "wage_growth"),
-    }
     df["_quarter"] = df["_month_ts"].dt.to_period("Q")
-    quarterly_lookups: list[pd.DataFrame] = []
     quarterly_present: set[str] = set()
-    for key, (qtr_col, value_col) in quarterly_indicators.items():
-        macro_df = raw_macro_data.get(key, pd.DataFrame())
-        if macro_df.empty or qtr_col not in macro_df.columns:
-            continue
-        lookup = macro_df[[qtr_col, value_col]].copy()
-        lookup[qtr_col] = pd.to_datetime(lookup[qtr_col], errors="coerce")
-        lookup["_quarter"] = lookup[qtr_col].dt.to_period("Q")
-        lookup = lookup.dropna(subset=["_quarter", value_col])
-        lookup = lookup.sort_values("_quarter").drop_duplicates(subset="_quarter", keep="last")
-        quarterly_lookups.append(lookup[["_quarter", value_col]])
-        quarterly_present.add(value_col)
-
-    if quarterly_lookups:
-        quarterly_combined = quarterly_lookups[0]
-        for nxt in quarterly_lookups[1:]:
-            quarterly_combined = quarterly_combined.merge(nxt, on="_quarter", how="outer")
+    if quarterly_combined is not None:
         df = df.merge(quarterly_combined, on="_quarter", how="left")
-    for value_col in (v for _, v in quarterly_indicators.values() if v not in quarterly_present):
+        quarterly_present = set(quarterly_combined.columns)
+    for value_col in (v for _, v in _QUARTERLY_INDICATORS.values() if v not in quarterly_present):
         df[value_col] = pd.NA
 
     df = df.drop(columns=["_month", "_month_ts", "_quarter"], errors="ignore")
@@ -660,16 +952,103 @@ def transactions_enriched(
         if col not in df.columns:
             df[col] = pd.NA
 
-    df = validate_and_quarantine(
-        df,
-        HFeatureTransaction,
-        "transactions_enriched",
-        layer_dir=gold_dir,
-        filename="transactions_enriched.parquet",
-        sample_validation_size=10_000,
+    return df
+
+
+def transactions_enriched(
+    geocoded_validated: pd.DataFrame,
+    location_dim: pd.DataFrame,
+    rental_yield: pd.DataFrame,
+    raw_macro_data: dict[str, pd.DataFrame],
+    raw_dwelling_units_by_town: pd.DataFrame,
+    raw_hdb_resident_population: pd.DataFrame,
+    raw_median_annual_value: pd.DataFrame,
+    raw_income_by_planning_area: pd.DataFrame,
+    gold_dir: Path,
+    incremental_transactions_enriched: bool = False,
+) -> pd.DataFrame:
+    """Join location_dim onto transactions + merge macro + yield + supply.
+
+    Fast merge: location_dim (10K) → transactions (1M) by (lat, lon),
+    then macro indicators, rental yield, town supply, income, and annual value.
+
+    Output is persisted as ``gold_dir/transactions_enriched/month=YYYY-MM/``
+    partitions. Each month gets a fingerprint of its source rows and of the
+    lookup rows that feed it; with ``incremental_transactions_enriched`` only
+    months whose fingerprint changed are re-enriched and rewritten, and the
+    remaining months are read back from disk.
+    """
+    if geocoded_validated.empty:
+        return pd.DataFrame()
+
+    df = geocoded_validated.copy()
+    require_columns(df, {"lat", "lon", "price"}, "geocoded_validated")
+    df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
+    df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+
+    lookups = {
+        "location_dim": location_dim,
+        "rental_yield": rental_yield,
+        "raw_macro_data": raw_macro_data,
+        "raw_dwelling_units_by_town": raw_dwelling_units_by_town,
+        "raw_hdb_resident_population": raw_hdb_resident_population,
+        "raw_median_annual_value": raw_median_annual_value,
+        "raw_income_by_planning_area": raw_income_by_planning_area,
+    }
+
+    df = ensure_month_column(df)
+    if df.empty:
+        return pd.DataFrame()
+    df["month"] = df["month"].astype(str)
+
+    dataset_dir = gold_dir / _TRANSACTIONS_ENRICHED_DATASET
+    fingerprints = _transaction_partition_fingerprints(df, **lookups)
+    manifest = _read_partition_manifest(dataset_dir) if incremental_transactions_enriched else {}
+    on_disk = set(list_partitions(dataset_dir, "month"))
+
+    changed = sorted(
+        m for m, fp in fingerprints.items() if m not in on_disk or manifest.get(m) != fp
+    )
+    unchanged = sorted(set(fingerprints) - set(changed))
+    stale = sorted(on_disk - set(fingerprints))
+    logger.info(
+        "transactions_enriched: %s/%s month partitions to enrich, %s unchanged, %s stale",
+        len(changed),
+        len(fingerprints),
+        len(unchanged),
+        len(stale),
     )
+    drop_partitions(dataset_dir, "month", [*changed, *stale])
+
+    legacy_path = gold_dir / "transactions_enriched.parquet"
+    if legacy_path.exists():
+        logger.info("Removing superseded monolithic %s", legacy_path.name)
+        legacy_path.unlink()
+
+    enriched = pd.DataFrame()
+    if changed:
+        to_enrich = df if not unchanged else df.loc[df["month"].isin(changed)].copy()
+        enriched = _enrich_transactions(to_enrich, **lookups)
+        enriched = validate_and_quarantine(
+            enriched,
+            HFeatureTransaction,
+            "transactions_enriched",
+            layer_dir=gold_dir,
+            filename=_TRANSACTIONS_ENRICHED_DATASET,
+            partition_col="month",
+        )
 
-    return df
+    written = set(list_partitions(dataset_dir, "month"))
+    _write_partition_manifest(
+        dataset_dir, {m: fp for m, fp in fingerprints.items() if m in written}
+    )
+
+    if not unchanged:
+        return enriched
+    previous = read_partitions(dataset_dir, "month", unchanged)
+    if enriched.empty:
+        return previous
+    return pd.concat([previous, enriched], ignore_index=True)[enriched.columns]
 
 
 def _map_flat_type_for_annual_value(flat_type: str) -> str:
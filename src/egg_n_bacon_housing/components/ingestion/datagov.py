@@ -5,14 +5,19 @@ plus geocoding post-processing nodes for malls and green mark buildings.
 """
 
 import logging
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
-from hamilton.function_modifiers import parameterize, value
+from hamilton.function_modifiers import parameterize, tag, value
 
 from egg_n_bacon_housing.adapters import datagovsg
+from egg_n_bacon_housing.utils.brackets import bracketed_median
 from egg_n_bacon_housing.utils.cache import cached_call
+from egg_n_bacon_housing.utils.execution import DATAGOVSG_HOST, ONEMAP_HOST
 from egg_n_bacon_housing.utils.geocoding import Geocoder
 
 logger = logging.getLogger(__name__)
@@ -48,6 +53,7 @@ MEDIAN_ANNUAL_VALUE_RESOURCE_ID = "d_48143be392f1ed22f0700835212e5a60"
 HDB_RESIDENT_POPULATION_RESOURCE_ID = "d_0a6c6d71f6fa14e2d27e406f1d018439"
 
 
+@tag(source_host=DATAGOVSG_HOST)
 @parameterize(
     raw_rental_index={
         "resource_id": value("d_8e4c50283fb7052a391dfb746a05c853"),
@@ -80,6 +86,7 @@ def raw_dataset(
     cache_filenames: tuple[str, ...],
     display_name: str,
     error_name: str,
+    datagovsg_workers: int = 1,
 ) -> pd.DataFrame:
     cache_paths = [bronze_dir / f for f in cache_filenames]
 
@@ -90,7 +97,10 @@ def raw_dataset(
 
     def _fetch():
         return datagovsg.fetch_datagovsg_dataset(
-            DATAGOVSG_API_BASE_URL, resource_id, use_cache=False
+            DATAGOVSG_API_BASE_URL,
+            resource_id,
+            use_cache=False,
+            max_workers=datagovsg_workers,
         )
 
     df = cached_call(cache_id, _fetch)
@@ -107,9 +117,92 @@ def _hdb_resale_csv_dir(bronze_dir: Path) -> Path:
     return bronze_dir.parent.parent / "manual" / "csv" / "ResaleFlatPrices"
 
 
-def raw_hdb_resale_transactions(bronze_dir: Path) -> pd.DataFrame:
+# Bronze schema for HDB resale: low-cardinality text as dictionary columns
+# (pandas categoricals), int32 years and float32 areas. Columns outside the
+# schema are dropped; columns missing from a source are written as nulls.
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+HDB_RESALE_SCHEMA = pa.schema(
+    [
+        ("month", pa.string()),
+        ("town", _CATEGORY),
+        ("flat_type", _CATEGORY),
+        ("block", pa.string()),
+        ("street_name", pa.string()),
+        ("storey_range", pa.string()),
+        ("floor_area_sqm", pa.float32()),
+        ("flat_model", _CATEGORY),
+        ("lease_commence_date", pa.int32()),
+        ("remaining_lease", pa.string()),
+        ("resale_price", pa.float64()),
+    ]
+)
+_HDB_RESALE_CSV_DTYPES = {
+    field.name: "category" if field.type == _CATEGORY else str
+    for field in HDB_RESALE_SCHEMA
+    if pa.types.is_dictionary(field.type) or pa.types.is_string(field.type)
+}
+_HDB_RESALE_CHUNKSIZE = 100_000
+_HDB_RESALE_API_START_MONTH = "2017-01"
+
+
+def _hdb_resale_table(chunk: pd.DataFrame) -> pa.Table:
+    """Conform one chunk of HDB resale rows to ``HDB_RESALE_SCHEMA``."""
+    chunk = chunk.reindex(columns=HDB_RESALE_SCHEMA.names)
+    for name in ("floor_area_sqm", "lease_commence_date", "resale_price"):
+        chunk[name] = pd.to_numeric(chunk[name], errors="coerce")
+    chunk["lease_commence_date"] = chunk["lease_commence_date"].astype("Int32")
+    for name in ("month", "block", "street_name", "storey_range", "remaining_lease"):
+        chunk[name] = chunk[name].astype("string")
+    chunk = chunk.sort_values("month", kind="stable")
+    return pa.Table.from_pandas(chunk, schema=HDB_RESALE_SCHEMA, preserve_index=False)
+
+
+def _historical_hdb_resale_chunks(csv_dir: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Yield pre-2017 rows from the historical resale CSVs, ``chunksize`` rows at a time."""
+    for csv_path in sorted(csv_dir.glob("*.csv")):
+        rows = 0
+        with pd.read_csv(
+            csv_path,
+            chunksize=chunksize,
+            dtype=_HDB_RESALE_CSV_DTYPES,
+            usecols=lambda col: col in HDB_RESALE_SCHEMA.names,
+        ) as reader:
+            for chunk in reader:
+                chunk = chunk[chunk["month"] < _HDB_RESALE_API_START_MONTH]
+                if not chunk.empty:
+                    rows += len(chunk)
+                    yield chunk
+        logger.info("Loaded %s historical rows from %s", rows, csv_path.name)
+
+
+def _write_hdb_resale_parquet(
+    path: Path,
+    chunks: Iterable[pd.DataFrame],
+) -> int:
+    """Stream ``chunks`` into ``path`` one row group per chunk; return rows written.
+
+    Writes to a temporary file first so an interrupted run never leaves a
+    truncated parquet that the bronze cache check would pick up.
+    """
+    tmp_path = path.with_suffix(".parquet.tmp")
+    rows = 0
+    with pq.ParquetWriter(tmp_path, HDB_RESALE_SCHEMA) as writer:
+        for chunk in chunks:
+            writer.write_table(_hdb_resale_table(chunk))
+            rows += len(chunk)
+    tmp_path.replace(path)
+    return rows
+
+
+@tag(source_host=DATAGOVSG_HOST)
+def raw_hdb_resale_transactions(bronze_dir: Path, datagovsg_workers: int = 1) -> pd.DataFrame:
     """Fetch HDB resale transactions from data.gov.sg API (Jan 2017+) merged with
     historical CSVs (1990–2016) for full coverage.
+
+    API pages are fetched ``datagovsg_workers`` at a time (1: serial).
+    Historical CSVs are streamed in chunks straight into the bronze parquet
+    (see ``HDB_RESALE_SCHEMA``), so ingest memory does not grow with the
+    amount of history on disk.
     """
     cache_paths = [bronze_dir / "raw_hdb_resale.parquet"]
 
@@ -119,7 +212,10 @@ def raw_hdb_resale_transactions(bronze_dir: Path) -> pd.DataFrame:
             return pd.read_parquet(cache_path)
 
     api_df = datagovsg.fetch_datagovsg_dataset(
-        DATAGOVSG_API_BASE_URL, HDB_RESALE_RESOURCE_ID, use_cache=False
+        DATAGOVSG_API_BASE_URL,
+        HDB_RESALE_RESOURCE_ID,
+        use_cache=False,
+        max_workers=datagovsg_workers,
     )
     if api_df is None or api_df.empty:
         raise RuntimeError("Core dataset fetch failed: hdb_resale")
@@ -127,40 +223,26 @@ def raw_hdb_resale_transactions(bronze_dir: Path) -> pd.DataFrame:
     logger.info("Fetched %s HDB resale records from API (Jan 2017+)", len(api_df))
 
     csv_dir = _hdb_resale_csv_dir(bronze_dir)
-    historical_dfs: list[pd.DataFrame] = []
-    if csv_dir.exists():
-        for csv_path in sorted(csv_dir.glob("*.csv")):
-            df = pd.read_csv(csv_path)
-            historical_dfs.append(df)
-            logger.info("Loaded %s rows from %s", len(df), csv_path.name)
-
-    if historical_dfs:
-        hist_df = pd.concat(historical_dfs, ignore_index=True)
-        hist_df = hist_df[hist_df["month"] < "2017-01"]
-        logger.info("Loaded %s historical HDB resale records (pre-2017)", len(hist_df))
-        combined = pd.concat([hist_df, api_df], ignore_index=True)
-    else:
+    if not (csv_dir.exists() and any(csv_dir.glob("*.csv"))):
         logger.warning("No historical HDB resale CSVs found — API data only (2017+)")
-        combined = api_df
 
-    for col in ("floor_area_sqm", "lease_commence_date", "resale_price"):
-        if col in combined.columns:
-            combined[col] = pd.to_numeric(combined[col], errors="coerce")
-
-    if "remaining_lease" in combined.columns:
-        combined["remaining_lease"] = combined["remaining_lease"].astype(str)
-
-    if "_id" in combined.columns:
-        combined = combined.drop(columns=["_id"])
-
-    combined = combined.sort_values("month").reset_index(drop=True)
+    def _chunks() -> Iterator[pd.DataFrame]:
+        if csv_dir.exists():
+            yield from _historical_hdb_resale_chunks(csv_dir, _HDB_RESALE_CHUNKSIZE)
+        for start in range(0, len(api_df), _HDB_RESALE_CHUNKSIZE):
+            yield api_df.iloc[start : start + _HDB_RESALE_CHUNKSIZE]
 
     bronze_dir.mkdir(parents=True, exist_ok=True)
-    combined.to_parquet(cache_paths[0], index=False)
-    logger.info("Saved %s HDB resale records to bronze", len(combined))
+    rows = _write_hdb_resale_parquet(cache_paths[0], _chunks())
+    logger.info("Saved %s HDB resale records to bronze", rows)
+
+    combined = pd.read_parquet(cache_paths[0])
+    if not combined["month"].is_monotonic_increasing:
+        combined = combined.sort_values("month", kind="stable").reset_index(drop=True)
     return combined
 
 
+@tag(source_host=DATAGOVSG_HOST)
 def raw_hdb_property_info(bronze_dir: Path) -> pd.DataFrame:
     """Fetch HDB Property Information from data.gov.sg (13K+ blocks)."""
     cache_path = bronze_dir / "raw_hdb_property_info.parquet"
@@ -202,6 +284,7 @@ def _income_bracket_midpoints() -> list[tuple[str, float]]:
     ]
 
 
+@tag(source_host=DATAGOVSG_HOST)
 def raw_income_by_planning_area(bronze_dir: Path) -> pd.DataFrame:
     """Fetch resident working persons income distribution by planning area."""
     cache_path = bronze_dir / "raw_income_by_planning_area.parquet"
@@ -224,27 +307,7 @@ def raw_income_by_planning_area(bronze_dir: Path) -> pd.DataFrame:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors="coerce")
 
-    def _weighted_median(row: pd.Series) -> float:
-        total = 0.0
-        cumulative = 0.0
-        weights = []
-        midpoints = []
-        for col, mid in brackets:
-            if col in row.index and pd.notna(row[col]):
-                w = float(row[col])
-                total += w
-                weights.append(w)
-                midpoints.append(mid)
-        if total == 0 or not weights:
-            return pd.NA
-        half = total / 2
-        for w, mid in zip(weights, midpoints, strict=True):
-            cumulative += w
-            if cumulative >= half:
-                return mid
-        return midpoints[-1]
-
-    df["median_monthly_income"] = df.apply(_weighted_median, axis=1)
+    df["median_monthly_income"] = bracketed_median(df, brackets)
     df["planning_area"] = df["planning_area"].astype(str).str.strip()
 
     bronze_dir.mkdir(parents=True, exist_ok=True)
@@ -253,6 +316,7 @@ def raw_income_by_planning_area(bronze_dir: Path) -> pd.DataFrame:
     return df
 
 
+@tag(source_host=DATAGOVSG_HOST)
 def raw_green_mark_buildings(bronze_dir: Path) -> pd.DataFrame:
     """Fetch BCA Green Mark certified buildings from data.gov.sg (CSV)."""
     cache_path = bronze_dir / "raw_green_mark_buildings.parquet"
@@ -276,6 +340,7 @@ def raw_green_mark_buildings(bronze_dir: Path) -> pd.DataFrame:
     return df
 
 
+@tag(source_host=ONEMAP_HOST)
 def geocoded_green_mark_buildings(
     bronze_dir: Path,
     raw_green_mark_buildings: pd.DataFrame,
@@ -312,6 +377,7 @@ def geocoded_green_mark_buildings(
     return df
 
 
+@tag(source_host=DATAGOVSG_HOST)
 def raw_dwelling_units_by_town(bronze_dir: Path) -> pd.DataFrame:
     """Fetch dwelling units under HDB management by town and flat type."""
     cache_path = bronze_dir / "raw_dwelling_units_by_town.parquet"
@@ -332,6 +398,7 @@ def raw_dwelling_units_by_town(bronze_dir: Path) -> pd.DataFrame:
     return df
 
 
+@tag(source_host=DATAGOVSG_HOST)
 def raw_median_annual_value(bronze_dir: Path) -> pd.DataFrame:
     """Fetch median annual value and property tax by HDB flat type from IRAS."""
     cache_path = bronze_dir / "raw_median_annual_value.parquet"
@@ -352,6 +419,7 @@ def raw_median_annual_value(bronze_dir: Path) -> pd.DataFrame:
     return df
 
 
+@tag(source_host=DATAGOVSG_HOST)
 def raw_hdb_resident_population(bronze_dir: Path) -> pd.DataFrame:
     """Fetch HDB resident population by geographical distribution (town/estate)."""
     cache_path = bronze_dir / "raw_hdb_resident_population.parquet"
@@ -406,6 +474,7 @@ def _standardize_geocoded_mall_columns(malls_df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+@tag(source_host=ONEMAP_HOST)
 def raw_shopping_malls(bronze_dir: Path, geocoder: Geocoder) -> pd.DataFrame:
     """Load shopping mall data from bronze layer."""
     raw_path, geocoded_path = _mall_cache_paths(bronze_dir)
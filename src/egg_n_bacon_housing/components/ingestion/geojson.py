@@ -4,8 +4,15 @@ import json
 import logging
 from pathlib import Path
 
-import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from egg_n_bacon_housing.utils.geometry_store import (
+    VERTEX_LAT_COLUMN,
+    VERTEX_LON_COLUMN,
+    load_geometry_table,
+    property_values,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,16 +30,19 @@ __all__ = [
 ]
 
 
-def _flatten_coord(coords: list) -> list[list[float]]:
-    """Recursively flatten nested coordinate lists into [lon, lat] pairs."""
-    if not coords:
-        return []
-    if isinstance(coords[0], int | float):
-        return [coords[:2]]
-    result = []
-    for item in coords:
-        result.extend(_flatten_coord(item))
-    return result
+def _feature_points(table: pa.Table) -> pd.DataFrame:
+    """``lat``/``lon`` of every feature with a location, indexed by feature.
+
+    Points keep their coordinates; other geometries use the mean of their
+    vertices (precomputed in the geometry store).
+    """
+    df = pd.DataFrame(
+        {
+            "lat": table.column(VERTEX_LAT_COLUMN).to_numpy(zero_copy_only=False),
+            "lon": table.column(VERTEX_LON_COLUMN).to_numpy(zero_copy_only=False),
+        }
+    )
+    return df[df["lat"].fillna(0).ne(0) & df["lon"].fillna(0).ne(0)]
 
 
 def _load_geojson_amenities(
@@ -41,72 +51,35 @@ def _load_geojson_amenities(
     """Load amenity locations from a GeoJSON file into a DataFrame.
 
     Handles both Point (direct coords) and Polygon (centroid) geometries.
+    The file is read through the cached geometry store.
     """
     if not geojson_path.exists():
         logger.warning("%s GeoJSON not found: %s", amenity_type, geojson_path)
         return pd.DataFrame()
 
-    with open(geojson_path, encoding="utf-8", errors="replace") as f:
-        data = json.load(f)
-
-    rows: list[dict] = []
-    for feature in data.get("features", []):
-        props = feature.get("properties", {})
-        geom = feature.get("geometry", {})
-        geom_type = geom.get("type", "")
-        coords = geom.get("coordinates", [])
-
-        name = ""
-        for prop_name in name_props:
-            val = props.get(prop_name)
-            if val and str(val).strip():
-                name = str(val).strip()
-                break
-
-        lat, lon = None, None
-        if geom_type == "Point":
-            lon, lat = coords[0], coords[1]
-        elif coords:
-            flat = _flatten_coord(coords)
-            if flat:
-                lon = float(np.mean([c[0] for c in flat]))
-                lat = float(np.mean([c[1] for c in flat]))
-
-        if lat and lon:
-            rows.append({"name": name, "lat": lat, "lon": lon, "amenity_type": amenity_type})
+    table = load_geometry_table(geojson_path, [*name_props, VERTEX_LON_COLUMN, VERTEX_LAT_COLUMN])
+    candidates = [property_values(table, prop) for prop in name_props]
+    names = [
+        next((str(v).strip() for v in values if v and str(v).strip()), "")
+        for values in zip(*candidates, strict=True)
+    ]
+    rows = _feature_points(table)
+    rows.insert(0, "name", [names[i] for i in rows.index])
 
     logger.info("Loaded %s %s locations", len(rows), amenity_type)
-    return pd.DataFrame(rows)
+    if rows.empty:
+        return pd.DataFrame()
+    return rows.assign(amenity_type=amenity_type).reset_index(drop=True)
 
 
 def _load_mrt_geojson(geojson_path: Path) -> pd.DataFrame:
     """Load MRT station centroids from GeoJSON."""
-    with open(geojson_path) as f:
-        data = json.load(f)
-
-    rows = []
-    for feature in data.get("features", []):
-        props = feature.get("properties", {})
-        geom = feature.get("geometry", {})
-        name = props.get("NAME", "")
-        geom_type = geom.get("type", "")
-        coords = geom.get("coordinates", [])
-
-        lat, lon = None, None
-        if geom_type == "Point":
-            lon, lat = coords[0], coords[1]
-        elif coords:
-            flat = _flatten_coord(coords)
-            if flat:
-                lons = [c[0] for c in flat]
-                lats = [c[1] for c in flat]
-                lon = float(np.mean(lons))
-                lat = float(np.mean(lats))
-
-        if name and lat and lon:
-            rows.append({"name": name, "lat": lat, "lon": lon})
-
-    return pd.DataFrame(rows)
+    table = load_geometry_table(geojson_path, ["NAME", VERTEX_LON_COLUMN, VERTEX_LAT_COLUMN])
+    names = pd.Series(property_values(table, "NAME"), dtype=object)
+    rows = _feature_points(table)
+    rows.insert(0, "name", names[rows.index])
+    rows = rows[[bool(name) for name in rows["name"]]]
+    return rows.reset_index(drop=True) if not rows.empty else pd.DataFrame()
 
 
 def raw_mrt_stations(bronze_dir: Path) -> pd.DataFrame:
@@ -2,17 +2,26 @@
 
 Fetches CPI, GDP, unemployment, bank rates, HDB RPI, URA PPI, supply pipeline,
 and wage growth from data.gov.sg pivot tables and melts them to long format.
+Each indicator is declared once in ``MACRO_INDICATORS``; the ones missing from
+bronze/external are fetched concurrently.
 SORA is loaded from a pre-built parquet in bronze/external.
 """
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
+from hamilton.function_modifiers import tag
 
 from egg_n_bacon_housing.adapters import datagovsg
 from egg_n_bacon_housing.adapters.exceptions import DatasetFetchError
+from egg_n_bacon_housing.utils.execution import DATAGOVSG_HOST
+from egg_n_bacon_housing.utils.time_index import parse_periods
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +58,7 @@ def _melt_pivot_monthly(df: pd.DataFrame, value_filter: str, value_col: str) ->
     label_col = "DataSeries" if "DataSeries" in df.columns else df.columns[1]
     melted = df.melt(id_vars=[label_col], var_name="period", value_name=value_col)
     melted = melted[melted[label_col].astype(str).str.strip() == value_filter]
-    melted["date"] = pd.to_datetime(melted["period"], format="%Y%b", errors="coerce")
+    melted["date"] = parse_periods(melted["period"], freq="M")
     melted[value_col] = pd.to_numeric(melted[value_col], errors="coerce")
     return (
         melted[["date", value_col]]
@@ -65,26 +74,7 @@ def _melt_pivot_quarterly(df: pd.DataFrame, value_filter: str, value_col: str) -
     melted = df.melt(id_vars=[label_col], var_name="period", value_name=value_col)
     melted = melted[melted[label_col].astype(str).str.strip() == value_filter]
     melted[value_col] = pd.to_numeric(melted[value_col], errors="coerce")
-
-    def _parse_quarter(p: str) -> pd.Timestamp | None:
-        p = str(p)
-        if len(p) >= 5 and p[-1] == "Q":
-            try:
-                year = int(p[:-2])
-                qtr = int(p[-2])
-                return pd.Timestamp(year=year, month=qtr * 3, day=1) + pd.offsets.QuarterEnd(0)
-            except (ValueError, IndexError):
-                return None
-        if len(p) >= 6 and p[4] == "Q":
-            try:
-                year = int(p[:4])
-                qtr = int(p[5])
-                return pd.Timestamp(year=year, month=qtr * 3, day=1) + pd.offsets.QuarterEnd(0)
-            except (ValueError, IndexError):
-                return None
-        return None
-
-    melted["quarter"] = melted["period"].apply(_parse_quarter)
+    melted["quarter"] = parse_periods(melted["period"], freq="Q")
     return (
         melted[["quarter", value_col]]
         .dropna(subset=["quarter"])
@@ -95,27 +85,198 @@ def _melt_pivot_quarterly(df: pd.DataFrame, value_filter: str, value_col: str) -
 
 def _parse_datagov_quarter(series: pd.Series) -> pd.Series:
     """Parse data.gov.sg quarter strings into quarter-end timestamps."""
-    series_str = series.astype(str).str.strip()
-    parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+    return parse_periods(series, freq="Q")
 
-    def _quarter_end(year: int, quarter: int) -> pd.Timestamp:
-        return pd.Timestamp(year=year, month=quarter * 3, day=1) + pd.offsets.QuarterEnd(0)
 
-    for idx, quarter_text in series_str.items():
-        try:
-            if len(quarter_text) == 6 and quarter_text.endswith("Q"):
-                parsed.at[idx] = _quarter_end(int(quarter_text[:4]), int(quarter_text[4]))
-            elif len(quarter_text) == 6 and quarter_text[4] == "Q":
-                parsed.at[idx] = _quarter_end(int(quarter_text[:4]), int(quarter_text[5]))
-        except (ValueError, IndexError):
-            continue
+def _cpi(raw: pd.DataFrame) -> pd.DataFrame:
+    return _melt_pivot_monthly(raw, "All Items", "cpi")
+
+
+def _unemployment(raw: pd.DataFrame) -> pd.DataFrame:
+    return _melt_pivot_quarterly(raw, "Total Unemployment Rate", "unemployment_rate")
+
+
+def _gdp(raw: pd.DataFrame) -> pd.DataFrame:
+    gdp = _melt_pivot_quarterly(raw, "GDP In Chained (2015) Dollars", "gdp")
+    if gdp.empty:
+        label_col = "DataSeries" if "DataSeries" in raw.columns else raw.columns[1]
+        first_series = str(raw.iloc[0][label_col]).strip()
+        gdp = _melt_pivot_quarterly(raw, first_series, "gdp")
+    return gdp
+
+
+def _bank_rates(raw: pd.DataFrame) -> pd.DataFrame:
+    return _melt_pivot_monthly(
+        raw, "Compounded Singapore Overnight Rate Average (SORA) - 3 Month", "sora_3m"
+    )
+
 
-    return parsed
+def _hdb_rpi(raw: pd.DataFrame) -> pd.DataFrame:
+    rpi = raw[["quarter", "index"]].copy()
+    rpi["index"] = pd.to_numeric(rpi["index"], errors="coerce")
+    rpi = rpi.dropna(subset=["index"])
+    rpi["quarter"] = _parse_datagov_quarter(rpi["quarter"])
+    rpi = rpi.dropna(subset=["quarter"]).sort_values("quarter").reset_index(drop=True)
+    return rpi.rename(columns={"index": "hdb_rpi"})
+
+
+def _ura_ppi(raw: pd.DataFrame) -> pd.DataFrame:
+    ppi = raw[raw["property_type"].astype(str).str.strip() == "All Residential"].copy()
+    ppi["index"] = pd.to_numeric(ppi["index"], errors="coerce")
+    ppi = ppi.dropna(subset=["index"])
+    ppi["quarter"] = _parse_datagov_quarter(ppi["quarter"])
+    ppi = ppi.dropna(subset=["quarter"]).sort_values("quarter").reset_index(drop=True)
+    return ppi[["quarter", "index"]].rename(columns={"index": "ura_ppi"})
+
+
+def _supply_pipeline(raw: pd.DataFrame) -> pd.DataFrame:
+    supply = raw.copy()
+    supply["no_of_units"] = pd.to_numeric(supply["no_of_units"], errors="coerce")
+    supply["quarter"] = _parse_datagov_quarter(supply["quarter"])
+    supply = supply.dropna(subset=["quarter", "no_of_units"])
+    return supply.sort_values("quarter").reset_index(drop=True)
+
+
+def _wage_growth(raw: pd.DataFrame) -> pd.DataFrame:
+    label_col = "DataSeries" if "DataSeries" in raw.columns else raw.columns[-1]
+    melted = raw.melt(id_vars=[label_col], var_name="year", value_name="wage_growth")
+    melted = melted[melted[label_col].astype(str).str.strip() == "Overall Economy"]
+    melted["wage_growth"] = pd.to_numeric(melted["wage_growth"], errors="coerce")
+    melted["year"] = pd.to_numeric(melted["year"], errors="coerce")
+    melted = melted.dropna(subset=["year", "wage_growth"])
+
+    # Each annual figure applies to all four quarters of its year.
+    quarterly = melted.loc[melted.index.repeat(4), ["year", "wage_growth"]]
+    quarter_labels = (
+        quarterly["year"].astype(int).astype(str) + "Q" + np.tile(["1", "2", "3", "4"], len(melted))
+    )
+    quarterly["quarter"] = parse_periods(quarter_labels, freq="Q")
+    return quarterly[["quarter", "wage_growth"]].sort_values("quarter").reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class MacroIndicator:
+    """A data.gov.sg table cached as one parquet file in bronze/external.
+
+    Attributes:
+        key: Key in the ``raw_macro_data`` result (and in failure messages).
+        label: Human-readable name for log lines.
+        resource_id: data.gov.sg resource id.
+        transform: Turns the fetched table into the long-format indicator.
+        filename: Parquet file under bronze/external.
+        refetch_empty: Treat an empty cached file as missing.
+    """
+
+    key: str
+    label: str
+    resource_id: str
+    transform: Callable[[pd.DataFrame], pd.DataFrame]
+    filename: str
+    refetch_empty: bool = False
+
+
+MACRO_INDICATORS: tuple[MacroIndicator, ...] = (
+    MacroIndicator("cpi", "CPI", CPI_RESOURCE_ID, _cpi, "cpi.parquet"),
+    MacroIndicator(
+        "unemployment",
+        "unemployment",
+        UNEMPLOYMENT_RESOURCE_ID,
+        _unemployment,
+        "unemployment.parquet",
+    ),
+    MacroIndicator("gdp", "GDP", GDP_RESOURCE_ID, _gdp, "gdp.parquet"),
+    MacroIndicator(
+        "bank_rates",
+        "bank interest rates (SORA 3M)",
+        BANK_RATES_RESOURCE_ID,
+        _bank_rates,
+        "bank_rates.parquet",
+    ),
+    MacroIndicator(
+        "hdb_rpi", "HDB Resale Price Index", HDB_RPI_RESOURCE_ID, _hdb_rpi, "hdb_rpi.parquet"
+    ),
+    MacroIndicator(
+        "ura_ppi", "URA Property Price Index", URA_PPI_RESOURCE_ID, _ura_ppi, "ura_ppi.parquet"
+    ),
+    MacroIndicator(
+        "supply_pipeline",
+        "private housing supply pipeline",
+        SUPPLY_PIPELINE_RESOURCE_ID,
+        _supply_pipeline,
+        "supply_pipeline.parquet",
+    ),
+    MacroIndicator(
+        "wage_growth",
+        "wage growth",
+        WAGE_GROWTH_RESOURCE_ID,
+        _wage_growth,
+        "wage_growth.parquet",
+        refetch_empty=True,
+    ),
+)
+
+
+def _load_cached_indicator(indicator: MacroIndicator, path: Path) -> pd.DataFrame | None:
+    """The indicator's bronze parquet, or None if it has to be fetched."""
+    if not path.exists():
+        return None
+    df = pd.read_parquet(path)
+    if indicator.refetch_empty and df.empty:
+        path.unlink()
+        return None
+    return df
 
 
-def raw_macro_data(bronze_dir: Path) -> dict[str, pd.DataFrame]:
+def _fetch_indicator(indicator: MacroIndicator, path: Path) -> pd.DataFrame:
+    """Fetch, transform and cache one indicator."""
+    logger.info("Fetching %s from data.gov.sg...", indicator.label)
+    raw = datagovsg.fetch_datagovsg_dataset(
+        DATAGOVSG_API_BASE_URL, indicator.resource_id, use_cache=False
+    )
+    df = indicator.transform(raw)
+    df.to_parquet(path, index=False)
+    logger.info("Fetched %s: %s records -> %s", indicator.label, len(df), path)
+    return df
+
+
+def _fetch_indicators(
+    pending: list[tuple[MacroIndicator, Path]], max_workers: int
+) -> dict[str, pd.DataFrame | BaseException]:
+    """Fetch indicators concurrently; expected fetch errors are returned per key.
+
+    Any other exception cancels the fetches not yet started and propagates.
+    """
+    outcomes: dict[str, pd.DataFrame | BaseException] = {}
+    if not pending:
+        return outcomes
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as pool:
+        futures = {
+            pool.submit(_fetch_indicator, indicator, path): indicator.key
+            for indicator, path in pending
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    outcomes[futures[future]] = future.result()
+                except _RETRIEVABLE_EXCEPTIONS as exc:
+                    outcomes[futures[future]] = exc
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+    return outcomes
+
+
+@tag(source_host=DATAGOVSG_HOST)
+def raw_macro_data(bronze_dir: Path, datagovsg_workers: int = 1) -> dict[str, pd.DataFrame]:
     """Fetch and load macro economic indicators from data.gov.sg API + local SORA.
 
+    Indicators without a bronze parquet (see ``MACRO_INDICATORS``) are fetched
+    ``datagovsg_workers`` at a time. Their requests draw on the data.gov.sg
+    budget shared with every other node (``datagovsg.configure``), so a 429
+    pauses all of them and the per-host cap still holds. An indicator
+    whose fetch fails with an expected data error degrades to an empty frame
+    and is named in one summary warning.
+
     Returns:
         Dictionary with keys: 'sora', 'cpi', 'gdp', 'unemployment',
         'bank_rates', 'hdb_rpi', 'ura_ppi', 'supply_pipeline', 'wage_growth'.
@@ -133,195 +294,23 @@ def raw_macro_data(bronze_dir: Path) -> dict[str, pd.DataFrame]:
         logger.warning("SORA data not found in bronze/external")
         result["sora"] = pd.DataFrame()
 
-    cpi_path = external_dir / "cpi.parquet"
-    if cpi_path.exists():
-        result["cpi"] = pd.read_parquet(cpi_path)
-    else:
-        try:
-            logger.info("Fetching CPI from data.gov.sg...")
-            raw = datagovsg.fetch_datagovsg_dataset(
-                DATAGOVSG_API_BASE_URL, CPI_RESOURCE_ID, use_cache=False
-            )
-            result["cpi"] = _melt_pivot_monthly(raw, "All Items", "cpi")
-            result["cpi"].to_parquet(cpi_path, index=False)
-            logger.info("Fetched CPI: %s records -> %s", len(result["cpi"]), cpi_path)
-        except _RETRIEVABLE_EXCEPTIONS as exc:
-            failures.append(f"cpi: {exc.__class__.__name__}: {exc}")
-            result["cpi"] = pd.DataFrame()
-
-    unemployment_path = external_dir / "unemployment.parquet"
-    if unemployment_path.exists():
-        result["unemployment"] = pd.read_parquet(unemployment_path)
-    else:
-        try:
-            logger.info("Fetching unemployment from data.gov.sg...")
-            raw = datagovsg.fetch_datagovsg_dataset(
-                DATAGOVSG_API_BASE_URL, UNEMPLOYMENT_RESOURCE_ID, use_cache=False
-            )
-            result["unemployment"] = _melt_pivot_quarterly(
-                raw, "Total Unemployment Rate", "unemployment_rate"
-            )
-            result["unemployment"].to_parquet(unemployment_path, index=False)
-            logger.info(
-                "Fetched unemployment: %s records -> %s",
-                len(result["unemployment"]),
-                unemployment_path,
-            )
-        except _RETRIEVABLE_EXCEPTIONS as exc:
-            failures.append(f"unemployment: {exc.__class__.__name__}: {exc}")
-            result["unemployment"] = pd.DataFrame()
-
-    gdp_path = external_dir / "gdp.parquet"
-    if gdp_path.exists():
-        result["gdp"] = pd.read_parquet(gdp_path)
-    else:
-        try:
-            logger.info("Fetching GDP from data.gov.sg...")
-            raw = datagovsg.fetch_datagovsg_dataset(
-                DATAGOVSG_API_BASE_URL, GDP_RESOURCE_ID, use_cache=False
-            )
-            result["gdp"] = _melt_pivot_quarterly(raw, "GDP In Chained (2015) Dollars", "gdp")
-            if result["gdp"].empty:
-                label_col = "DataSeries" if "DataSeries" in raw.columns else raw.columns[1]
-                first_series = str(raw.iloc[0][label_col]).strip()
-                result["gdp"] = _melt_pivot_quarterly(raw, first_series, "gdp")
-            result["gdp"].to_parquet(gdp_path, index=False)
-            logger.info("Fetched GDP: %s records -> %s", len(result["gdp"]), gdp_path)
-        except _RETRIEVABLE_EXCEPTIONS as exc:
-            failures.append(f"gdp: {exc.__class__.__name__}: {exc}")
-            result["gdp"] = pd.DataFrame()
-
-    bank_rates_path = external_dir / "bank_rates.parquet"
-    if bank_rates_path.exists():
-        result["bank_rates"] = pd.read_parquet(bank_rates_path)
-    else:
-        try:
-            logger.info("Fetching bank interest rates from data.gov.sg...")
-            raw = datagovsg.fetch_datagovsg_dataset(
-                DATAGOVSG_API_BASE_URL, BANK_RATES_RESOURCE_ID, use_cache=False
-            )
-            result["bank_rates"] = _melt_pivot_monthly(
-                raw, "Compounded Singapore Overnight Rate Average (SORA) - 3 Month", "sora_3m"
-            )
-            result["bank_rates"].to_parquet(bank_rates_path, index=False)
-            logger.info(
-                "Fetched bank rates (SORA 3M): %s records -> %s",
-                len(result["bank_rates"]),
-                bank_rates_path,
-            )
-        except _RETRIEVABLE_EXCEPTIONS as exc:
-            failures.append(f"bank_rates: {exc.__class__.__name__}: {exc}")
-            result["bank_rates"] = pd.DataFrame()
-
-    hdb_rpi_path = external_dir / "hdb_rpi.parquet"
-    if hdb_rpi_path.exists():
-        result["hdb_rpi"] = pd.read_parquet(hdb_rpi_path)
-    else:
-        try:
-            logger.info("Fetching HDB Resale Price Index from data.gov.sg...")
-            raw = datagovsg.fetch_datagovsg_dataset(
-                DATAGOVSG_API_BASE_URL, HDB_RPI_RESOURCE_ID, use_cache=False
-            )
-            rpi = raw[["quarter", "index"]].copy()
-            rpi["index"] = pd.to_numeric(rpi["index"], errors="coerce")
-            rpi = rpi.dropna(subset=["index"])
-            rpi["quarter"] = _parse_datagov_quarter(rpi["quarter"])
-            rpi = rpi.dropna(subset=["quarter"]).sort_values("quarter").reset_index(drop=True)
-            result["hdb_rpi"] = rpi.rename(columns={"index": "hdb_rpi"})
-            result["hdb_rpi"].to_parquet(hdb_rpi_path, index=False)
-            logger.info("Fetched HDB RPI: %s records -> %s", len(result["hdb_rpi"]), hdb_rpi_path)
-        except _RETRIEVABLE_EXCEPTIONS as exc:
-            failures.append(f"hdb_rpi: {exc.__class__.__name__}: {exc}")
-            result["hdb_rpi"] = pd.DataFrame()
-
-    ura_ppi_path = external_dir / "ura_ppi.parquet"
-    if ura_ppi_path.exists():
-        result["ura_ppi"] = pd.read_parquet(ura_ppi_path)
-    else:
-        try:
-            logger.info("Fetching URA Property Price Index from data.gov.sg...")
-            raw = datagovsg.fetch_datagovsg_dataset(
-                DATAGOVSG_API_BASE_URL, URA_PPI_RESOURCE_ID, use_cache=False
-            )
-            ppi = raw[raw["property_type"].astype(str).str.strip() == "All Residential"].copy()
-            ppi["index"] = pd.to_numeric(ppi["index"], errors="coerce")
-            ppi = ppi.dropna(subset=["index"])
-            ppi["quarter"] = _parse_datagov_quarter(ppi["quarter"])
-            ppi = ppi.dropna(subset=["quarter"]).sort_values("quarter").reset_index(drop=True)
-            result["ura_ppi"] = ppi[["quarter", "index"]].rename(columns={"index": "ura_ppi"})
-            result["ura_ppi"].to_parquet(ura_ppi_path, index=False)
-            logger.info("Fetched URA PPI: %s records -> %s", len(result["ura_ppi"]), ura_ppi_path)
-        except _RETRIEVABLE_EXCEPTIONS as exc:
-            failures.append(f"ura_ppi: {exc.__class__.__name__}: {exc}")
-            result["ura_ppi"] = pd.DataFrame()
-
-    supply_path = external_dir / "supply_pipeline.parquet"
-    if supply_path.exists():
-        result["supply_pipeline"] = pd.read_parquet(supply_path)
-    else:
-        try:
-            logger.info("Fetching private housing supply pipeline from data.gov.sg...")
-            raw = datagovsg.fetch_datagovsg_dataset(
-                DATAGOVSG_API_BASE_URL, SUPPLY_PIPELINE_RESOURCE_ID, use_cache=False
-            )
-            supply = raw.copy()
-            supply["no_of_units"] = pd.to_numeric(supply["no_of_units"], errors="coerce")
-            supply["quarter"] = _parse_datagov_quarter(supply["quarter"])
-            supply = supply.dropna(subset=["quarter", "no_of_units"])
-            supply = supply.dropna(subset=["quarter"]).sort_values("quarter").reset_index(drop=True)
-            result["supply_pipeline"] = supply
-            result["supply_pipeline"].to_parquet(supply_path, index=False)
-            logger.info(
-                "Fetched supply pipeline: %s records -> %s",
-                len(result["supply_pipeline"]),
-                supply_path,
-            )
-        except _RETRIEVABLE_EXCEPTIONS as exc:
-            failures.append(f"supply_pipeline: {exc.__class__.__name__}: {exc}")
-            result["supply_pipeline"] = pd.DataFrame()
-
-    wage_path = external_dir / "wage_growth.parquet"
-    if wage_path.exists():
-        result["wage_growth"] = pd.read_parquet(wage_path)
-        if result["wage_growth"].empty:
-            wage_path.unlink()
-    if "wage_growth" not in result or result["wage_growth"].empty:
-        try:
-            logger.info("Fetching wage growth from data.gov.sg...")
-            raw = datagovsg.fetch_datagovsg_dataset(
-                DATAGOVSG_API_BASE_URL, WAGE_GROWTH_RESOURCE_ID, use_cache=False
-            )
-            label_col = "DataSeries" if "DataSeries" in raw.columns else raw.columns[-1]
-            melted = raw.melt(id_vars=[label_col], var_name="year", value_name="wage_growth")
-            melted = melted[melted[label_col].astype(str).str.strip() == "Overall Economy"]
-            melted["wage_growth"] = pd.to_numeric(melted["wage_growth"], errors="coerce")
-            melted["year"] = pd.to_numeric(melted["year"], errors="coerce")
-            melted = melted.dropna(subset=["year", "wage_growth"])
-
-            quarterly_rows = []
-            for _, row in melted.iterrows():
-                year = int(row["year"])
-                for q in range(1, 5):
-                    quarter_date = pd.Timestamp(
-                        year=year, month=q * 3, day=1
-                    ) + pd.offsets.QuarterEnd(0)
-                    quarterly_rows.append(
-                        {"quarter": quarter_date, "wage_growth": row["wage_growth"]}
-                    )
-            result["wage_growth"] = (
-                pd.DataFrame(quarterly_rows).sort_values("quarter").reset_index(drop=True)
-            )
-
-            result["wage_growth"].to_parquet(wage_path, index=False)
-            logger.info(
-                "Fetched wage growth: %s annual records -> %s quarterly -> %s",
-                len(melted),
-                len(result["wage_growth"]),
-                wage_path,
-            )
-        except _RETRIEVABLE_EXCEPTIONS as exc:
-            failures.append(f"wage_growth: {exc.__class__.__name__}: {exc}")
-            result["wage_growth"] = pd.DataFrame()
+    cached: dict[str, pd.DataFrame] = {}
+    pending: list[tuple[MacroIndicator, Path]] = []
+    for indicator in MACRO_INDICATORS:
+        path = external_dir / indicator.filename
+        df = _load_cached_indicator(indicator, path)
+        if df is None:
+            pending.append((indicator, path))
+        else:
+            cached[indicator.key] = df
+
+    fetched = _fetch_indicators(pending, datagovsg_workers)
+    for indicator in MACRO_INDICATORS:
+        outcome = cached.get(indicator.key, fetched.get(indicator.key))
+        if isinstance(outcome, BaseException):
+            failures.append(f"{indicator.key}: {outcome.__class__.__name__}: {outcome}")
+            outcome = pd.DataFrame()
+        result[indicator.key] = outcome
 
     if failures:
         logger.warning(
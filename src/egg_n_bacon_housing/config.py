@@ -5,17 +5,36 @@ from pathlib import Path
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from egg_n_bacon_housing.utils.cache import DEFAULT_MEMORY_CACHE_MB
+
 
 class PipelineConfig(BaseSettings):
     parquet_compression: str = "snappy"
     use_caching: bool = True
     cache_duration_hours: int = 24
     allow_legacy_pickle_cache: bool = False
+    cache_backend: str = "file"
+    memory_cache_mb: float = DEFAULT_MEMORY_CACHE_MB
+    incremental_location_dim: bool = False
+    incremental_transactions_enriched: bool = False
+    profile_nodes: bool = False
+    ingest_workers: int = 1
+    datagovsg_workers: int = 1
+    validation_workers: int = 1
+    quality_exact_max_rows: int = 250_000
+    ingest_host_limits: dict[str, int] = {
+        "data.gov.sg": 2,
+        "www.onemap.gov.sg": 1,
+    }
 
 
 class GeocodingConfig(BaseSettings):
+    engine: str = "threads"
     max_workers: int = 5
     api_delay_seconds: float = 1.2
+    max_requests_per_second: float = 4.0
+    use_gazetteer: bool = True
+    gazetteer_prefetch_hdb_blocks: bool = False
     timeout_seconds: int = 30
     cache_duration_hours: int = 24
     min_coordinate_coverage: float = 0.7
@@ -7,8 +7,12 @@ from hamilton import driver
 
 from egg_n_bacon_housing.components import cleaning, export, features, ingestion, metrics
 from egg_n_bacon_housing.config import Settings
+from egg_n_bacon_housing.utils import data_quality
+from egg_n_bacon_housing.utils.execution import DATAGOVSG_HOST, IngestExecutionManager
+from egg_n_bacon_housing.utils.gazetteer import GAZETTEER_FILENAME
 from egg_n_bacon_housing.utils.geocoding import Geocoder, build_default_geocoder
 from egg_n_bacon_housing.utils.layer_writer import build_writer
+from egg_n_bacon_housing.utils.profiling import PROFILE_REPORT_FILENAME, NodeProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +60,7 @@ STAGE_VARS: dict[str, list[str]] = {
         "condo_validated",
         "geocoded_properties",
         "geocoded_validated",
+        "address_gazetteer",
     ],
     "features": [
         "rental_yield",
@@ -74,6 +79,7 @@ STAGE_VARS: dict[str, list[str]] = {
     ],
     "all": [
         "unified_dataset",
+        "address_gazetteer",
         "planning_area_360",
         "town_360",
         "block_profile",
@@ -87,9 +93,25 @@ def build_pipeline(
     settings: Settings,
     data_path: str | None = None,
     cache_dir: str | None = None,
+    ingest_workers: int | None = None,
+    profile: bool | None = None,
 ) -> driver.Driver:
-    """Build and return a configured Hamilton Driver."""
+    """Build and return a configured Hamilton Driver.
+
+    With more than one ingest worker (``ingest_workers``, else
+    ``settings.pipeline.ingest_workers``) the driver uses Hamilton's
+    task-based executor: ingestion nodes run on thread pools capped per
+    source host by ``settings.pipeline.ingest_host_limits``, and all other
+    nodes run as before.
+
+    With profiling (``profile``, else ``settings.pipeline.profile_nodes``)
+    each run writes a per-node ``pipeline_profile.json`` to the data dir.
+    """
     resolved_data_path = settings.resolve_data_path(data_path)
+    if ingest_workers is None:
+        ingest_workers = settings.pipeline.ingest_workers
+    if profile is None:
+        profile = settings.pipeline.profile_nodes
 
     builder = (
         driver.Builder()
@@ -97,6 +119,12 @@ def build_pipeline(
         .with_config({"data_path": str(resolved_data_path)})
     )
 
+    if ingest_workers > 1:
+        builder = builder.enable_dynamic_execution(allow_experimental_mode=True)
+        builder = builder.with_execution_manager(
+            IngestExecutionManager(ingest_workers, settings.pipeline.ingest_host_limits)
+        )
+
     if _HAS_TRACKER:
         tracker = _sdk_adapters.HamiltonTracker(
             project_id=1,
@@ -106,6 +134,11 @@ def build_pipeline(
         )
         builder = builder.with_adapters(tracker)
 
+    if profile:
+        builder = builder.with_adapters(
+            NodeProfiler(report_path=resolved_data_path / PROFILE_REPORT_FILENAME)
+        )
+
     if cache_dir:
         builder = builder.with_cache(path=cache_dir)
     elif settings.pipeline.use_caching:
@@ -119,20 +152,31 @@ def build_pipeline(
 def _configure_runtime(settings: Settings, data_dir: Path, bronze_dir: Path) -> None:
     """Configure all module-level state once at pipeline startup.
 
-    Bundles the four ``configure()`` calls so the coupling is explicit
+    Bundles the ``configure()`` calls so the coupling is explicit
     and the set of modules that need wiring is discoverable in one place.
     """
-    from egg_n_bacon_housing.utils import cache, data_loader, mrt_line_mapping, school_features
+    from egg_n_bacon_housing.adapters import datagovsg
+    from egg_n_bacon_housing.utils import (
+        cache,
+        data_loader,
+        mrt_line_mapping,
+        school_features,
+        validation_gateway,
+    )
 
     cache.configure(
         cache_dir=data_dir / "cache",
         use_caching=settings.pipeline.use_caching,
         allow_legacy_pickle=settings.pipeline.allow_legacy_pickle_cache,
         cache_duration_hours=settings.pipeline.cache_duration_hours,
+        backend=settings.pipeline.cache_backend,
+        memory_cache_mb=settings.pipeline.memory_cache_mb,
     )
+    datagovsg.configure(max_in_flight=settings.pipeline.ingest_host_limits.get(DATAGOVSG_HOST))
     data_loader.configure(data_dir)
     mrt_line_mapping.configure(bronze_dir / "external")
     school_features.configure(bronze_dir, data_dir)
+    validation_gateway.configure(validation_workers=settings.pipeline.validation_workers)
 
 
 def run_pipeline(
@@ -164,15 +208,27 @@ def run_pipeline(
     bronze_dir = settings.layer_dir("bronze", resolved_data_path)
 
     _configure_runtime(settings, resolved_data_path, bronze_dir)
+    gazetteer_path = (
+        settings.layer_dir("silver", resolved_data_path) / GAZETTEER_FILENAME
+        if settings.geocoding.use_gazetteer
+        else None
+    )
 
     layer_inputs = {
         "bronze_dir": settings.layer_dir("bronze", resolved_data_path),
         "silver_dir": settings.layer_dir("silver", resolved_data_path),
         "gold_dir": settings.layer_dir("gold", resolved_data_path),
         "writer": build_writer(settings, resolved_data_path / "pipeline"),
-        "geocoder": geocoder or build_default_geocoder(settings),
+        "geocoder": geocoder or build_default_geocoder(settings, gazetteer_path=gazetteer_path),
         "min_coordinate_coverage": settings.geocoding.min_coordinate_coverage,
+        "gazetteer_prefetch_hdb_blocks": settings.geocoding.gazetteer_prefetch_hdb_blocks,
+        "datagovsg_workers": settings.pipeline.datagovsg_workers,
+        "incremental_location_dim": settings.pipeline.incremental_location_dim,
+        "incremental_transactions_enriched": settings.pipeline.incremental_transactions_enriched,
         "median_household_income": settings.metrics.median_household_income,
         "affordability_thresholds": settings.metrics.affordability_thresholds,
     }
-    return dr.execute(final_vars=final_vars, inputs=layer_inputs)
+    try:
+        return dr.execute(final_vars=final_vars, inputs=layer_inputs)
+    finally:
+        data_quality.flush_collector()
@@ -0,0 +1,62 @@
+"""Address normalization.
+
+``normalize_addresses`` maps trivially different spellings of one address
+("123 Ang Mo Kio Avenue 3", "123  ANG MO KIO AVE 3.") to one canonical key:
+upper case, single spaces, no ``.``/``,`` punctuation, no ``BLK`` prefix and
+street words abbreviated the way HDB writes them (AVENUE → AVE,
+STREET → ST, ...). Abbreviating rather than expanding keeps HDB addresses,
+the bulk of the inputs, unchanged.
+"""
+
+import re
+
+import pandas as pd
+
+# Full street word -> abbreviation used in HDB resale data.
+STREET_ABBREVIATIONS = {
+    "AVENUE": "AVE",
+    "STREET": "ST",
+    "ROAD": "RD",
+    "DRIVE": "DR",
+    "CRESCENT": "CRES",
+    "CLOSE": "CL",
+    "CENTRAL": "CTRL",
+    "NORTH": "NTH",
+    "SOUTH": "STH",
+    "UPPER": "UPP",
+    "LORONG": "LOR",
+    "JALAN": "JLN",
+    "BUKIT": "BT",
+    "KAMPONG": "KG",
+    "TANJONG": "TG",
+    "PLACE": "PL",
+    "TERRACE": "TER",
+    "HEIGHTS": "HTS",
+    "GARDENS": "GDNS",
+    "BOULEVARD": "BLVD",
+    "MOUNT": "MT",
+    "MARKET": "MKT",
+    "COMMONWEALTH": "C'WEALTH",
+}
+
+_ABBREVIATION_PATTERN = re.compile(r"\b(" + "|".join(STREET_ABBREVIATIONS) + r")\b")
+_BLOCK_PREFIX_PATTERN = r"^(?:BLK|BLOCK) (?=\d)"
+
+
+def normalize_address(address: str) -> str:
+    """Canonical form of one address (see module docstring)."""
+    return normalize_addresses(pd.Series([address])).iloc[0]
+
+
+def normalize_addresses(addresses: pd.Series) -> pd.Series:
+    """Vectorized ``normalize_address``; missing values stay missing."""
+    normalized = (
+        addresses.astype("string")
+        .str.upper()
+        .str.replace(r"[.,]", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+        .str.replace(_BLOCK_PREFIX_PATTERN, "", regex=True)
+        .str.replace(_ABBREVIATION_PATTERN, lambda m: STREET_ABBREVIATIONS[m.group(1)], regex=True)
+    )
+    return normalized.astype(object).where(normalized.notna(), None)
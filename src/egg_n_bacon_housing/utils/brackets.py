@@ -0,0 +1,90 @@
+"""Medians of bracketed (grouped) census tables.
+
+Census tables such as income, household size or dwelling type by planning
+area report counts per bracket rather than raw values. These helpers take
+the whole count matrix (rows x brackets, in bracket order) at once:
+cumulative sums per row, a row-wise search for the half-total, and either
+the median bracket's midpoint or a linear interpolation between bracket
+midpoints.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _first_at_least(cumulative: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Row-wise ``searchsorted(cumulative[i], target[i], side="left")``.
+
+    Rows of ``cumulative`` are non-decreasing, so the insertion point is the
+    number of entries strictly below the target.
+    """
+    return (cumulative < target[:, None]).sum(axis=1)
+
+
+def bracket_weighted_median(
+    counts: np.ndarray, midpoints: np.ndarray, interpolate: bool = False
+) -> np.ndarray:
+    """Weighted median of every row of a bracket-count matrix.
+
+    Args:
+        counts: ``(rows, brackets)`` counts in bracket order; NaN counts as 0.
+        midpoints: Representative value of each bracket, ascending.
+        interpolate: False returns the midpoint of the bracket holding the
+            half-total. True places each bracket's weight at its midpoint
+            and interpolates linearly between the midpoints on either side
+            of the half-total (clamped to the first and last midpoint).
+
+    Returns:
+        Float array of medians; NaN for rows without positive total.
+    """
+    counts = np.nan_to_num(np.atleast_2d(np.asarray(counts, dtype=float)))
+    midpoints = np.asarray(midpoints, dtype=float)
+    rows, brackets = counts.shape
+    if brackets == 0:
+        return np.full(rows, np.nan)
+
+    cumulative = counts.cumsum(axis=1)
+    total = cumulative[:, -1]
+    half = total / 2
+
+    if not interpolate:
+        idx = np.minimum(_first_at_least(cumulative, half), brackets - 1)
+        result = midpoints[idx]
+    else:
+        # Cumulative weight at each bracket's midpoint.
+        position = cumulative - counts / 2
+        upper = _first_at_least(position, half)
+        lower = np.clip(upper - 1, 0, brackets - 1)
+        upper = np.minimum(upper, brackets - 1)
+        row = np.arange(rows)
+        x0, x1 = position[row, lower], position[row, upper]
+        span = np.where(x1 > x0, x1 - x0, 1.0)
+        fraction = np.clip((half - x0) / span, 0.0, 1.0)
+        result = midpoints[lower] + fraction * (midpoints[upper] - midpoints[lower])
+
+    return np.where(total > 0, result, np.nan)
+
+
+def bracketed_median(
+    df: pd.DataFrame, brackets: list[tuple[str, float]], interpolate: bool = False
+) -> pd.Series:
+    """Weighted median per row of a frame with one count column per bracket.
+
+    Args:
+        df: Frame with bracket count columns (numeric or numeric strings).
+        brackets: ``(column, midpoint)`` pairs in ascending bracket order;
+            columns missing from ``df`` are skipped.
+        interpolate: See :func:`bracket_weighted_median`.
+
+    Returns:
+        Float Series aligned to ``df.index`` (NaN where a row has no counts).
+    """
+    present = [(col, mid) for col, mid in brackets if col in df.columns]
+    counts = (
+        df[[col for col, _ in present]].apply(pd.to_numeric, errors="coerce").to_numpy(float)
+        if present
+        else np.empty((len(df), 0))
+    )
+    midpoints = np.asarray([mid for _, mid in present], dtype=float)
+    medians = bracket_weighted_median(counts, midpoints, interpolate)
+    return pd.Series(medians, index=df.index, dtype=float)
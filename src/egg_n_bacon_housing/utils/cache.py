@@ -5,17 +5,25 @@ SECURITY NOTE: Cache files may contain API response data including geocoding
 results and dataset contents. Ensure cache directories are gitignored and
 not exposed in production.
 
-This module provides a simple file-based caching system to speed up development
-and reduce API quota usage.
+This module provides a small key-value cache to speed up development and
+reduce API quota usage. Entries live either as one file per key or in a single
+SQLite (WAL) database; ``migrate_file_cache`` moves the former to the latter.
 """
 
+import abc
+import copy
 import hashlib
+import io
 import json
 import logging
-from collections.abc import Callable
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import pandas as pd
 
@@ -23,34 +31,80 @@ logger = logging.getLogger(__name__)
 
 _CACHE_MISS = object()
 
+SQLITE_CACHE_FILENAME = "cache.sqlite3"
+CACHE_BACKENDS = ("file", "sqlite")
+DEFAULT_MEMORY_CACHE_MB = 256
 
-class CacheManager:
-    """File-based cache manager for API responses and computed results."""
 
-    def __init__(
-        self,
-        cache_dir: Path,
-        use_caching: bool = True,
-        allow_legacy_pickle: bool = False,
-        cache_duration_hours: int = 24,
-    ):
-        """Initialize cache manager.
+class CacheEntry(NamedTuple):
+    """A cached value with its write time and expiry (epoch seconds)."""
 
-        Args:
-            cache_dir: Directory to store cache files.
-            use_caching: Whether caching is enabled.
-            allow_legacy_pickle: Whether to read legacy .pkl cache files.
-            cache_duration_hours: Default cache validity duration.
-        """
+    value: Any
+    created_at: float
+    expires_at: float
+
+
+def _is_fresh(entry: CacheEntry, max_age_seconds: float | None, now: float) -> bool:
+    """Freshness rule shared by every tier: an explicit age bound, else the entry's expiry."""
+    if max_age_seconds is None:
+        return now <= entry.expires_at
+    return now - entry.created_at <= max_age_seconds
+
+
+def _serialize(value: Any) -> tuple[str, bytes]:
+    """Encode a cache value as ``("parquet", bytes)`` for frames, else JSON."""
+    if hasattr(value, "to_parquet") and callable(value.to_parquet):
+        buffer = io.BytesIO()
+        value.to_parquet(buffer, index=False)
+        return "parquet", buffer.getvalue()
+    return "json", json.dumps(value).encode("utf-8")
+
+
+def _deserialize(kind: str, payload: bytes) -> Any:
+    if kind == "parquet":
+        return pd.read_parquet(io.BytesIO(payload))
+    return json.loads(payload)
+
+
+class CacheBackend(abc.ABC):
+    """Storage for serialized cache entries keyed by ``CacheManager`` cache keys.
+
+    ``max_age_seconds`` is the caller's freshness bound for a read; ``None``
+    means "use the entry's own expiry".
+    """
+
+    name: str
+
+    @abc.abstractmethod
+    def get_many(self, keys: list[str], max_age_seconds: float | None) -> dict[str, CacheEntry]:
+        """Return fresh, readable entries among ``keys`` (misses are omitted)."""
+
+    @abc.abstractmethod
+    def set_many(self, items: Mapping[str, tuple[str, bytes]], ttl_seconds: float) -> list[str]:
+        """Store ``key -> (kind, payload)`` from ``_serialize``; return the keys written."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> bool:
+        """Delete one entry; return whether anything was removed."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Delete every entry."""
+
+    @abc.abstractmethod
+    def stats(self) -> dict:
+        """Entry count, total size and oldest/newest write times."""
+
+
+class FileCacheBackend(CacheBackend):
+    """One ``<sha256>.json`` / ``.parquet`` file per entry; expiry from file mtime."""
+
+    name = "file"
+
+    def __init__(self, cache_dir: Path, default_ttl_hours: int, allow_legacy_pickle: bool = False):
         self.cache_dir = cache_dir
-        self.use_caching = use_caching
+        self.default_ttl_hours = default_ttl_hours
         self.allow_legacy_pickle = allow_legacy_pickle
-        self.cache_duration_hours = cache_duration_hours
-        if self.use_caching:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-    def _get_cache_key(self, identifier: str) -> str:
-        return hashlib.sha256(identifier.encode()).hexdigest()
 
     def _cache_paths(self, cache_key: str) -> dict[str, Path]:
         """Return paths for supported cache formats."""
@@ -72,105 +126,527 @@ class CacheManager:
                 return path
         return None
 
-    def _is_expired(self, cache_path: Path | None, duration_hours: int) -> bool:
+    def _is_expired(self, cache_path: Path | None, max_age_seconds: float | None) -> bool:
         if cache_path is None or not cache_path.exists():
             return True
+        if max_age_seconds is None:
+            max_age_seconds = self.default_ttl_hours * 3600
         file_age = datetime.now(tz=UTC) - datetime.fromtimestamp(cache_path.stat().st_mtime, tz=UTC)
-        return file_age > timedelta(hours=duration_hours)
+        return file_age > timedelta(seconds=max_age_seconds)
+
+    def get_many(self, keys: list[str], max_age_seconds: float | None) -> dict[str, CacheEntry]:
+        found = {}
+        for cache_key in keys:
+            cache_path = self._get_existing_cache_path(cache_key)
+            if self._is_expired(cache_path, max_age_seconds):
+                continue
+            assert cache_path is not None
+            try:
+                mtime = cache_path.stat().st_mtime
+                if cache_path.suffix == ".json":
+                    with open(cache_path, encoding="utf-8") as f:
+                        value = json.load(f)
+                elif cache_path.suffix == ".parquet":
+                    value = pd.read_parquet(cache_path)
+                else:
+                    logger.warning("Legacy pickle cache disabled: %s", cache_path)
+                    continue
+            except (OSError, json.JSONDecodeError, ValueError) as e:
+                logger.warning("Failed to load cache: %s", e)
+                continue
+            found[cache_key] = CacheEntry(value, mtime, mtime + self.default_ttl_hours * 3600)
+        return found
+
+    def set_many(self, items: Mapping[str, tuple[str, bytes]], ttl_seconds: float) -> list[str]:
+        written = []
+        for cache_key, (kind, payload) in items.items():
+            try:
+                self._cache_paths(cache_key)[kind].write_bytes(payload)
+                written.append(cache_key)
+            except OSError as e:
+                logger.warning("Failed to cache value: %s", e)
+        return written
+
+    def delete(self, key: str) -> bool:
+        deleted_any = False
+        for path in self._cache_paths(key).values():
+            if path.exists():
+                path.unlink()
+                deleted_any = True
+        return deleted_any
+
+    def _cache_files(self) -> list[Path]:
+        cache_files: list[Path] = []
+        for pattern in ("*.json", "*.parquet", "*.pkl"):
+            cache_files.extend(self.cache_dir.glob(pattern))
+        return cache_files
+
+    def clear(self) -> None:
+        for cache_file in self._cache_files():
+            cache_file.unlink()
+
+    def stats(self) -> dict:
+        cache_files = self._cache_files()
+        if not cache_files:
+            return {"count": 0, "total_size_mb": 0, "oldest": None, "newest": None}
+
+        total_size = sum(f.stat().st_size for f in cache_files)
+        mtimes = [datetime.fromtimestamp(f.stat().st_mtime, tz=UTC) for f in cache_files]
+
+        return {
+            "count": len(cache_files),
+            "total_size_mb": round(total_size / 1024**2, 2),
+            "oldest": min(mtimes).isoformat(),
+            "newest": max(mtimes).isoformat(),
+        }
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """All entries in one SQLite database (WAL mode), expiry stored per row.
+
+    One connection is shared by all threads behind a lock; WAL lets other
+    processes read while a write is in progress.
+    """
+
+    name = "sqlite"
+    _QUERY_BATCH = 500
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries(expires_at)"
+            )
+
+    def get_many(self, keys: list[str], max_age_seconds: float | None) -> dict[str, CacheEntry]:
+        now = time.time()
+        rows = []
+        with self._lock:
+            for start in range(0, len(keys), self._QUERY_BATCH):
+                batch = keys[start : start + self._QUERY_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(
+                    self._conn.execute(
+                        "SELECT key, kind, value, created_at, expires_at FROM cache_entries "
+                        f"WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                )
+        found = {}
+        for key, kind, payload, created_at, expires_at in rows:
+            if not _is_fresh(CacheEntry(None, created_at, expires_at), max_age_seconds, now):
+                continue
+            try:
+                found[key] = CacheEntry(_deserialize(kind, payload), created_at, expires_at)
+            except (OSError, json.JSONDecodeError, ValueError) as e:
+                logger.warning("Failed to load cache: %s", e)
+        return found
+
+    def set_many(self, items: Mapping[str, tuple[str, bytes]], ttl_seconds: float) -> list[str]:
+        now = time.time()
+        rows = [
+            (key, kind, payload, now, now + ttl_seconds) for key, (kind, payload) in items.items()
+        ]
+        if rows:
+            self.upsert_rows(rows)
+        return [row[0] for row in rows]
+
+    def upsert_rows(self, rows: list[tuple[str, str, bytes, float, float]]) -> None:
+        """Insert ``(key, kind, value, created_at, expires_at)`` rows, newest write wins."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO cache_entries (key, kind, value, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    kind = excluded.kind,
+                    value = excluded.value,
+                    created_at = excluded.created_at,
+                    expires_at = excluded.expires_at
+                WHERE excluded.created_at >= cache_entries.created_at
+                """,
+                rows,
+            )
+
+    def delete(self, key: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache_entries")
+
+    def purge_expired(self) -> int:
+        """Delete rows past their stored expiry; return how many were removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM cache_entries WHERE expires_at < ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total_size, oldest, newest = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0), MIN(created_at), "
+                "MAX(created_at) FROM cache_entries"
+            ).fetchone()
+        if not count:
+            return {"count": 0, "total_size_mb": 0, "oldest": None, "newest": None}
+        return {
+            "count": count,
+            "total_size_mb": round(total_size / 1024**2, 2),
+            "oldest": datetime.fromtimestamp(oldest, tz=UTC).isoformat(),
+            "newest": datetime.fromtimestamp(newest, tz=UTC).isoformat(),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate in-memory size: deep frame memory, else the JSON length."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    try:
+        return len(json.dumps(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _detached(value: Any) -> Any:
+    """Copy mutable values handed out from memory so callers can't alter the cache."""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+class _MemoryTier:
+    """Thread-safe LRU of decoded cache entries, bounded by total bytes.
+
+    Each entry is charged its decoded size (``_estimate_size``), measured
+    once when it is admitted, so the budget bounds resident memory. Entries
+    keep the ``created_at`` / ``expires_at`` of the backend row they came
+    from, so freshness is judged exactly as the disk tier would.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[CacheEntry, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, keys: list[str], max_age_seconds: float | None) -> dict[str, CacheEntry]:
+        now = time.time()
+        found = {}
+        with self._lock:
+            for key in keys:
+                item = self._entries.get(key)
+                if item is None:
+                    self.misses += 1
+                    continue
+                entry, size = item
+                if not _is_fresh(entry, max_age_seconds, now):
+                    self.misses += 1
+                    if now > entry.expires_at:
+                        del self._entries[key]
+                        self._bytes -= size
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found[key] = entry
+        return found
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        if time.time() > entry.expires_at:
+            return
+        size = _estimate_size(entry.value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (entry, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def discard(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._bytes -= old[1]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "memory_hits": self.hits,
+                "memory_misses": self.misses,
+                "memory_evictions": self.evictions,
+                "memory_entries": len(self._entries),
+                "memory_size_mb": round(self._bytes / 1024**2, 2),
+                "memory_max_mb": round(self.max_bytes / 1024**2, 2),
+            }
+
+
+class CacheManager:
+    """Cache manager for API responses and computed results.
+
+    Entries are stored by a pluggable backend: ``"file"`` (one file per key)
+    or ``"sqlite"`` (a single WAL database, ``cache.sqlite3``). Decoded values
+    are also kept in an in-process LRU (``memory_cache_mb``, 0 disables) so
+    repeated reads of the same key skip disk I/O and parsing; writes go
+    through to the backend.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        use_caching: bool = True,
+        allow_legacy_pickle: bool = False,
+        cache_duration_hours: int = 24,
+        backend: str = "file",
+        memory_cache_mb: float = DEFAULT_MEMORY_CACHE_MB,
+    ):
+        """Initialize cache manager.
+
+        Args:
+            cache_dir: Directory to store cache files.
+            use_caching: Whether caching is enabled.
+            allow_legacy_pickle: Whether to read legacy .pkl cache files.
+            cache_duration_hours: Default cache validity duration.
+            backend: Storage backend, ``"file"`` or ``"sqlite"``.
+            memory_cache_mb: Byte budget of the in-process LRU tier.
+        """
+        if backend not in CACHE_BACKENDS:
+            raise ValueError(f"Unknown cache backend {backend!r}; expected one of {CACHE_BACKENDS}")
+        self.cache_dir = cache_dir
+        self.use_caching = use_caching
+        self.allow_legacy_pickle = allow_legacy_pickle
+        self.cache_duration_hours = cache_duration_hours
+        self.backend: CacheBackend
+        if backend == "sqlite" and self.use_caching:
+            self.backend = SQLiteCacheBackend(cache_dir / SQLITE_CACHE_FILENAME)
+            if any(cache_dir.glob("*.json")) or any(cache_dir.glob("*.parquet")):
+                logger.warning(
+                    "File cache entries in %s are not read by the sqlite backend; "
+                    "migrate them with scripts/tools/migrate_cache.py",
+                    cache_dir,
+                )
+        else:
+            self.backend = FileCacheBackend(cache_dir, cache_duration_hours, allow_legacy_pickle)
+        self.memory = _MemoryTier(int(memory_cache_mb * 1024**2)) if memory_cache_mb > 0 else None
+        if self.use_caching:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_key(self, identifier: str) -> str:
+        return hashlib.sha256(identifier.encode()).hexdigest()
+
+    @staticmethod
+    def _max_age_seconds(duration_hours: int | None) -> float | None:
+        return None if duration_hours is None else duration_hours * 3600
+
+    def _lookup(self, keys: list[str], duration_hours: int | None) -> dict[str, Any]:
+        """Resolve cache keys through the memory tier, then the backend."""
+        if duration_hours == 0:
+            return {}
+        max_age = self._max_age_seconds(duration_hours)
+        found = self.memory.get_many(keys, max_age) if self.memory else {}
+        missing = [key for key in keys if key not in found]
+        if missing:
+            loaded = self.backend.get_many(missing, max_age)
+            if self.memory:
+                for key, entry in loaded.items():
+                    self.memory.put(key, entry)
+            found.update(loaded)
+        return {key: _detached(entry.value) for key, entry in found.items()}
 
     def get(self, identifier: str, duration_hours: int | None = None) -> Any:
         """Retrieve a cached value.
 
         Returns ``_CACHE_MISS`` sentinel if not found, expired, or caching disabled.
+        ``duration_hours`` bounds the entry's age; by default each entry's own
+        expiry (written with ``cache_duration_hours``) applies.
         """
         if not self.use_caching:
             logger.debug("Caching is disabled")
             return _CACHE_MISS
 
-        effective_duration = (
-            duration_hours if duration_hours is not None else self.cache_duration_hours
-        )
-
         cache_key = self._get_cache_key(identifier)
-        cache_path = self._get_existing_cache_path(cache_key)
-
-        if self._is_expired(cache_path, effective_duration):
+        found = self._lookup([cache_key], duration_hours)
+        if cache_key not in found:
             logger.debug("Cache miss or expired: %s...", identifier[:100])
             return _CACHE_MISS
+        logger.info("Cache hit: %s...", identifier[:100])
+        return found[cache_key]
 
-        assert cache_path is not None
+    def get_many(
+        self, identifiers: Iterable[str], duration_hours: int | None = None
+    ) -> dict[str, Any]:
+        """Retrieve many cached values in one backend round trip.
 
-        try:
-            if cache_path.suffix == ".json":
-                with open(cache_path, encoding="utf-8") as f:
-                    value = json.load(f)
-            elif cache_path.suffix == ".parquet":
-                value = pd.read_parquet(cache_path)
-            else:
-                logger.warning("Legacy pickle cache disabled: %s", cache_path)
-                return _CACHE_MISS
-            logger.info("Cache hit: %s...", identifier[:100])
-            return value
-        except (OSError, json.JSONDecodeError, ValueError) as e:
-            logger.warning("Failed to load cache: %s", e)
-            return _CACHE_MISS
+        Returns a dict of ``identifier -> value`` for hits only.
+        """
+        if not self.use_caching:
+            return {}
+        keys = {self._get_cache_key(identifier): identifier for identifier in identifiers}
+        found = self._lookup(list(keys), duration_hours)
+        logger.debug("Cache get_many: %s/%s hits", len(found), len(keys))
+        return {keys[key]: value for key, value in found.items()}
 
     def set(self, identifier: str, value: Any) -> None:
         """Store a value in cache."""
         if not self.use_caching:
             return
+        if self._store({self._get_cache_key(identifier): value}):
+            logger.info("Cached: %s...", identifier[:100])
 
-        cache_key = self._get_cache_key(identifier)
-        cache_paths = self._cache_paths(cache_key)
-        json_path = cache_paths["json"]
-        parquet_path = cache_paths["parquet"]
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store many ``identifier -> value`` pairs in one backend write."""
+        if not self.use_caching or not items:
+            return
+        written = self._store(
+            {self._get_cache_key(identifier): value for identifier, value in items.items()}
+        )
+        logger.info("Cached %s entries", len(written))
 
-        try:
-            if hasattr(value, "to_parquet") and callable(value.to_parquet):
-                value.to_parquet(parquet_path, index=False)
-            else:
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(value, f)
-            logger.info("Cached: %s...", identifier[:100])
-        except (OSError, TypeError, ValueError) as e:
-            logger.warning("Failed to cache value: %s", e)
+    def _store(self, items: dict[str, Any]) -> list[str]:
+        """Encode ``items`` once, write them to the backend and admit them to memory.
+
+        Memory holds the decoded payload rather than the caller's object, so a
+        value reads back the same (parquet without the index, JSON lists for
+        tuples, string dict keys) whichever tier serves it.
+        """
+        encoded = {}
+        for key, value in items.items():
+            try:
+                encoded[key] = _serialize(value)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Failed to cache value: %s", e)
+        ttl_seconds = self.cache_duration_hours * 3600
+        now = time.time()
+        written = self.backend.set_many(encoded, ttl_seconds)
+        if self.memory:
+            for key in written:
+                value = _deserialize(*encoded[key])
+                self.memory.put(key, CacheEntry(value, now, now + ttl_seconds))
+        return written
 
     def clear(self, identifier: str | None = None) -> None:
         """Clear cache entries."""
         if identifier:
             cache_key = self._get_cache_key(identifier)
-            paths = self._cache_paths(cache_key)
-            deleted_any = False
-            for path in paths.values():
-                if path.exists():
-                    path.unlink()
-                    deleted_any = True
-            if deleted_any:
+            if self.memory:
+                self.memory.discard(cache_key)
+            if self.backend.delete(cache_key):
                 logger.info("Cleared cache: %s...", identifier[:100])
         else:
-            for pattern in ("*.json", "*.parquet", "*.pkl"):
-                for cache_file in self.cache_dir.glob(pattern):
-                    cache_file.unlink()
+            if self.memory:
+                self.memory.discard()
+            self.backend.clear()
             logger.info("Cleared all cache files")
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        cache_files: list[Path] = []
-        for pattern in ("*.json", "*.parquet", "*.pkl"):
-            cache_files.extend(self.cache_dir.glob(pattern))
+        stats = {**self.backend.stats(), "backend": self.backend.name}
+        if self.memory:
+            stats.update(self.memory.stats())
+        return stats
 
-        if not cache_files:
-            return {"count": 0, "total_size_mb": 0, "oldest": None, "newest": None}
 
-        total_size = sum(f.stat().st_size for f in cache_files)
-        mtimes = [datetime.fromtimestamp(f.stat().st_mtime, tz=UTC) for f in cache_files]
+def migrate_file_cache(
+    cache_dir: Path,
+    db_path: Path | None = None,
+    cache_duration_hours: int = 24,
+    delete: bool = False,
+) -> dict[str, int]:
+    """Copy a file-per-key cache directory into the SQLite backend.
 
-        return {
-            "count": len(cache_files),
-            "total_size_mb": round(total_size / 1024**2, 2),
-            "oldest": min(mtimes).isoformat(),
-            "newest": max(mtimes).isoformat(),
-        }
+    Keys are the existing SHA-256 file stems, so lookups by identifier keep
+    hitting. ``created_at`` is taken from each file's mtime, so entries keep
+    their age. Legacy ``.pkl`` files are never unpickled and are skipped.
+
+    Args:
+        cache_dir: Directory holding ``<sha256>.json`` / ``.parquet`` files.
+        db_path: Target database (default ``cache_dir / cache.sqlite3``).
+        cache_duration_hours: TTL recorded for migrated rows.
+        delete: Remove each file once its row is committed.
+
+    Returns:
+        Counts of ``migrated`` and ``skipped`` files.
+    """
+    backend = SQLiteCacheBackend(db_path or cache_dir / SQLITE_CACHE_FILENAME)
+    ttl_seconds = cache_duration_hours * 3600
+    counts = {"migrated": 0, "skipped": 0}
+    batch: list[tuple[str, str, bytes, float, float]] = []
+    batch_paths: list[Path] = []
+
+    def _flush() -> None:
+        backend.upsert_rows(batch)
+        if delete:
+            for path in batch_paths:
+                path.unlink(missing_ok=True)
+        counts["migrated"] += len(batch)
+        batch.clear()
+        batch_paths.clear()
+
+    try:
+        for path in cache_dir.iterdir():
+            kind = {".json": "json", ".parquet": "parquet"}.get(path.suffix)
+            if kind is None or not path.is_file():
+                if path.suffix == ".pkl":
+                    counts["skipped"] += 1
+                continue
+            try:
+                mtime = path.stat().st_mtime
+                batch.append((path.stem, kind, path.read_bytes(), mtime, mtime + ttl_seconds))
+                batch_paths.append(path)
+            except OSError as e:
+                logger.warning("Skipping unreadable cache file %s: %s", path, e)
+                counts["skipped"] += 1
+                continue
+            if len(batch) >= 1000:
+                _flush()
+        if batch:
+            _flush()
+    finally:
+        backend.close()
+    logger.info(
+        "Migrated %s cache files to %s (%s skipped)",
+        counts["migrated"],
+        backend.db_path,
+        counts["skipped"],
+    )
+    return counts
 
 
 _cache_manager: CacheManager | None = None
@@ -181,6 +657,8 @@ def configure(
     use_caching: bool = True,
     allow_legacy_pickle: bool = False,
     cache_duration_hours: int = 24,
+    backend: str = "file",
+    memory_cache_mb: float = DEFAULT_MEMORY_CACHE_MB,
 ) -> CacheManager:
     """Set up the global cache manager (call once at startup)."""
     global _cache_manager
@@ -189,6 +667,8 @@ def configure(
         use_caching=use_caching,
         allow_legacy_pickle=allow_legacy_pickle,
         cache_duration_hours=cache_duration_hours,
+        backend=backend,
+        memory_cache_mb=memory_cache_mb,
     )
     return _cache_manager
 
@@ -4,20 +4,36 @@ This module provides optimized data loading functions with caching
 for HDB, Condo, and amenity data.
 """
 
-import json
 import logging
+import math
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import shapely
+from scipy import ndimage
 from shapely import STRtree
-from shapely.geometry import Point, shape
-from shapely.prepared import prep
+
+from egg_n_bacon_housing.utils.geometry_store import (
+    GEOMETRY_COLUMN,
+    geometries,
+    load_geometry_table,
+    property_values,
+    source_fingerprint,
+)
 
 logger = logging.getLogger(__name__)
 
 _paths: dict[str, Path] = {}
 
+_METRES_PER_DEGREE = 111_320.0
+_NO_POLYGON = np.iinfo(np.intp).max
+BOUNDARY_CELL = -2
+# Above this many points a tree over the points beats one over the polygons.
+_POINT_TREE_MIN_POINTS = 500
+
 
 def configure(data_dir: Path) -> None:
     """Set data paths (call once at pipeline startup).
@@ -34,6 +50,7 @@ def configure(data_dir: Path) -> None:
         "manual_dir": data_dir / "manual",
     }
     _load_planning_areas_raw.cache_clear()
+    planning_area_grid.cache_clear()
 
 
 def _get(key: str) -> Path:
@@ -64,40 +81,45 @@ def _read_first_existing(*paths: Path) -> pd.DataFrame:
     return pd.DataFrame()
 
 
+def _planning_area_geojson() -> Path:
+    return _get_raw_data_dir() / "onemap_planning_area_polygon.geojson"
+
+
 @lru_cache(maxsize=1)
-def _load_planning_areas_raw() -> tuple[list[dict], list[tuple], STRtree | None, list[str]]:
-    geojson_path = _get_raw_data_dir() / "onemap_planning_area_polygon.geojson"
+def _load_planning_areas_raw() -> tuple[list[dict], STRtree | None, list[str]]:
+    geojson_path = _planning_area_geojson()
 
     if not geojson_path.exists():
         logger.warning("Planning area GeoJSON not found at %s", geojson_path)
-        return ([], [], None, [])
+        return ([], None, [])
 
     try:
-        with open(geojson_path) as f:
-            geojson_data = json.load(f)
+        table = load_geometry_table(geojson_path, [GEOMETRY_COLUMN, "pln_area_n"])
+        names = property_values(table, "pln_area_n")
 
         planning_areas = []
-        prepared_list = []
         geom_list = []
         name_list = []
-        for feature in geojson_data.get("features", []):
-            props = feature.get("properties", {})
-            geom = shape(geom_data) if (geom_data := feature.get("geometry")) else None
-
-            name = props.get("pln_area_n", "Unknown")
+        for name, geom in zip(names, geometries(table), strict=True):
+            name = "Unknown" if name is None else name
             planning_areas.append({"name": name, "geometry": geom})
 
             if geom is not None:
-                prepared_list.append((name, prep(geom)))
                 geom_list.append(geom)
                 name_list.append(name)
 
         tree = STRtree(geom_list) if geom_list else None
-        return (planning_areas, prepared_list, tree, name_list)
+        return (planning_areas, tree, name_list)
 
-    except (OSError, json.JSONDecodeError, ValueError, KeyError) as e:
+    except (OSError, ValueError, KeyError) as e:
         logger.warning("Error loading planning areas: %s", e)
-        return ([], [], None, [])
+        return ([], None, [])
+
+
+def planning_areas_fingerprint() -> str:
+    """Content hash of the planning-area GeoJSON ("missing" if there is none)."""
+    geojson_path = _planning_area_geojson()
+    return source_fingerprint(geojson_path) if geojson_path.exists() else "missing"
 
 
 def load_planning_areas() -> list[dict]:
@@ -110,12 +132,125 @@ def load_planning_areas() -> list[dict]:
     return _load_planning_areas_raw()[0]
 
 
+def _planning_area_indices(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    """Exact point-in-polygon: index into the planning-area names of the
+    polygon each point lies within, -1 for misses and NaN coordinates.
+
+    Small batches run one vectorized ``STRtree.query(points,
+    predicate="within")`` against the polygon tree. Larger batches invert
+    the query, as ``geopandas.sjoin`` does: a tree over the points queried
+    with each polygon and ``predicate="contains"`` (the same relation), so
+    shapely prepares each polygon once instead of testing unprepared
+    polygons per point. Where sliver overlaps match several polygons, the
+    first polygon in source order wins.
+    """
+    _, tree, _ = _load_planning_areas_raw()
+    result = np.full(len(lon), -1, dtype=np.intp)
+    valid = np.flatnonzero(np.isfinite(lon) & np.isfinite(lat))
+    if tree is None or not len(valid):
+        return result
+
+    points = shapely.points(lon[valid], lat[valid])
+    if len(points) < _POINT_TREE_MIN_POINTS:
+        point_idx, polygon_idx = tree.query(points, predicate="within")
+    else:
+        polygon_idx, point_idx = STRtree(points).query(tree.geometries, predicate="contains")
+    first = np.full(len(valid), _NO_POLYGON, dtype=np.intp)
+    np.minimum.at(first, point_idx, polygon_idx)
+    hit = first != _NO_POLYGON
+    result[valid[hit]] = first[hit]
+    return result
+
+
+@dataclass(frozen=True)
+class PlanningAreaGrid:
+    """Raster of planning-area indices over the polygons' bounding box.
+
+    ``labels[row, col]`` is the planning-area index of every point in the
+    cell, -1 if the cell lies outside all polygons, or ``BOUNDARY_CELL``
+    if a polygon boundary passes through or next to it; only points in
+    boundary cells need an exact point-in-polygon test.
+    """
+
+    x0: float
+    y0: float
+    dx: float
+    dy: float
+    labels: np.ndarray
+
+    def lookup(self, lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+        """Planning-area index per point (-1 for misses)."""
+        rows, cols = self.labels.shape
+        col = np.floor((lon - self.x0) / self.dx)
+        row = np.floor((lat - self.y0) / self.dy)
+        on_grid = (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+
+        result = np.full(len(lon), -1, dtype=np.intp)
+        result[on_grid] = self.labels[row[on_grid].astype(np.intp), col[on_grid].astype(np.intp)]
+        boundary = np.flatnonzero(result == BOUNDARY_CELL)
+        result[boundary] = _planning_area_indices(lon[boundary], lat[boundary])
+        return result
+
+
+@lru_cache(maxsize=2)
+def planning_area_grid(cell_m: float = 20.0) -> PlanningAreaGrid | None:
+    """Build (once per cell size) the lookup raster of the planning areas.
+
+    Boundary cells are found by sampling every polygon boundary at half the
+    cell size and marking each sample's cell and its 8 neighbours, so any
+    cell a boundary crosses is marked. The remaining cells fall into
+    connected regions that no boundary crosses; one exact test at a cell
+    centre labels a whole region.
+
+    Returns:
+        The grid, or None when the planning-area polygons are unavailable.
+    """
+    _, tree, _ = _load_planning_areas_raw()
+    if tree is None:
+        return None
+
+    polygons = tree.geometries
+    minx, miny, maxx, maxy = shapely.total_bounds(polygons)
+    dy = cell_m / _METRES_PER_DEGREE
+    dx = dy / math.cos(math.radians((miny + maxy) / 2))
+    x0, y0 = minx - dx, miny - dy
+    cols = int(math.ceil((maxx - x0) / dx)) + 2
+    rows = int(math.ceil((maxy - y0) / dy)) + 2
+
+    samples = shapely.get_coordinates(
+        shapely.segmentize(shapely.boundary(polygons), min(dx, dy) / 2)
+    )
+    boundary = np.zeros((rows, cols), dtype=bool)
+    boundary[
+        np.floor((samples[:, 1] - y0) / dy).astype(np.intp),
+        np.floor((samples[:, 0] - x0) / dx).astype(np.intp),
+    ] = True
+    boundary = ndimage.binary_dilation(boundary, structure=np.ones((3, 3), dtype=bool))
+
+    regions, count = ndimage.label(~boundary)
+    _, first_cell = np.unique(regions.ravel(), return_index=True)
+    if regions.ravel()[first_cell[0]] == 0:
+        first_cell = first_cell[1:]
+    row, col = np.divmod(first_cell, cols)
+    region_labels = np.empty(count + 1, dtype=np.intp)
+    region_labels[0] = BOUNDARY_CELL
+    region_labels[1:] = _planning_area_indices(x0 + (col + 0.5) * dx, y0 + (row + 0.5) * dy)
+
+    logger.info(
+        "Built %sx%s planning-area grid (%.0f m cells, %.1f%% boundary)",
+        rows,
+        cols,
+        cell_m,
+        boundary.mean() * 100,
+    )
+    return PlanningAreaGrid(x0, y0, dx, dy, region_labels[regions])
+
+
 def get_planning_area_for_point(lat: float, lon: float) -> str | None:
     """
     Get the planning area name for a given lat/lon coordinate.
 
-    Uses STRtree spatial index for candidate filtering, then prepared
-    geometries for exact point-in-polygon tests.
+    Uses the STRtree spatial index with an exact ``within`` predicate.
 
     Args:
         lat: Latitude
@@ -124,27 +259,18 @@ def get_planning_area_for_point(lat: float, lon: float) -> str | None:
     Returns:
         Planning area name or None if not found
     """
-    _, prepared_list, tree, name_list = _load_planning_areas_raw()
-
-    if tree is None or not prepared_list:
-        return None
+    _, _, name_list = _load_planning_areas_raw()
+    idx = _planning_area_indices(np.array([lon], dtype=float), np.array([lat], dtype=float))[0]
+    return name_list[idx] if idx >= 0 else None
 
-    point = Point(lon, lat)
 
-    candidate_indices = tree.query(point)
-    for idx in candidate_indices:
-        name = name_list[idx]
-        _, prepared_geom = prepared_list[idx]
-        if prepared_geom.contains(point):
-            return name
-
-    return None
-
-
-def get_planning_areas_for_points(lat: pd.Series, lon: pd.Series) -> pd.Series:
+def get_planning_areas_for_points(
+    lat: pd.Series, lon: pd.Series, grid_cell_m: float | None = None
+) -> pd.Series:
     """Batch point-in-polygon lookup for many coordinates at once.
 
-    Single vectorized ``geopandas.sjoin`` over the planning-area polygons -- far
+    One vectorized ``STRtree`` query over a shapely points array, without
+    building GeoDataFrames -- far
     faster than calling :func:`get_planning_area_for_point` per row when there
     are many coordinates (e.g. the ~10k unique coords derived in
     ``location_dim``). Mirrors the single-point function's first-match-wins and
@@ -153,57 +279,33 @@ def get_planning_areas_for_points(lat: pd.Series, lon: pd.Series) -> pd.Series:
     Args:
         lat: Latitudes (Series, any index).
         lon: Longitudes (Series, same length as ``lat``).
+        grid_cell_m: If set, look points up in a :func:`planning_area_grid`
+            of this cell size (metres) and test only points near polygon
+            boundaries exactly. Same results; worth its one-off build cost
+            for millions of points.
 
     Returns:
         Series of planning-area names aligned to ``lat.index``; ``None`` for
         misses (point outside every polygon, or NaN coordinates) and when the
         planning-area polygons are unavailable.
     """
-    import geopandas as gpd
-
-    miss = pd.Series([None] * len(lat), index=lat.index, dtype=object)
-
-    polys = load_planning_areas()
-    if not polys:
-        return miss
-
-    valid = [
-        (p["name"], p["geometry"])
-        for p in polys
-        if p.get("geometry") is not None and not p["geometry"].is_empty
-    ]
-    if not valid:
-        return miss
-
-    poly_gdf = gpd.GeoDataFrame(
-        {"planning_area": [name for name, _ in valid]},
-        geometry=[geom for _, geom in valid],
-        crs="EPSG:4326",
-    )
-
-    pts_lat = pd.to_numeric(pd.Series(lat), errors="coerce")
-    pts_lon = pd.to_numeric(pd.Series(lon), errors="coerce")
-    mask = pts_lat.notna() & pts_lon.notna()
-    if not mask.any():
-        return miss
-
-    points = gpd.GeoDataFrame(
-        {"_idx": pts_lat[mask].index.to_numpy()},
-        geometry=gpd.points_from_xy(pts_lon[mask].to_numpy(), pts_lat[mask].to_numpy()),
-        crs="EPSG:4326",
-    )
-
-    joined = gpd.sjoin(points, poly_gdf, how="left", predicate="within")
-    # Sliver overlaps can match multiple polygons; keep the first to mirror
-    # get_planning_area_for_point's first-candidate-wins behaviour, then drop
-    # the left-join misses (planning_area is NaN for points outside everything).
-    joined = joined.drop_duplicates(subset="_idx", keep="first")
-    joined = joined.dropna(subset=["planning_area"])
-
-    result = miss.copy()
-    if not joined.empty:
-        result.loc[joined["_idx"].tolist()] = joined["planning_area"].tolist()
-    return result
+    lat = pd.Series(lat)
+    result = np.full(len(lat), None, dtype=object)
+
+    _, tree, name_list = _load_planning_areas_raw()
+    if tree is not None and len(lat):
+        pts_lat = pd.to_numeric(lat, errors="coerce").to_numpy(dtype=float)
+        pts_lon = pd.to_numeric(pd.Series(lon), errors="coerce").to_numpy(dtype=float)
+        grid = planning_area_grid(grid_cell_m) if grid_cell_m else None
+        idx = (
+            grid.lookup(pts_lon, pts_lat)
+            if grid is not None
+            else _planning_area_indices(pts_lon, pts_lat)
+        )
+        hit = idx >= 0
+        result[hit] = np.asarray(name_list, dtype=object)[idx[hit]]
+
+    return pd.Series(result, index=lat.index, dtype=object)
 
 
 def load_market_summary() -> pd.DataFrame:
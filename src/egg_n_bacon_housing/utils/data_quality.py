@@ -2,15 +2,34 @@
 
 This module provides automatic quality metric capture through decorators,
 SQLite storage for historical baselines, and adaptive anomaly detection.
+
+One ``DataQualityCollector`` per database holds a single WAL-mode SQLite
+connection for the whole run. Snapshots are buffered in memory and written
+in one transaction by ``flush()`` (called at pipeline end and at exit), so
+anomaly checks compare against earlier runs only. Metrics for written
+layers are computed on a background thread (``submit_table_quality``) by a
+pluggable ``MetricsEngine`` (``utils/quality_metrics.py``).
 """
 
+import atexit
 import logging
 import sqlite3
-from dataclasses import dataclass
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+
+from egg_n_bacon_housing.utils.quality_metrics import (
+    ArrowMetricsEngine,
+    ColumnMetrics,
+    FrameMetrics,
+    MetricsEngine,
+    PandasMetricsEngine,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +76,8 @@ class QualitySnapshot:
     data_types: dict[str, str]
     source: str
     stage: str
+    duplicates_estimated: bool = False
+    column_metrics: list[ColumnMetrics] = field(default_factory=list)
 
 
 @dataclass
@@ -73,20 +94,40 @@ class QualityBaseline:
     last_updated: str
 
 
-def get_collector(db_path: Path) -> "DataQualityCollector":
+def get_collector(db_path: Path, engine: MetricsEngine | None = None) -> "DataQualityCollector":
     """Get or create global collector instance.
 
-    Reuses the current collector only when it points at the same database.
-    This keeps tests isolated when they override the data directory.
+    Reuses the current collector only when it points at the same database;
+    switching databases flushes and closes the previous one. This keeps
+    tests isolated when they override the data directory.
     """
     global _collector
+    if _collector is not None and Path(_collector.db_path) != Path(db_path):
+        _collector.close()
+        _collector = None
     if _collector is None:
-        _collector = DataQualityCollector(db_path)
-    elif Path(_collector.db_path) != Path(db_path):
-        _collector = DataQualityCollector(db_path)
+        _collector = DataQualityCollector(db_path, engine=engine)
+    elif engine is not None:
+        _collector.engine = engine
     return _collector
 
 
+def flush_collector() -> int:
+    """Write the global collector's buffered snapshots; returns how many."""
+    return _collector.flush() if _collector is not None else 0
+
+
+def close_collector() -> None:
+    """Flush and close the global collector (registered to run at exit)."""
+    global _collector
+    if _collector is not None:
+        _collector.close()
+        _collector = None
+
+
+atexit.register(close_collector)
+
+
 def infer_quality_stage(dataset_name: str) -> str:
     """Infer pipeline stage from the dataset name."""
     stage_prefixes = {"L0", "L1", "L2", "L3", "L4", "L5"}
@@ -98,6 +139,29 @@ def infer_quality_stage(dataset_name: str) -> str:
     return "unknown"
 
 
+def _snapshot(
+    metrics: FrameMetrics,
+    dataset_name: str,
+    source: str,
+    stage: str | None,
+    input_rows: int | None,
+) -> QualitySnapshot:
+    return QualitySnapshot(
+        timestamp=datetime.now(tz=UTC).strftime("%Y-%m-%d %H:%M:%S"),
+        dataset_name=dataset_name,
+        input_rows=metrics.rows if input_rows is None else input_rows,
+        output_rows=metrics.rows,
+        duplicate_count=metrics.duplicate_count,
+        null_percentage=metrics.null_percentage,
+        columns=[c.name for c in metrics.columns],
+        data_types={c.name: c.dtype for c in metrics.columns},
+        source=source,
+        stage=stage or infer_quality_stage(dataset_name),
+        duplicates_estimated=metrics.duplicates_estimated,
+        column_metrics=metrics.columns,
+    )
+
+
 def record_dataframe_quality(
     df: pd.DataFrame,
     dataset_name: str,
@@ -106,31 +170,27 @@ def record_dataframe_quality(
     stage: str | None = None,
     input_rows: int | None = None,
 ) -> QualitySnapshot:
-    """Record quality metrics for an already-persisted DataFrame."""
-    null_percentage = 0.0
-    if df.size > 0:
-        null_percentage = round((df.isnull().sum().sum() / df.size) * 100, 2)
-
-    snapshot = QualitySnapshot(
-        timestamp=datetime.now(tz=UTC).strftime("%Y-%m-%d %H:%M:%S"),
-        dataset_name=dataset_name,
-        input_rows=len(df) if input_rows is None else input_rows,
-        output_rows=len(df),
-        duplicate_count=int(df.duplicated().sum()),
-        null_percentage=null_percentage,
-        columns=df.columns.tolist(),
-        data_types={col: str(dtype) for col, dtype in df.dtypes.items()},
-        source=source,
-        stage=stage or infer_quality_stage(dataset_name),
-    )
+    """Record quality metrics for an already-persisted DataFrame.
 
+    Metrics are computed synchronously with exact pandas operations; the
+    snapshot is stored on the collector's next ``flush()``.
+    """
     collector = get_collector(db_path)
-    collector.record_snapshot(snapshot)
+    metrics = PandasMetricsEngine().compute_frame(df)
+    return collector.record_metrics(metrics, dataset_name, source, stage, input_rows)
 
-    anomalies = collector.check_anomaly(snapshot)
-    _log_quality_summary(snapshot, anomalies)
 
-    return snapshot
+def submit_table_quality(
+    table: pa.Table,
+    dataset_name: str,
+    db_path: Path,
+    source: str = "unknown",
+    stage: str | None = None,
+    engine: MetricsEngine | None = None,
+) -> Future:
+    """Compute and record quality metrics of a written Arrow table in the
+    background. Returns a future resolving to the ``QualitySnapshot``."""
+    return get_collector(db_path, engine=engine).submit(table, dataset_name, source, stage)
 
 
 def get_duplicate_status(dataset_name: str, duplicate_count: int) -> tuple[str, bool]:
@@ -190,95 +250,210 @@ def _log_quality_summary(snapshot: QualitySnapshot, anomalies: list[str]) -> Non
 
 
 class DataQualityCollector:
-    """Collects and analyzes data quality metrics."""
+    """Collects and analyzes data quality metrics.
 
-    def __init__(self, db_path: Path):
+    Args:
+        db_path: SQLite database for snapshots and baselines.
+        engine: Metrics engine for ``submit()``; defaults to
+            ``ArrowMetricsEngine()``.
+    """
+
+    def __init__(self, db_path: Path, engine: MetricsEngine | None = None):
         """Initialize collector with SQLite database."""
         self.db_path = db_path
+        self.engine = engine or ArrowMetricsEngine()
+        self._lock = threading.Lock()
+        self._pending: list[QualitySnapshot] = []
+        self._futures: list[Future] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._conn = self._connect()
         self._init_db()
 
-    def _init_db(self) -> None:
-        """Initialize SQLite database schema."""
+    def _connect(self) -> sqlite3.Connection:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def _init_db(self) -> None:
+        """Initialize SQLite database schema."""
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        cursor.execute(
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS run_snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    dataset_name TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    input_rows INTEGER NOT NULL,
+                    output_rows INTEGER NOT NULL,
+                    duplicate_count INTEGER NOT NULL,
+                    null_percentage REAL NOT NULL,
+                    column_count INTEGER NOT NULL,
+                    source TEXT
+                )
             """
-            CREATE TABLE IF NOT EXISTS run_snapshots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                dataset_name TEXT NOT NULL,
-                stage TEXT NOT NULL,
-                input_rows INTEGER NOT NULL,
-                output_rows INTEGER NOT NULL,
-                duplicate_count INTEGER NOT NULL,
-                null_percentage REAL NOT NULL,
-                column_count INTEGER NOT NULL,
-                source TEXT
             )
-        """
-        )
+            existing = {row[1] for row in cursor.execute("PRAGMA table_info(run_snapshots)")}
+            if "duplicates_estimated" not in existing:
+                cursor.execute(
+                    "ALTER TABLE run_snapshots "
+                    "ADD COLUMN duplicates_estimated INTEGER NOT NULL DEFAULT 0"
+                )
 
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_dataset_stage ON run_snapshots(dataset_name, stage)"
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON run_snapshots(timestamp)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_dataset_stage ON run_snapshots(dataset_name, stage)"
+            )
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON run_snapshots(timestamp)")
 
-        cursor.execute(
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS column_snapshots (
+                    snapshot_id INTEGER NOT NULL REFERENCES run_snapshots(id),
+                    column_name TEXT NOT NULL,
+                    data_type TEXT NOT NULL,
+                    null_count INTEGER NOT NULL,
+                    distinct_count INTEGER,
+                    min_value TEXT,
+                    max_value TEXT
+                )
+            """
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_column_snapshot ON column_snapshots(snapshot_id)"
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS historical_baselines (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    dataset_name TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    mean_rows REAL NOT NULL,
+                    std_rows REAL NOT NULL,
+                    mean_null_pct REAL NOT NULL,
+                    std_null_pct REAL NOT NULL,
+                    sample_count INTEGER NOT NULL,
+                    last_updated TEXT NOT NULL,
+                    UNIQUE(dataset_name, stage)
+                )
             """
-            CREATE TABLE IF NOT EXISTS historical_baselines (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                dataset_name TEXT NOT NULL,
-                stage TEXT NOT NULL,
-                mean_rows REAL NOT NULL,
-                std_rows REAL NOT NULL,
-                mean_null_pct REAL NOT NULL,
-                std_null_pct REAL NOT NULL,
-                sample_count INTEGER NOT NULL,
-                last_updated TEXT NOT NULL,
-                UNIQUE(dataset_name, stage)
             )
-        """
-        )
 
-        conn.commit()
-        conn.close()
+            self._conn.commit()
 
         logger.info("Data quality database initialized: %s", self.db_path)
 
-    def record_snapshot(self, snapshot: QualitySnapshot) -> None:
-        """Save snapshot to database and update baseline."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def record_metrics(
+        self,
+        metrics: FrameMetrics,
+        dataset_name: str,
+        source: str = "unknown",
+        stage: str | None = None,
+        input_rows: int | None = None,
+    ) -> QualitySnapshot:
+        """Turn metrics into a snapshot, buffer it and log anomalies."""
+        snapshot = _snapshot(metrics, dataset_name, source, stage, input_rows)
+        self.record_snapshot(snapshot)
+        anomalies = self.check_anomaly(snapshot)
+        _log_quality_summary(snapshot, anomalies)
+        return snapshot
+
+    def submit(
+        self, table: pa.Table, dataset_name: str, source: str = "unknown", stage: str | None = None
+    ) -> Future:
+        """Compute metrics of ``table`` with ``self.engine`` on a background thread."""
+
+        def _run() -> QualitySnapshot:
+            return self.record_metrics(self.engine.compute(table), dataset_name, source, stage)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="data-quality"
+                )
+            future = self._executor.submit(_run)
+            self._futures.append(future)
+        return future
 
-        cursor.execute(
-            """
-            INSERT INTO run_snapshots
-            (timestamp, dataset_name, stage, input_rows, output_rows,
-             duplicate_count, null_percentage, column_count, source)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                snapshot.timestamp,
-                snapshot.dataset_name,
-                snapshot.stage,
-                snapshot.input_rows,
-                snapshot.output_rows,
-                snapshot.duplicate_count,
-                snapshot.null_percentage,
-                len(snapshot.columns),
-                snapshot.source,
-            ),
-        )
+    def record_snapshot(self, snapshot: QualitySnapshot) -> None:
+        """Buffer a snapshot until the next ``flush()``."""
+        with self._lock:
+            self._pending.append(snapshot)
+        logger.debug("Recorded quality snapshot for %s", snapshot.dataset_name)
 
-        self._update_baseline(cursor, snapshot)
+    def flush(self) -> int:
+        """Wait for background metrics, then write buffered snapshots and
+        update baselines in one transaction. Returns the number written."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        wait(futures)
+        for future in futures:
+            if future.exception() is not None:
+                logger.warning("Data quality metrics failed: %s", future.exception())
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return 0
+            cursor = self._conn.cursor()
+            for snapshot in pending:
+                cursor.execute(
+                    """
+                    INSERT INTO run_snapshots
+                    (timestamp, dataset_name, stage, input_rows, output_rows,
+                     duplicate_count, null_percentage, column_count, source,
+                     duplicates_estimated)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        snapshot.timestamp,
+                        snapshot.dataset_name,
+                        snapshot.stage,
+                        snapshot.input_rows,
+                        snapshot.output_rows,
+                        snapshot.duplicate_count,
+                        snapshot.null_percentage,
+                        len(snapshot.columns),
+                        snapshot.source,
+                        int(snapshot.duplicates_estimated),
+                    ),
+                )
+                snapshot_id = cursor.lastrowid
+                cursor.executemany(
+                    "INSERT INTO column_snapshots (snapshot_id, column_name, data_type, "
+                    "null_count, distinct_count, min_value, max_value) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            snapshot_id,
+                            c.name,
+                            c.dtype,
+                            c.null_count,
+                            c.distinct_count,
+                            None if c.min_value is None else str(c.min_value),
+                            None if c.max_value is None else str(c.max_value),
+                        )
+                        for c in snapshot.column_metrics
+                    ],
+                )
+                self._update_baseline(cursor, snapshot)
+            self._conn.commit()
 
-        conn.commit()
-        conn.close()
+        logger.info("Saved %s data quality snapshots to %s", len(pending), self.db_path)
+        return len(pending)
 
-        logger.debug("Recorded quality snapshot for %s", snapshot.dataset_name)
+    def close(self) -> None:
+        """Flush, stop the background thread and close the connection."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            self._conn.close()
 
     def _update_baseline(self, cursor: sqlite3.Cursor, snapshot: QualitySnapshot) -> None:
         """Update baseline using incremental algorithm (Welford's method)."""
@@ -348,21 +523,16 @@ class DataQualityCollector:
 
     def get_baseline(self, dataset_name: str, stage: str) -> QualityBaseline | None:
         """Get historical baseline for comparison."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT dataset_name, stage, mean_rows, std_rows, mean_null_pct,
-                   std_null_pct, sample_count, last_updated
-            FROM historical_baselines
-            WHERE dataset_name = ? AND stage = ?
-        """,
-            (dataset_name, stage),
-        )
-
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT dataset_name, stage, mean_rows, std_rows, mean_null_pct,
+                       std_null_pct, sample_count, last_updated
+                FROM historical_baselines
+                WHERE dataset_name = ? AND stage = ?
+            """,
+                (dataset_name, stage),
+            ).fetchone()
 
         if row is None:
             return None
@@ -0,0 +1,83 @@
+"""Parallel execution of bronze ingestion nodes in the Hamilton DAG.
+
+Hamilton's task-based executor (``enable_dynamic_execution``) turns every
+node into its own task. ``IngestExecutionManager`` routes tasks for nodes
+defined under ``components.ingestion`` to thread pools and runs everything
+else synchronously, so only the I/O-bound fetches and file reads overlap.
+
+Nodes that call an external API declare it with ``@tag(source_host=...)``.
+Each host listed in ``host_limits`` gets its own pool sized to its cap, so
+e.g. at most two data.gov.sg nodes are in flight however many workers the
+general pool has. The same limits cap open requests per host inside the
+adapters (``adapters/datagovsg.configure``), so page and indicator workers
+of those nodes draw from one budget.
+"""
+
+import logging
+
+from hamilton.execution import executors
+from hamilton.execution.grouping import TaskImplementation
+
+logger = logging.getLogger(__name__)
+
+INGESTION_MODULE_PREFIX = "egg_n_bacon_housing.components.ingestion"
+SOURCE_HOST_TAG = "source_host"
+
+DATAGOVSG_HOST = "data.gov.sg"
+ONEMAP_HOST = "www.onemap.gov.sg"
+
+
+def is_ingestion_task(
+    task: TaskImplementation, module_prefix: str = INGESTION_MODULE_PREFIX
+) -> bool:
+    """True if every node in ``task`` comes from a module under ``module_prefix``."""
+    return bool(task.nodes) and all(
+        str(node_.tags.get("module", "")).startswith(module_prefix) for node_ in task.nodes
+    )
+
+
+def task_source_host(task: TaskImplementation) -> str | None:
+    """The ``source_host`` tag shared by the task's nodes, if any."""
+    hosts = {node_.tags.get(SOURCE_HOST_TAG) for node_ in task.nodes}
+    return hosts.pop() if len(hosts) == 1 else None
+
+
+class IngestExecutionManager(executors.ExecutionManager):
+    """Run ingestion tasks on thread pools with per-host caps, the rest locally.
+
+    Args:
+        max_workers: Size of the general ingestion pool.
+        host_limits: Maximum concurrent tasks per ``source_host`` tag value.
+            A host pool is never larger than ``max_workers``.
+        module_prefix: Nodes from modules under this prefix count as ingestion.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        host_limits: dict[str, int] | None = None,
+        module_prefix: str = INGESTION_MODULE_PREFIX,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        self.module_prefix = module_prefix
+        self.local_executor = executors.SynchronousLocalTaskExecutor()
+        self.ingest_executor = executors.MultiThreadingExecutor(max_tasks=max_workers)
+        self.host_executors = {
+            host: executors.MultiThreadingExecutor(max_tasks=max(1, min(limit, max_workers)))
+            for host, limit in (host_limits or {}).items()
+        }
+        super().__init__([self.local_executor, self.ingest_executor, *self.host_executors.values()])
+        logger.info(
+            "Parallel ingestion: %s workers, per-host limits %s",
+            max_workers,
+            {host: ex.max_tasks for host, ex in self.host_executors.items()},
+        )
+
+    def get_executor_for_task(self, task: TaskImplementation) -> executors.TaskExecutor:
+        if not is_ingestion_task(task, self.module_prefix):
+            return self.local_executor
+        host = task_source_host(task)
+        if host is None:
+            return self.ingest_executor
+        return self.host_executors.get(host, self.ingest_executor)
@@ -0,0 +1,137 @@
+"""Offline address gazetteer: the persisted address → coordinate store.
+
+The gazetteer is a parquet table keyed by normalized address
+(``utils/address_normalization.py``) and by postal code. Coordinates of an
+address do not change, so entries outlive the API cache TTL:
+``geocoded_properties`` takes every known address from it and adds each
+newly resolved one, and ``GazetteerGeocoder`` serves other lookups from it
+without touching the network.
+
+Sources, in order of precedence:
+- past OneMap results (earlier gazetteer rows, the legacy
+  ``address_coordinates.parquet`` index, and geocoded property snapshots);
+- HDB blocks from ``raw_hdb_property_info`` that no past result covers,
+  geocoded once through a fallback geocoder when prefetching is enabled.
+"""
+
+import logging
+import re
+from pathlib import Path
+
+import pandas as pd
+
+from egg_n_bacon_housing.utils.address_normalization import normalize_addresses
+from egg_n_bacon_housing.utils.geocoding import GAZETTEER_COLUMNS, Geocoder
+
+logger = logging.getLogger(__name__)
+
+GAZETTEER_FILENAME = "address_gazetteer.parquet"
+# Standalone normalized-address index that the gazetteer replaced; still
+# read so its addresses are not geocoded again.
+LEGACY_ADDRESS_INDEX_FILENAME = "address_coordinates.parquet"
+_POSTAL_CODE = re.compile(r"^\d{6}$")
+
+
+def hdb_block_addresses(raw_hdb_property_info: pd.DataFrame) -> pd.Series:
+    """Normalized ``"<blk_no> <street>"`` address of every HDB block."""
+    if raw_hdb_property_info.empty or not {"blk_no", "street"} <= set(
+        raw_hdb_property_info.columns
+    ):
+        return pd.Series([], dtype=object)
+    addresses = (
+        raw_hdb_property_info["blk_no"].astype(str)
+        + " "
+        + raw_hdb_property_info["street"].astype(str)
+    )
+    return pd.Series(normalize_addresses(addresses).dropna().unique(), dtype=object)
+
+
+def _keyed(results: pd.DataFrame, address_col: str) -> pd.DataFrame:
+    rows = results.reindex(columns=[address_col, "lat", "lon", "matched_name", "postal_code"])
+    rows = rows.dropna(subset=[address_col, "lat", "lon"])
+    return rows.assign(key=normalize_addresses(rows[address_col]))[GAZETTEER_COLUMNS]
+
+
+def build_gazetteer(
+    past_results: list[pd.DataFrame],
+    hdb_blocks: pd.Series | None = None,
+    geocoder: Geocoder | None = None,
+) -> pd.DataFrame:
+    """Assemble gazetteer rows (``GAZETTEER_COLUMNS``), one per ``key``.
+
+    Args:
+        past_results: Frames with ``normalized_address`` (or ``key``) and
+            ``lat``/``lon``, most authoritative first. Rows without
+            coordinates are ignored.
+        hdb_blocks: Normalized HDB block addresses that should be covered.
+        geocoder: If given, HDB blocks missing from ``past_results`` are
+            geocoded with it once and added.
+    """
+    frames = [
+        _keyed(df, "key" if "key" in df.columns else "normalized_address")
+        for df in past_results
+        if not df.empty
+    ]
+    frames = [f for f in frames if not f.empty]
+    known = set().union(*(set(f["key"]) for f in frames)) if frames else set()
+
+    if hdb_blocks is not None and not hdb_blocks.empty:
+        missing = hdb_blocks[~hdb_blocks.isin(known)]
+        logger.info(
+            "Gazetteer covers %s/%s HDB blocks from past results",
+            len(hdb_blocks) - len(missing),
+            len(hdb_blocks),
+        )
+        if geocoder is not None and not missing.empty:
+            logger.info("Prefetching %s uncovered HDB blocks", len(missing))
+            fetched = _keyed(geocoder.geocode(missing.reset_index(drop=True)), "input")
+            if not fetched.empty:
+                frames.append(fetched)
+
+    if not frames:
+        return pd.DataFrame(columns=GAZETTEER_COLUMNS)
+
+    by_address = pd.concat(frames, ignore_index=True)
+    postal = by_address["postal_code"].astype(str).str.strip()
+    by_postal = by_address[postal.str.match(_POSTAL_CODE)].assign(
+        key=postal[postal.str.match(_POSTAL_CODE)]
+    )
+    return pd.concat([by_address, by_postal], ignore_index=True).drop_duplicates(
+        "key", keep="first", ignore_index=True
+    )
+
+
+def load_gazetteer(path: Path) -> pd.DataFrame:
+    """Read a gazetteer, or an empty one if it does not exist yet.
+
+    A legacy address index next to ``path`` is folded in behind the
+    gazetteer's own rows.
+    """
+    past_results = []
+    if path.exists():
+        past_results.append(pd.read_parquet(path, columns=GAZETTEER_COLUMNS))
+    legacy_path = path.with_name(LEGACY_ADDRESS_INDEX_FILENAME)
+    if legacy_path.exists():
+        past_results.append(pd.read_parquet(legacy_path))
+    return build_gazetteer(past_results)
+
+
+def update_gazetteer(path: Path, gazetteer: pd.DataFrame, resolved: pd.DataFrame) -> pd.DataFrame:
+    """Add newly resolved rows (``normalized_address``, ``lat``, ...) and save.
+
+    Rows without coordinates are not stored, so failed lookups are retried
+    on the next run.
+    """
+    updated = build_gazetteer([gazetteer, resolved])
+    if len(updated) == len(gazetteer):
+        return gazetteer
+    write_gazetteer(updated, path)
+    return updated
+
+
+def write_gazetteer(gazetteer: pd.DataFrame, path: Path) -> Path:
+    """Write the gazetteer to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    gazetteer.to_parquet(path, index=False)
+    logger.info("Saved address gazetteer (%s keys) to %s", len(gazetteer), path)
+    return path
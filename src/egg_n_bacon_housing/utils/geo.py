@@ -1,10 +1,29 @@
 import numpy as np
+import numpy.typing as npt
 
+EARTH_RADIUS_M = 6371000
 
-def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    lat1, lon1, lat2, lon2 = map(float, [lat1, lon1, lat2, lon2])
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
+
+def haversine_many(
+    lat1: npt.ArrayLike,
+    lon1: npt.ArrayLike,
+    lat2: npt.ArrayLike,
+    lon2: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    """Great-circle distance in metres between coordinate arrays (degrees).
+
+    Inputs follow NumPy broadcasting, so equal-length arrays give element-wise
+    distances and ``lat1[:, None]`` against ``lat2[None, :]`` gives a pairwise
+    ``(len(lat1), len(lat2))`` matrix. NaN coordinates yield NaN distances.
+    """
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(x, dtype=np.float64)) for x in (lat1, lon1, lat2, lon2)
+    )
     dlat = lat2 - lat1
     dlon = lon2 - lon1
     a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
-    return float(2 * np.arcsin(np.sqrt(a)) * 6371000)
+    return 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0))) * EARTH_RADIUS_M
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    return float(haversine_many(float(lat1), float(lon1), float(lat2), float(lon2)))
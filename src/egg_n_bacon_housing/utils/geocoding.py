@@ -1,7 +1,10 @@
 """Geocoding module: unified interface for address-to-coordinate resolution.
 
-One interface, two adapters:
-- OneMapGeocoder: production geocoding via OneMap API
+One interface, several adapters:
+- OneMapGeocoder: production geocoding via OneMap API (thread pool)
+- AsyncOneMapGeocoder: OneMap via asyncio with a global QPS ceiling
+- GazetteerGeocoder: offline lookups in a prebuilt gazetteer parquet
+- CompositeGeocoder: tiers of geocoders, each seeing only earlier misses
 - InMemoryGeocoder: test geocoding from a fixed lookup table
 
 Extracts geocoding logic that was duplicated across ingestion
@@ -9,14 +12,25 @@ Extracts geocoding logic that was duplicated across ingestion
 and the onemap adapter.
 """
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import requests
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from egg_n_bacon_housing.config import Settings
+from egg_n_bacon_housing.utils.address_normalization import normalize_addresses
 
 logger = logging.getLogger(__name__)
 
@@ -62,10 +76,15 @@ class Geocoder(ABC):
 class OneMapGeocoder(Geocoder):
     """Production geocoder using OneMap API via the onemap adapter.
 
-    Cache-first: addresses already in the OneMap cache resolve instantly
-    without an API call. Misses are geocoded in parallel (``max_workers``)
-    or sequentially with rate-limit pacing (``rate_limit_seconds``, applied
-    only on actual API calls, never on cache hits).
+    Cache-first: each run resolves all unique addresses against the OneMap
+    cache in one bulk lookup, so hits never reach the thread pool or the
+    API. Only the misses are geocoded, in parallel (``max_workers``) or
+    sequentially with rate-limit pacing (``rate_limit_seconds``). Per-run
+    hit/API-call counts are kept in ``last_run_stats``.
+
+    Besides the raw OneMap search frames, each resolved address is cached
+    as a small JSON result row (``onemap_geocode:<address>``), so warm runs
+    skip decoding one parquet frame per address.
     """
 
     def __init__(
@@ -81,6 +100,15 @@ class OneMapGeocoder(Geocoder):
         self.max_workers = max_workers
         self.timeout = timeout
         self.rate_limit_seconds = rate_limit_seconds
+        self.last_run_stats: dict[str, float] = {}
+
+    @staticmethod
+    def _cache_id(address: str) -> str:
+        return f"onemap_search:{address}"
+
+    @staticmethod
+    def _result_id(address: str) -> str:
+        return f"onemap_geocode:{address}"
 
     def query_geocode_cache(self, address: str) -> tuple[float, float] | None:
         """Read-only lookup of the OneMap cache for one address.
@@ -92,12 +120,55 @@ class OneMapGeocoder(Geocoder):
         from egg_n_bacon_housing.utils.cache import _CACHE_MISS, get_cache_manager
 
         cached = get_cache_manager().get(
-            f"onemap_search:{address}", duration_hours=self.cache_duration_hours
+            self._cache_id(address), duration_hours=self.cache_duration_hours
         )
         if cached is _CACHE_MISS or not isinstance(cached, pd.DataFrame) or cached.empty:
             return None
         return self._coords_from_row(cached.iloc[0])
 
+    def lookup_geocode_cache(self, addresses: list[str]) -> dict[str, dict]:
+        """Bulk read-only lookup of the OneMap cache.
+
+        Returns a result row (as produced by ``geocode``) for every address
+        with a cached result, including addresses OneMap could not match
+        (``lat``/``lon`` None). Compact result rows are read first; search
+        frames only for the rest. Makes no API call.
+        """
+        compact, from_frames = self._lookup_cached_rows(addresses)
+        return {**compact, **from_frames}
+
+    def _lookup_cached_rows(self, addresses: list[str]) -> tuple[dict[str, dict], dict[str, dict]]:
+        """Cached rows split into (from compact results, from search frames)."""
+        from egg_n_bacon_housing.utils.cache import get_cache_manager
+
+        manager = get_cache_manager()
+        result_ids = {self._result_id(addr): addr for addr in addresses}
+        found = manager.get_many(result_ids, duration_hours=self.cache_duration_hours)
+        compact = {
+            result_ids[key]: {**row, "input": result_ids[key]}
+            for key, row in found.items()
+            if isinstance(row, dict)
+        }
+
+        from_frames = {}
+        search_ids = {self._cache_id(addr): addr for addr in addresses if addr not in compact}
+        if search_ids:
+            frames = manager.get_many(search_ids, duration_hours=self.cache_duration_hours)
+            for key, df in frames.items():
+                if isinstance(df, pd.DataFrame):
+                    from_frames[search_ids[key]] = self._row_from_result(search_ids[key], df)
+        return compact, from_frames
+
+    def _store_results(self, rows: list[dict]) -> None:
+        from egg_n_bacon_housing.utils.cache import get_cache_manager
+
+        get_cache_manager().set_many(
+            {
+                self._result_id(row["input"]): {k: v for k, v in row.items() if k != "input"}
+                for row in rows
+            }
+        )
+
     @staticmethod
     def _coords_from_row(row: pd.Series) -> tuple[float, float] | None:
         lat = pd.to_numeric(row.get("LATITUDE") or row.get("Y"), errors="coerce")
@@ -148,40 +219,317 @@ class OneMapGeocoder(Geocoder):
         if not addrs:
             return pd.DataFrame(columns=columns)
 
+        unique = list(dict.fromkeys(addrs))
+        compact, from_frames = self._lookup_cached_rows(unique)
+        resolved = {**compact, **from_frames}
+        misses = [addr for addr in unique if addr not in resolved]
+
+        fetched = self._geocode_misses(misses) if misses else []
+        resolved.update(zip(misses, fetched, strict=True))
+        # API failures come back as empty rows; only persist real answers.
+        self._store_results([*from_frames.values(), *(r for r in fetched if r["lat"] is not None)])
+
+        self.last_run_stats = {
+            "addresses": len(addrs),
+            "unique_addresses": len(unique),
+            "cache_hits": len(compact) + len(from_frames),
+            "api_calls": len(misses),
+            "hit_ratio": round((len(compact) + len(from_frames)) / len(unique), 4),
+            "unresolved": sum(resolved[addr]["lat"] is None for addr in unique),
+        }
+        logger.info(
+            "Geocoded %s addresses (%s unique): %s cache hits (%.1f%%), %s API calls, %s unresolved",
+            len(addrs),
+            len(unique),
+            self.last_run_stats["cache_hits"],
+            100 * self.last_run_stats["hit_ratio"],
+            len(misses),
+            self.last_run_stats["unresolved"],
+        )
+        return pd.DataFrame([resolved[addr] for addr in addrs])
+
+    def _geocode_misses(self, addrs: list[str]) -> list[dict]:
+        """Geocode cache misses via the API, one row per address in order."""
         if self.max_workers > 1 and len(addrs) > 1:
             return self._geocode_parallel(addrs)
         return self._geocode_sequential(addrs)
 
-    def _geocode_sequential(self, addrs: list[str]) -> pd.DataFrame:
+    def _geocode_sequential(self, addrs: list[str]) -> list[dict]:
         rows = []
         for addr in addrs:
-            cached = self.query_geocode_cache(addr)
-            if cached is not None:
-                rows.append({**self._empty_row(addr), "lat": cached[0], "lon": cached[1]})
-                continue
             rows.append(self._geocode_via_api(addr))
             if self.rate_limit_seconds:
                 time.sleep(self.rate_limit_seconds)
-        return pd.DataFrame(rows)
+        return rows
 
-    def _geocode_parallel(self, addrs: list[str]) -> pd.DataFrame:
+    def _geocode_parallel(self, addrs: list[str]) -> list[dict]:
         rows: list[dict] = [self._empty_row(a) for a in addrs]
         with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
             futures = {pool.submit(self._geocode_via_api, a): i for i, a in enumerate(addrs)}
             for future in as_completed(futures):
                 rows[futures[future]] = future.result()
-        return pd.DataFrame(rows)
+        return rows
+
+
+class AsyncTokenBucket:
+    """Token bucket shared by all coroutines of one event loop.
+
+    Each ``acquire`` reserves a token, so waiters are paced ``1 / rate``
+    apart in arrival order and no more than ``burst`` requests start at once
+    after an idle period.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            if self._updated is not None:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            await asyncio.sleep(wait)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+class AsyncOneMapGeocoder(OneMapGeocoder):
+    """OneMap geocoder that resolves cache misses on an asyncio event loop.
+
+    Unlike the thread-pool path, every request (retries included) takes a
+    token from one shared ``AsyncTokenBucket``, so the whole run stays under
+    ``requests_per_second``. At most ``max_concurrency`` requests are in
+    flight; they share one pooled ``requests.Session`` and are executed on
+    the loop's thread pool, as the project has no async HTTP client.
+    Transient failures (429, 5xx, connection errors, timeouts) are retried
+    with jittered exponential backoff. Cache lookups and result rows are
+    inherited from ``OneMapGeocoder``.
+
+    ``geocode`` stays synchronous; called from a thread that already runs an
+    event loop (a notebook, an async app), the lookups get their own loop on
+    a worker thread.
+    """
+
+    def __init__(
+        self,
+        headers: dict[str, str],
+        cache_duration_hours: int = 24,
+        max_concurrency: int = 8,
+        requests_per_second: float = 4.0,
+        timeout: int = 30,
+        max_attempts: int = 5,
+        base_url: str | None = None,
+    ):
+        super().__init__(
+            headers,
+            cache_duration_hours=cache_duration_hours,
+            max_workers=max_concurrency,
+            timeout=timeout,
+        )
+        self.requests_per_second = requests_per_second
+        self.max_attempts = max_attempts
+        self.base_url = base_url
+
+    def _geocode_misses(self, addrs: list[str]) -> list[dict]:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._geocode_async(addrs))
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self._geocode_async(addrs)).result()
+
+    async def _geocode_async(self, addrs: list[str]) -> list[dict]:
+        from egg_n_bacon_housing.adapters.onemap import ONEMAP_SEARCH_URL
+
+        bucket = AsyncTokenBucket(self.requests_per_second)
+        in_flight = asyncio.Semaphore(self.max_workers)
+        base_url = self.base_url or ONEMAP_SEARCH_URL
+        with (
+            requests.Session() as session,
+            ThreadPoolExecutor(max_workers=self.max_workers) as pool,
+        ):
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=self.max_workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(self.headers)
+            frames = await asyncio.gather(
+                *(self._search(addr, session, pool, bucket, in_flight, base_url) for addr in addrs)
+            )
+
+        from egg_n_bacon_housing.utils.cache import get_cache_manager
+
+        get_cache_manager().set_many(
+            {self._cache_id(a): df for a, df in zip(addrs, frames, strict=True) if df is not None}
+        )
+        return [self._row_from_result(a, df) for a, df in zip(addrs, frames, strict=True)]
+
+    async def _search(
+        self,
+        addr: str,
+        session: requests.Session,
+        pool: ThreadPoolExecutor,
+        bucket: AsyncTokenBucket,
+        in_flight: asyncio.Semaphore,
+        base_url: str,
+    ) -> pd.DataFrame | None:
+        from egg_n_bacon_housing.adapters.onemap import parse_search_response, search_url
+
+        loop = asyncio.get_running_loop()
+        url = search_url(addr, base_url)
+
+        def _get() -> str:
+            response = session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+
+        try:
+            async with in_flight:
+                async for attempt in AsyncRetrying(
+                    retry=retry_if_exception(_is_retryable),
+                    stop=stop_after_attempt(self.max_attempts),
+                    wait=wait_exponential_jitter(initial=1, max=30),
+                    reraise=True,
+                ):
+                    with attempt:
+                        await bucket.acquire()
+                        text = await loop.run_in_executor(pool, _get)
+            return parse_search_response(text)
+        except (requests.RequestException, ValueError, KeyError) as exc:
+            logger.warning("Geocoding failed for %s: %s", addr, exc)
+            return None
+
+
+GEOCODE_COLUMNS = ["input", "lat", "lon", "matched_name", "postal_code", "address"]
+GAZETTEER_COLUMNS = ["key", "lat", "lon", "matched_name", "postal_code"]
+
 
+class GazetteerGeocoder(Geocoder):
+    """Offline geocoder over a prebuilt gazetteer (``utils/gazetteer.py``).
 
-def build_default_geocoder(settings: Settings) -> Geocoder:
+    The gazetteer maps normalized addresses and postal codes (``key``) to
+    coordinates. Inputs are normalized the same way and resolved with one
+    vectorized index lookup; misses come back with ``lat``/``lon`` missing.
+    """
+
+    def __init__(self, gazetteer: pd.DataFrame):
+        table = gazetteer[GAZETTEER_COLUMNS].drop_duplicates("key", keep="first")
+        self._table = table.set_index("key")
+        self.last_run_stats: dict[str, float] = {}
+
+    @classmethod
+    def from_parquet(cls, path: Path) -> "GazetteerGeocoder":
+        return cls(pd.read_parquet(path, columns=GAZETTEER_COLUMNS))
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def geocode(self, addresses: pd.Series) -> pd.DataFrame:
+        inputs = pd.Series(list(addresses), dtype=object)
+        if inputs.empty:
+            return pd.DataFrame(columns=GEOCODE_COLUMNS)
+
+        keys = normalize_addresses(inputs).fillna("")
+        positions = self._table.index.get_indexer(keys)
+        found = positions >= 0
+        result = pd.DataFrame({"input": inputs, "address": inputs.astype(str)})
+        for col in ("lat", "lon", "matched_name", "postal_code"):
+            values = np.full(len(inputs), None, dtype=object)
+            values[found] = self._table[col].to_numpy()[positions[found]]
+            result[col] = values
+        result["lat"] = pd.to_numeric(result["lat"])
+        result["lon"] = pd.to_numeric(result["lon"])
+
+        self.last_run_stats = {"addresses": len(inputs), "hits": int(found.sum())}
+        return result[GEOCODE_COLUMNS]
+
+
+class CompositeGeocoder(Geocoder):
+    """Geocoders tried in order; each tier only sees what earlier tiers missed.
+
+    Typical use is an offline ``GazetteerGeocoder`` in front of
+    ``OneMapGeocoder``, so the network is only used for gazetteer misses.
+    """
+
+    def __init__(self, geocoders: list[Geocoder]):
+        if not geocoders:
+            raise ValueError("CompositeGeocoder needs at least one geocoder")
+        self.geocoders = geocoders
+        self.last_run_stats: dict[str, int] = {}
+
+    def geocode(self, addresses: pd.Series) -> pd.DataFrame:
+        inputs = pd.Series(list(addresses), dtype=object)
+        if inputs.empty:
+            return pd.DataFrame(columns=GEOCODE_COLUMNS)
+
+        result: pd.DataFrame | None = None
+        pending = np.arange(len(inputs))
+        stats: dict[str, int] = {}
+        for geocoder in self.geocoders:
+            out = geocoder.geocode(inputs.iloc[pending].reset_index(drop=True))
+            out = out.reset_index(drop=True).reindex(columns=GEOCODE_COLUMNS)
+            resolved = (out["lat"].notna() & out["lon"].notna()).to_numpy()
+            if result is None:
+                result = out.astype({"lat": float, "lon": float})
+            elif resolved.any():
+                columns = ["lat", "lon", "matched_name", "postal_code", "address"]
+                result.loc[pending[resolved], columns] = out.loc[resolved, columns].to_numpy()
+            stats[type(geocoder).__name__] = int(resolved.sum())
+            pending = pending[~resolved]
+            if not len(pending):
+                break
+
+        assert result is not None
+        self.last_run_stats = {**stats, "unresolved": len(pending)}
+        logger.info("Geocoded %s addresses by tier: %s", len(inputs), self.last_run_stats)
+        return result
+
+
+def build_default_geocoder(settings: Settings, gazetteer_path: Path | None = None) -> Geocoder:
     """Construct the production OneMap geocoder from settings.
 
     Reads ``settings`` once at the wiring point and returns a fully-wired
     ``Geocoder``. Call sites pass the result around so the OneMap cache-key
-    format, rate limiting, and concurrency stay local to this module.
+    format, rate limiting, and concurrency stay local to this module. If a
+    gazetteer exists at ``gazetteer_path`` it is consulted first and OneMap
+    only sees its misses.
     """
+    onemap = _build_onemap_geocoder(settings)
+    if gazetteer_path is None or not gazetteer_path.exists():
+        return onemap
+    gazetteer = GazetteerGeocoder.from_parquet(gazetteer_path)
+    logger.info(
+        "Using address gazetteer (%s keys) before OneMap: %s", len(gazetteer), gazetteer_path
+    )
+    return CompositeGeocoder([gazetteer, onemap])
+
+
+def _build_onemap_geocoder(settings: Settings) -> OneMapGeocoder:
     from egg_n_bacon_housing.adapters.onemap import setup_onemap_headers
 
+    if settings.geocoding.engine == "async":
+        return AsyncOneMapGeocoder(
+            headers=setup_onemap_headers(settings),
+            cache_duration_hours=settings.geocoding.cache_duration_hours,
+            max_concurrency=settings.geocoding.max_workers,
+            requests_per_second=settings.geocoding.max_requests_per_second,
+            timeout=settings.geocoding.timeout_seconds,
+        )
     return OneMapGeocoder(
         headers=setup_onemap_headers(settings),
         cache_duration_hours=settings.geocoding.cache_duration_hours,
@@ -0,0 +1,247 @@
+"""Binary geometry store for GeoJSON sources.
+
+Parsing a large GeoJSON file with ``json.load`` and building shapely objects
+feature by feature costs seconds on every process start. Instead, each
+source is converted once into a GeoParquet file next to it
+(``.geometry_store/<stem>-<path hash>.parquet``):
+
+- ``geometry``: WKB (GeoParquet 1.0 metadata, OGC:CRS84 like GeoJSON);
+- ``_vertex_lon``/``_vertex_lat``: mean of the feature's raw coordinates,
+  the amenity loaders' centroid (closing ring vertices included);
+- one column per feature property (JSON text when its values mix types;
+  ``property_values`` decodes them).
+
+The source's size, mtime and SHA-256 are kept in the file metadata. A
+changed size or mtime triggers a content-hash check, and a changed hash
+triggers reconversion. Loaders read the store memory-mapped and only the
+columns they need.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shapely
+from shapely.geometry import shape
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = ".geometry_store"
+GEOMETRY_COLUMN = "geometry"
+VERTEX_LON_COLUMN = "_vertex_lon"
+VERTEX_LAT_COLUMN = "_vertex_lat"
+_RESERVED = {GEOMETRY_COLUMN, VERTEX_LON_COLUMN, VERTEX_LAT_COLUMN}
+# Bump when the conversion changes so existing stores are rebuilt.
+_FORMAT_VERSION = "1"
+_META_KEY = b"egg_n_bacon_housing.geometry_store"
+_JSON_FIELD = {b"encoding": b"json"}
+
+
+def store_path(source: Path) -> Path:
+    """Location of the converted store for a GeoJSON source."""
+    digest = hashlib.sha1(str(source.resolve()).encode()).hexdigest()[:8]
+    return source.parent / STORE_DIRNAME / f"{source.stem}-{digest}.parquet"
+
+
+def source_hash(source: Path) -> str:
+    """SHA-256 of the source file's bytes."""
+    digest = hashlib.sha256()
+    with open(source, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _vertex_mean(coords: list) -> tuple[float, float] | None:
+    flat = np.asarray(_flatten(coords), dtype=float).reshape(-1, 2)
+    if not len(flat):
+        return None
+    lon, lat = flat.mean(axis=0)
+    return float(lon), float(lat)
+
+
+def _flatten(coords: list) -> list[float]:
+    if not coords:
+        return []
+    if isinstance(coords[0], int | float):
+        return list(coords[:2])
+    return [value for item in coords for value in _flatten(item)]
+
+
+def _feature_geometry(geometry: dict | None) -> tuple[bytes | None, tuple[float, float] | None]:
+    """WKB and raw-vertex centroid of a GeoJSON geometry."""
+    if not geometry:
+        return None, None
+    coords = geometry.get("coordinates", [])
+    if geometry.get("type") == "Point":
+        vertex = (float(coords[0]), float(coords[1])) if len(coords) >= 2 else None
+    else:
+        vertex = _vertex_mean(coords)
+    try:
+        wkb = shapely.to_wkb(shape(geometry))
+    except (ValueError, TypeError, AttributeError, shapely.errors.ShapelyError):
+        wkb = None
+    return wkb, vertex
+
+
+def _property_field(name: str, values: list) -> tuple[pa.Field, pa.Array]:
+    """Arrow column of one property; mixed-type values are stored as JSON."""
+    try:
+        array = pa.array(values)
+        return pa.field(name, array.type), array
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        array = pa.array([None if v is None else json.dumps(v) for v in values], pa.string())
+        return pa.field(name, pa.string(), metadata=_JSON_FIELD), array
+
+
+def property_values(table: pa.Table, name: str) -> list:
+    """Python values of a property column, as they were in the GeoJSON."""
+    if name not in table.column_names:
+        return [None] * table.num_rows
+    values = table.column(name).to_pylist()
+    if table.schema.field(name).metadata == _JSON_FIELD:
+        return [None if v is None else json.loads(v) for v in values]
+    return values
+
+
+def convert_geojson(source: Path) -> pa.Table:
+    """Parse a GeoJSON file into a store table (see module docstring)."""
+    raw = source.read_bytes()
+    data = json.loads(raw.decode("utf-8", errors="replace"))
+    features = data.get("features", [])
+
+    geometries, lons, lats, types = [], [], [], set()
+    for feature in features:
+        wkb, vertex = _feature_geometry(feature.get("geometry"))
+        if wkb is not None:
+            types.add(feature["geometry"]["type"])
+        geometries.append(wkb)
+        lons.append(vertex[0] if vertex else None)
+        lats.append(vertex[1] if vertex else None)
+
+    properties = [feature.get("properties") or {} for feature in features]
+    names = dict.fromkeys(str(key) for props in properties for key in props)
+    fields = [
+        pa.field(GEOMETRY_COLUMN, pa.binary()),
+        pa.field(VERTEX_LON_COLUMN, pa.float64()),
+        pa.field(VERTEX_LAT_COLUMN, pa.float64()),
+    ]
+    arrays = [
+        pa.array(geometries, pa.binary()),
+        pa.array(lons, pa.float64()),
+        pa.array(lats, pa.float64()),
+    ]
+    for name in names:
+        if name not in _RESERVED:
+            field, array = _property_field(name, [props.get(name) for props in properties])
+            fields.append(field)
+            arrays.append(array)
+    table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+    geo = {
+        "version": "1.0.0",
+        "primary_column": GEOMETRY_COLUMN,
+        "columns": {
+            GEOMETRY_COLUMN: {
+                "encoding": "WKB",
+                "geometry_types": sorted(types),
+            }
+        },
+    }
+    stat = source.stat()
+    meta = {
+        "format_version": _FORMAT_VERSION,
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_sha256": hashlib.sha256(raw).hexdigest(),
+    }
+    return _with_meta(table.replace_schema_metadata({b"geo": json.dumps(geo).encode()}), meta)
+
+
+def _store_meta(path: Path) -> dict | None:
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    meta = json.loads(metadata.get(_META_KEY, b"{}"))
+    return meta if meta.get("format_version") == _FORMAT_VERSION else None
+
+
+def _with_meta(table: pa.Table, meta: dict) -> pa.Table:
+    metadata = dict(table.schema.metadata or {})
+    metadata[_META_KEY] = json.dumps(meta).encode()
+    return table.replace_schema_metadata(metadata)
+
+
+def _write(table: pa.Table, path: Path) -> bool:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        pq.write_table(table, tmp)
+        tmp.replace(path)
+    except OSError as e:
+        logger.warning("Could not write geometry store %s: %s", path, e)
+        return False
+    return True
+
+
+def _is_fresh(source: Path, path: Path) -> bool:
+    """Whether the store matches the source, by stat or else by content hash.
+
+    A store whose content still matches after a stat change (e.g. a fresh
+    checkout) gets its recorded stat updated, so the next check is cheap.
+    """
+    meta = _store_meta(path) if path.exists() else None
+    if meta is None:
+        return False
+    stat = source.stat()
+    if (meta["source_size"], meta["source_mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+        return True
+    if meta["source_size"] != stat.st_size or meta["source_sha256"] != source_hash(source):
+        return False
+    meta.update(source_size=stat.st_size, source_mtime_ns=stat.st_mtime_ns)
+    _write(_with_meta(pq.read_table(path), meta), path)
+    return True
+
+
+def source_fingerprint(source: Path) -> str:
+    """SHA-256 of a GeoJSON source, read from its store when that is fresh."""
+    path = store_path(source)
+    if _is_fresh(source, path):
+        meta = _store_meta(path)
+        if meta is not None:
+            return meta["source_sha256"]
+    return source_hash(source)
+
+
+def load_geometry_table(source: Path, columns: list[str] | None = None) -> pa.Table:
+    """Read the store for a GeoJSON source, converting it first if needed.
+
+    The store is memory-mapped. If it cannot be written, the freshly
+    converted table is returned instead.
+
+    Args:
+        source: GeoJSON file.
+        columns: Columns to read; property columns missing from the source
+            are skipped. Defaults to all columns.
+    """
+    path = store_path(source)
+    if not _is_fresh(source, path):
+        table = convert_geojson(source)
+        if not _write(table, path):
+            names = table.column_names if columns is None else columns
+            return table.select([c for c in names if c in table.column_names])
+        logger.info("Converted %s (%s features) to %s", source.name, table.num_rows, path)
+
+    available = pq.read_schema(path).names
+    wanted = None if columns is None else [c for c in columns if c in available]
+    return pq.read_table(path, columns=wanted, memory_map=True)
+
+
+def geometries(table: pa.Table) -> np.ndarray:
+    """Shapely geometries of a store table (None where the source had none)."""
+    return shapely.from_wkb(table.column(GEOMETRY_COLUMN).to_numpy(zero_copy_only=False))
@@ -2,6 +2,8 @@
 
 One interface, two adapters:
 - TrackedWriter (prod): path routing, quality monitoring, compression from settings.
+  The frame is converted to Arrow once; the same table is written and handed
+  to the quality collector, which computes metrics on a background thread.
 - SimpleWriter (tests): mkdir + to_parquet, no side effects.
 
 Single deep interface for all DAG layer persistence.
@@ -12,6 +14,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from egg_n_bacon_housing.config import Settings
 
@@ -85,7 +89,8 @@ class TrackedWriter(LayerWriter):
             return path
         path.parent.mkdir(parents=True, exist_ok=True)
         compression = self.settings.pipeline.parquet_compression
-        df.to_parquet(path, index=False, compression=compression)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, path, compression=compression)
         logger.info(
             "Saved %s %s records to %s (compression: %s)",
             len(df),
@@ -94,14 +99,16 @@ class TrackedWriter(LayerWriter):
             compression,
         )
 
-        from egg_n_bacon_housing.utils.data_quality import record_dataframe_quality
+        from egg_n_bacon_housing.utils.data_quality import submit_table_quality
+        from egg_n_bacon_housing.utils.quality_metrics import ArrowMetricsEngine
 
-        record_dataframe_quality(
-            df,
+        submit_table_quality(
+            table,
             dataset_name=name,
             db_path=self.settings.data_dir / "quality_metrics.db",
             source="layer_writer",
             stage=f"L_{layer}",
+            engine=ArrowMetricsEngine(self.settings.pipeline.quality_exact_max_rows),
         )
 
         return path
@@ -0,0 +1,100 @@
+"""PartitionedParquet: Hive-style partitioned datasets for large gold tables.
+
+A dataset is a directory of ``<column>=<value>/part-0.parquet`` partitions.
+Writes replace only the partitions present in the written frame, so callers
+can refresh a subset of partitions and leave the rest untouched.
+"""
+
+import logging
+import shutil
+from collections.abc import Iterable
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+logger = logging.getLogger(__name__)
+
+
+def partition_path(dataset_dir: Path, column: str, value: str) -> Path:
+    """Directory holding the ``column=value`` partition."""
+    return dataset_dir / f"{column}={quote(str(value), safe='')}"
+
+
+def list_partitions(dataset_dir: Path, column: str) -> list[str]:
+    """Return the partition values present on disk, sorted."""
+    if not dataset_dir.is_dir():
+        return []
+    prefix = f"{column}="
+    return sorted(
+        unquote(p.name[len(prefix) :])
+        for p in dataset_dir.iterdir()
+        if p.is_dir() and p.name.startswith(prefix)
+    )
+
+
+def write_partitions(
+    df: pd.DataFrame,
+    dataset_dir: Path,
+    column: str,
+    compression: str = "snappy",
+) -> list[str]:
+    """Write ``df`` partitioned by ``column``, replacing only those partitions.
+
+    Partition values are written as strings. Returns the partition values
+    written (empty if ``df`` is empty).
+    """
+    if df.empty:
+        logger.debug("Skipping partitioned write for empty DataFrame: %s", dataset_dir.name)
+        return []
+
+    df = df.assign(**{column: df[column].astype(str)})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    dataset_dir.mkdir(parents=True, exist_ok=True)
+    ds.write_dataset(
+        table,
+        dataset_dir,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([(column, pa.string())]), flavor="hive"),
+        existing_data_behavior="delete_matching",
+        basename_template="part-{i}.parquet",
+        file_options=ds.ParquetFileFormat().make_write_options(compression=compression),
+    )
+    values = sorted(df[column].unique())
+    logger.info(
+        "Saved %s %s records across %s %s partitions",
+        len(df),
+        dataset_dir.name,
+        len(values),
+        column,
+    )
+    return values
+
+
+def read_partitions(
+    dataset_dir: Path,
+    column: str,
+    values: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """Read the given partitions (all if ``values`` is None) into one DataFrame.
+
+    Partitions are read file by file and concatenated with pandas, so
+    partitions written in different runs need not share an Arrow schema.
+    """
+    selected = list_partitions(dataset_dir, column) if values is None else list(values)
+    frames = []
+    for value in selected:
+        part_dir = partition_path(dataset_dir, column, value)
+        for part_file in sorted(part_dir.glob("*.parquet")):
+            frames.append(pd.read_parquet(part_file).assign(**{column: value}))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def drop_partitions(dataset_dir: Path, column: str, values: Iterable[str]) -> None:
+    """Delete the given partitions if present."""
+    for value in values:
+        shutil.rmtree(partition_path(dataset_dir, column, value), ignore_errors=True)
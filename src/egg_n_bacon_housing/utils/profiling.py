@@ -0,0 +1,185 @@
+"""Per-node timing and memory profiling for the Hamilton pipeline.
+
+``NodeProfiler`` is a Hamilton lifecycle adapter that records, for every
+executed node: wall time, CPU time of the executing thread, growth of the
+process peak RSS, input/output row counts and the deep memory footprint of
+DataFrame outputs. After each run it writes a JSON report (by default
+``pipeline_profile.json`` next to ``quality_metrics.db``).
+
+Peak RSS is process-wide, so with parallel ingestion (``ingest_workers > 1``)
+the delta of overlapping nodes is attributed to whichever node raised the
+peak first.
+"""
+
+import json
+import logging
+import resource
+import sys
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+from hamilton.lifecycle import GraphExecutionHook, NodeExecutionHook
+
+logger = logging.getLogger(__name__)
+
+PROFILE_REPORT_FILENAME = "pipeline_profile.json"
+
+# ru_maxrss is kilobytes on Linux and bytes on macOS.
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss_bytes() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def _frames(value: Any) -> list[pd.DataFrame]:
+    """DataFrames held by a node value (a frame, or a dict of frames)."""
+    if isinstance(value, pd.DataFrame):
+        return [value]
+    if isinstance(value, dict):
+        return [v for v in value.values() if isinstance(v, pd.DataFrame)]
+    return []
+
+
+def _row_count(value: Any) -> int | None:
+    frames = _frames(value)
+    return sum(len(df) for df in frames) if frames else None
+
+
+def _frame_bytes(value: Any) -> int | None:
+    frames = _frames(value)
+    if not frames:
+        return None
+    return int(sum(df.memory_usage(deep=True).sum() for df in frames))
+
+
+class NodeProfiler(NodeExecutionHook, GraphExecutionHook):
+    """Hamilton adapter collecting per-node timings and writing a run report.
+
+    Args:
+        report_path: Where to write the JSON report after each run; ``None``
+            keeps the report in memory only (``self.report``).
+    """
+
+    def __init__(self, report_path: Path | None = None) -> None:
+        self.report_path = report_path
+        self.report: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._started: dict[tuple[str, str | None, str], tuple[float, float, int, int | None]] = {}
+        self._nodes: list[dict[str, Any]] = []
+        self._run_started = 0.0
+        self._run_started_at = ""
+
+    def run_before_graph_execution(self, *, final_vars: list[str], run_id: str, **kwargs: Any):
+        with self._lock:
+            self._started.clear()
+            self._nodes = []
+        self._run_started = time.perf_counter()
+        self._run_started_at = datetime.now(UTC).isoformat()
+
+    def run_before_node_execution(
+        self,
+        *,
+        node_name: str,
+        node_kwargs: dict[str, Any],
+        task_id: str | None,
+        run_id: str,
+        **kwargs: Any,
+    ):
+        input_rows = [_row_count(v) for v in node_kwargs.values()]
+        counted = [r for r in input_rows if r is not None]
+        with self._lock:
+            self._started[(run_id, task_id, node_name)] = (
+                time.perf_counter(),
+                time.thread_time(),
+                _peak_rss_bytes(),
+                sum(counted) if counted else None,
+            )
+
+    def run_after_node_execution(
+        self,
+        *,
+        node_name: str,
+        node_tags: dict[str, Any],
+        result: Any,
+        success: bool,
+        task_id: str | None,
+        run_id: str,
+        **kwargs: Any,
+    ):
+        wall_end, cpu_end, rss_end = time.perf_counter(), time.thread_time(), _peak_rss_bytes()
+        with self._lock:
+            started = self._started.pop((run_id, task_id, node_name), None)
+        if started is None:
+            return
+        wall_start, cpu_start, rss_start, input_rows = started
+        record = {
+            "node": node_name,
+            "module": node_tags.get("module"),
+            "success": success,
+            "wall_seconds": round(wall_end - wall_start, 6),
+            "cpu_seconds": round(cpu_end - cpu_start, 6),
+            "peak_rss_delta_bytes": rss_end - rss_start,
+            "input_rows": input_rows,
+            "output_rows": _row_count(result),
+            "output_bytes": _frame_bytes(result),
+        }
+        with self._lock:
+            self._nodes.append(record)
+
+    def run_after_graph_execution(self, *, success: bool, run_id: str, **kwargs: Any):
+        with self._lock:
+            nodes = sorted(self._nodes, key=lambda r: r["wall_seconds"], reverse=True)
+        self.report = {
+            "run_id": run_id,
+            "started_at": self._run_started_at,
+            "finished_at": datetime.now(UTC).isoformat(),
+            "success": success,
+            "wall_seconds": round(time.perf_counter() - self._run_started, 6),
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "nodes": nodes,
+        }
+        if self.report_path is None:
+            return
+        try:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            self.report_path.write_text(json.dumps(self.report, indent=2))
+            logger.info("Saved pipeline profile (%s nodes) to %s", len(nodes), self.report_path)
+        except OSError as e:
+            logger.warning("Could not write pipeline profile to %s: %s", self.report_path, e)
+
+
+def load_profile(report_path: Path) -> dict[str, Any]:
+    """Load a report written by ``NodeProfiler``."""
+    return json.loads(report_path.read_text())
+
+
+def format_top_nodes(report: dict[str, Any], top_n: int = 15) -> str:
+    """Render the ``top_n`` slowest nodes of a profile report as a text table."""
+    nodes = sorted(report.get("nodes", []), key=lambda r: r["wall_seconds"], reverse=True)
+    header = (
+        f"{'node':<36} {'wall s':>9} {'cpu s':>9} {'rss +MB':>9} "
+        f"{'rows in':>10} {'rows out':>10} {'out MB':>9}"
+    )
+    lines = [header, "-" * len(header)]
+
+    def _num(value: int | None) -> str:
+        return "-" if value is None else f"{value:,}"
+
+    def _mb(value: int | None) -> str:
+        return "-" if value is None else f"{value / 1e6:.1f}"
+
+    for r in nodes[:top_n]:
+        lines.append(
+            f"{r['node'][:36]:<36} {r['wall_seconds']:>9.2f} {r['cpu_seconds']:>9.2f} "
+            f"{_mb(r['peak_rss_delta_bytes']):>9} {_num(r['input_rows']):>10} "
+            f"{_num(r['output_rows']):>10} {_mb(r['output_bytes']):>9}"
+        )
+    total = report.get("wall_seconds")
+    if total is not None:
+        lines.append(f"{len(nodes)} nodes, run wall time {total:.2f}s")
+    return "\n".join(lines)
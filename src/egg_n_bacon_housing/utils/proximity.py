@@ -3,23 +3,246 @@
 Absorbs school_features.py proximity logic
 and the inline _nearest_mall_features from features.
 
-One function: compute_proximity_features(properties_df, poi_dfs) -> DataFrame.
+Build a ProximityIndex once from the POI frames and join it onto any number of
+property frames, or call compute_proximity_features(properties_df, ...) for a
+one-off build-and-join. cached_proximity_index persists built indices under the
+CacheManager directory, keyed by a hash of the cleaned POI arrays, and loads
+them back on later runs, rebuilding each tree over memory-mapped points.
 """
 
+import hashlib
+import json
 import logging
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
 
 import numpy as np
 import pandas as pd
 from scipy.spatial import cKDTree
-from sklearn.neighbors import BallTree
 
-from egg_n_bacon_housing.utils.geo import haversine_distance
+from egg_n_bacon_housing.utils.cache import get_cache_manager
+from egg_n_bacon_housing.utils.geo import EARTH_RADIUS_M, haversine_many
 from egg_n_bacon_housing.utils.mrt_line_mapping import (
     get_station_score,
 )
 
 logger = logging.getLogger(__name__)
 
+GENERIC_AMENITY_LABELS = (
+    "hawker",
+    "supermarket",
+    "park",
+    "childcare",
+    "kindergarten",
+    "bus_stop",
+    "chas_clinic",
+    "sports_facility",
+    "community_club",
+    "green_mark_building",
+)
+
+_INDEX_FORMAT_VERSION = 3
+_INDEX_CACHE_SUBDIR = "proximity_index"
+
+MRT_COLUMNS = (
+    "nearest_mrt_station",
+    "nearest_mrt_tier",
+    "nearest_mrt_is_interchange",
+    "nearest_mrt_distance",
+    "dist_to_nearest_mrt",
+    "nearest_mrt_score",
+)
+
+
+class _LayerArrays(NamedTuple):
+    """Cleaned POI arrays for one layer, before any tree is built."""
+
+    names: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    extras: dict[str, np.ndarray]
+
+
+@dataclass(frozen=True)
+class ProximityLayer:
+    """One amenity type: cleaned POI coordinates plus the tree built over them.
+
+    MRT layers use a cKDTree over (lon, lat) degrees and recompute exact
+    haversine distances for the match. Every other layer uses a cKDTree over
+    unit-sphere vectors: chord length is monotonic in great-circle distance,
+    so the nearest neighbour is exact and the chord converts straight back to
+    metres. A layer with no usable POIs has ``tree=None`` and emits
+    all-missing columns.
+    """
+
+    label: str
+    names: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    tree: cKDTree | None
+    extras: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def is_mrt(self) -> bool:
+        return self.label == "mrt"
+
+    @classmethod
+    def build(
+        cls,
+        label: str,
+        names: np.ndarray,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        extras: dict[str, np.ndarray] | None = None,
+    ) -> "ProximityLayer":
+        """Build the layer's tree from already-cleaned POI arrays."""
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        tree = cKDTree(_tree_points(label, lat, lon)) if len(lat) else None
+        return cls(
+            label=label,
+            names=np.asarray(names, dtype=object),
+            lat=lat,
+            lon=lon,
+            tree=tree,
+            extras=extras or {},
+        )
+
+
+class ProximityIndex:
+    """Nearest-amenity index over every POI layer, built once and reusable.
+
+    POI coordinates are cleaned and indexed once per layer; ``query`` converts
+    property coordinates to unit-sphere vectors once and returns every nearest
+    name and distance column as a single block, which ``join`` attaches to the
+    frame.
+    """
+
+    def __init__(self, layers: dict[str, ProximityLayer]):
+        self.layers = layers
+
+    @property
+    def labels(self) -> list[str]:
+        return list(self.layers)
+
+    @classmethod
+    def from_pois(
+        cls,
+        mrt_stations: pd.DataFrame | None = None,
+        malls: pd.DataFrame | None = None,
+        hawkers: pd.DataFrame | None = None,
+        supermarkets: pd.DataFrame | None = None,
+        parks: pd.DataFrame | None = None,
+        childcare: pd.DataFrame | None = None,
+        kindergartens: pd.DataFrame | None = None,
+        bus_stops: pd.DataFrame | None = None,
+        chas_clinics: pd.DataFrame | None = None,
+        sports_facilities: pd.DataFrame | None = None,
+        community_clubs: pd.DataFrame | None = None,
+        green_mark_buildings: pd.DataFrame | None = None,
+    ) -> "ProximityIndex":
+        """Build one layer per non-empty POI frame (see compute_proximity_features)."""
+        arrays = _layer_arrays(
+            mrt_stations=mrt_stations,
+            malls=malls,
+            hawkers=hawkers,
+            supermarkets=supermarkets,
+            parks=parks,
+            childcare=childcare,
+            kindergartens=kindergartens,
+            bus_stops=bus_stops,
+            chas_clinics=chas_clinics,
+            sports_facilities=sports_facilities,
+            community_clubs=community_clubs,
+            green_mark_buildings=green_mark_buildings,
+        )
+        return cls._from_arrays(arrays)
+
+    @classmethod
+    def _from_arrays(cls, arrays: dict[str, _LayerArrays]) -> "ProximityIndex":
+        return cls(
+            {
+                label: ProximityLayer.build(label, a.names, a.lat, a.lon, a.extras)
+                for label, a in arrays.items()
+            }
+        )
+
+    def query(self, properties_df: pd.DataFrame) -> pd.DataFrame:
+        """Return the proximity feature block for ``properties_df``.
+
+        The result has one row per input row, in the same order and with the
+        same index, and contains only the proximity columns.
+        """
+        lat = pd.to_numeric(properties_df["lat"], errors="coerce").to_numpy(dtype=np.float64)
+        lon = pd.to_numeric(properties_df["lon"], errors="coerce").to_numpy(dtype=np.float64)
+        valid = ~(np.isnan(lat) | np.isnan(lon))
+        positions = np.flatnonzero(valid)
+        lat_valid = lat[valid]
+        lon_valid = lon[valid]
+        unit_coords = _unit_vectors(lat_valid, lon_valid)
+
+        columns: dict[str, np.ndarray] = {}
+        for layer in self.layers.values():
+            if layer.is_mrt:
+                columns.update(_query_mrt(layer, lat_valid, lon_valid, positions, len(lat)))
+            else:
+                columns.update(_query_amenity(layer, unit_coords, positions, len(lat)))
+
+        return pd.DataFrame(columns, index=properties_df.index)
+
+    def join(self, properties_df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of ``properties_df`` with the proximity block attached.
+
+        Existing proximity columns are replaced and ``lat``/``lon`` are
+        coerced to numeric.
+        """
+        block = self.query(properties_df)
+        df = properties_df.drop(columns=block.columns, errors="ignore")
+        df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
+        df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+        out = pd.concat([df.reset_index(drop=True), block.reset_index(drop=True)], axis=1)
+        out.index = properties_df.index
+        return out
+
+    def save(self, directory: Path) -> None:
+        """Persist cleaned POI arrays and tree points as ``.npy`` files.
+
+        The manifest is written last into a temporary directory that is then
+        renamed, so a half-written index is never picked up by ``load``.
+        """
+        tmp_dir = directory.with_name(f"{directory.name}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        try:
+            layers = [_save_layer(layer, tmp_dir) for layer in self.layers.values()]
+            manifest = {
+                "format": _INDEX_FORMAT_VERSION,
+                "layers": layers,
+            }
+            (tmp_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+            shutil.rmtree(directory, ignore_errors=True)
+            tmp_dir.replace(directory)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @classmethod
+    def load(cls, directory: Path) -> "ProximityIndex":
+        """Load an index written by ``save`` with memory-mapped arrays.
+
+        Each tree is rebuilt over its memory-mapped points without copying them.
+
+        Raises:
+            ValueError: If the index was written by another format version.
+        """
+        manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+        if manifest.get("format") != _INDEX_FORMAT_VERSION:
+            raise ValueError(f"Incompatible proximity index at {directory}")
+        layers = [_load_layer(entry, directory) for entry in manifest["layers"]]
+        return cls({layer.label: layer for layer in layers})
+
 
 def compute_proximity_features(
     properties_df: pd.DataFrame,
@@ -36,6 +259,7 @@ def compute_proximity_features(
     sports_facilities: pd.DataFrame | None = None,
     community_clubs: pd.DataFrame | None = None,
     green_mark_buildings: pd.DataFrame | None = None,
+    index: ProximityIndex | None = None,
 ) -> pd.DataFrame:
     """Compute all proximity features for a property dataset.
 
@@ -44,6 +268,10 @@ def compute_proximity_features(
     community club, and green mark building distances and names.
     Gracefully handles missing POI datasets (skips those features).
 
+    Builds a ProximityIndex from the POI frames unless a prebuilt ``index``
+    is passed, in which case the POI frames are ignored and the index is
+    reused as-is.
+
     Args:
         properties_df: Properties with lat/lon columns.
         mrt_stations: DataFrame with name, lat, lon, plus MRT metadata.
@@ -59,107 +287,178 @@ def compute_proximity_features(
         sports_facilities: DataFrame with name, lat, lon.
         community_clubs: DataFrame with name, lat, lon.
         green_mark_buildings: DataFrame with name, lat, lon.
+        index: Prebuilt ProximityIndex to reuse across calls.
 
     Returns:
         Properties DataFrame with proximity feature columns added.
     """
-    df = properties_df.copy()
-    df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
-    df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+    if index is not None:
+        return index.join(properties_df)
+
+    index = ProximityIndex.from_pois(
+        mrt_stations=mrt_stations,
+        malls=malls,
+        hawkers=hawkers,
+        supermarkets=supermarkets,
+        parks=parks,
+        childcare=childcare,
+        kindergartens=kindergartens,
+        bus_stops=bus_stops,
+        chas_clinics=chas_clinics,
+        sports_facilities=sports_facilities,
+        community_clubs=community_clubs,
+        green_mark_buildings=green_mark_buildings,
+    )
+    return index.join(properties_df)
 
-    if mrt_stations is not None and not mrt_stations.empty:
-        df = _compute_mrt_proximity(df, mrt_stations)
 
-    if malls is not None and not malls.empty:
-        df = _compute_mall_proximity(df, malls)
-
-    generic_amenities = {
-        "hawker": hawkers,
-        "supermarket": supermarkets,
-        "park": parks,
-        "childcare": childcare,
-        "kindergarten": kindergartens,
-        "bus_stop": bus_stops,
-        "chas_clinic": chas_clinics,
-        "sports_facility": sports_facilities,
-        "community_club": community_clubs,
-        "green_mark_building": green_mark_buildings,
+def poi_fingerprint(**pois: pd.DataFrame | None) -> str:
+    """Content hash of the cleaned POI arrays behind a ProximityIndex.
+
+    Takes the same keyword arguments as ``ProximityIndex.from_pois``. The hash
+    only changes when a layer's names, coordinates or MRT metadata change.
+    """
+    return _fingerprint(_layer_arrays(**pois))
+
+
+def cached_proximity_index(
+    cache_dir: Path | None = None, **pois: pd.DataFrame | None
+) -> ProximityIndex:
+    """Return a ProximityIndex for ``pois``, reusing a persisted build if present.
+
+    Indices live under ``<cache_dir>/proximity_index/<hash>/``. ``cache_dir``
+    defaults to the configured CacheManager directory; when the cache is not
+    configured or disabled, the index is simply built in memory.
+
+    Args:
+        cache_dir: Cache root directory (defaults to the CacheManager's).
+        **pois: Same keyword arguments as ``ProximityIndex.from_pois``.
+    """
+    if cache_dir is None:
+        try:
+            cache_manager = get_cache_manager()
+        except RuntimeError:
+            return ProximityIndex.from_pois(**pois)
+        if not cache_manager.use_caching:
+            return ProximityIndex.from_pois(**pois)
+        cache_dir = cache_manager.cache_dir
+
+    arrays = _layer_arrays(**pois)
+    digest = hashlib.sha256(f"{_fingerprint(arrays)}|v{_INDEX_FORMAT_VERSION}".encode()).hexdigest()
+    directory = cache_dir / _INDEX_CACHE_SUBDIR / digest
+
+    if (directory / "manifest.json").exists():
+        start = time.perf_counter()
+        try:
+            index = ProximityIndex.load(directory)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Proximity index cache unreadable, rebuilding: %s", exc)
+        else:
+            logger.info(
+                "Proximity index cache hit %s: %s layers loaded in %.3fs",
+                digest[:12],
+                len(index.layers),
+                time.perf_counter() - start,
+            )
+            return index
+
+    start = time.perf_counter()
+    index = ProximityIndex._from_arrays(arrays)
+    logger.info(
+        "Proximity index cache miss %s: %s layers rebuilt in %.3fs",
+        digest[:12],
+        len(index.layers),
+        time.perf_counter() - start,
+    )
+    try:
+        index.save(directory)
+        return ProximityIndex.load(directory)
+    except (OSError, ValueError) as exc:
+        logger.warning("Failed to persist proximity index: %s", exc)
+        return index
+
+
+def _fingerprint(arrays: dict[str, _LayerArrays]) -> str:
+    digest = hashlib.sha256()
+    for label, layer in arrays.items():
+        digest.update(label.encode())
+        digest.update(pd.util.hash_array(np.asarray(layer.names, dtype=object)).tobytes())
+        digest.update(np.asarray(layer.lat, dtype=np.float64).tobytes())
+        digest.update(np.asarray(layer.lon, dtype=np.float64).tobytes())
+        for col in sorted(layer.extras):
+            digest.update(col.encode())
+            digest.update(pd.util.hash_array(np.asarray(layer.extras[col])).tobytes())
+    return digest.hexdigest()
+
+
+def _save_layer(layer: ProximityLayer, directory: Path) -> dict:
+    """Write one layer's arrays and tree points; return its manifest entry."""
+
+    def save_array(name: str, values: np.ndarray) -> str:
+        filename = f"{layer.label}.{name}.npy"
+        np.save(directory / filename, values, allow_pickle=False)
+        return filename
+
+    # .npy cannot hold objects without pickling: store names as text plus a
+    # mask of the missing ones, so NaN names survive the round trip.
+    missing = pd.isna(np.asarray(layer.names, dtype=object))
+    names = np.array(
+        ["" if m else str(n) for n, m in zip(layer.names, missing, strict=True)], dtype=str
+    )
+    return {
+        "label": layer.label,
+        "names": save_array("names", names),
+        "names_missing": save_array("names_missing", missing),
+        "lat": save_array("lat", layer.lat),
+        "lon": save_array("lon", layer.lon),
+        "extras": {col: save_array(f"extra_{col}", v) for col, v in layer.extras.items()},
+        "points": save_array("points", layer.tree.data) if layer.tree is not None else None,
     }
-    for label, poi_df in generic_amenities.items():
-        if poi_df is not None and not poi_df.empty:
-            df = _compute_generic_proximity(df, poi_df, label)
-
-    return df
-
-
-def _compute_mrt_proximity(df: pd.DataFrame, mrt_stations: pd.DataFrame) -> pd.DataFrame:
-    """Add nearest MRT station features."""
-    station_coords = mrt_stations[["lon", "lat"]].values
-    tree = cKDTree(station_coords)
-
-    valid_mask = df["lat"].notna() & df["lon"].notna()
-    valid_df = df.loc[valid_mask]
-
-    if valid_df.empty:
-        df["nearest_mrt_station"] = None
-        df["nearest_mrt_distance"] = None
-        df["dist_to_nearest_mrt"] = None
-        df["nearest_mrt_tier"] = None
-        df["nearest_mrt_is_interchange"] = False
-        return df
-
-    property_coords = valid_df[["lon", "lat"]].values
-    _distances, indices = tree.query(property_coords, k=1)
-    nearest = mrt_stations.iloc[indices]
-
-    df.loc[valid_mask, "nearest_mrt_station"] = nearest["name"].values
-    if "tier" in nearest.columns:
-        df.loc[valid_mask, "nearest_mrt_tier"] = nearest["tier"].values
-    if "is_interchange" in nearest.columns:
-        df.loc[valid_mask, "nearest_mrt_is_interchange"] = nearest["is_interchange"].values
-    else:
-        df.loc[valid_mask, "nearest_mrt_is_interchange"] = False
-
-    mrt_coords = nearest[["lon", "lat"]].values
-    distances = np.array(
-        [
-            haversine_distance(lat1, lon1, lat2, lon2)
-            for (lon1, lat1), (lon2, lat2) in zip(property_coords, mrt_coords, strict=True)
-        ]
+
+
+def _load_layer(entry: dict, directory: Path) -> ProximityLayer:
+    def load_array(filename: str) -> np.ndarray:
+        return np.load(directory / filename, mmap_mode="r", allow_pickle=False)
+
+    tree = None
+    if entry["points"] is not None:
+        tree = cKDTree(load_array(entry["points"]), copy_data=False)
+    names = load_array(entry["names"]).astype(object)
+    names[load_array(entry["names_missing"])] = np.nan
+    return ProximityLayer(
+        label=entry["label"],
+        names=names,
+        lat=load_array(entry["lat"]),
+        lon=load_array(entry["lon"]),
+        tree=tree,
+        extras={col: load_array(filename) for col, filename in entry["extras"].items()},
     )
-    df.loc[valid_mask, "nearest_mrt_distance"] = distances
-    df.loc[valid_mask, "dist_to_nearest_mrt"] = distances
-
-    df.loc[valid_mask, "nearest_mrt_score"] = [
-        get_station_score(name, dist)
-        for name, dist in zip(
-            df.loc[valid_mask, "nearest_mrt_station"],
-            df.loc[valid_mask, "nearest_mrt_distance"],
-            strict=True,
-        )
-    ]
-
-    for col in [
-        "nearest_mrt_station",
-        "nearest_mrt_distance",
-        "dist_to_nearest_mrt",
-        "nearest_mrt_tier",
-        "nearest_mrt_is_interchange",
-        "nearest_mrt_score",
-    ]:
-        df.loc[~valid_mask, col] = None if col != "nearest_mrt_is_interchange" else False
-        if col == "nearest_mrt_score":
-            df.loc[~valid_mask, col] = 0.0
 
-    logger.info(
-        "MRT proximity: median distance %sm",
-        f"{pd.to_numeric(df.loc[valid_mask, 'nearest_mrt_distance'], errors='coerce').median():.0f}",
+
+def _clean_poi_coords(
+    poi_df: pd.DataFrame, name_col: str, lat_col: str, lon_col: str
+) -> pd.DataFrame:
+    valid = poi_df[[name_col, lat_col, lon_col]].copy()
+    valid[lat_col] = pd.to_numeric(valid[lat_col], errors="coerce")
+    valid[lon_col] = pd.to_numeric(valid[lon_col], errors="coerce")
+    return valid.dropna(subset=[lat_col, lon_col])
+
+
+def _mrt_arrays(mrt_stations: pd.DataFrame) -> _LayerArrays:
+    extra_cols = [c for c in ("tier", "is_interchange") if c in mrt_stations.columns]
+    stations = mrt_stations[["name", "lat", "lon", *extra_cols]].copy()
+    stations["lat"] = pd.to_numeric(stations["lat"], errors="coerce")
+    stations["lon"] = pd.to_numeric(stations["lon"], errors="coerce")
+    stations = stations.dropna(subset=["lat", "lon"])
+    return _LayerArrays(
+        stations["name"].to_numpy(),
+        stations["lat"].to_numpy(),
+        stations["lon"].to_numpy(),
+        {col: stations[col].to_numpy() for col in extra_cols},
     )
-    return df
 
 
-def _compute_mall_proximity(df: pd.DataFrame, malls: pd.DataFrame) -> pd.DataFrame:
-    """Add nearest mall distance and name features."""
+def _mall_arrays(malls: pd.DataFrame) -> _LayerArrays:
     name_col = next(
         (c for c in ["shopping_mall", "name", "mall_name"] if c in malls.columns),
         None,
@@ -168,94 +467,185 @@ def _compute_mall_proximity(df: pd.DataFrame, malls: pd.DataFrame) -> pd.DataFra
     lon_col = next((c for c in ["lon", "longitude"] if c in malls.columns), None)
 
     if not name_col or not lat_col or not lon_col:
-        df["dist_to_nearest_mall"] = pd.NA
-        df["nearest_mall"] = pd.NA
-        return df
-
-    valid_malls = malls[[name_col, lat_col, lon_col]].copy()
-    valid_malls[lat_col] = pd.to_numeric(valid_malls[lat_col], errors="coerce")
-    valid_malls[lon_col] = pd.to_numeric(valid_malls[lon_col], errors="coerce")
-    valid_malls = valid_malls.dropna(subset=[lat_col, lon_col])
-
-    if valid_malls.empty:
-        df["dist_to_nearest_mall"] = pd.NA
-        df["nearest_mall"] = pd.NA
-        return df
-
-    valid_mask = df["lat"].notna() & df["lon"].notna()
-    valid_df = df.loc[valid_mask]
-
-    if valid_df.empty:
-        df["dist_to_nearest_mall"] = pd.NA
-        df["nearest_mall"] = pd.NA
-        return df
-
-    property_coords = np.radians(valid_df[["lat", "lon"]].astype(float).to_numpy())
-    mall_coords = np.radians(valid_malls[[lat_col, lon_col]].to_numpy())
-
-    tree = BallTree(mall_coords, metric="haversine")
-    distances_rad, nearest_indices = tree.query(property_coords, k=1)
-    distances_m = distances_rad[:, 0] * 6371000
-    nearest_indices_flat = nearest_indices[:, 0]
-
-    df.loc[valid_mask, "dist_to_nearest_mall"] = distances_m
-    df.loc[valid_mask, "nearest_mall"] = valid_malls.iloc[nearest_indices_flat][name_col].to_numpy()
-
-    df.loc[~valid_mask, "dist_to_nearest_mall"] = pd.NA
-    df.loc[~valid_mask, "nearest_mall"] = pd.NA
-
-    return df
-
-
-def _compute_generic_proximity(df: pd.DataFrame, poi_df: pd.DataFrame, label: str) -> pd.DataFrame:
-    """Add nearest amenity distance and name for a generic POI type.
+        return _LayerArrays(np.array([], dtype=object), np.array([]), np.array([]), {})
+
+    valid_malls = _clean_poi_coords(malls, name_col, lat_col, lon_col)
+    return _LayerArrays(
+        valid_malls[name_col].to_numpy(),
+        valid_malls[lat_col].to_numpy(),
+        valid_malls[lon_col].to_numpy(),
+        {},
+    )
 
-    Uses BallTree with haversine metric for accurate distance computation.
 
-    Args:
-        df: Properties DataFrame with lat/lon.
-        poi_df: POI DataFrame with name, lat, lon.
-        label: Amenity label (e.g. 'hawker', 'supermarket', 'park').
-    """
+def _generic_arrays(poi_df: pd.DataFrame) -> _LayerArrays:
     name_col = "name" if "name" in poi_df.columns else poi_df.columns[0]
-    valid_pois = poi_df[[name_col, "lat", "lon"]].copy()
-    valid_pois["lat"] = pd.to_numeric(valid_pois["lat"], errors="coerce")
-    valid_pois["lon"] = pd.to_numeric(valid_pois["lon"], errors="coerce")
-    valid_pois = valid_pois.dropna(subset=["lat", "lon"])
-
-    dist_col = f"dist_to_nearest_{label}"
-    name_out_col = f"nearest_{label}"
-
-    if valid_pois.empty:
-        df[dist_col] = pd.NA
-        df[name_out_col] = pd.NA
-        return df
-
-    valid_mask = df["lat"].notna() & df["lon"].notna()
-    valid_df = df.loc[valid_mask]
+    valid_pois = _clean_poi_coords(poi_df, name_col, "lat", "lon")
+    return _LayerArrays(
+        valid_pois[name_col].to_numpy(),
+        valid_pois["lat"].to_numpy(),
+        valid_pois["lon"].to_numpy(),
+        {},
+    )
 
-    if valid_df.empty:
-        df[dist_col] = pd.NA
-        df[name_out_col] = pd.NA
-        return df
 
-    property_coords = np.radians(valid_df[["lat", "lon"]].astype(float).to_numpy())
-    poi_coords = np.radians(valid_pois[["lat", "lon"]].to_numpy())
+def _layer_arrays(
+    mrt_stations: pd.DataFrame | None = None,
+    malls: pd.DataFrame | None = None,
+    hawkers: pd.DataFrame | None = None,
+    supermarkets: pd.DataFrame | None = None,
+    parks: pd.DataFrame | None = None,
+    childcare: pd.DataFrame | None = None,
+    kindergartens: pd.DataFrame | None = None,
+    bus_stops: pd.DataFrame | None = None,
+    chas_clinics: pd.DataFrame | None = None,
+    sports_facilities: pd.DataFrame | None = None,
+    community_clubs: pd.DataFrame | None = None,
+    green_mark_buildings: pd.DataFrame | None = None,
+) -> dict[str, _LayerArrays]:
+    """Clean every non-empty POI frame into per-layer arrays, in output order."""
+    arrays: dict[str, _LayerArrays] = {}
 
-    tree = BallTree(poi_coords, metric="haversine")
-    distances_rad, nearest_indices = tree.query(property_coords, k=1)
-    distances_m = distances_rad[:, 0] * 6371000
-    nearest_indices_flat = nearest_indices[:, 0]
+    if mrt_stations is not None and not mrt_stations.empty:
+        arrays["mrt"] = _mrt_arrays(mrt_stations)
 
-    df.loc[valid_mask, dist_col] = distances_m
-    df.loc[valid_mask, name_out_col] = valid_pois.iloc[nearest_indices_flat][name_col].to_numpy()
+    if malls is not None and not malls.empty:
+        arrays["mall"] = _mall_arrays(malls)
+
+    generic_amenities = dict(
+        zip(
+            GENERIC_AMENITY_LABELS,
+            (
+                hawkers,
+                supermarkets,
+                parks,
+                childcare,
+                kindergartens,
+                bus_stops,
+                chas_clinics,
+                sports_facilities,
+                community_clubs,
+                green_mark_buildings,
+            ),
+            strict=True,
+        )
+    )
+    for label, poi_df in generic_amenities.items():
+        if poi_df is not None and not poi_df.empty:
+            arrays[label] = _generic_arrays(poi_df)
+
+    return arrays
+
+
+def _tree_points(label: str, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Points a layer's tree is built over: (lon, lat) degrees for MRT, else unit vectors."""
+    if label == "mrt":
+        return np.column_stack([lon, lat])
+    return _unit_vectors(lat, lon)
+
+
+def _unit_vectors(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Map (lat, lon) degrees onto 3-D points on the unit sphere."""
+    lat_rad = np.radians(lat)
+    lon_rad = np.radians(lon)
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack([cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)])
+
+
+def _scatter(values: np.ndarray, positions: np.ndarray, size: int, fill, dtype) -> np.ndarray:
+    """Place per-valid-row ``values`` at ``positions`` in a ``fill``-ed array."""
+    out = np.full(size, fill, dtype=dtype)
+    out[positions] = values
+    return out
+
+
+def _scatter_tier(
+    tier: np.ndarray | None, indices: np.ndarray, positions: np.ndarray, size: int
+) -> np.ndarray:
+    if tier is None:
+        return np.full(size, None, dtype=object)
+    values = tier[indices]
+    if np.issubdtype(values.dtype, np.number):
+        return _scatter(values, positions, size, np.nan, np.float64)
+    return _scatter(values, positions, size, None, object)
+
+
+def _query_mrt(
+    layer: ProximityLayer,
+    lat: np.ndarray,
+    lon: np.ndarray,
+    positions: np.ndarray,
+    size: int,
+) -> dict[str, np.ndarray]:
+    """Nearest MRT station, tier, interchange flag, distance and score."""
+    if layer.tree is None or len(positions) == 0:
+        return {
+            "nearest_mrt_station": np.full(size, None, dtype=object),
+            "nearest_mrt_tier": np.full(size, None, dtype=object),
+            "nearest_mrt_is_interchange": np.zeros(size, dtype=bool),
+            "nearest_mrt_distance": np.full(size, np.nan),
+            "dist_to_nearest_mrt": np.full(size, np.nan),
+            "nearest_mrt_score": np.zeros(size),
+        }
+
+    _distances, indices = layer.tree.query(np.column_stack([lon, lat]), k=1)
+    names = layer.names[indices]
+    distances = haversine_many(lat, lon, layer.lat[indices], layer.lon[indices])
+    scores = np.array(
+        [get_station_score(name, dist) for name, dist in zip(names, distances, strict=True)],
+        dtype=np.float64,
+    )
 
-    df.loc[~valid_mask, dist_col] = pd.NA
-    df.loc[~valid_mask, name_out_col] = pd.NA
+    tier = layer.extras.get("tier")
+    is_interchange = layer.extras.get("is_interchange")
+    columns = {
+        "nearest_mrt_station": _scatter(names, positions, size, None, object),
+        "nearest_mrt_tier": _scatter_tier(tier, indices, positions, size),
+        "nearest_mrt_is_interchange": _scatter(
+            is_interchange[indices].astype(bool)
+            if is_interchange is not None
+            else np.zeros(len(positions), dtype=bool),
+            positions,
+            size,
+            False,
+            bool,
+        ),
+        "nearest_mrt_distance": _scatter(distances, positions, size, np.nan, np.float64),
+        "dist_to_nearest_mrt": _scatter(distances, positions, size, np.nan, np.float64),
+        "nearest_mrt_score": _scatter(scores, positions, size, 0.0, np.float64),
+    }
 
-    logger.info(
-        "%s proximity: median distance %sm",
-        label.capitalize(),
-        f"{pd.to_numeric(df.loc[valid_mask, dist_col], errors='coerce').median():.0f}",
-    )
-    return df
+    logger.info("MRT proximity: median distance %sm", f"{np.median(distances):.0f}")
+    return columns
+
+
+def _query_amenity(
+    layer: ProximityLayer,
+    unit_coords: np.ndarray,
+    positions: np.ndarray,
+    size: int,
+) -> dict[str, np.ndarray]:
+    """Nearest amenity name and great-circle distance for a unit-sphere layer."""
+    dist_col = f"dist_to_nearest_{layer.label}"
+    name_col = f"nearest_{layer.label}"
+
+    if layer.tree is None or len(positions) == 0:
+        return {
+            dist_col: np.full(size, np.nan),
+            name_col: np.full(size, pd.NA, dtype=object),
+        }
+
+    chords, nearest_indices = layer.tree.query(unit_coords, k=1)
+    distances_m = 2 * np.arcsin(np.clip(chords / 2, 0.0, 1.0)) * EARTH_RADIUS_M
+    names = layer.names[nearest_indices]
+
+    if layer.label != "mall":
+        logger.info(
+            "%s proximity: median distance %sm",
+            layer.label.capitalize(),
+            f"{np.median(distances_m):.0f}",
+        )
+    return {
+        dist_col: _scatter(distances_m, positions, size, np.nan, np.float64),
+        name_col: _scatter(names, positions, size, pd.NA, object),
+    }
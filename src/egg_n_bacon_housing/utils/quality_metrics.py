@@ -0,0 +1,222 @@
+"""Metrics engines for data quality snapshots.
+
+An engine turns a (written) Arrow table into ``FrameMetrics``: row count,
+null counts, duplicate rows and per-column distinct counts and min/max.
+
+- ``PandasMetricsEngine`` is exact: ``duplicated()``/``isnull()``/``nunique()``
+  on the pandas frame, as the quality monitor always did. It also accepts
+  frames that cannot be converted to Arrow (``compute_frame``).
+- ``ArrowMetricsEngine`` reads null counts from the Arrow validity bitmaps
+  (no scan) and min/max from ``pyarrow.compute.min_max``. Up to
+  ``exact_max_rows`` rows, duplicates and distinct counts are exact. Above
+  it, every column is hashed once: string columns are dictionary-encoded
+  (exact distinct count, min/max from the dictionary), other columns get a
+  HyperLogLog distinct estimate, and duplicate rows are counted on 64-bit
+  row fingerprints combined from the column hashes (a false duplicate
+  needs a hash collision).
+"""
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+HLL_PRECISION = 14
+_ROW_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+@dataclass
+class ColumnMetrics:
+    """Quality metrics of one column."""
+
+    name: str
+    dtype: str
+    null_count: int
+    distinct_count: int | None = None
+    min_value: Any = None
+    max_value: Any = None
+
+
+@dataclass
+class FrameMetrics:
+    """Quality metrics of one table."""
+
+    rows: int
+    null_count: int
+    duplicate_count: int
+    duplicates_estimated: bool = False
+    columns: list[ColumnMetrics] = field(default_factory=list)
+
+    @property
+    def null_percentage(self) -> float:
+        cells = self.rows * len(self.columns)
+        return round(self.null_count / cells * 100, 2) if cells else 0.0
+
+
+class MetricsEngine(ABC):
+    """Computes ``FrameMetrics`` for a table."""
+
+    @abstractmethod
+    def compute(self, table: pa.Table) -> FrameMetrics: ...
+
+
+def _scalar(value: pa.Scalar) -> Any:
+    value = value.as_py()
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _is_string(kind: pa.DataType) -> bool:
+    return pa.types.is_string(kind) or pa.types.is_large_string(kind)
+
+
+def _is_scalar_number(kind: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(kind)
+        or pa.types.is_floating(kind)
+        or pa.types.is_boolean(kind)
+        or pa.types.is_temporal(kind)
+    )
+
+
+def _min_max(values: pa.Array | pa.ChunkedArray) -> tuple[Any, Any]:
+    if not (_is_string(values.type) or _is_scalar_number(values.type)) or pa.types.is_boolean(
+        values.type
+    ):
+        return None, None
+    result = pc.call_function("min_max", [values])
+    return _scalar(result["min"]), _scalar(result["max"])
+
+
+class PandasMetricsEngine(MetricsEngine):
+    """Exact metrics computed on the pandas frame."""
+
+    def compute(self, table: pa.Table) -> FrameMetrics:
+        return self.compute_frame(table.to_pandas())
+
+    def compute_frame(self, df: pd.DataFrame) -> FrameMetrics:
+        nulls = df.isnull().sum()
+        distinct = df.nunique(dropna=True)
+        columns = []
+        for i, (name, dtype) in enumerate(df.dtypes.items()):
+            low = high = None
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                low, high = df.iloc[:, i].min(), df.iloc[:, i].max()
+                low, high = (None if pd.isna(v) else v.item() for v in (low, high))
+            columns.append(
+                ColumnMetrics(
+                    name=str(name),
+                    dtype=str(dtype),
+                    null_count=int(nulls.iloc[i]),
+                    distinct_count=int(distinct.iloc[i]),
+                    min_value=low,
+                    max_value=high,
+                )
+            )
+        return FrameMetrics(
+            rows=len(df),
+            null_count=int(nulls.sum()),
+            duplicate_count=int(df.duplicated().sum()) if len(df.columns) else 0,
+            columns=columns,
+        )
+
+
+def hll_estimate(hashes: np.ndarray, precision: int = HLL_PRECISION) -> int:
+    """HyperLogLog distinct-count estimate of 64-bit hashes."""
+    if len(hashes) == 0:
+        return 0
+    m = 1 << precision
+    width = 64 - precision
+    index = (hashes >> np.uint64(width)).astype(np.intp)
+    rest = (hashes & np.uint64((1 << width) - 1)).astype(np.float64)
+    # Rank = position of the leftmost 1-bit in the remaining bits; frexp's
+    # exponent is the bit length (exact: the remainder has < 53 bits).
+    rank = (width + 1 - np.frexp(rest)[1]).astype(np.int8)
+    registers = np.zeros(m, dtype=np.int8)
+    np.maximum.at(registers, index, rank)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.exp2(-registers.astype(np.float64)))
+    zeros = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * math.log(m / zeros)
+    return int(round(estimate))
+
+
+class ArrowMetricsEngine(MetricsEngine):
+    """Metrics from Arrow buffers, hashing each column at most once.
+
+    Args:
+        exact_max_rows: Largest table whose duplicates and distinct counts
+            are computed exactly; larger tables use row fingerprints and
+            HyperLogLog.
+    """
+
+    def __init__(self, exact_max_rows: int = 250_000) -> None:
+        self.exact_max_rows = exact_max_rows
+
+    def _sketched_column(
+        self, name: str, column: pa.ChunkedArray
+    ) -> tuple[ColumnMetrics, np.ndarray]:
+        """Column metrics plus a per-row hash of the column."""
+        array = column.combine_chunks()
+        if _is_string(array.type):
+            encoded = array.dictionary_encode()
+            codes = pc.fill_null(encoded.indices, -1).to_numpy(zero_copy_only=False)
+            low, high = _min_max(encoded.dictionary)
+            metrics = ColumnMetrics(
+                name, str(array.type), array.null_count, len(encoded.dictionary), low, high
+            )
+            return metrics, pd.util.hash_array(codes.astype(np.int64))
+
+        if not _is_scalar_number(array.type):
+            values = array.to_pandas().astype(str).to_numpy()
+            return ColumnMetrics(name, str(array.type), array.null_count), pd.util.hash_array(
+                values
+            )
+
+        values = array.to_numpy(zero_copy_only=False)
+        if pa.types.is_temporal(array.type):
+            values = values.view(np.int64)
+        hashes = pd.util.hash_array(values)
+        present = hashes
+        if array.null_count:
+            nulls = array.is_null().to_numpy(zero_copy_only=False)
+            hashes[nulls] = np.uint64(0)
+            present = hashes[~nulls]
+        low, high = _min_max(array)
+        metrics = ColumnMetrics(
+            name, str(array.type), array.null_count, hll_estimate(present), low, high
+        )
+        return metrics, hashes
+
+    def compute(self, table: pa.Table) -> FrameMetrics:
+        columns = []
+        if table.num_rows <= self.exact_max_rows:
+            df = table.to_pandas()
+            distinct = df.nunique(dropna=True)
+            for i, (name, column) in enumerate(zip(table.column_names, table.columns, strict=True)):
+                low, high = _min_max(column)
+                columns.append(
+                    ColumnMetrics(
+                        name, str(column.type), column.null_count, int(distinct.iloc[i]), low, high
+                    )
+                )
+            duplicates = int(df.duplicated().sum()) if columns else 0
+        else:
+            row_hash = np.zeros(table.num_rows, dtype=np.uint64)
+            for name, column in zip(table.column_names, table.columns, strict=True):
+                metrics, hashes = self._sketched_column(name, column)
+                row_hash = row_hash * _ROW_HASH_MULTIPLIER ^ hashes
+                columns.append(metrics)
+            duplicates = table.num_rows - len(np.unique(row_hash)) if columns else 0
+        return FrameMetrics(
+            rows=table.num_rows,
+            null_count=sum(c.null_count for c in columns),
+            duplicate_count=duplicates,
+            duplicates_estimated=table.num_rows > self.exact_max_rows,
+            columns=columns,
+        )
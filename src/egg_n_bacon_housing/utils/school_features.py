@@ -11,7 +11,7 @@ import pandas as pd
 from rapidfuzz import fuzz, process
 from scipy.spatial import cKDTree
 
-from egg_n_bacon_housing.utils.geo import haversine_distance
+from egg_n_bacon_housing.utils.geo import haversine_distance, haversine_many
 from egg_n_bacon_housing.utils.geocoding import Geocoder
 
 # Constants
@@ -205,6 +205,25 @@ def calculate_accessibility_score(distance_m: float, quality_score: float) -> fl
     return distance_factor * quality_amplification * (quality_score / 10)
 
 
+def calculate_accessibility_scores(
+    distances_m: np.ndarray, quality_scores: np.ndarray
+) -> np.ndarray:
+    """Vectorized :func:`calculate_accessibility_score` over aligned arrays.
+
+    Args:
+        distances_m: Distances to school in meters.
+        quality_scores: School quality scores (0-10).
+
+    Returns:
+        Array of accessibility scores from 0-1.
+    """
+    distances_m = np.asarray(distances_m, dtype=float)
+    quality_norm = np.asarray(quality_scores, dtype=float) / 10
+    distance_factor = np.maximum(0, 1 - (distances_m / 2000))
+    decayed = distance_factor * (1 + quality_norm) * quality_norm
+    return np.where(distances_m <= 0, quality_norm, decayed)
+
+
 def fuzzy_match_schools(
     tier_schools: pd.DataFrame, official_schools: pd.DataFrame, min_score: int = 85
 ) -> tuple[pd.DataFrame, dict[str, str]]:
@@ -339,6 +358,46 @@ def _get_school_attributes(school: pd.Series) -> dict[str, Any]:
     }
 
 
+_SCHOOL_ATTRIBUTE_COLUMNS = {
+    "name": "school_name",
+    "type": "type_code",
+    "dgp": "dgp_code",
+    "zone": "zone_code",
+    "nature": "nature_code",
+    "mrt_desc": "mrt_desc",
+}
+_SCHOOL_INDICATOR_COLUMNS = {
+    "sap": "sap_ind",
+    "autonomous": "autonomous_ind",
+    "gifted": "gifted_ind",
+    "ip": "ip_ind",
+}
+
+
+def _get_school_attribute_arrays(schools: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Column-wise counterpart of :func:`_get_school_attributes` for a school table.
+
+    Returns one object array per attribute key, aligned with ``schools`` rows,
+    so nearest-school attributes can be gathered with a single fancy index.
+    """
+    n = len(schools)
+    attrs: dict[str, np.ndarray] = {}
+    for key, col in _SCHOOL_ATTRIBUTE_COLUMNS.items():
+        if col in schools.columns:
+            attrs[key] = schools[col].to_numpy(dtype=object)
+        else:
+            attrs[key] = np.full(n, None, dtype=object)
+    for key, col in _SCHOOL_INDICATOR_COLUMNS.items():
+        if col not in schools.columns:
+            attrs[key] = np.full(n, None, dtype=object)
+            continue
+        values = schools[col]
+        flags = (values == "Yes").to_numpy(dtype=object)
+        flags[values.isna().to_numpy()] = None
+        attrs[key] = flags
+    return attrs
+
+
 def _create_unique_location_index(properties_df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
     """Create unique location index and mapping back to original indices.
 
@@ -366,8 +425,121 @@ def _create_unique_location_index(properties_df: pd.DataFrame) -> tuple[pd.DataF
     return unique_coords, index_mapping
 
 
+def _compute_school_features_batched(
+    unique_coords: pd.DataFrame,
+    schools_by_level: dict[str, dict[str, Any]],
+    all_tree: cKDTree,
+    levels: list[str],
+) -> pd.DataFrame:
+    """Compute school features for all unique locations in one pass per tree.
+
+    Each cKDTree is queried once with the whole coordinate array (nearest
+    school via ``query``, radius counts via ``query_ball_point`` with
+    ``return_length=True``), and accessibility scores are computed with NumPy.
+
+    Args:
+        unique_coords: DataFrame of unique ``lat``/``lon`` pairs.
+        schools_by_level: Per-level ``tree``/``data`` built in
+            :func:`calculate_school_features`.
+        all_tree: cKDTree over every geocoded school.
+        levels: School levels to emit columns for.
+
+    Returns:
+        ``unique_coords`` with all school feature columns added.
+    """
+    unique_features = _initialize_school_columns(unique_coords.copy(), levels)
+    if unique_features.empty:
+        return unique_features
+
+    lat = unique_features["lat"].to_numpy(dtype=float)
+    lon = unique_features["lon"].to_numpy(dtype=float)
+    coords_rad = np.column_stack([np.radians(lat), np.radians(lon)])
+
+    density_counts = all_tree.query_ball_point(coords_rad, r=1000 / 6371000, return_length=True)
+    unique_features["school_density_score"] = np.minimum(density_counts / 10, 1.0)
+
+    for col_suffix, radius_m in DISTANCES.items():
+        unique_features[f"school_within_{col_suffix}"] = all_tree.query_ball_point(
+            coords_rad, r=radius_m / 6371000, return_length=True
+        )
+
+    primary_accessibility = np.zeros(len(unique_features))
+    secondary_accessibility = np.zeros(len(unique_features))
+
+    for level, school_data in schools_by_level.items():
+        level_code = level.split()[0]
+        tree = school_data["tree"]
+        level_df = school_data["data"]
+
+        _dist_radians, nearest_idx = tree.query(coords_rad, k=1)
+
+        school_lat = level_df["latitude"].to_numpy(dtype=float)[nearest_idx]
+        school_lon = level_df["longitude"].to_numpy(dtype=float)[nearest_idx]
+        true_dist = haversine_many(lat, lon, school_lat, school_lon)
+        unique_features[f"nearest_school{level_code}_dist"] = true_dist
+
+        quality = (
+            pd.to_numeric(level_df["quality_score"], errors="coerce")
+            .fillna(0.0)
+            .to_numpy(dtype=float)[nearest_idx]
+        )
+        if level == "PRIMARY":
+            primary_accessibility = calculate_accessibility_scores(true_dist, quality)
+            unique_features["school_primary_quality_score"] = quality
+            unique_features["school_primary_dist_score"] = primary_accessibility * 10
+        elif level == "SECONDARY (S1-S5)":
+            secondary_accessibility = calculate_accessibility_scores(true_dist, quality)
+            unique_features["school_secondary_quality_score"] = quality
+            unique_features["school_secondary_dist_score"] = secondary_accessibility * 10
+
+        for key, values in _get_school_attribute_arrays(level_df).items():
+            unique_features[f"nearest_school{level_code}_{key}"] = values[nearest_idx]
+
+        for col_suffix, radius_m in DISTANCES.items():
+            unique_features[f"school{level_code}_count{col_suffix}"] = tree.query_ball_point(
+                coords_rad, r=radius_m / 6371000, return_length=True
+            )
+
+    # Overall accessibility: weighted combination (40% primary, 60% secondary)
+    unique_features["school_accessibility_score"] = (
+        0.4 * primary_accessibility + 0.6 * secondary_accessibility
+    )
+    return unique_features
+
+
+def _merge_unique_features(
+    properties_df: pd.DataFrame, unique_features: pd.DataFrame
+) -> pd.DataFrame:
+    """Broadcast per-location features back onto every property with one merge.
+
+    Properties without coordinates get missing nearest-school attributes and
+    the zero counts/scores set by :func:`_initialize_school_columns`.
+    """
+    feature_columns = [col for col in unique_features.columns if col not in ("lat", "lon")]
+
+    merged = properties_df.drop(columns=feature_columns).merge(
+        unique_features, on=["lat", "lon"], how="left"
+    )
+    merged.index = properties_df.index
+
+    missing = merged["lat"].isna() | merged["lon"].isna()
+    for col in feature_columns:
+        if col.startswith("nearest_school"):
+            if merged[col].dtype == object:
+                merged[col] = merged[col].where(~missing, None)
+            continue
+        if "_count" in col or col.startswith("school_within_"):
+            merged[col] = merged[col].fillna(0).astype(int)
+        else:
+            merged[col] = merged[col].fillna(0.0)
+    return merged
+
+
 def calculate_school_features(
-    properties_df: pd.DataFrame, schools_df: pd.DataFrame, levels: list[str] = SCHOOL_LEVELS
+    properties_df: pd.DataFrame,
+    schools_df: pd.DataFrame,
+    levels: list[str] = SCHOOL_LEVELS,
+    batched: bool = True,
 ) -> pd.DataFrame:
     """Calculate school features using KDTree for efficient nearest-neighbor search.
 
@@ -375,6 +547,8 @@ def calculate_school_features(
         properties_df: DataFrame with property data (must have 'lat', 'lon' columns)
         schools_df: DataFrame with school data (must have 'latitude', 'longitude', 'mainlevel_code')
         levels: List of school levels to process
+        batched: Query each tree once with every unique location (default).
+            ``False`` uses the per-location reference loop.
 
     Returns:
         DataFrame with school features added
@@ -519,6 +693,18 @@ def calculate_school_features(
     props_with_coords = properties_df.dropna(subset=["lat", "lon"])
     total_original = len(props_with_coords)
 
+    if batched:
+        unique_coords = props_with_coords[["lat", "lon"]].drop_duplicates().reset_index(drop=True)
+        logger.info(
+            "Reduced to %s unique locations from %s total records",
+            len(unique_coords),
+            total_original,
+        )
+        unique_features = _compute_school_features_batched(
+            unique_coords, schools_by_level, all_tree, levels
+        )
+        return _merge_unique_features(properties_df, unique_features)
+
     unique_coords, index_mapping = _create_unique_location_index(props_with_coords)
     logger.info(
         "Reduced to %s unique locations from %s total records",
@@ -1,9 +1,11 @@
 """TimeIndex: shared month-period derivation for time-grouped operations.
 
 Deduplicates dt.to_period("M").astype(str) from 4 locations
-(features, metrics) into one function.
+(features, metrics) into one function, and parses the period labels of
+data.gov.sg tables ("2026Q1", "20261Q", "2026Apr") for the macro melts.
 """
 
+import calendar
 import logging
 
 import pandas as pd
@@ -44,3 +46,53 @@ def ensure_month_column(
         pd.to_datetime(df[date_column], errors="coerce").dt.to_period("M").astype(str)
     )
     return df
+
+
+_PERIOD_PATTERN = (
+    r"^(?P<year>\d{4})"
+    r"(?:Q(?P<quarter>[1-4])|(?P<quarter_suffix>[1-4])Q|(?P<month>(?i:[a-z]{3})))$"
+)
+_MONTH_NUMBERS = {name.lower(): f"{i:02d}" for i, name in enumerate(calendar.month_abbr) if name}
+# Years whose periods fit in datetime64[ns].
+_MIN_YEAR, _MAX_YEAR = 1678, 2261
+
+
+def parse_periods(values: pd.Series, freq: str | None = None) -> pd.Series:
+    """Parse data.gov.sg period labels into timestamps.
+
+    Quarters ("2026Q1" or "20261Q") become the quarter-end date; months
+    ("2026Apr", any case) become the first of the month. Each distinct
+    label is parsed once, by regex extraction and ``pd.PeriodIndex``
+    construction.
+
+    Args:
+        values: Period labels; surrounding whitespace is ignored.
+        freq: "Q" or "M" to accept only quarter or only month labels.
+
+    Returns:
+        datetime64[ns] Series aligned to ``values``; NaT where a label is
+        not a (valid) period of the accepted kinds.
+    """
+    values = pd.Series(values)
+    codes, labels = pd.factorize(values.astype(str).str.strip())
+    parts = pd.Series(labels, dtype=object).str.extract(_PERIOD_PATTERN)
+    year = pd.to_numeric(parts["year"])
+    in_range = year.between(_MIN_YEAR, _MAX_YEAR)
+    quarter = parts["quarter"].fillna("") + parts["quarter_suffix"].fillna("")
+    month = parts["month"].str.lower().map(_MONTH_NUMBERS)
+
+    parsed = pd.Series(pd.NaT, index=parts.index, dtype="datetime64[ns]")
+    if freq in (None, "Q"):
+        is_quarter = in_range & (quarter != "")
+        if is_quarter.any():
+            periods = pd.PeriodIndex(
+                parts["year"][is_quarter] + "Q" + quarter[is_quarter], freq="Q"
+            )
+            parsed[is_quarter] = periods.end_time.normalize().as_unit("ns")
+    if freq in (None, "M"):
+        is_month = in_range & month.notna()
+        if is_month.any():
+            periods = pd.PeriodIndex(parts["year"][is_month] + "-" + month[is_month], freq="M")
+            parsed[is_month] = periods.to_timestamp().as_unit("ns")
+
+    return pd.Series(parsed.to_numpy()[codes], index=values.index, dtype="datetime64[ns]")
@@ -1,80 +1,494 @@
-"""Shared schema validation utility for silver and gold layers."""
+"""Shared schema validation utility for silver and gold layers.
 
+``validate_schema`` validates column by column instead of row by row: each
+Pydantic field is compiled into a ``FieldCheck`` (base type, nullability,
+Gt/Ge/Lt/Le bounds, allowed choices) and checked with vectorized pandas
+operations. Values the compiled checks cannot decide (mixed-type object
+columns, unsupported annotations or constraints) are validated with a
+per-field ``TypeAdapter``, once per distinct value, so the result matches
+Pydantic's lax-mode validation.
+
+The compiled checks, required-field set and TypeAdapters of a model are
+bundled in a ``ValidationPlan``, built once per model class by
+``validation_plan`` and shared with ``vectorized_precheck``.
+
+Models with custom validators (``@field_validator``/``@model_validator``)
+are validated row by row with Pydantic.
+
+With ``workers > 1`` large frames are split into Arrow record batches and
+validated in a process pool; the parent merges the results in batch order.
+"""
+
+import itertools
 import logging
-from typing import Any
+import multiprocessing
+import operator
+import os
+import pickle
+import types
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from functools import cache, cached_property
+from typing import Annotated, Any, Literal, Union, get_args, get_origin
 
+import annotated_types
+import numpy as np
 import pandas as pd
-from pydantic import TypeAdapter, ValidationError
+import pyarrow as pa
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
 
 logger = logging.getLogger(__name__)
 
+REJECTION_REASON_COLUMN = "_rejection_reason"
 
-def validate_schema(
-    df: pd.DataFrame,
-    model_cls: type[Any],
-    entity_name: str,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Validate DataFrame rows against a Pydantic schema.
+# Below this many rows, starting worker processes costs more than it saves.
+PARALLEL_MIN_ROWS = 200_000
+_BATCHES_PER_WORKER = 4
 
-    Validates only schema-matching columns but preserves all original columns
-    in the returned valid DataFrame.
+_BOUNDS = {
+    annotated_types.Gt: ("gt", operator.gt, "greater than"),
+    annotated_types.Ge: ("ge", operator.ge, "greater than or equal to"),
+    annotated_types.Lt: ("lt", operator.lt, "less than"),
+    annotated_types.Le: ("le", operator.le, "less than or equal to"),
+}
+BOUND_CHECKS = {op: fn for op, fn, _ in _BOUNDS.values()}
+_BOUND_TEXT = {op: text for op, _, text in _BOUNDS.values()}
+
+_TYPE_LABELS = {
+    "float": "a valid number",
+    "int": "a valid integer",
+    "str": "a valid string",
+    "datetime": "a valid datetime",
+    "bool": "a valid boolean",
+}
+
+_NUMERIC_INFERRED = {"integer", "floating", "mixed-integer-float", "boolean", "decimal"}
+_DATETIME_INFERRED = {"datetime", "datetime64", "date"}
+
+
+@dataclass(frozen=True)
+class FieldCheck:
+    """Vectorizable constraints of one model field.
+
+    ``kind`` is ``"float"``, ``"int"``, ``"str"``, ``"datetime"``,
+    ``"bool"``, ``"choice"`` (Literal/Enum) or ``"other"``; ``"other"``
+    fields are validated by Pydantic only. ``annotation`` is the non-None
+    field type with its constraints, used for the Pydantic fallback.
+    """
+
+    name: str
+    kind: str
+    required: bool
+    nullable: bool
+    bounds: tuple[tuple[str, Any], ...]
+    choices: tuple[Any, ...]
+    annotation: Any
+
+    @cached_property
+    def adapter(self) -> TypeAdapter:
+        """TypeAdapter for single values of this field, built on first use."""
+        return TypeAdapter(self.annotation)
+
+
+def _unwrap(annotation: Any) -> tuple[Any, bool, list[Any]]:
+    """Strip ``Optional``/``Annotated`` into (base type, nullable, constraints)."""
+    nullable = False
+    metadata: list[Any] = []
+    while True:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            annotation, *extras = get_args(annotation)
+            for extra in extras:
+                metadata.extend(extra.metadata if isinstance(extra, FieldInfo) else [extra])
+            continue
+        if origin in (Union, types.UnionType):
+            args = [a for a in get_args(annotation) if a is not type(None)]
+            nullable = nullable or len(args) < len(get_args(annotation))
+            if len(args) == 1:
+                annotation = args[0]
+                continue
+        return annotation, nullable, metadata
+
+
+def _kind(base: Any) -> tuple[str, tuple[Any, ...]]:
+    if get_origin(base) is Literal:
+        return "choice", get_args(base)
+    if isinstance(base, type):
+        if issubclass(base, Enum):
+            return "choice", tuple(m.value for m in base)
+        for kind, typ in (("bool", bool), ("int", int), ("float", float), ("str", str)):
+            if base is typ:
+                return kind, ()
+        if base is datetime:
+            return "datetime", ()
+    return "other", ()
+
+
+def compile_field_checks(model_cls: type[BaseModel]) -> list[FieldCheck]:
+    """Compile every field of ``model_cls`` into a ``FieldCheck``."""
+    checks = []
+    for name, field_info in model_cls.model_fields.items():
+        base, nullable, metadata = _unwrap(field_info.annotation)
+        metadata = [*field_info.metadata, *metadata]
+        kind, choices = _kind(base)
+        bounds = tuple(
+            (_BOUNDS[type(m)][0], getattr(m, _BOUNDS[type(m)][0]))
+            for m in metadata
+            if type(m) in _BOUNDS
+        )
+        if any(type(m) not in _BOUNDS for m in metadata) or (
+            bounds and kind not in ("float", "int")
+        ):
+            kind = "other"
+        checks.append(
+            FieldCheck(
+                name=name,
+                kind=kind,
+                required=field_info.is_required(),
+                nullable=nullable,
+                bounds=bounds,
+                choices=choices,
+                annotation=Annotated[(base, *metadata)] if metadata else base,
+            )
+        )
+    return checks
+
+
+def _has_custom_validators(model_cls: type[BaseModel]) -> bool:
+    decorators = model_cls.__pydantic_decorators__
+    return bool(
+        decorators.field_validators
+        or decorators.model_validators
+        or decorators.validators
+        or decorators.root_validators
+    )
+
+
+@dataclass(frozen=True)
+class ValidationPlan:
+    """Everything validation needs to know about one model, computed once."""
+
+    model_cls: type[BaseModel]
+    checks: tuple[FieldCheck, ...]
+    required: frozenset[str]
+    row_validation: bool
+
+    @property
+    def field_names(self) -> list[str]:
+        return [check.name for check in self.checks]
+
+    def null_masks(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Missing-value mask of every model field present in ``df``, in one pass."""
+        columns = [name for name in self.field_names if name in df.columns]
+        nulls = df[columns].isna().to_numpy()
+        return {name: nulls[:, i] for i, name in enumerate(columns)}
+
+    @cached_property
+    def rows_adapter(self) -> TypeAdapter:
+        """``TypeAdapter(list[model_cls])`` for row-by-row validation."""
+        return TypeAdapter(list[self.model_cls])  # type: ignore[name-defined]
+
+
+@cache
+def validation_plan(model_cls: type[BaseModel]) -> ValidationPlan:
+    """The cached ``ValidationPlan`` of ``model_cls``."""
+    checks = tuple(compile_field_checks(model_cls))
+    return ValidationPlan(
+        model_cls=model_cls,
+        checks=checks,
+        required=frozenset(check.name for check in checks if check.required),
+        row_validation=_has_custom_validators(model_cls),
+    )
+
+
+def _as_numbers(series: pd.Series) -> tuple[np.ndarray, np.ndarray] | None:
+    """Float values and unparsable mask, or None if the column needs Pydantic."""
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=float, na_value=np.nan), np.zeros(len(series), dtype=bool)
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred in _NUMERIC_INFERRED:
+        values = pd.to_numeric(series, errors="coerce")
+    elif inferred == "string":
+        values = pd.to_numeric(series.str.strip(), errors="coerce")
+    else:
+        return None
+    values = values.to_numpy(dtype=float, na_value=np.nan)
+    return values, np.isnan(values) & series.notna().to_numpy()
+
+
+def _fast_accepted(check: FieldCheck, series: pd.Series) -> np.ndarray | None:
+    """Mask of present values accepted without Pydantic (None: decide none)."""
+    if check.kind == "str":
+        if pd.api.types.is_string_dtype(series) and series.dtype != object:
+            return np.ones(len(series), dtype=bool)
+        if series.dtype == object:
+            if pd.api.types.infer_dtype(series, skipna=True) == "string":
+                return np.ones(len(series), dtype=bool)
+            return series.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.astype(object).map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+        return np.zeros(len(series), dtype=bool)
+    if check.kind == "datetime":
+        if pd.api.types.is_datetime64_any_dtype(series) or (
+            pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+        ):
+            return np.ones(len(series), dtype=bool)
+        if pd.api.types.infer_dtype(series, skipna=True) in _DATETIME_INFERRED:
+            return np.ones(len(series), dtype=bool)
+        return None
+    if check.kind == "bool" and pd.api.types.is_bool_dtype(series):
+        return np.ones(len(series), dtype=bool)
+    if check.kind == "choice":
+        return series.isin(check.choices).to_numpy(dtype=bool)
+    return None
+
+
+def _pydantic_errors(
+    check: FieldCheck, series: pd.Series, mask: np.ndarray
+) -> list[tuple[np.ndarray, str]]:
+    """Validate the masked values with Pydantic, once per distinct value."""
+    adapter = check.adapter
+
+    def _message(value: Any) -> str | None:
+        try:
+            adapter.validate_python(value)
+        except ValidationError as e:
+            return e.errors()[0]["msg"]
+        return None
+
+    values = series[mask].astype(object)
+    try:
+        messages = values.map({v: _message(v) for v in pd.unique(values)})
+    except TypeError:
+        messages = values.map(_message)
+    found = messages.to_numpy(dtype=object)
+    positions = np.flatnonzero(mask)
+    errors = []
+    for message in pd.unique(messages.dropna()):
+        bad = np.zeros(len(series), dtype=bool)
+        bad[positions[found == message]] = True
+        errors.append((bad, message))
+    return errors
+
+
+def _field_errors(
+    check: FieldCheck, series: pd.Series, missing: np.ndarray
+) -> list[tuple[np.ndarray, str]]:
+    """(row mask, message) pairs for every way ``series`` violates ``check``."""
+    present = ~missing
+    errors: list[tuple[np.ndarray, str]] = []
+    if missing.any() and not check.nullable:
+        errors.append((missing, f"Input should be {_TYPE_LABELS.get(check.kind, 'a value')}"))
+    if not present.any():
+        return errors
+
+    if check.kind == "float" and not check.bounds and pd.api.types.is_numeric_dtype(series):
+        return errors
+    if check.kind in ("float", "int"):
+        parsed = _as_numbers(series)
+        if parsed is not None:
+            values, unparsable = parsed
+            if unparsable.any():
+                errors.append((unparsable, f"Input should be {_TYPE_LABELS[check.kind]}"))
+            ok = present & ~unparsable
+            if check.kind == "int":
+                with np.errstate(invalid="ignore"):
+                    fractional = ok & ~(np.isfinite(values) & (values == np.floor(values)))
+                if fractional.any():
+                    errors.append(
+                        (
+                            fractional,
+                            "Input should be a valid integer, got a number with a fractional part",
+                        )
+                    )
+                ok &= ~fractional
+            for op, bound in check.bounds:
+                fn, text = BOUND_CHECKS[op], _BOUND_TEXT[op]
+                with np.errstate(invalid="ignore"):
+                    violated = ok & ~fn(values, bound)
+                if violated.any():
+                    errors.append((violated, f"Input should be {text} {bound}"))
+            return errors
+
+    accepted = _fast_accepted(check, series)
+    undecided = present if accepted is None else present & ~accepted
+    if undecided.any():
+        if check.kind == "str" and series.dtype != object:
+            errors.append((undecided, f"Input should be {_TYPE_LABELS['str']}"))
+        else:
+            errors.extend(_pydantic_errors(check, series, undecided))
+    return errors
+
+
+def _rejection_reasons(
+    df: pd.DataFrame, errors: list[tuple[str, np.ndarray, str]], rejected: np.ndarray
+) -> np.ndarray:
+    """One ``"field: message [input_value=...]"`` list per rejected row."""
+    reasons = np.full(int(rejected.sum()), "", dtype=object)
+    for field, mask, message in errors:
+        hit = mask[rejected]
+        if field in df.columns:
+            inputs = df[field][mask].tolist()
+            text = np.array(
+                [f"{field}: {message} [input_value={v!r}]" for v in inputs], dtype=object
+            )
+        else:
+            text = np.full(int(mask.sum()), f"{field}: {message}", dtype=object)
+        separator = np.where(reasons[hit] == "", "", "; ").astype(object)
+        reasons[hit] = reasons[hit] + separator + text
+    return reasons
+
+
+def columnar_validate(df: pd.DataFrame, model_cls: type[BaseModel]) -> tuple[np.ndarray, pd.Series]:
+    """Validate every row of ``df`` against ``model_cls`` column by column.
 
     Returns:
-        Tuple of (valid_df with ALL original columns, quarantine_df with
-        _rejection_reason column).
+        Tuple of (boolean mask of valid rows, rejection reasons indexed like
+        the rejected rows of ``df``).
     """
-    if df.empty:
-        return pd.DataFrame(), pd.DataFrame()
+    plan = validation_plan(model_cls)
+    nulls = plan.null_masks(df)
+    errors: list[tuple[str, np.ndarray, str]] = []
+    for check in plan.checks:
+        if check.name not in nulls:
+            if check.required:
+                errors.append((check.name, np.ones(len(df), dtype=bool), "Field required"))
+            continue
+        errors.extend(
+            (check.name, mask, msg)
+            for mask, msg in _field_errors(check, df[check.name], nulls[check.name])
+        )
 
-    required_fields = {
-        name for name, field in model_cls.model_fields.items() if field.is_required()
-    }
-    existing_required = [col for col in required_fields if col in df.columns]
-    if existing_required:
-        df = df.dropna(subset=existing_required)
-        if df.empty:
-            logger.warning("No %s records left after required-field prefilter", entity_name)
-            return pd.DataFrame(), pd.DataFrame()
+    rejected = np.zeros(len(df), dtype=bool)
+    for _, mask, _ in errors:
+        rejected |= mask
+    reasons = pd.Series(
+        _rejection_reasons(df, errors, rejected), index=df.index[rejected], dtype=object
+    )
+    return ~rejected, reasons
 
-    model_fields = set(model_cls.model_fields.keys())
-    common_cols = [c for c in df.columns if c in model_fields]
-    df_validate = df[common_cols]
 
-    adapter = TypeAdapter(list[model_cls])  # type: ignore[valid-type]
-    valid_indices: list = []
-    quarantine_records: list[dict] = []
-    records = df_validate.to_dict(orient="records")
+def _validate_rows(df: pd.DataFrame, model_cls: type[BaseModel]) -> tuple[np.ndarray, pd.Series]:
+    """Row-by-row Pydantic validation, for models with custom validators."""
+    plan = validation_plan(model_cls)
+    model_fields = set(plan.field_names)
+    common_cols = [c for c in df.columns if c in model_fields]
+    records = df[common_cols].to_dict(orient="records")
     for record in records:
         for key, value in record.items():
             if isinstance(value, float) and pd.isna(value):
                 record[key] = None
-    indices = df.index.tolist()
-    chunk_size = 5000
 
+    adapter = plan.rows_adapter
+    valid = np.ones(len(df), dtype=bool)
+    reasons: dict[Any, str] = {}
+    chunk_size = 5000
     for chunk_start in range(0, len(records), chunk_size):
         chunk = records[chunk_start : chunk_start + chunk_size]
-        chunk_idx = indices[chunk_start : chunk_start + chunk_size]
         try:
             adapter.validate_python(chunk)
-            valid_indices.extend(chunk_idx)
         except ValidationError:
             for i, row in enumerate(chunk):
                 try:
                     model_cls(**row)
-                    valid_indices.append(chunk_idx[i])
                 except ValidationError as e:
-                    original_row = df.loc[chunk_idx[i]].to_dict()
-                    original_row["_rejection_reason"] = str(e)
-                    quarantine_records.append(original_row)
+                    valid[chunk_start + i] = False
+                    reasons[df.index[chunk_start + i]] = str(e)
+    return valid, pd.Series(reasons, index=df.index[~valid], dtype=object)
+
+
+def _validate_frame(df: pd.DataFrame, model_cls: type[BaseModel]) -> tuple[np.ndarray, pd.Series]:
+    if validation_plan(model_cls).row_validation:
+        return _validate_rows(df, model_cls)
+    return columnar_validate(df, model_cls)
+
+
+def _validate_batch(
+    model_cls: type[BaseModel], batch: pa.RecordBatch
+) -> tuple[np.ndarray, list[str]]:
+    """Process-pool worker: valid mask and rejection reasons of one batch."""
+    valid, reasons = _validate_frame(batch.to_pandas(), model_cls)
+    return valid, reasons.tolist()
+
+
+def _record_batches(
+    df: pd.DataFrame, model_cls: type[BaseModel], count: int
+) -> list[pa.RecordBatch] | None:
+    """Model columns of ``df`` as ~``count`` record batches, or None if they
+    cannot be shipped to worker processes."""
+    columns = [name for name in validation_plan(model_cls).field_names if name in df.columns]
+    if not columns:
+        return None
+    try:
+        pickle.dumps(model_cls)
+        table = pa.Table.from_pandas(df[columns], preserve_index=False)
+    except (pickle.PicklingError, AttributeError, TypeError, pa.ArrowException) as e:
+        logger.info("Validating %s in-process: %s", model_cls.__name__, e)
+        return None
+    return table.to_batches(max_chunksize=-(-len(df) // count))
+
+
+def _validate_parallel(
+    df: pd.DataFrame, model_cls: type[BaseModel], workers: int
+) -> tuple[np.ndarray, pd.Series]:
+    batches = _record_batches(df, model_cls, workers * _BATCHES_PER_WORKER)
+    if batches is None:
+        return _validate_frame(df, model_cls)
+    logger.info("Validating %s rows in %s batches on %s processes", len(df), len(batches), workers)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        results = list(pool.map(_validate_batch, itertools.repeat(model_cls), batches))
+    valid = np.concatenate([batch_valid for batch_valid, _ in results])
+    reasons = [reason for _, batch_reasons in results for reason in batch_reasons]
+    return valid, pd.Series(reasons, index=df.index[~valid], dtype=object)
+
+
+def validate_schema(
+    df: pd.DataFrame,
+    model_cls: type[BaseModel],
+    entity_name: str,
+    workers: int = 1,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Validate DataFrame rows against a Pydantic schema.
+
+    Validates only schema-matching columns but preserves all original columns
+    in the returned valid DataFrame. With ``workers > 1`` frames of at least
+    ``PARALLEL_MIN_ROWS`` rows are validated in a process pool of at most
+    one process per CPU.
+
+    Returns:
+        Tuple of (valid_df with ALL original columns, quarantine_df with
+        _rejection_reason column).
+    """
+    if df.empty:
+        return pd.DataFrame(), pd.DataFrame()
+
+    plan = validation_plan(model_cls)
+    existing_required = [c.name for c in plan.checks if c.required and c.name in df.columns]
+    if existing_required:
+        df = df.dropna(subset=existing_required)
+        if df.empty:
+            logger.warning("No %s records left after required-field prefilter", entity_name)
+            return pd.DataFrame(), pd.DataFrame()
 
-    quarantine_count = len(quarantine_records)
-    if quarantine_count:
-        logger.warning("Validation failed for %s %s records", quarantine_count, entity_name)
+    workers = min(workers, os.cpu_count() or 1)
+    if workers > 1 and len(df) >= PARALLEL_MIN_ROWS:
+        valid, reasons = _validate_parallel(df, model_cls, workers)
+    else:
+        valid, reasons = _validate_frame(df, model_cls)
 
-    quarantine_df = pd.DataFrame(quarantine_records) if quarantine_records else pd.DataFrame()
+    quarantine_df = pd.DataFrame()
+    if not valid.all():
+        quarantine_df = (
+            df[~valid].assign(**{REJECTION_REASON_COLUMN: reasons}).reset_index(drop=True)
+        )
+        logger.warning("Validation failed for %s %s records", len(quarantine_df), entity_name)
 
-    if valid_indices:
-        valid_df = df.loc[valid_indices]
+    if valid.any():
+        valid_df = df[valid]
         logger.info("Validated %s %s records successfully", len(valid_df), entity_name)
         return valid_df, quarantine_df
     logger.warning("No %s records passed validation", entity_name)
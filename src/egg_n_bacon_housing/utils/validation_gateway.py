@@ -7,15 +7,27 @@ that was repeated across 6 DAG nodes in cleaning and features.
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
 
-import annotated_types
+import numpy as np
 import pandas as pd
+from pydantic import BaseModel
 
-from egg_n_bacon_housing.utils.validation import validate_schema
+from egg_n_bacon_housing.utils.partitioned_parquet import write_partitions
+from egg_n_bacon_housing.utils.validation import BOUND_CHECKS, validate_schema, validation_plan
 
 logger = logging.getLogger(__name__)
 
+_validation_workers = 1
+
+
+def configure(validation_workers: int = 1) -> None:
+    """Set the default process count for ``validate_and_quarantine`` (call once
+    at pipeline startup)."""
+    global _validation_workers
+    if validation_workers < 1:
+        raise ValueError(f"validation_workers must be >= 1, got {validation_workers}")
+    _validation_workers = validation_workers
+
 
 def _save_parquet(df: pd.DataFrame, path: Path, description: str = "") -> Path:
     """Write DataFrame to parquet, creating parent dirs as needed. Skip if empty."""
@@ -29,15 +41,29 @@ def _save_parquet(df: pd.DataFrame, path: Path, description: str = "") -> Path:
     return path
 
 
+def _save_output(
+    df: pd.DataFrame,
+    layer_dir: Path,
+    filename: str,
+    description: str,
+    partition_col: str | None,
+) -> None:
+    if partition_col is None:
+        _save_parquet(df, layer_dir / filename, description)
+    else:
+        write_partitions(df, layer_dir / filename, partition_col)
+
+
 def vectorized_precheck(
     df: pd.DataFrame,
-    model_cls: type[Any],
+    model_cls: type[BaseModel],
     entity_name: str,
 ) -> list[str]:
     """Run fast vectorized checks against Pydantic model constraints.
 
     Scans the full DataFrame with pandas (no per-row Pydantic validation)
-    to surface systemic data-quality issues before sampling.
+    to surface systemic data-quality issues before sampling. Bounds and
+    required fields come from the model's cached ``ValidationPlan``.
 
     Args:
         df: DataFrame to check.
@@ -50,55 +76,41 @@ def vectorized_precheck(
     issues: list[str] = []
     total = len(df)
 
-    for field_name, field_info in model_cls.model_fields.items():
-        if field_name not in df.columns:
+    plan = validation_plan(model_cls)
+    nulls = plan.null_masks(df)
+
+    for check in plan.checks:
+        if check.name not in nulls:
             continue
 
-        series = df[field_name]
+        series = df[check.name]
 
-        if field_info.is_required():
-            null_count = int(series.isna().sum())
+        if check.required:
+            null_count = int(nulls[check.name].sum())
             if null_count:
                 pct = null_count / total * 100 if total else 0
-                issues.append(f"  {field_name}: {null_count} null ({pct:.1f}%) — required field")
-
-        bounds: dict[str, Any] = {}
-        for m in field_info.metadata:
-            if isinstance(m, annotated_types.Gt):
-                bounds["gt"] = m.gt
-            elif isinstance(m, annotated_types.Ge):
-                bounds["ge"] = m.ge
-            elif isinstance(m, annotated_types.Lt):
-                bounds["lt"] = m.lt
-            elif isinstance(m, annotated_types.Le):
-                bounds["le"] = m.le
-
-        if bounds and pd.api.types.is_numeric_dtype(series):
-            non_null = series.dropna()
-            for op, bound in bounds.items():
-                if op == "gt":
-                    bad = int((non_null <= bound).sum())
-                elif op == "ge":
-                    bad = int((non_null < bound).sum())
-                elif op == "lt":
-                    bad = int((non_null >= bound).sum())
-                elif op == "le":
-                    bad = int((non_null > bound).sum())
-                else:
-                    continue
+                issues.append(f"  {check.name}: {null_count} null ({pct:.1f}%) — required field")
+
+        if check.bounds and pd.api.types.is_numeric_dtype(series):
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+            for op, bound in check.bounds:
+                with np.errstate(invalid="ignore"):
+                    bad = int((~BOUND_CHECKS[op](values, bound) & ~np.isnan(values)).sum())
                 if bad:
-                    issues.append(f"  {field_name}: {bad} values violate {op} {bound}")
+                    issues.append(f"  {check.name}: {bad} values violate {op} {bound}")
 
     return issues
 
 
 def validate_and_quarantine(
     df: pd.DataFrame,
-    model_cls: type[Any],
+    model_cls: type[BaseModel],
     entity_name: str,
     layer_dir: Path,
     filename: str,
     sample_validation_size: int | None = None,
+    partition_col: str | None = None,
+    workers: int | None = None,
 ) -> pd.DataFrame:
     """Validate DataFrame against schema, quarantine failures, persist both.
 
@@ -111,6 +123,11 @@ def validate_and_quarantine(
         sample_validation_size: When set and df exceeds this row count,
             validate only a random sample to catch schema violations while
             saving all rows. Use for large fact tables (~1M rows).
+        partition_col: When set, persist valid rows as a Hive-partitioned
+            dataset directory named ``filename`` (e.g. "transactions_enriched"),
+            replacing only the partitions present in ``df``.
+        workers: Processes for full validation of large frames; defaults to
+            the configured ``validation_workers``.
 
     Returns:
         Full validation: valid DataFrame with all original columns.
@@ -142,7 +159,7 @@ def validate_and_quarantine(
             model_cls,
             f"{entity_name} (sample)",
         )
-        _save_parquet(df, layer_dir / filename, f"validated {entity_name}")
+        _save_output(df, layer_dir, filename, f"validated {entity_name}", partition_col)
         if not quarantine_sample.empty:
             logger.warning(
                 "Sample validation quarantined %s/%s rows for %s — "
@@ -157,9 +174,11 @@ def validate_and_quarantine(
             _save_parquet(quarantine_sample, q_path, f"quarantined {entity_name} (sample)")
         return df
 
-    valid_df, quarantine_df = validate_schema(df, model_cls, entity_name)
+    valid_df, quarantine_df = validate_schema(
+        df, model_cls, entity_name, workers=workers or _validation_workers
+    )
 
-    _save_parquet(valid_df, layer_dir / filename, f"validated {entity_name}")
+    _save_output(valid_df, layer_dir, filename, f"validated {entity_name}", partition_col)
 
     if not quarantine_df.empty:
         timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
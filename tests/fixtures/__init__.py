@@ -0,0 +1 @@
+"""Hamilton node modules used as small DAGs by the pipeline tests."""
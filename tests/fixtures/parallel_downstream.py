@@ -0,0 +1,10 @@
+"""Non-ingestion node downstream of ``parallel_ingest``."""
+
+import threading
+
+state: dict = {}
+
+
+def total(raw_local_a: int, raw_local_b: int, raw_gov_a: int, raw_gov_b: int) -> int:
+    state["thread"] = threading.current_thread().name
+    return raw_local_a + raw_local_b + raw_gov_a + raw_gov_b
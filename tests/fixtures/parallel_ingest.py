@@ -0,0 +1,62 @@
+"""Ingestion-style nodes that record their threads and data.gov.sg overlap.
+
+``raw_local_a`` and ``raw_local_b`` wait on a shared barrier, so they only
+finish if they run concurrently. Call ``_reset()`` before each run.
+"""
+
+import threading
+import time
+
+from hamilton.function_modifiers import tag
+
+_lock = threading.Lock()
+barrier = threading.Barrier(2, timeout=5)
+state: dict = {}
+
+
+def _reset() -> None:
+    global barrier
+    barrier = threading.Barrier(2, timeout=5)
+    state.clear()
+    state.update({"gov_active": 0, "gov_max": 0, "threads": {}})
+
+
+def _record(name: str) -> None:
+    state["threads"][name] = threading.current_thread().name
+
+
+def _gov_call(name: str) -> None:
+    _record(name)
+    with _lock:
+        state["gov_active"] += 1
+        state["gov_max"] = max(state["gov_max"], state["gov_active"])
+    time.sleep(0.05)
+    with _lock:
+        state["gov_active"] -= 1
+
+
+def raw_local_a(x: int) -> int:
+    _record("raw_local_a")
+    barrier.wait()
+    return x + 1
+
+
+def raw_local_b(x: int) -> int:
+    _record("raw_local_b")
+    barrier.wait()
+    return x + 2
+
+
+@tag(source_host="data.gov.sg")
+def raw_gov_a(x: int) -> int:
+    _gov_call("raw_gov_a")
+    return x + 3
+
+
+@tag(source_host="data.gov.sg")
+def raw_gov_b(x: int) -> int:
+    _gov_call("raw_gov_b")
+    return x + 4
+
+
+_reset()
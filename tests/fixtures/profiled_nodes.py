@@ -0,0 +1,18 @@
+"""Small DAG with a slow node, a frame node and a dict-of-frames node."""
+
+import time
+
+import pandas as pd
+
+
+def raw_rows(n: int) -> pd.DataFrame:
+    return pd.DataFrame({"town": ["BEDOK"] * n, "price": range(n)})
+
+
+def macro(n: int) -> dict:
+    return {"cpi": pd.DataFrame({"cpi": [1.0, 2.0]}), "gdp": pd.DataFrame({"gdp": [3.0]})}
+
+
+def slow_summary(raw_rows: pd.DataFrame, macro: dict) -> pd.DataFrame:
+    time.sleep(0.05)
+    return raw_rows.head(2)
@@ -0,0 +1,43 @@
+"""Tests for utils/address_normalization.py."""
+
+import pandas as pd
+import pytest
+
+from egg_n_bacon_housing.utils.address_normalization import (
+    normalize_address,
+    normalize_addresses,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestNormalizeAddresses:
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "123 ANG MO KIO AVE 3",
+            "123 Ang Mo Kio Ave 3",
+            "123  ang mo kio   avenue 3 ",
+            "Blk 123 Ang Mo Kio Avenue 3.",
+            "BLOCK 123 ANG MO KIO AVE 3",
+        ],
+    )
+    def test_variants_share_one_key(self, raw):
+        assert normalize_address(raw) == "123 ANG MO KIO AVE 3"
+
+    def test_street_words_use_hdb_abbreviations(self):
+        result = normalize_addresses(
+            pd.Series(["5 Upper Boon Keng Road", "10 Commonwealth Close", "2 Jalan Bukit Merah"])
+        )
+
+        assert result.tolist() == ["5 UPP BOON KENG RD", "10 C'WEALTH CL", "2 JLN BT MERAH"]
+
+    def test_only_whole_words_and_numeric_blocks_are_rewritten(self):
+        result = normalize_addresses(pd.Series(["BLOCKHOUSE ROADSIDE", "BLK A STREET 1"]))
+
+        assert result.tolist() == ["BLOCKHOUSE ROADSIDE", "BLK A ST 1"]
+
+    def test_missing_values_stay_missing(self):
+        result = normalize_addresses(pd.Series(["1 Orchard Road", None]))
+
+        assert result.tolist() == ["1 ORCHARD RD", None]
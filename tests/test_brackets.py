@@ -0,0 +1,75 @@
+"""Tests for bracketed census medians (utils/brackets.py)."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from egg_n_bacon_housing.utils.brackets import bracket_weighted_median, bracketed_median
+
+pytestmark = pytest.mark.unit
+
+MIDPOINTS = [500.0, 1250.0, 1750.0, 2250.0]
+
+bracket_counts = st.lists(
+    st.lists(st.integers(min_value=0, max_value=50), min_size=4, max_size=4),
+    min_size=1,
+    max_size=20,
+)
+
+
+class TestBracketWeightedMedian:
+    @given(counts=bracket_counts)
+    @settings(max_examples=100)
+    def test_matches_median_of_expanded_values(self, counts):
+        result = bracket_weighted_median(np.array(counts), MIDPOINTS)
+
+        for row, median in zip(counts, result, strict=True):
+            expanded = np.repeat(MIDPOINTS, row)
+            if not len(expanded):
+                assert math.isnan(median)
+            else:
+                assert median == expanded[math.ceil(len(expanded) / 2) - 1]
+
+    @given(counts=bracket_counts)
+    @settings(max_examples=100)
+    def test_interpolated_median_stays_between_neighbouring_midpoints(self, counts):
+        counts = np.array(counts)
+        plain = bracket_weighted_median(counts, MIDPOINTS)
+        interpolated = bracket_weighted_median(counts, MIDPOINTS, interpolate=True)
+
+        assert np.array_equal(np.isnan(plain), np.isnan(interpolated))
+        present = ~np.isnan(plain)
+        steps = np.diff(MIDPOINTS).max()
+        assert (np.abs(interpolated[present] - plain[present]) <= steps).all()
+        assert (interpolated[present] >= MIDPOINTS[0]).all()
+        assert (interpolated[present] <= MIDPOINTS[-1]).all()
+
+    def test_interpolates_between_midpoints(self):
+        result = bracket_weighted_median(
+            [[10, 20], [1, 1], [0, 5], [5, 0]], [500, 1250], interpolate=True
+        )
+
+        assert result.tolist() == [1000.0, 875.0, 1250.0, 500.0]
+
+
+class TestBracketedMedian:
+    def test_skips_missing_columns_and_nan_counts(self):
+        df = pd.DataFrame(
+            {"low": [10, np.nan, None], "high": ["20", "5", None], "other": [1, 2, 3]},
+            index=[7, 8, 9],
+        )
+
+        result = bracketed_median(df, [("low", 500), ("mid", 1000), ("high", 1500)])
+
+        assert result.index.tolist() == [7, 8, 9]
+        assert result.iloc[:2].tolist() == [1500.0, 1500.0]
+        assert math.isnan(result.iloc[2])
+
+    def test_no_bracket_columns(self):
+        result = bracketed_median(pd.DataFrame({"x": [1, 2]}), [("low", 500)])
+
+        assert result.isna().all()
@@ -1,6 +1,7 @@
 """Tests for utils/cache.py."""
 
 import importlib
+import os
 
 import pandas as pd
 import pytest
@@ -140,3 +141,226 @@ class TestCacheSerialization:
 
         result = cache.cached_call("legacy_cache", lambda: {"legacy": False}, duration_hours=1)
         assert result == {"legacy": False}
+
+
+class TestSQLiteBackend:
+    def test_round_trips_frames_and_scalars_in_one_file(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True, backend="sqlite")
+
+        df = pd.DataFrame([{"x": 1, "y": "a"}])
+        manager.set("df", df)
+        manager.set("scalar", {"lat": 1.3, "lon": 103.8})
+
+        pd.testing.assert_frame_equal(manager.get("df"), df)
+        assert manager.get("scalar") == {"lat": 1.3, "lon": 103.8}
+        assert manager.get("missing") is cache._CACHE_MISS
+        assert sorted(
+            p.name for p in tmp_path.iterdir() if not p.name.endswith(("-wal", "-shm"))
+        ) == [cache.SQLITE_CACHE_FILENAME]
+
+    def test_get_many_and_set_many(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True, backend="sqlite")
+
+        manager.set_many({f"addr:{i}": [i, i + 1] for i in range(1200)})
+        found = manager.get_many([f"addr:{i}" for i in range(0, 1300, 100)])
+
+        assert found == {f"addr:{i}": [i, i + 1] for i in range(0, 1200, 100)}
+        assert manager.get_stats()["count"] == 1200
+        assert manager.get_stats()["backend"] == "sqlite"
+
+    def test_ttl_is_stored_per_row(self, tmp_path, monkeypatch):
+        cache = _get_cache_module()
+        manager = cache.configure(
+            tmp_path, use_caching=True, backend="sqlite", cache_duration_hours=1
+        )
+        manager.set("key", "value")
+
+        real_time = cache.time.time
+        monkeypatch.setattr(cache.time, "time", lambda: real_time() + 2 * 3600)
+
+        assert manager.get("key") is cache._CACHE_MISS
+        assert manager.get("key", duration_hours=3) == "value"
+        assert manager.backend.purge_expired() == 1
+        assert manager.get("key", duration_hours=3) is cache._CACHE_MISS
+
+    def test_duration_hours_zero_means_no_cache(self, tmp_path):
+        cache = _get_cache_module()
+        cache.configure(tmp_path, use_caching=True, backend="sqlite")
+
+        calls = []
+        cache.cached_call("zero", lambda: calls.append(1) or "v", duration_hours=0)
+        cache.cached_call("zero", lambda: calls.append(1) or "v", duration_hours=0)
+
+        assert len(calls) == 2
+
+    def test_clear_single_and_all(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True, backend="sqlite")
+        manager.set_many({"a": 1, "b": 2})
+
+        manager.clear("a")
+        assert manager.get_many(["a", "b"]) == {"b": 2}
+        manager.clear()
+        assert manager.get_stats()["count"] == 0
+
+    def test_points_to_migration_when_file_entries_are_left_behind(self, tmp_path, caplog):
+        cache = _get_cache_module()
+        cache.configure(tmp_path, use_caching=True, backend="file").set("key", "value")
+
+        with caplog.at_level("WARNING", logger=cache.logger.name):
+            manager = cache.configure(tmp_path, use_caching=True, backend="sqlite")
+
+        assert "scripts/tools/migrate_cache.py" in caplog.text
+        assert manager.get("key") is cache._CACHE_MISS
+
+    def test_unknown_backend_rejected(self, tmp_path):
+        cache = _get_cache_module()
+        with pytest.raises(ValueError, match="Unknown cache backend"):
+            cache.configure(tmp_path, backend="lmdb")
+
+
+class TestMigrateFileCache:
+    def test_migrates_file_entries_keeping_age(self, tmp_path):
+        cache = _get_cache_module()
+        file_manager = cache.configure(tmp_path, use_caching=True, backend="file")
+        df = pd.DataFrame([{"x": 1}])
+        file_manager.set("df", df)
+        file_manager.set("scalar", 42)
+        file_manager.set("stale", "old")
+        stale_path = tmp_path / f"{file_manager._get_cache_key('stale')}.json"
+        old = stale_path.stat().st_mtime - 48 * 3600
+        os.utime(stale_path, (old, old))
+        (tmp_path / "legacy.pkl").write_bytes(b"legacy")
+
+        counts = cache.migrate_file_cache(tmp_path, cache_duration_hours=24, delete=True)
+
+        assert counts == {"migrated": 3, "skipped": 1}
+        assert not list(tmp_path.glob("*.json")) and not list(tmp_path.glob("*.parquet"))
+        manager = cache.configure(tmp_path, use_caching=True, backend="sqlite")
+        pd.testing.assert_frame_equal(manager.get("df"), df)
+        assert manager.get("scalar") == 42
+        assert manager.get("stale") is cache._CACHE_MISS
+        assert manager.get("stale", duration_hours=72) == "old"
+
+
+class TestMemoryTier:
+    def test_default_budget_matches_pipeline_config(self, tmp_path):
+        cache = _get_cache_module()
+        from egg_n_bacon_housing.config import PipelineConfig
+
+        budget_mb = PipelineConfig().memory_cache_mb
+
+        assert cache.configure(tmp_path).memory.max_bytes == int(budget_mb * 1024**2)
+        assert cache.CacheManager(tmp_path).memory.max_bytes == int(budget_mb * 1024**2)
+
+    def test_repeat_reads_are_served_from_memory(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True)
+        manager.set("scalar", {"lat": 1.3})
+        key = manager._get_cache_key("scalar")
+
+        (tmp_path / f"{key}.json").write_text('{"lat": 0.0}')
+
+        assert manager.get("scalar") == {"lat": 1.3}
+        stats = manager.get_stats()
+        assert stats["memory_hits"] == 1
+        assert stats["memory_entries"] == 1
+
+    def test_disk_reads_populate_memory(self, tmp_path):
+        cache = _get_cache_module()
+        cache.configure(tmp_path, use_caching=True).set("df", pd.DataFrame({"x": [1, 2]}))
+        manager = cache.configure(tmp_path, use_caching=True)
+
+        manager.get("df")
+        manager.get("df")
+
+        stats = manager.get_stats()
+        assert (stats["memory_misses"], stats["memory_hits"]) == (1, 1)
+
+    def test_evicts_least_recently_used_by_bytes(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True, memory_cache_mb=0.001)
+        payload = "x" * 400
+
+        manager.set("a", payload)
+        manager.set("b", payload)
+        manager.get("a")
+        manager.set("c", payload)
+
+        stats = manager.get_stats()
+        assert stats["memory_evictions"] == 1
+        assert stats["memory_entries"] == 2
+        assert manager.get("b") == payload
+        assert manager.get_stats()["memory_misses"] == 1
+
+    def test_frames_are_charged_their_decoded_memory(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True, backend="sqlite")
+        df = pd.DataFrame({"address": ["BLK 123 ANG MO KIO AVE 3 SINGAPORE"] * 20_000})
+        manager.set("df", df)
+
+        encoded = manager.get_stats()["total_size_mb"]
+        resident = manager.get_stats()["memory_size_mb"]
+
+        assert resident == round(df.memory_usage(deep=True).sum() / 1024**2, 2)
+        assert resident > 10 * encoded
+
+    def test_memory_entries_expire_with_the_disk_ttl(self, tmp_path, monkeypatch):
+        cache = _get_cache_module()
+        manager = cache.configure(
+            tmp_path, use_caching=True, backend="sqlite", cache_duration_hours=1
+        )
+        manager.set("key", "value")
+
+        real_time = cache.time.time
+        monkeypatch.setattr(cache.time, "time", lambda: real_time() + 2 * 3600)
+
+        assert manager.get("key") is cache._CACHE_MISS
+        assert manager.get_stats()["memory_entries"] == 0
+
+    @pytest.mark.parametrize("backend", ["file", "sqlite"])
+    def test_memory_and_disk_hits_return_the_same_value(self, tmp_path, backend):
+        cache = _get_cache_module()
+        values = {
+            "df": pd.DataFrame({"x": [1, 2]}, index=[10, 20]),
+            "mapping": {1: (1.3, 103.8)},
+        }
+        manager = cache.configure(tmp_path, use_caching=True, backend=backend)
+        manager.set_many(values)
+        from_memory = manager.get_many(values)
+        disk_only = cache.configure(tmp_path, use_caching=True, backend=backend)
+        from_disk = disk_only.get_many(values)
+
+        assert disk_only.get_stats()["memory_hits"] == 0
+        pd.testing.assert_frame_equal(from_memory["df"], from_disk["df"])
+        assert from_memory["mapping"] == from_disk["mapping"] == {"1": [1.3, 103.8]}
+
+    def test_returned_frames_do_not_alias_the_cache(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True)
+        manager.set("df", pd.DataFrame({"x": [1, 2]}))
+
+        df = manager.get("df")
+        df.loc[0, "x"] = 99
+
+        assert manager.get("df")["x"].tolist() == [1, 2]
+
+    def test_clear_invalidates_memory(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True)
+        manager.set("key", "value")
+
+        manager.clear("key")
+
+        assert manager.get("key") is cache._CACHE_MISS
+        assert manager.get_stats()["memory_entries"] == 0
+
+    def test_zero_budget_disables_memory_tier(self, tmp_path):
+        cache = _get_cache_module()
+        manager = cache.configure(tmp_path, use_caching=True, memory_cache_mb=0)
+        manager.set("key", "value")
+
+        assert manager.get("key") == "value"
+        assert "memory_hits" not in manager.get_stats()
@@ -250,6 +250,30 @@ class TestCollectSchemaInfo:
 # ---------------------------------------------------------------------------
 
 
+class TestCollectParquetStats:
+    """Tests for collect_parquet_stats."""
+
+    def test_partitioned_dataset_totals_partitions(self, gen, tmp_path):
+        """A hive-partitioned gold dataset is reported as one dataset."""
+        import pandas as pd
+
+        dataset = tmp_path / "03_gold" / "transactions_enriched"
+        for month, n in (("2024-01", 2), ("2024-02", 3)):
+            (dataset / f"month={month}").mkdir(parents=True)
+            pd.DataFrame({"price": [1.0] * n}).to_parquet(
+                dataset / f"month={month}" / "part-0.parquet"
+            )
+
+        stats = gen.collect_parquet_stats(tmp_path)
+
+        entry = stats["transactions_enriched"]
+        assert entry["status"] == "available"
+        assert entry["layer"] == "gold"
+        assert entry["row_count"] == 5
+        assert entry["partition_count"] == 2
+        assert "price" in entry["columns"]
+
+
 class TestMergeAndWrite:
     """Test the merge logic with small fixtures."""
 
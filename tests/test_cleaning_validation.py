@@ -329,6 +329,61 @@ class TestGeocodedValidation:
         assert result.loc[result.index[0], "lat"] == 1.4
         assert result.loc[result.index[0], "lon"] == 103.9
 
+    def test_geocoded_properties_dedupes_variants_and_reuses_gazetteer(self, tmp_path):
+        cleaning = _get_cleaning_module()
+
+        class CountingGeocoder(InMemoryGeocoder):
+            def __init__(self, lookup):
+                super().__init__(lookup)
+                self.calls: list[list[str]] = []
+
+            def geocode(self, addresses):
+                self.calls.append(list(addresses))
+                return super().geocode(addresses)
+
+        hdb_validated = pd.DataFrame(
+            {
+                "address": [
+                    "123 ANG MO KIO AVE 3",
+                    "123 Ang Mo Kio Avenue 3",
+                    " 123  ang mo kio ave 3",
+                    "9 NOWHERE RD",
+                    "8 Bukit Timah Road",
+                    "8 BT TIMAH RD",
+                    "8 Bukit Timah Road",
+                ],
+                "price": [500000.0] * 7,
+            }
+        )
+        geocoder = CountingGeocoder(
+            {"123 ANG MO KIO AVE 3": (1.37, 103.85), "8 Bukit Timah Road": (1.31, 103.82)}
+        )
+
+        result = cleaning.geocoded_properties(
+            hdb_validated,
+            pd.DataFrame(),
+            writer=SimpleWriter(tmp_path),
+            geocoder=geocoder,
+            silver_dir=tmp_path,
+        )
+
+        assert geocoder.calls == [["123 ANG MO KIO AVE 3", "9 NOWHERE RD", "8 Bukit Timah Road"]]
+        assert result["lat"].tolist()[:3] == [1.37, 1.37, 1.37]
+        assert result["lat"].tolist()[4:] == [1.31, 1.31, 1.31]
+        assert result["address"].tolist() == hdb_validated["address"].tolist()
+
+        rerun = CountingGeocoder({})
+        result = cleaning.geocoded_properties(
+            hdb_validated,
+            pd.DataFrame(),
+            writer=SimpleWriter(tmp_path),
+            geocoder=rerun,
+            silver_dir=tmp_path,
+        )
+
+        assert rerun.calls == [["9 NOWHERE RD"]]
+        assert result["lat"].tolist()[:3] == [1.37, 1.37, 1.37]
+
 
 class TestQuarantineIntegration:
     """Test that quarantine rows are saved to disk with _rejection_reason."""
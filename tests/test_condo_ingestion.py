@@ -74,7 +74,7 @@ class TestRawCondoTransactions:
         calls = []
         fetched_data = pd.DataFrame([{"price": 1}])
 
-        def tracking_fetch(url, dataset_id, use_cache=False):
+        def tracking_fetch(url, dataset_id, use_cache=False, max_workers=1):
             calls.append(dataset_id)
             return fetched_data
 
@@ -2,6 +2,7 @@
 
 import json
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -12,6 +13,7 @@ pytestmark = pytest.mark.unit
 
 def _clear_planning_cache():
     data_loader._load_planning_areas_raw.cache_clear()
+    data_loader.planning_area_grid.cache_clear()
 
 
 def _make_geojson(area_name="TEST_AREA"):
@@ -199,3 +201,71 @@ class TestGetPlanningAreasForPoints:
             pd.Series([None, None]), pd.Series([None, None])
         )
         assert result.tolist() == [None, None]
+
+
+def _overlapping_geojson():
+    geojson = _make_multi_polygon_geojson()
+    triangle = [[103.85, 1.35], [103.95, 1.35], [103.95, 1.45], [103.85, 1.35]]
+    geojson["features"].append(
+        {
+            "properties": {"pln_area_n": "AREA_C"},
+            "geometry": {"type": "Polygon", "coordinates": [triangle]},
+        }
+    )
+    return geojson
+
+
+class TestVectorizedPlanningAreas:
+    @pytest.fixture
+    def polygons(self, tmp_path):
+        _clear_planning_cache()
+        geojson_dir = tmp_path / "geojsons"
+        geojson_dir.mkdir(parents=True)
+        (geojson_dir / "onemap_planning_area_polygon.geojson").write_text(
+            json.dumps(_overlapping_geojson())
+        )
+        data_loader._paths["raw_data_dir"] = geojson_dir
+
+    def _points(self, n=3000):
+        rng = np.random.default_rng(0)
+        lat = rng.uniform(1.25, 1.65, n)
+        lon = rng.uniform(103.75, 104.15, n)
+        # Points on polygon edges and vertices are outside ("within" is strict).
+        lat[:4], lon[:4] = [1.30, 1.35, 1.40, 1.50], [103.85, 103.90, 103.80, 104.10]
+        return pd.Series(lat), pd.Series(lon)
+
+    def test_first_polygon_wins_on_overlap(self, polygons):
+        assert data_loader.get_planning_area_for_point(1.36, 103.88) == "AREA_A"
+        assert data_loader.get_planning_area_for_point(1.38, 103.93) == "AREA_C"
+        assert data_loader.get_planning_area_for_point(1.30, 103.85) is None
+
+    def test_point_tree_matches_polygon_tree(self, polygons):
+        lat, lon = self._points()
+
+        batch = data_loader.get_planning_areas_for_points(lat, lon)
+        scalar = [data_loader.get_planning_area_for_point(a, b) for a, b in zip(lat, lon)]
+
+        assert batch.tolist() == scalar
+        assert batch.iloc[:4].isna().all()
+
+    def test_grid_matches_exact_lookup(self, polygons):
+        lat, lon = self._points()
+        lat.iloc[-1] = np.nan
+
+        exact = data_loader.get_planning_areas_for_points(lat, lon)
+        gridded = data_loader.get_planning_areas_for_points(lat, lon, grid_cell_m=500)
+        grid = data_loader.planning_area_grid(500)
+
+        assert gridded.tolist() == exact.tolist()
+        assert (grid.labels == data_loader.BOUNDARY_CELL).any()
+        assert (grid.labels >= 0).any() and (grid.labels == -1).any()
+
+    def test_grid_unavailable_without_polygons(self, tmp_path):
+        _clear_planning_cache()
+        data_loader._paths["raw_data_dir"] = tmp_path / "nonexistent"
+
+        assert data_loader.planning_area_grid(20) is None
+        result = data_loader.get_planning_areas_for_points(
+            pd.Series([1.35]), pd.Series([103.85]), grid_cell_m=20
+        )
+        assert result.tolist() == [None]
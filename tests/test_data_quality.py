@@ -0,0 +1,106 @@
+"""Tests for the data quality collector (utils/data_quality.py)."""
+
+import sqlite3
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from egg_n_bacon_housing.config import Settings
+from egg_n_bacon_housing.utils import data_quality
+from egg_n_bacon_housing.utils.data_quality import (
+    DataQualityCollector,
+    flush_collector,
+    record_dataframe_quality,
+    submit_table_quality,
+)
+from egg_n_bacon_housing.utils.layer_writer import TrackedWriter
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _reset_collector():
+    yield
+    data_quality.close_collector()
+
+
+def _count(db_path, table: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestCollector:
+    def test_uses_wal_connection(self, tmp_path):
+        collector = DataQualityCollector(tmp_path / "quality.db")
+
+        mode = collector._conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+        collector.close()
+
+    def test_snapshots_written_on_flush(self, tmp_path):
+        db_path = tmp_path / "quality.db"
+        df = pd.DataFrame({"town": ["BEDOK", "BEDOK", None], "price": [1.0, 1.0, 2.0]})
+
+        snapshot = record_dataframe_quality(df, "L1_test", db_path, stage="L1")
+        record_dataframe_quality(df, "L1_other", db_path, stage="L1")
+
+        assert snapshot.duplicate_count == 1
+        assert snapshot.null_percentage == pytest.approx(16.67)
+        assert _count(db_path, "run_snapshots") == 0
+        assert flush_collector() == 2
+        assert _count(db_path, "run_snapshots") == 2
+        assert _count(db_path, "column_snapshots") == 4
+        assert _count(db_path, "historical_baselines") == 2
+
+    def test_background_submit(self, tmp_path):
+        db_path = tmp_path / "quality.db"
+        table = pa.table({"price": [1.0, None, 3.0]})
+
+        snapshot = submit_table_quality(table, "L2_test", db_path, stage="L2").result()
+        flush_collector()
+
+        assert (snapshot.output_rows, snapshot.column_metrics[0].null_count) == (3, 1)
+        with sqlite3.connect(db_path) as conn:
+            row = conn.execute(
+                "SELECT null_count, distinct_count, min_value, max_value FROM column_snapshots"
+            ).fetchone()
+        assert row == (1, 2, "1.0", "3.0")
+
+    def test_background_failure_does_not_block_flush(self, tmp_path):
+        class Broken:
+            def compute(self, table):
+                raise RuntimeError("boom")
+
+        collector = data_quality.get_collector(tmp_path / "quality.db", engine=Broken())
+
+        future = collector.submit(pa.table({"x": [1]}), "L2_broken")
+
+        assert collector.flush() == 0
+        assert isinstance(future.exception(), RuntimeError)
+
+    def test_switching_databases_flushes_previous(self, tmp_path):
+        df = pd.DataFrame({"x": [1]})
+        record_dataframe_quality(df, "L1_a", tmp_path / "a.db")
+
+        record_dataframe_quality(df, "L1_b", tmp_path / "b.db")
+
+        assert _count(tmp_path / "a.db", "run_snapshots") == 1
+
+
+class TestTrackedWriter:
+    def test_write_records_quality_after_flush(self, tmp_path):
+        settings = Settings(data_path=str(tmp_path))
+        df = pd.DataFrame({"town": ["BEDOK", "BEDOK"], "price": [1.0, 1.0]})
+
+        path = TrackedWriter(tmp_path / "pipeline", settings).write(df, "L2_sample", "silver")
+        flush_collector()
+
+        pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+        with sqlite3.connect(tmp_path / "quality_metrics.db") as conn:
+            row = conn.execute(
+                "SELECT stage, output_rows, duplicate_count, duplicates_estimated "
+                "FROM run_snapshots"
+            ).fetchone()
+        assert row == ("L_silver", 2, 1, 0)
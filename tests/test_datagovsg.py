@@ -1,7 +1,13 @@
 """Contract tests for adapters/datagovsg.py retry behavior."""
 
 import importlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
 
 import pandas as pd
 import pytest
@@ -14,6 +20,12 @@ def _get_datagov_module():
     return importlib.import_module("egg_n_bacon_housing.adapters.datagovsg")
 
 
+@pytest.fixture(autouse=True)
+def _fresh_host_limiter():
+    """A 429 in one test must not pause the shared limiter of the next."""
+    _get_datagov_module().configure()
+
+
 class TestDatagovRetryBehavior:
     def test_retries_on_server_error_then_succeeds(self, monkeypatch):
         """Should retry 5xx responses and eventually return records."""
@@ -220,6 +232,40 @@ class TestDatagovMultiPagePagination:
         assert len(sleep_calls) == 1
         assert sleep_calls[0] == 2
 
+    def test_rate_limit_429_holds_later_fetches_through_the_host_limiter(self, monkeypatch):
+        """A 429 in one fetch pauses later fetches sharing the data.gov.sg limiter."""
+        datagov = _get_datagov_module()
+
+        responses = [429, 200, 200]
+        sleep_calls = []
+
+        def fake_get(url, timeout=60):
+            response = MagicMock()
+            response.status_code = responses.pop(0)
+            if response.status_code == 429:
+                response.headers = {"Retry-After": "2"}
+                response.raise_for_status.side_effect = requests.HTTPError(response=response)
+                return response
+            response.raise_for_status.return_value = None
+            response.json.return_value = {
+                "result": {"records": [{"id": 1}], "_links": {}, "total": 1}
+            }
+            return response
+
+        monkeypatch.setattr(datagov.requests, "get", fake_get)
+        monkeypatch.setattr(datagov.time, "sleep", sleep_calls.append)
+
+        for dataset_id in ("first", "second"):
+            datagov.fetch_datagovsg_dataset(
+                "https://data.gov.sg/api/action/datastore_search?resource_id=",
+                dataset_id,
+                use_cache=False,
+            )
+
+        assert sleep_calls[0] == 2
+        assert len(sleep_calls) == 2
+        assert 1 < sleep_calls[1] <= 2
+
     def test_empty_results_returns_empty_dataframe(self, monkeypatch):
         """Should return empty DataFrame when no records in response."""
         datagov = _get_datagov_module()
@@ -271,3 +317,133 @@ class TestDatagovMultiPagePagination:
 
         assert isinstance(result, pd.DataFrame)
         assert result.empty
+
+
+class _StubDatastore:
+    """Local datastore_search stand-in serving ``total`` records in pages.
+
+    ``latency`` is added to every response; offsets in ``rate_limited``
+    answer 429 (Retry-After: 1) once, offsets in ``failing`` always 500.
+    ``peak_in_flight`` is the most requests it was serving at once.
+    """
+
+    def __init__(self, total, latency=0.0, rate_limited=(), failing=()):
+        self.total = total
+        self.latency = latency
+        self.rate_limited = set(rate_limited)
+        self.failing = set(failing)
+        self.requests = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub._lock:
+                    stub.in_flight += 1
+                    stub.peak_in_flight = max(stub.peak_in_flight, stub.in_flight)
+                try:
+                    self._respond()
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+            def _respond(self):
+                query = parse_qs(urlparse(self.path).query)
+                limit = int(query["limit"][0])
+                offset = int(query.get("offset", ["0"])[0])
+                stub.requests.append((offset, time.monotonic()))
+                time.sleep(stub.latency)
+                if offset in stub.failing:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                if offset in stub.rate_limited:
+                    stub.rate_limited.discard(offset)
+                    self.send_response(429)
+                    self.send_header("Retry-After", "1")
+                    self.end_headers()
+                    return
+                end = min(offset + limit, stub.total)
+                result = {
+                    "records": [{"_id": i, "value": f"row-{i}"} for i in range(offset, end)],
+                    "total": stub.total,
+                    "_links": {"next": f"{stub.base}&limit={limit}&offset={offset + limit}"},
+                }
+                body = json.dumps({"result": result}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        host, port = self.server.server_address
+        self.url = f"http://{host}:{port}/api/action/datastore_search?resource_id="
+        self.base = f"{self.url}stub"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def fetch(self, max_workers, page_size=100):
+        datagov = _get_datagov_module()
+        return datagov.fetch_datagovsg_dataset(
+            self.url, f"stub&limit={page_size}", use_cache=False, max_workers=max_workers
+        )
+
+
+class TestDatagovConcurrentPagination:
+    def test_concurrent_fetch_matches_serial_walk(self):
+        """Pages fetched concurrently are reassembled in offset order."""
+        with _StubDatastore(total=1050, latency=0.01) as stub:
+            serial = stub.fetch(max_workers=1)
+            concurrent = stub.fetch(max_workers=4)
+
+        assert serial["_id"].tolist() == list(range(1050))
+        pd.testing.assert_frame_equal(concurrent, serial)
+
+    def test_rate_limit_pauses_all_workers_until_retry_after(self):
+        """A 429 on one page holds every worker for Retry-After, then completes."""
+        with _StubDatastore(total=800, latency=0.01, rate_limited={300}) as stub:
+            result = stub.fetch(max_workers=4)
+
+        assert result["_id"].tolist() == list(range(800))
+        first_429 = next(t for offset, t in stub.requests if offset == 300)
+        after = [t - first_429 for offset, t in stub.requests if t > first_429 + 0.1]
+        assert after and min(after) >= 0.9
+
+    def test_host_limit_caps_requests_across_concurrent_fetches(self):
+        datagov = _get_datagov_module()
+        datagov.configure(max_in_flight=2)
+
+        with _StubDatastore(total=800, latency=0.02) as stub:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(lambda _: stub.fetch(max_workers=4), range(2)))
+
+        assert stub.peak_in_flight == 2
+        assert all(r["_id"].tolist() == list(range(800)) for r in results)
+
+    def test_failed_page_raises_incomplete_fetch(self, monkeypatch):
+        datagov = _get_datagov_module()
+        monkeypatch.setattr(datagov, "MAX_RETRY_ATTEMPTS", 0)
+
+        with _StubDatastore(total=500, failing={300}) as stub:
+            with pytest.raises(datagov.IncompleteDatasetFetchError, match="offset 300"):
+                stub.fetch(max_workers=4)
+
+    @pytest.mark.slow
+    def test_concurrent_fetch_matches_serial_walk_over_many_pages(self):
+        with _StubDatastore(total=2000, latency=0.05) as stub:
+            serial = stub.fetch(max_workers=1)
+            concurrent = stub.fetch(max_workers=8)
+
+        pd.testing.assert_frame_equal(concurrent, serial)
@@ -1,5 +1,7 @@
 """Test 03_features component."""
 
+import json
+
 import pandas as pd
 import pytest
 
@@ -275,6 +277,300 @@ class TestLocationDim:
         assert result.loc[0, "max_floor_lvl"] == 25
 
 
+class TestIncrementalLocationDim:
+    """location_dim reuses the previous gold build for known coordinates."""
+
+    @staticmethod
+    def _transactions(coords):
+        return pd.DataFrame(
+            [
+                {
+                    "lat": lat,
+                    "lon": lon,
+                    "block": str(i),
+                    "street_name": "LOR 1",
+                    "town": "TOA PAYOH",
+                    "price": 500000.0,
+                    "transaction_date": pd.Timestamp("2024-01-15"),
+                }
+                for i, (lat, lon) in enumerate(coords)
+            ]
+        )
+
+    @staticmethod
+    def _run(features, tmp_path, coords, mrt_stations, incremental=True):
+        return features.location_dim(
+            TestIncrementalLocationDim._transactions(coords),
+            raw_mrt_stations=mrt_stations,
+            raw_school_directory=pd.DataFrame(),
+            raw_shopping_malls=pd.DataFrame(),
+            raw_hdb_property_info=pd.DataFrame(),
+            gold_dir=tmp_path / "gold",
+            geocoder=InMemoryGeocoder({}),
+            incremental_location_dim=incremental,
+            **_empty_poi_args(),
+        )
+
+    @pytest.fixture
+    def proximity_calls(self, monkeypatch):
+        features = _get_features_module()
+        calls: list[int] = []
+
+        def fake_proximity(props, **kw):
+            calls.append(len(props))
+            props = props.copy()
+            props["dist_to_nearest_mrt"] = props["lat"] * 1000
+            props["nearest_mrt_station"] = "Toa Payoh"
+            return props
+
+        monkeypatch.setattr(features, "calculate_school_features", lambda props, schools: props)
+        monkeypatch.setattr(features, "compute_proximity_features", fake_proximity)
+        return calls
+
+    def test_only_new_coordinates_are_computed(self, tmp_path, proximity_calls):
+        features = _get_features_module()
+        mrt = _make_mrt_stations()
+
+        first = self._run(features, tmp_path, [(1.35, 103.8), (1.36, 103.82)], mrt)
+        second = self._run(features, tmp_path, [(1.37, 103.84), (1.35, 103.8), (1.36, 103.82)], mrt)
+
+        assert proximity_calls == [2, 1]
+        assert len(first) == 2
+        assert list(zip(second["lat"], second["lon"], strict=True)) == [
+            (1.37, 103.84),
+            (1.35, 103.8),
+            (1.36, 103.82),
+        ]
+        assert second["dist_to_nearest_mrt"].tolist() == pytest.approx([1370.0, 1350.0, 1360.0])
+        persisted = pd.read_parquet(tmp_path / "gold" / "location_dim.parquet")
+        assert len(persisted) == 3
+
+    def test_dropped_coordinates_are_not_carried_forward(self, tmp_path, proximity_calls):
+        features = _get_features_module()
+        mrt = _make_mrt_stations()
+
+        self._run(features, tmp_path, [(1.35, 103.8), (1.36, 103.82)], mrt)
+        result = self._run(features, tmp_path, [(1.36, 103.82)], mrt)
+
+        assert proximity_calls == [2]
+        assert result["lat"].tolist() == [1.36]
+
+    def test_changed_poi_input_forces_full_recompute(self, tmp_path, proximity_calls):
+        features = _get_features_module()
+        coords = [(1.35, 103.8), (1.36, 103.82)]
+
+        self._run(features, tmp_path, coords, _make_mrt_stations())
+        moved = _make_mrt_stations().assign(lat=1.333)
+        self._run(features, tmp_path, [*coords, (1.37, 103.84)], moved)
+
+        assert proximity_calls == [2, 3]
+
+    def test_changed_reference_files_force_full_recompute(
+        self, tmp_path, proximity_calls, monkeypatch
+    ):
+        from egg_n_bacon_housing.utils import data_loader, school_features
+
+        features = _get_features_module()
+        external = tmp_path / "bronze" / "external"
+        geojsons = tmp_path / "geojsons"
+        external.mkdir(parents=True)
+        geojsons.mkdir()
+        monkeypatch.setattr(school_features, "_paths", {"bronze_dir": tmp_path / "bronze"})
+        monkeypatch.setattr(data_loader, "_paths", {"raw_data_dir": geojsons})
+        data_loader._load_planning_areas_raw.cache_clear()
+        tiers = external / "school_tiers.json"
+        areas = geojsons / "onemap_planning_area_polygon.geojson"
+        tiers.write_text(json.dumps({"primary": [{"school_name": "A", "tier": 1}]}))
+        areas.write_text(json.dumps({"type": "FeatureCollection", "features": []}))
+        coords = [(1.35, 103.8), (1.36, 103.82)]
+        mrt = _make_mrt_stations()
+
+        self._run(features, tmp_path, coords, mrt)
+        self._run(features, tmp_path, coords, mrt)
+        tiers.write_text(json.dumps({"primary": [{"school_name": "A", "tier": 2}]}))
+        self._run(features, tmp_path, coords, mrt)
+        polygon = [[[103.7, 1.3], [103.9, 1.3], [103.9, 1.4], [103.7, 1.4], [103.7, 1.3]]]
+        feature = {
+            "properties": {"pln_area_n": "TOA PAYOH"},
+            "geometry": {"type": "Polygon", "coordinates": polygon},
+        }
+        areas.write_text(json.dumps({"type": "FeatureCollection", "features": [feature]}))
+        data_loader._load_planning_areas_raw.cache_clear()
+        result = self._run(features, tmp_path, coords, mrt)
+        data_loader._load_planning_areas_raw.cache_clear()
+
+        assert proximity_calls == [2, 2, 2]
+        assert result["planning_area"].tolist() == ["TOA PAYOH", "TOA PAYOH"]
+
+    def test_non_incremental_mode_always_recomputes(self, tmp_path, proximity_calls):
+        features = _get_features_module()
+        coords = [(1.35, 103.8), (1.36, 103.82)]
+
+        mrt = _make_mrt_stations()
+        moved = mrt.assign(lat=1.333)
+
+        self._run(features, tmp_path, coords, mrt)
+        self._run(features, tmp_path, coords, moved, incremental=False)
+        self._run(features, tmp_path, coords, moved, incremental=False)
+        # rows on disk now come from ``moved``; the original inputs must not reuse them
+        self._run(features, tmp_path, coords, mrt)
+
+        assert proximity_calls == [2, 2, 2, 2]
+        assert (tmp_path / "gold" / "location_dim.fingerprint").exists()
+
+
+class TestPartitionedTransactionsEnriched:
+    """transactions_enriched writes month partitions and refreshes only changed ones."""
+
+    @staticmethod
+    def _transactions(extra_rows=()):
+        rows = [
+            {
+                "lat": 1.35,
+                "lon": 103.8,
+                "town": "TOA PAYOH",
+                "price": 500000.0,
+                "floor_area_sqft": 1000.0,
+                "property_type": "hdb",
+                "transaction_date": pd.Timestamp("2024-01-15"),
+            },
+            {
+                "lat": 1.36,
+                "lon": 103.82,
+                "town": "BEDOK",
+                "price": 400000.0,
+                "floor_area_sqft": 800.0,
+                "property_type": "hdb",
+                "transaction_date": pd.Timestamp("2024-02-10"),
+            },
+            *extra_rows,
+        ]
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _location_dim():
+        return pd.DataFrame(
+            [
+                {"lat": 1.35, "lon": 103.8, "planning_area": "Toa Payoh"},
+                {"lat": 1.36, "lon": 103.82, "planning_area": "Bedok"},
+            ]
+        )
+
+    @staticmethod
+    def _run(features, gold_dir, transactions, macro=None, incremental=True):
+        return features.transactions_enriched(
+            transactions,
+            TestPartitionedTransactionsEnriched._location_dim(),
+            rental_yield=pd.DataFrame(),
+            raw_macro_data=macro or {},
+            raw_dwelling_units_by_town=pd.DataFrame(),
+            raw_hdb_resident_population=pd.DataFrame(),
+            raw_median_annual_value=pd.DataFrame(),
+            raw_income_by_planning_area=pd.DataFrame(),
+            gold_dir=gold_dir,
+            incremental_transactions_enriched=incremental,
+        )
+
+    @pytest.fixture
+    def enriched_months(self, monkeypatch):
+        features = _get_features_module()
+        calls: list[list[str]] = []
+        original = features._enrich_transactions
+
+        def spy(df, **lookups):
+            calls.append(sorted(df["month"].unique()))
+            return original(df, **lookups)
+
+        monkeypatch.setattr(features, "_enrich_transactions", spy)
+        return calls
+
+    @staticmethod
+    def _sorted(df):
+        # All-null lookup columns round-trip through parquet as None rather than pd.NA.
+        df = df.sort_values(["month", "price"]).reset_index(drop=True).astype(object)
+        return df.where(df.notna(), None)
+
+    def test_writes_hive_month_partitions(self, tmp_path):
+        features = _get_features_module()
+
+        self._run(features, tmp_path / "gold", self._transactions())
+
+        dataset = tmp_path / "gold" / "transactions_enriched"
+        assert (dataset / "month=2024-01" / "part-0.parquet").exists()
+        assert (dataset / "month=2024-02" / "part-0.parquet").exists()
+        assert (dataset / "_manifest.json").exists()
+        assert not (tmp_path / "gold" / "transactions_enriched.parquet").exists()
+        on_disk = pd.read_parquet(dataset / "month=2024-02" / "part-0.parquet")
+        assert on_disk["planning_area"].tolist() == ["Bedok"]
+
+    def test_only_changed_months_are_reenriched(self, tmp_path, enriched_months):
+        features = _get_features_module()
+        gold = tmp_path / "gold"
+        new_row = {
+            "lat": 1.35,
+            "lon": 103.8,
+            "town": "TOA PAYOH",
+            "price": 450000.0,
+            "floor_area_sqft": 900.0,
+            "property_type": "hdb",
+            "transaction_date": pd.Timestamp("2024-02-20"),
+        }
+
+        self._run(features, gold, self._transactions())
+        january = gold / "transactions_enriched" / "month=2024-01" / "part-0.parquet"
+        january_mtime = january.stat().st_mtime_ns
+        result = self._run(features, gold, self._transactions([new_row]))
+
+        assert enriched_months == [["2024-01", "2024-02"], ["2024-02"]]
+        assert january.stat().st_mtime_ns == january_mtime
+        full = self._run(
+            features, tmp_path / "fresh", self._transactions([new_row]), incremental=False
+        )
+        pd.testing.assert_frame_equal(self._sorted(result), self._sorted(full), check_dtype=False)
+
+    def test_changed_macro_lookup_reenriches_affected_month(self, tmp_path, enriched_months):
+        features = _get_features_module()
+        gold = tmp_path / "gold"
+        cpi = pd.DataFrame({"date": ["2024-01-01", "2024-02-01"], "cpi": [110.0, 111.0]})
+        revised = cpi.assign(cpi=[110.0, 111.5])
+
+        self._run(features, gold, self._transactions(), macro={"cpi": cpi})
+        self._run(features, gold, self._transactions(), macro={"cpi": cpi})
+        result = self._run(features, gold, self._transactions(), macro={"cpi": revised})
+
+        assert enriched_months == [["2024-01", "2024-02"], ["2024-02"]]
+        assert result.set_index("month").loc["2024-02", "cpi"] == pytest.approx(111.5)
+
+    def test_vanished_month_partition_is_removed(self, tmp_path):
+        features = _get_features_module()
+        gold = tmp_path / "gold"
+
+        self._run(features, gold, self._transactions())
+        result = self._run(features, gold, self._transactions().iloc[:1])
+
+        assert result["month"].tolist() == ["2024-01"]
+        assert not (gold / "transactions_enriched" / "month=2024-02").exists()
+
+    def test_large_tables_are_validated_in_full(self, tmp_path):
+        features = _get_features_module()
+        transactions = pd.concat([self._transactions()] * 5_001, ignore_index=True)
+        transactions.loc[len(transactions) - 1, "price"] = -1.0
+
+        result = self._run(features, tmp_path / "gold", transactions)
+
+        assert len(result) == len(transactions) - 1
+        assert (result["price"] > 0).all()
+
+    def test_non_incremental_mode_reenriches_everything(self, tmp_path, enriched_months):
+        features = _get_features_module()
+        gold = tmp_path / "gold"
+
+        self._run(features, gold, self._transactions(), incremental=False)
+        self._run(features, gold, self._transactions(), incremental=False)
+
+        assert enriched_months == [["2024-01", "2024-02"], ["2024-01", "2024-02"]]
+
+
 class TestTransactionsEnriched:
     """Test the transactions_enriched fact table."""
 
@@ -0,0 +1,91 @@
+"""Tests for the offline address gazetteer (utils/gazetteer.py)."""
+
+import pandas as pd
+import pytest
+
+from egg_n_bacon_housing.utils.gazetteer import (
+    build_gazetteer,
+    hdb_block_addresses,
+    load_gazetteer,
+    update_gazetteer,
+    write_gazetteer,
+)
+from egg_n_bacon_housing.utils.geocoding import InMemoryGeocoder
+
+pytestmark = pytest.mark.unit
+
+
+def _past_results() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "normalized_address": ["123 ANG MO KIO AVE 3", "1 ORCHARD RD", "NOWHERE"],
+            "lat": [1.37, 1.30, None],
+            "lon": [103.85, 103.83, None],
+            "matched_name": ["BLK 123", "ORCHARD", None],
+            "postal_code": ["560123", "NIL", None],
+        }
+    )
+
+
+class TestBuildGazetteer:
+    def test_keys_by_normalized_address_and_postal_code(self):
+        gazetteer = build_gazetteer([_past_results()])
+
+        assert sorted(gazetteer["key"]) == ["1 ORCHARD RD", "123 ANG MO KIO AVE 3", "560123"]
+        postal = gazetteer.set_index("key").loc["560123"]
+        assert (postal["lat"], postal["lon"]) == (1.37, 103.85)
+
+    def test_earlier_sources_take_precedence(self):
+        newer = pd.DataFrame({"key": ["1 ORCHARD RD"], "lat": [9.9], "lon": [9.9]})
+
+        gazetteer = build_gazetteer([_past_results(), newer])
+
+        assert gazetteer.set_index("key").loc["1 ORCHARD RD", "lat"] == 1.30
+
+    def test_prefetches_uncovered_hdb_blocks_through_fallback(self):
+        property_info = pd.DataFrame(
+            {
+                "blk_no": ["123", "5", "7"],
+                "street": ["ANG MO KIO AVE 3", "Upper Boon Keng Road", "X"],
+            }
+        )
+        blocks = hdb_block_addresses(property_info)
+        fallback = InMemoryGeocoder({"5 UPP BOON KENG RD": (1.31, 103.87)})
+
+        offline = build_gazetteer([_past_results()], hdb_blocks=blocks)
+        prefetched = build_gazetteer([_past_results()], hdb_blocks=blocks, geocoder=fallback)
+
+        assert "5 UPP BOON KENG RD" not in set(offline["key"])
+        assert prefetched.set_index("key").loc["5 UPP BOON KENG RD", "lat"] == 1.31
+        assert "7 X" not in set(prefetched["key"])
+
+    def test_write_and_load_round_trip(self, tmp_path):
+        path = tmp_path / "address_gazetteer.parquet"
+        assert load_gazetteer(path).empty
+
+        gazetteer = build_gazetteer([_past_results()])
+        write_gazetteer(gazetteer, path)
+
+        pd.testing.assert_frame_equal(load_gazetteer(path), gazetteer)
+
+    def test_update_stores_only_resolved_rows(self, tmp_path):
+        path = tmp_path / "address_gazetteer.parquet"
+        resolved = _past_results().assign(input=lambda df: df["normalized_address"])
+
+        updated = update_gazetteer(path, load_gazetteer(path), resolved)
+        unchanged = update_gazetteer(path, updated, resolved.iloc[:1])
+
+        assert unchanged is updated
+        assert "NOWHERE" not in set(updated["key"])
+        pd.testing.assert_frame_equal(load_gazetteer(path), updated)
+
+    def test_load_folds_in_legacy_address_index(self, tmp_path):
+        path = tmp_path / "address_gazetteer.parquet"
+        write_gazetteer(build_gazetteer([_past_results().iloc[:1]]), path)
+        legacy = _past_results().iloc[1:].assign(lat=[1.29, None])
+        legacy.to_parquet(tmp_path / "address_coordinates.parquet", index=False)
+
+        gazetteer = load_gazetteer(path).set_index("key")
+
+        assert gazetteer.loc["123 ANG MO KIO AVE 3", "lat"] == 1.37
+        assert gazetteer.loc["1 ORCHARD RD", "lat"] == 1.29
@@ -6,11 +6,21 @@ rate-limit, and parallel paths are covered with the OneMap transport and the
 cache manager monkeypatched (no network).
 """
 
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
 import pandas as pd
 import pytest
 
 from egg_n_bacon_housing.utils.cache import _CACHE_MISS
 from egg_n_bacon_housing.utils.geocoding import (
+    AsyncOneMapGeocoder,
+    CompositeGeocoder,
+    GazetteerGeocoder,
     Geocoder,
     InMemoryGeocoder,
     OneMapGeocoder,
@@ -20,6 +30,27 @@ from egg_n_bacon_housing.utils.geocoding import (
 pytestmark = pytest.mark.unit
 
 
+def _patch_cache(monkeypatch, cache: dict) -> None:
+    """Serve OneMap cache reads (single and bulk) and bulk writes from ``cache``."""
+    from pathlib import Path
+
+    import egg_n_bacon_housing.utils.cache as cache_mod
+
+    cache_mod.configure(Path("/tmp/test_cache"), use_caching=True)
+    manager = cache_mod.get_cache_manager()
+    monkeypatch.setattr(
+        manager,
+        "get",
+        lambda identifier, duration_hours=24: cache.get(identifier, _CACHE_MISS),
+    )
+    monkeypatch.setattr(
+        manager,
+        "get_many",
+        lambda identifiers, duration_hours=24: {i: cache[i] for i in identifiers if i in cache},
+    )
+    monkeypatch.setattr(manager, "set_many", cache.update)
+
+
 class TestInMemoryGeocoder:
     """The Geocoder contract, verified through the test adapter."""
 
@@ -136,16 +167,7 @@ class TestOneMapGeocoderCacheFirst:
         geocoder = OneMapGeocoder(
             headers={"Authorization": "x"}, max_workers=1, rate_limit_seconds=5
         )
-        from pathlib import Path
-
-        import egg_n_bacon_housing.utils.cache as cache_mod
-
-        cache_mod.configure(Path("/tmp/test_cache"), use_caching=True)
-        monkeypatch.setattr(
-            cache_mod.get_cache_manager(),
-            "get",
-            lambda identifier, duration_hours=24: cache.get(identifier, _CACHE_MISS),
-        )
+        _patch_cache(monkeypatch, cache)
         api_calls = self._patch_api(
             monkeypatch, pd.DataFrame([{"LATITUDE": 9.0, "LONGITUDE": 9.0}])
         )
@@ -161,16 +183,7 @@ class TestOneMapGeocoderCacheFirst:
         geocoder = OneMapGeocoder(
             headers={"Authorization": "x"}, max_workers=1, rate_limit_seconds=0.0
         )
-        from pathlib import Path
-
-        import egg_n_bacon_housing.utils.cache as cache_mod
-
-        cache_mod.configure(Path("/tmp/test_cache"), use_caching=True)
-        monkeypatch.setattr(
-            cache_mod.get_cache_manager(),
-            "get",
-            lambda identifier, duration_hours=24: _CACHE_MISS,
-        )
+        _patch_cache(monkeypatch, {})
         self._patch_api(monkeypatch, pd.DataFrame([{"LATITUDE": 7.0, "LONGITUDE": 8.0}]))
         sleeps = self._patch_sleep(monkeypatch)
 
@@ -183,16 +196,7 @@ class TestOneMapGeocoderCacheFirst:
         geocoder = OneMapGeocoder(
             headers={"Authorization": "x"}, max_workers=1, rate_limit_seconds=3
         )
-        from pathlib import Path
-
-        import egg_n_bacon_housing.utils.cache as cache_mod
-
-        cache_mod.configure(Path("/tmp/test_cache"), use_caching=True)
-        monkeypatch.setattr(
-            cache_mod.get_cache_manager(),
-            "get",
-            lambda identifier, duration_hours=24: _CACHE_MISS,
-        )
+        _patch_cache(monkeypatch, {})
         self._patch_api(monkeypatch, pd.DataFrame([{"LATITUDE": 7.0, "LONGITUDE": 8.0}]))
         sleeps = self._patch_sleep(monkeypatch)
 
@@ -204,16 +208,7 @@ class TestOneMapGeocoderCacheFirst:
 class TestOneMapGeocoderParallel:
     def test_parallel_geocode_resolves_all_via_api(self, monkeypatch):
         geocoder = OneMapGeocoder(headers={"Authorization": "x"}, max_workers=3)
-        from pathlib import Path
-
-        import egg_n_bacon_housing.utils.cache as cache_mod
-
-        cache_mod.configure(Path("/tmp/test_cache"), use_caching=True)
-        monkeypatch.setattr(
-            cache_mod.get_cache_manager(),
-            "get",
-            lambda identifier, duration_hours=24: _CACHE_MISS,
-        )
+        _patch_cache(monkeypatch, {})
         monkeypatch.setattr(
             "egg_n_bacon_housing.adapters.onemap.fetch_data_cached",
             lambda *a, **k: pd.DataFrame([{"LATITUDE": 1.5, "LONGITUDE": 2.5}]),
@@ -227,16 +222,7 @@ class TestOneMapGeocoderParallel:
 
     def test_parallel_preserves_input_order(self, monkeypatch):
         geocoder = OneMapGeocoder(headers={"Authorization": "x"}, max_workers=4)
-        from pathlib import Path
-
-        import egg_n_bacon_housing.utils.cache as cache_mod
-
-        cache_mod.configure(Path("/tmp/test_cache"), use_caching=True)
-
-        def fake_get(identifier, duration_hours=24):
-            return _CACHE_MISS
-
-        monkeypatch.setattr(cache_mod.get_cache_manager(), "get", fake_get)
+        _patch_cache(monkeypatch, {})
 
         def fake_fetch(search_string, headers, timeout):
             return pd.DataFrame(
@@ -251,6 +237,130 @@ class TestOneMapGeocoderParallel:
         assert df["lat"].tolist() == [1.0, 2.0, 3.0, 4.0]
 
 
+class TestOneMapGeocoderBulkCacheLookup:
+    def test_only_misses_reach_the_pool_and_stats_are_reported(self, monkeypatch):
+        cache = {
+            "onemap_search:Hit": pd.DataFrame(
+                [{"LATITUDE": "1.0", "LONGITUDE": "2.0", "SEARCHVAL": "HIT MALL"}]
+            ),
+            "onemap_search:Known none": pd.DataFrame(),
+        }
+        _patch_cache(monkeypatch, cache)
+        api_calls: list = []
+
+        def fake_fetch(search_string, headers, timeout):
+            api_calls.append(search_string)
+            return pd.DataFrame([{"LATITUDE": 5.0, "LONGITUDE": 6.0}])
+
+        monkeypatch.setattr("egg_n_bacon_housing.adapters.onemap.fetch_data_cached", fake_fetch)
+        geocoder = OneMapGeocoder(headers={"Authorization": "x"}, max_workers=4)
+
+        df = geocoder.geocode(pd.Series(["Hit", "Miss A", "Hit", "Known none", "Miss B", "Miss A"]))
+
+        assert sorted(api_calls) == ["Miss A", "Miss B"]
+        assert df["input"].tolist() == ["Hit", "Miss A", "Hit", "Known none", "Miss B", "Miss A"]
+        assert df["lat"].tolist()[:3] == [1.0, 5.0, 1.0]
+        assert df.loc[0, "matched_name"] == "HIT MALL"
+        assert pd.isna(df.loc[3, "lat"])
+        assert geocoder.last_run_stats == {
+            "addresses": 6,
+            "unique_addresses": 4,
+            "cache_hits": 2,
+            "api_calls": 2,
+            "hit_ratio": 0.5,
+            "unresolved": 1,
+        }
+        assert sorted(k for k in cache if k.startswith("onemap_geocode:")) == [
+            "onemap_geocode:Hit",
+            "onemap_geocode:Known none",
+            "onemap_geocode:Miss A",
+            "onemap_geocode:Miss B",
+        ]
+        assert cache["onemap_geocode:Hit"]["matched_name"] == "HIT MALL"
+
+    def test_warm_run_makes_no_api_calls(self, monkeypatch, tmp_path):
+        import egg_n_bacon_housing.utils.cache as cache_mod
+
+        manager = cache_mod.configure(tmp_path, use_caching=True, backend="sqlite")
+        manager.set_many(
+            {
+                f"onemap_search:{i:06d}": pd.DataFrame([{"LATITUDE": 1.3, "LONGITUDE": 103.8}])
+                for i in range(200)
+            }
+        )
+        monkeypatch.setattr(
+            "egg_n_bacon_housing.adapters.onemap.fetch_data_cached",
+            lambda *a, **k: pytest.fail("API called on a warm cache"),
+        )
+        geocoder = OneMapGeocoder(headers={"Authorization": "x"}, max_workers=4)
+
+        df = geocoder.geocode(pd.Series([f"{i:06d}" for i in range(200)]))
+
+        assert df["lat"].notna().all()
+        assert geocoder.last_run_stats["hit_ratio"] == 1.0
+        assert geocoder.last_run_stats["api_calls"] == 0
+
+
+def _gazetteer() -> GazetteerGeocoder:
+    return GazetteerGeocoder(
+        pd.DataFrame(
+            {
+                "key": ["123 ANG MO KIO AVE 3", "560123"],
+                "lat": [1.37, 1.37],
+                "lon": [103.85, 103.85],
+                "matched_name": ["BLK 123", "BLK 123"],
+                "postal_code": ["560123", "560123"],
+            }
+        )
+    )
+
+
+class TestGazetteerGeocoder:
+    def test_resolves_normalized_addresses_and_postal_codes(self):
+        df = _gazetteer().geocode(pd.Series(["Blk 123 Ang Mo Kio Avenue 3", "560123", "Unknown"]))
+
+        assert df["input"].tolist() == ["Blk 123 Ang Mo Kio Avenue 3", "560123", "Unknown"]
+        assert df["lat"].tolist()[:2] == [1.37, 1.37]
+        assert pd.isna(df.loc[2, "lat"])
+        assert df.loc[0, "postal_code"] == "560123"
+
+    def test_empty_input(self):
+        assert _gazetteer().geocode(pd.Series([], dtype=object)).empty
+
+
+class TestCompositeGeocoder:
+    def test_fallback_only_sees_misses_and_order_is_preserved(self):
+        class Recording(InMemoryGeocoder):
+            seen: list = []
+
+            def geocode(self, addresses):
+                self.seen.extend(addresses)
+                return super().geocode(addresses)
+
+        fallback = Recording({"1 Orchard Road": (1.30, 103.83)})
+        composite = CompositeGeocoder([_gazetteer(), fallback])
+
+        df = composite.geocode(pd.Series(["1 Orchard Road", "123 ANG MO KIO AVE 3", "Nowhere"]))
+
+        assert fallback.seen == ["1 Orchard Road", "Nowhere"]
+        assert df["input"].tolist() == ["1 Orchard Road", "123 ANG MO KIO AVE 3", "Nowhere"]
+        assert df["lat"].tolist()[:2] == [1.30, 1.37]
+        assert pd.isna(df.loc[2, "lat"])
+        assert composite.last_run_stats == {
+            "GazetteerGeocoder": 1,
+            "Recording": 1,
+            "unresolved": 1,
+        }
+
+    def test_fallback_skipped_when_first_tier_resolves_everything(self):
+        fallback = InMemoryGeocoder({})
+        fallback.geocode = lambda addresses: pytest.fail("fallback should not be called")
+
+        df = CompositeGeocoder([_gazetteer(), fallback]).geocode(pd.Series(["560123"]))
+
+        assert df["lat"].tolist() == [1.37]
+
+
 class TestBuildDefaultGeocoder:
     def test_wires_settings_into_onemap_geocoder(self, monkeypatch):
         monkeypatch.setattr(
@@ -259,10 +369,12 @@ class TestBuildDefaultGeocoder:
         )
 
         class _Geo:
+            engine = "threads"
             cache_duration_hours = 48
             max_workers = 7
             timeout_seconds = 20
             api_delay_seconds = 0.5
+            max_requests_per_second = 4.0
 
         class FakeSettings:
             geocoding = _Geo()
@@ -275,3 +387,163 @@ class TestBuildDefaultGeocoder:
         assert geocoder.timeout == 20
         assert geocoder.rate_limit_seconds == 0.5
         assert geocoder.cache_duration_hours == 48
+
+    def test_async_engine_selects_async_geocoder(self, monkeypatch):
+        monkeypatch.setattr(
+            "egg_n_bacon_housing.adapters.onemap.setup_onemap_headers",
+            lambda settings: {"Authorization": "token"},
+        )
+
+        class _Geo:
+            engine = "async"
+            cache_duration_hours = 48
+            max_workers = 6
+            timeout_seconds = 20
+            api_delay_seconds = 0.5
+            max_requests_per_second = 3.5
+
+        class FakeSettings:
+            geocoding = _Geo()
+
+        geocoder = build_default_geocoder(FakeSettings())
+
+        assert isinstance(geocoder, AsyncOneMapGeocoder)
+        assert geocoder.max_workers == 6
+        assert geocoder.requests_per_second == 3.5
+
+
+class _StubOneMap:
+    """Local OneMap search stand-in; ``flaky`` addresses answer 503 once."""
+
+    def __init__(self, latency=0.0, flaky=()):
+        self.latency = latency
+        self.flaky = set(flaky)
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                address = parse_qs(urlparse(self.path).query)["searchVal"][0]
+                stub.requests.append((address, time.monotonic(), self.headers["Authorization"]))
+                time.sleep(stub.latency)
+                if address in stub.flaky:
+                    stub.flaky.discard(address)
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                results = []
+                if address != "Nowhere":
+                    n = float(len(address))
+                    results = [{"SEARCHVAL": address.upper(), "LATITUDE": n, "LONGITUDE": -n}]
+                body = json.dumps({"found": len(results), "results": results}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        host, port = self.server.server_address
+        self.url = f"http://{host}:{port}/api/common/elastic/search"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestAsyncOneMapGeocoder:
+    @pytest.fixture(autouse=True)
+    def _cache(self, tmp_path):
+        import egg_n_bacon_housing.utils.cache as cache_mod
+
+        return cache_mod.configure(tmp_path, use_caching=True, backend="sqlite")
+
+    def test_geocodes_misses_against_stub_and_caches_results(self, _cache, monkeypatch):
+        monkeypatch.setattr(
+            "egg_n_bacon_housing.utils.geocoding.wait_exponential_jitter",
+            lambda **kwargs: (lambda retry_state: 0),
+        )
+        with _StubOneMap(flaky={"Flaky Rd"}) as stub:
+            geocoder = AsyncOneMapGeocoder(
+                headers={"Authorization": "token"},
+                requests_per_second=200,
+                base_url=stub.url,
+            )
+            df = geocoder.geocode(pd.Series(["Ab", "Flaky Rd", "Nowhere", "Ab"]))
+
+        assert df["lat"].tolist()[:2] == [2.0, 8.0]
+        assert pd.isna(df.loc[2, "lat"])
+        assert df.loc[3, "matched_name"] == "AB"
+        assert [r[0] for r in stub.requests].count("Flaky Rd") == 2
+        assert {r[2] for r in stub.requests} == {"token"}
+        assert geocoder.last_run_stats["api_calls"] == 3
+        assert _cache.get("onemap_search:Nowhere").empty
+        assert _cache.get("onemap_geocode:Flaky Rd")["lat"] == 8.0
+
+    def test_geocode_works_inside_a_running_event_loop(self):
+        with _StubOneMap() as stub:
+            geocoder = AsyncOneMapGeocoder(
+                headers={"Authorization": "token"},
+                requests_per_second=200,
+                base_url=stub.url,
+            )
+
+            async def caller():
+                return geocoder.geocode(pd.Series(["Ab", "Nowhere"]))
+
+            df = asyncio.run(caller())
+
+        assert df.loc[0, "lat"] == 2.0
+        assert pd.isna(df.loc[1, "lat"])
+
+    @pytest.mark.slow
+    def test_sustained_throughput_tracks_the_qps_ceiling(self):
+        rate = 20.0
+        addresses = pd.Series([f"Street {i}" for i in range(40)])
+        with _StubOneMap(latency=0.05) as stub:
+            geocoder = AsyncOneMapGeocoder(
+                headers={"Authorization": "token"},
+                max_concurrency=8,
+                requests_per_second=rate,
+                base_url=stub.url,
+            )
+            df = geocoder.geocode(addresses)
+
+        starts = sorted(t for _, t, _ in stub.requests)
+        achieved = (len(starts) - 1) / (starts[-1] - starts[0])
+        assert df["lat"].notna().all()
+        assert 0.85 * rate <= achieved <= 1.05 * rate
+        # no one-second window exceeds the ceiling beyond the burst token and arrival jitter
+        assert max(sum(s <= t < s + 1 for t in starts) for s in starts) <= rate + 2
+
+
+class TestBuildDefaultGeocoderWithGazetteer:
+    def test_gazetteer_file_puts_offline_tier_first(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "egg_n_bacon_housing.adapters.onemap.setup_onemap_headers",
+            lambda settings: {"Authorization": "token"},
+        )
+        from egg_n_bacon_housing.config import settings
+        from egg_n_bacon_housing.utils.gazetteer import build_gazetteer, write_gazetteer
+
+        path = tmp_path / "address_gazetteer.parquet"
+        assert isinstance(build_default_geocoder(settings, gazetteer_path=path), OneMapGeocoder)
+
+        write_gazetteer(
+            build_gazetteer(
+                [pd.DataFrame({"key": ["1 ORCHARD RD"], "lat": [1.3], "lon": [103.8]})]
+            ),
+            path,
+        )
+        geocoder = build_default_geocoder(settings, gazetteer_path=path)
+
+        assert isinstance(geocoder, CompositeGeocoder)
+        assert isinstance(geocoder.geocoders[0], GazetteerGeocoder)
+        assert isinstance(geocoder.geocoders[1], OneMapGeocoder)
@@ -0,0 +1,105 @@
+"""Tests for the cached GeoJSON geometry store (utils/geometry_store.py)."""
+
+import json
+import os
+
+import pyarrow.parquet as pq
+import pytest
+
+from egg_n_bacon_housing.utils import geometry_store
+from egg_n_bacon_housing.utils.geometry_store import (
+    GEOMETRY_COLUMN,
+    VERTEX_LAT_COLUMN,
+    geometries,
+    load_geometry_table,
+    property_values,
+    source_fingerprint,
+    source_hash,
+    store_path,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _write_geojson(path, features):
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+    return path
+
+
+def _square(name, x=103.8, code=1):
+    ring = [[x, 1.3], [x + 0.1, 1.3], [x + 0.1, 1.4], [x, 1.4], [x, 1.3]]
+    return {
+        "properties": {"pln_area_n": name, "code": code},
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+    }
+
+
+class TestGeometryStore:
+    def test_converts_once_and_reads_store(self, tmp_path, monkeypatch):
+        source = _write_geojson(tmp_path / "areas.geojson", [_square("A"), _square("B", 104.0)])
+
+        table = load_geometry_table(source)
+        monkeypatch.setattr(geometry_store, "convert_geojson", pytest.fail)
+        cached = load_geometry_table(source, [GEOMETRY_COLUMN, "pln_area_n", "missing"])
+
+        assert store_path(source).exists()
+        assert table.num_rows == 2
+        assert cached.column_names == [GEOMETRY_COLUMN, "pln_area_n"]
+        assert property_values(cached, "pln_area_n") == ["A", "B"]
+        assert geometries(cached)[1].bounds == pytest.approx((104.0, 1.3, 104.1, 1.4))
+        assert table.column(VERTEX_LAT_COLUMN).to_pylist()[0] == pytest.approx(1.34)
+
+    def test_writes_geoparquet_metadata(self, tmp_path):
+        source = _write_geojson(tmp_path / "areas.geojson", [_square("A")])
+
+        load_geometry_table(source)
+        geo = json.loads(pq.read_schema(store_path(source)).metadata[b"geo"])
+
+        assert geo["primary_column"] == GEOMETRY_COLUMN
+        assert geo["columns"][GEOMETRY_COLUMN] == {"encoding": "WKB", "geometry_types": ["Polygon"]}
+
+    def test_reconverts_when_content_changes(self, tmp_path):
+        source = _write_geojson(tmp_path / "areas.geojson", [_square("A")])
+        load_geometry_table(source)
+
+        _write_geojson(source, [_square("Z")])
+
+        assert property_values(load_geometry_table(source), "pln_area_n") == ["Z"]
+
+    def test_touched_source_is_not_reconverted(self, tmp_path, monkeypatch):
+        source = _write_geojson(tmp_path / "areas.geojson", [_square("A")])
+        load_geometry_table(source)
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        monkeypatch.setattr(geometry_store, "convert_geojson", pytest.fail)
+
+        assert property_values(load_geometry_table(source), "pln_area_n") == ["A"]
+        monkeypatch.setattr(geometry_store, "source_hash", pytest.fail)
+        assert property_values(load_geometry_table(source), "pln_area_n") == ["A"]
+
+    def test_source_fingerprint_reads_recorded_hash_from_fresh_store(self, tmp_path, monkeypatch):
+        source = _write_geojson(tmp_path / "areas.geojson", [_square("A")])
+        expected = source_hash(source)
+        load_geometry_table(source)
+        monkeypatch.setattr(geometry_store, "source_hash", pytest.fail)
+
+        assert source_fingerprint(source) == expected
+
+    def test_mixed_type_properties_round_trip(self, tmp_path):
+        features = [_square("A", code=1), _square("B", code="X1"), _square("C", code=None)]
+        features[2]["geometry"] = None
+        source = _write_geojson(tmp_path / "areas.geojson", features)
+
+        table = load_geometry_table(source)
+
+        assert property_values(table, "code") == [1, "X1", None]
+        assert geometries(table)[2] is None
+
+    def test_unwritable_store_falls_back_to_memory(self, tmp_path, monkeypatch):
+        source = _write_geojson(tmp_path / "areas.geojson", [_square("A")])
+        monkeypatch.setattr(geometry_store, "_write", lambda table, path: False)
+
+        table = load_geometry_table(source, ["pln_area_n"])
+
+        assert table.column_names == ["pln_area_n"]
+        assert not store_path(source).exists()
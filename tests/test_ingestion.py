@@ -2,6 +2,8 @@
 
 import json
 import logging
+import threading
+import time
 
 import pandas as pd
 import pytest
@@ -82,6 +84,68 @@ class TestBronzeLayer:
                 error_name="hdb_resale",
             )
 
+    def test_raw_hdb_resale_transactions_streams_history_with_compact_dtypes(
+        self, tmp_path, monkeypatch
+    ):
+        """Historical CSVs are streamed in chunks and merged with API rows (2017+)."""
+        from egg_n_bacon_housing.adapters import datagovsg
+        from egg_n_bacon_housing.components.ingestion import datagov
+
+        bronze_dir = tmp_path / "pipeline" / "01_bronze"
+        csv_dir = datagov._hdb_resale_csv_dir(bronze_dir)
+        csv_dir.mkdir(parents=True)
+        row = {
+            "town": "BEDOK",
+            "flat_type": "4 ROOM",
+            "block": "10A",
+            "street_name": "BEDOK NTH",
+            "storey_range": "01 TO 03",
+            "floor_area_sqm": 90.5,
+            "flat_model": "Improved",
+            "lease_commence_date": 1980,
+            "resale_price": 300000.0,
+        }
+        pd.DataFrame([{**row, "month": m} for m in ("1990-01", "1990-02", "1990-03")]).to_csv(
+            csv_dir / "1990.csv", index=False
+        )
+        pd.DataFrame(
+            [
+                {**row, "month": "2016-12", "remaining_lease": "63 years"},
+                {**row, "month": "2017-01", "remaining_lease": "62 years"},
+            ]
+        ).to_csv(csv_dir / "2015.csv", index=False)
+        api_df = pd.DataFrame(
+            [
+                {
+                    **row,
+                    "_id": 1,
+                    "month": "2017-01",
+                    "town": "TAMPINES",
+                    "remaining_lease": "62 years",
+                    "resale_price": "450000",
+                }
+            ]
+        ).astype(str)
+        monkeypatch.setattr(datagovsg, "fetch_datagovsg_dataset", lambda *a, **kw: api_df)
+        monkeypatch.setattr(datagov, "_HDB_RESALE_CHUNKSIZE", 2)
+
+        result = datagov.raw_hdb_resale_transactions(bronze_dir)
+
+        assert result["month"].tolist() == ["1990-01", "1990-02", "1990-03", "2016-12", "2017-01"]
+        assert result["town"].tolist()[-1] == "TAMPINES"
+        assert result["resale_price"].iloc[-1] == 450000.0
+        assert "_id" not in result.columns
+        assert result["remaining_lease"].isna().sum() == 3
+        assert isinstance(result["town"].dtype, pd.CategoricalDtype)
+        assert isinstance(result["flat_model"].dtype, pd.CategoricalDtype)
+        assert result["lease_commence_date"].dtype == "int32"
+        assert result["floor_area_sqm"].dtype == "float32"
+
+        import pyarrow.parquet as pq
+
+        assert pq.ParquetFile(bronze_dir / "raw_hdb_resale.parquet").num_row_groups > 1
+        pd.testing.assert_frame_equal(datagov.raw_hdb_resale_transactions(bronze_dir), result)
+
     def test_raw_rental_index_reads_legacy_bronze_filename(self, tmp_path, monkeypatch):
         """Test that rental index reads the tracked bronze parquet filename."""
         ingestion = _get_ingestion_module()
@@ -189,7 +253,7 @@ class TestBronzeLayer:
 
         from egg_n_bacon_housing.adapters import datagovsg
 
-        def fake_fetch(_base_url, resource_id, use_cache=False):
+        def fake_fetch(_base_url, resource_id, **kw):
             if resource_id == ingestion.macro.GDP_RESOURCE_ID:
                 return pd.DataFrame(
                     [
@@ -221,7 +285,7 @@ class TestBronzeLayer:
 
         from egg_n_bacon_housing.adapters import datagovsg
 
-        def fake_fetch(_base_url, resource_id, use_cache=False):
+        def fake_fetch(_base_url, resource_id, **kw):
             if resource_id == ingestion.macro.WAGE_GROWTH_RESOURCE_ID:
                 return pd.DataFrame(
                     [{"metric": "ignored", "DataSeries": "Overall Economy", "2025": "4.5"}]
@@ -316,6 +380,41 @@ class TestBronzeLayer:
         for key in ("cpi", "gdp", "hdb_rpi"):
             assert result[key].empty
 
+    def test_raw_macro_data_fetches_missing_indicators_with_bounded_concurrency(
+        self, tmp_path, monkeypatch
+    ):
+        ingestion = _get_ingestion_module()
+        macro = _get_macro_module()
+        external_dir = tmp_path / "external"
+        external_dir.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame([{"value": 100}]).to_parquet(external_dir / "cpi.parquet", index=False)
+
+        from egg_n_bacon_housing.adapters import datagovsg
+
+        lock = threading.Lock()
+        in_flight, peak, fetched = 0, 0, []
+
+        def slow_fetch(_base_url, resource_id, **kw):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                fetched.append(resource_id)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            raise requests.Timeout("slow")
+
+        monkeypatch.setattr(datagovsg, "fetch_datagovsg_dataset", slow_fetch)
+
+        result = ingestion.raw_macro_data(bronze_dir=tmp_path, datagovsg_workers=2)
+
+        assert peak == 2
+        assert macro.CPI_RESOURCE_ID not in fetched
+        assert len(fetched) == len(macro.MACRO_INDICATORS) - 1
+        assert not result["cpi"].empty
+        assert list(result) == ["sora"] + [i.key for i in macro.MACRO_INDICATORS]
+
     def test_raw_shopping_malls_prefers_geocoded_bronze_file(self, tmp_path):
         """Test that geocoded mall bronze output is preferred when present."""
         ingestion = _get_ingestion_module()
@@ -6,8 +6,11 @@ import types
 
 import pandas as pd
 import pytest
+from fixtures import parallel_downstream, parallel_ingest
+from hamilton import driver
 
 from egg_n_bacon_housing.config import settings
+from egg_n_bacon_housing.utils.execution import IngestExecutionManager
 from egg_n_bacon_housing.utils.geocoding import InMemoryGeocoder
 
 pytestmark = pytest.mark.integration
@@ -64,3 +67,25 @@ def test_run_pipeline_defaults_to_all_stage(monkeypatch):
 
     assert captured["final_vars"] == pipeline.STAGE_VARS["all"]
     assert set(result.keys()) == set(captured["final_vars"])
+
+
+def test_ingest_execution_manager_runs_ingestion_nodes_in_parallel():
+    """Ingestion nodes overlap on worker threads; host caps and other nodes are respected."""
+    parallel_ingest._reset()
+    dr = (
+        driver.Builder()
+        .with_modules(parallel_ingest, parallel_downstream)
+        .enable_dynamic_execution(allow_experimental_mode=True)
+        .with_execution_manager(
+            IngestExecutionManager(4, {"data.gov.sg": 1}, module_prefix=parallel_ingest.__name__)
+        )
+        .build()
+    )
+
+    result = dr.execute(final_vars=["total"], inputs={"x": 0})
+
+    assert result["total"] == 10
+    assert parallel_ingest.state["gov_max"] == 1
+    assert parallel_ingest.state["threads"]["raw_local_a"] != "MainThread"
+    assert parallel_ingest.state["threads"]["raw_gov_a"] != "MainThread"
+    assert parallel_downstream.state["thread"] == "MainThread"
@@ -68,6 +68,8 @@ class TestPipelineIntegration:
         assert captured["inputs"]["gold_dir"] == tmp_path / "pipeline" / "03_gold"
         assert "writer" in captured["inputs"]
         assert captured["inputs"]["writer"].data_dir == tmp_path / "pipeline"
+        assert captured["inputs"]["incremental_location_dim"] is False
+        assert captured["inputs"]["incremental_transactions_enriched"] is False
 
     def test_run_pipeline_reconfigures_helpers_to_override_data_path(self, tmp_path, monkeypatch):
         pipeline = _get_pipeline_module()
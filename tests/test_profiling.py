@@ -0,0 +1,88 @@
+"""Tests for the per-node profiling adapter (utils/profiling.py)."""
+
+import functools
+import importlib
+
+import pytest
+from fixtures import profiled_nodes
+
+from egg_n_bacon_housing.config import settings
+from egg_n_bacon_housing.utils.execution import IngestExecutionManager
+from egg_n_bacon_housing.utils.profiling import (
+    PROFILE_REPORT_FILENAME,
+    format_top_nodes,
+    load_profile,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def profiled_modules(monkeypatch):
+    """Pipeline module whose DAG is ``profiled_nodes``, run as ingestion with >1 worker."""
+    pipeline = importlib.import_module("egg_n_bacon_housing.pipeline")
+    monkeypatch.setattr(pipeline, "_STAGE_MODULES", [profiled_nodes])
+    monkeypatch.setattr(
+        pipeline,
+        "IngestExecutionManager",
+        functools.partial(IngestExecutionManager, module_prefix=profiled_nodes.__name__),
+    )
+    monkeypatch.setattr(settings.pipeline, "use_caching", False)
+    return pipeline
+
+
+class TestNodeProfiler:
+    @pytest.mark.parametrize("ingest_workers", [1, 2])
+    def test_run_writes_per_node_report(self, profiled_modules, tmp_path, ingest_workers):
+        dr = profiled_modules.build_pipeline(
+            settings, data_path=str(tmp_path), ingest_workers=ingest_workers, profile=True
+        )
+        dr.execute(final_vars=["slow_summary"], inputs={"n": 1000})
+
+        report = load_profile(tmp_path / PROFILE_REPORT_FILENAME)
+        nodes = {r["node"]: r for r in report["nodes"]}
+
+        assert report["success"] is True
+        assert set(nodes) == {"raw_rows", "macro", "slow_summary"}
+        assert report["nodes"][0]["node"] == "slow_summary"
+        assert nodes["slow_summary"]["wall_seconds"] >= 0.05
+        assert nodes["slow_summary"]["input_rows"] == 1003
+        assert nodes["slow_summary"]["output_rows"] == 2
+        assert nodes["raw_rows"]["input_rows"] is None
+        assert nodes["raw_rows"]["output_rows"] == 1000
+        assert nodes["raw_rows"]["output_bytes"] > 0
+        assert nodes["macro"]["output_rows"] == 3
+        assert nodes["raw_rows"]["peak_rss_delta_bytes"] >= 0
+
+    def test_profile_disabled_writes_no_report(self, profiled_modules, tmp_path):
+        dr = profiled_modules.build_pipeline(settings, data_path=str(tmp_path), profile=False)
+        dr.execute(final_vars=["slow_summary"], inputs={"n": 10})
+
+        assert not (tmp_path / PROFILE_REPORT_FILENAME).exists()
+
+
+class TestFormatTopNodes:
+    def test_lists_slowest_nodes_first_and_truncates(self):
+        report = {
+            "wall_seconds": 3.5,
+            "nodes": [
+                {
+                    "node": name,
+                    "wall_seconds": wall,
+                    "cpu_seconds": wall / 2,
+                    "peak_rss_delta_bytes": 2_000_000,
+                    "input_rows": None,
+                    "output_rows": 1234,
+                    "output_bytes": 5_000_000,
+                }
+                for name, wall in [("fast", 0.5), ("slowest", 2.0), ("middle", 1.0)]
+            ],
+        }
+
+        table = format_top_nodes(report, top_n=2).splitlines()
+
+        assert table[2].startswith("slowest")
+        assert table[3].startswith("middle")
+        assert not any(line.startswith("fast") for line in table)
+        assert "1,234" in table[2]
+        assert table[-1] == "3 nodes, run wall time 3.50s"
@@ -7,6 +7,7 @@ from hypothesis import strategies as st
 from pydantic import ValidationError
 
 from egg_n_bacon_housing.utils.geo import haversine_distance
+from egg_n_bacon_housing.utils.time_index import parse_periods
 
 pytestmark = pytest.mark.unit
 
@@ -172,3 +173,93 @@ class TestSchemaRoundTrip:
                 floor_area_sqm=90.0,
                 floor_area_sqft=969.0,
             )
+
+
+def _legacy_melt_quarter(p: str) -> pd.Timestamp | None:
+    """The per-label parser _melt_pivot_quarterly used before parse_periods."""
+    p = str(p)
+    if len(p) >= 5 and p[-1] == "Q":
+        try:
+            year, qtr = int(p[:-2]), int(p[-2])
+            return pd.Timestamp(year=year, month=qtr * 3, day=1) + pd.offsets.QuarterEnd(0)
+        except (ValueError, IndexError):
+            return None
+    if len(p) >= 6 and p[4] == "Q":
+        try:
+            year, qtr = int(p[:4]), int(p[5])
+            return pd.Timestamp(year=year, month=qtr * 3, day=1) + pd.offsets.QuarterEnd(0)
+        except (ValueError, IndexError):
+            return None
+    return None
+
+
+def _legacy_datagov_quarter(text: str) -> pd.Timestamp | None:
+    """The per-label parser _parse_datagov_quarter used before parse_periods."""
+    text = str(text).strip()
+
+    def _quarter_end(year: int, quarter: int) -> pd.Timestamp:
+        return pd.Timestamp(year=year, month=quarter * 3, day=1) + pd.offsets.QuarterEnd(0)
+
+    try:
+        if len(text) == 6 and text.endswith("Q"):
+            return _quarter_end(int(text[:4]), int(text[4]))
+        if len(text) == 6 and text[4] == "Q":
+            return _quarter_end(int(text[:4]), int(text[5]))
+    except (ValueError, IndexError):
+        return None
+    return None
+
+
+years = st.integers(min_value=1900, max_value=2199).map(str)
+quarter_digits = st.integers(min_value=0, max_value=9).map(str)
+month_names = st.sampled_from(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    + ["jan", "APR", "Sept", "Foo", "Q1", "1Q"]
+)
+period_labels = st.one_of(
+    st.builds(lambda y, q: f"{y}Q{q}", years, quarter_digits),
+    st.builds(lambda y, q: f"{y}{q}Q", years, quarter_digits),
+    st.builds(lambda y, m: f"{y}{m}", years, month_names),
+    st.text(alphabet="QAprJanx-/.", max_size=8),
+    st.integers(min_value=0, max_value=10**7).map(str),
+)
+
+
+def _timestamps(parsed: pd.Series) -> list:
+    return [None if pd.isna(v) else pd.Timestamp(v) for v in parsed]
+
+
+class TestPeriodParserMatchesLegacyParsers:
+    @given(labels=st.lists(period_labels, max_size=30))
+    @settings(max_examples=200)
+    def test_quarters_match_melt_parser(self, labels):
+        expected = [_legacy_melt_quarter(label) for label in labels]
+
+        assert _timestamps(parse_periods(pd.Series(labels, dtype=object), freq="Q")) == expected
+
+    @given(labels=st.lists(period_labels, max_size=30))
+    @settings(max_examples=200)
+    def test_quarters_match_datagov_parser(self, labels):
+        expected = [_legacy_datagov_quarter(f" {label} ") for label in labels]
+
+        parsed = parse_periods(pd.Series([f" {label} " for label in labels], dtype=object), "Q")
+
+        assert _timestamps(parsed) == expected
+
+    @given(labels=st.lists(period_labels, max_size=30))
+    @settings(max_examples=200)
+    def test_months_match_to_datetime(self, labels):
+        series = pd.Series(labels, dtype=object)
+        expected = pd.to_datetime(series, format="%Y%b", errors="coerce")
+
+        assert _timestamps(parse_periods(series, freq="M")) == _timestamps(expected)
+
+    @given(labels=st.lists(period_labels, max_size=30))
+    @settings(max_examples=100)
+    def test_unrestricted_parse_combines_quarters_and_months(self, labels):
+        series = pd.Series(labels, dtype=object)
+
+        combined = parse_periods(series)
+
+        expected = parse_periods(series, freq="Q").fillna(parse_periods(series, freq="M"))
+        assert _timestamps(combined) == _timestamps(expected)
@@ -3,10 +3,19 @@
 Re-homes behavioral assertions from the deleted mrt_distance.py.
 """
 
+import numpy as np
 import pandas as pd
 import pytest
+from sklearn.neighbors import BallTree
 
-from egg_n_bacon_housing.utils.proximity import compute_proximity_features
+from egg_n_bacon_housing.utils import cache
+from egg_n_bacon_housing.utils.geo import haversine_many
+from egg_n_bacon_housing.utils.proximity import (
+    ProximityIndex,
+    cached_proximity_index,
+    compute_proximity_features,
+    poi_fingerprint,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -117,3 +126,183 @@ class TestGenericAmenityProximity:
 
         assert pd.isna(result.iloc[0]["nearest_park"])
         assert pd.isna(result.iloc[0]["dist_to_nearest_park"])
+
+
+def _make_random_pois(rng, n, name_col="name"):
+    return pd.DataFrame(
+        {
+            name_col: [f"POI {i}" for i in range(n)],
+            "lat": rng.uniform(1.25, 1.45, n),
+            "lon": rng.uniform(103.65, 103.95, n),
+        }
+    )
+
+
+class TestProximityIndex:
+    def test_index_reused_across_frames_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        pois = {
+            "mrt_stations": _make_mrt_df(),
+            "hawkers": _make_random_pois(rng, 50),
+            "parks": _make_random_pois(rng, 80),
+        }
+        index = ProximityIndex.from_pois(**pois)
+        assert index.labels == ["mrt", "hawker", "park"]
+
+        for seed in (1, 2):
+            local = np.random.default_rng(seed)
+            props = pd.DataFrame(
+                {"lat": local.uniform(1.3, 1.4, 20), "lon": local.uniform(103.8, 103.9, 20)}
+            )
+            result = index.join(props)
+
+            for key, label, name_col in (
+                ("mrt_stations", "mrt", "nearest_mrt_station"),
+                ("hawkers", "hawker", "nearest_hawker"),
+                ("parks", "park", "nearest_park"),
+            ):
+                poi = pois[key]
+                matrix = haversine_many(
+                    props["lat"].to_numpy()[:, None],
+                    props["lon"].to_numpy()[:, None],
+                    poi["lat"].to_numpy()[None, :],
+                    poi["lon"].to_numpy()[None, :],
+                )
+                nearest = matrix.argmin(axis=1)
+                assert result[name_col].tolist() == poi["name"].to_numpy()[nearest].tolist()
+                np.testing.assert_allclose(
+                    result[f"dist_to_nearest_{label}"], matrix.min(axis=1), rtol=1e-9
+                )
+
+            pd.testing.assert_frame_equal(compute_proximity_features(props, index=index), result)
+
+    def test_query_returns_only_feature_block_aligned_to_input_index(self):
+        props = pd.DataFrame(
+            {"lat": [1.333, None, 1.351], "lon": [103.848, 103.8, 103.85], "id": [1, 2, 3]},
+            index=[10, 10, 30],
+        )
+        index = ProximityIndex.from_pois(
+            mrt_stations=_make_mrt_df(),
+            parks=pd.DataFrame([{"name": "Park", "lat": 1.34, "lon": 103.84}]),
+        )
+
+        block = index.query(props)
+
+        assert list(block.index) == [10, 10, 30]
+        assert "id" not in block.columns
+        assert block["nearest_mrt_station"].tolist() == ["TOA PAYOH", None, "BISHAN INTERCHANGE"]
+        assert block["nearest_mrt_score"].iloc[1] == 0.0
+        assert pd.isna(block["nearest_park"].iloc[1])
+        assert np.isnan(block["dist_to_nearest_park"].iloc[1])
+
+    def test_join_replaces_existing_proximity_columns(self):
+        props = pd.DataFrame([{"lat": 1.333, "lon": 103.848, "nearest_mrt_station": "STALE"}])
+        index = ProximityIndex.from_pois(mrt_stations=_make_mrt_df())
+
+        result = index.join(props)
+
+        assert list(result.columns).count("nearest_mrt_station") == 1
+        assert result.iloc[0]["nearest_mrt_station"] == "TOA PAYOH"
+
+    def test_unit_sphere_lookup_matches_haversine_balltree(self):
+        rng = np.random.default_rng(3)
+        pois = _make_random_pois(rng, 500)
+        props = _make_random_pois(rng, 2000)[["lat", "lon"]]
+
+        block = ProximityIndex.from_pois(bus_stops=pois).query(props)
+
+        tree = BallTree(np.radians(pois[["lat", "lon"]].to_numpy()), metric="haversine")
+        dist_rad, idx = tree.query(np.radians(props[["lat", "lon"]].to_numpy()), k=1)
+        np.testing.assert_allclose(
+            block["dist_to_nearest_bus_stop"], dist_rad[:, 0] * 6371000, atol=1e-6
+        )
+        assert (block["nearest_bus_stop"].to_numpy() == pois["name"].to_numpy()[idx[:, 0]]).all()
+
+
+class TestCachedProximityIndex:
+    @staticmethod
+    def _pois():
+        rng = np.random.default_rng(11)
+        return {
+            "mrt_stations": _make_mrt_df(),
+            "malls": _make_random_pois(rng, 30, name_col="shopping_mall"),
+            "bus_stops": _make_random_pois(rng, 200),
+        }
+
+    @staticmethod
+    def _props():
+        rng = np.random.default_rng(12)
+        props = _make_random_pois(rng, 100)[["lat", "lon"]]
+        props.loc[5, "lat"] = np.nan
+        return props
+
+    def test_warm_load_is_memory_mapped_and_matches_fresh_build(self, tmp_path, caplog):
+        pois = self._pois()
+        expected = ProximityIndex.from_pois(**pois).join(self._props())
+
+        with caplog.at_level("INFO", logger="egg_n_bacon_housing.utils.proximity"):
+            cold = cached_proximity_index(cache_dir=tmp_path, **pois)
+            warm = cached_proximity_index(cache_dir=tmp_path, **pois)
+
+        assert "cache miss" in caplog.text
+        assert "cache hit" in caplog.text
+        assert len(list((tmp_path / "proximity_index").iterdir())) == 1
+        assert isinstance(warm.layers["bus_stop"].lat, np.memmap)
+        # Trees are rebuilt over the memory-mapped points, not unpickled.
+        assert isinstance(warm.layers["bus_stop"].tree.data.base, np.memmap)
+        (entry,) = (tmp_path / "proximity_index").iterdir()
+        assert sorted(p.name for p in entry.glob("*.points.npy")) == [
+            "bus_stop.points.npy",
+            "mall.points.npy",
+            "mrt.points.npy",
+        ]
+        pd.testing.assert_frame_equal(cold.join(self._props()), expected)
+        pd.testing.assert_frame_equal(warm.join(self._props()), expected)
+
+    def test_missing_poi_names_survive_warm_load(self, tmp_path):
+        pois = self._pois()
+        pois["bus_stops"].loc[:, "name"] = np.nan
+        expected = ProximityIndex.from_pois(**pois).join(self._props())
+
+        cached_proximity_index(cache_dir=tmp_path, **pois)
+        warm = cached_proximity_index(cache_dir=tmp_path, **pois)
+
+        result = warm.join(self._props())
+        assert result["nearest_bus_stop"].isna().all()
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_changed_poi_content_gets_new_cache_entry(self, tmp_path):
+        pois = self._pois()
+        cached_proximity_index(cache_dir=tmp_path, **pois)
+
+        moved = pois["bus_stops"].copy()
+        moved.loc[0, "lat"] += 0.001
+        assert poi_fingerprint(**pois) != poi_fingerprint(**{**pois, "bus_stops": moved})
+        cached_proximity_index(cache_dir=tmp_path, **{**pois, "bus_stops": moved})
+
+        assert len(list((tmp_path / "proximity_index").iterdir())) == 2
+
+    def test_incompatible_cache_entry_is_rebuilt(self, tmp_path):
+        pois = self._pois()
+        cached_proximity_index(cache_dir=tmp_path, **pois)
+        (entry,) = (tmp_path / "proximity_index").iterdir()
+        (entry / "manifest.json").write_text('{"format": 0}', encoding="utf-8")
+
+        index = cached_proximity_index(cache_dir=tmp_path, **pois)
+
+        assert index.labels == ["mrt", "mall", "bus_stop"]
+        assert '"format": 3' in (entry / "manifest.json").read_text(encoding="utf-8")
+
+    def test_uses_configured_cache_manager_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache, "_cache_manager", cache.CacheManager(tmp_path / "cache"))
+
+        cached_proximity_index(**self._pois())
+
+        assert (tmp_path / "cache" / "proximity_index").is_dir()
+
+    def test_builds_in_memory_when_cache_not_configured(self, monkeypatch):
+        monkeypatch.setattr(cache, "_cache_manager", None)
+
+        index = cached_proximity_index(**self._pois())
+
+        assert not isinstance(index.layers["bus_stop"].lat, np.memmap)
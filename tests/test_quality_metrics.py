@@ -0,0 +1,93 @@
+"""Tests for data quality metrics engines (utils/quality_metrics.py)."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from egg_n_bacon_housing.utils.quality_metrics import (
+    ArrowMetricsEngine,
+    PandasMetricsEngine,
+    hll_estimate,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _frame(n: int, duplicates: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "town": np.array(["BEDOK", "TAMPINES", None], dtype=object)[rng.integers(0, 3, n)],
+            "price": rng.uniform(1e5, 1e6, n),
+            "storeys": rng.integers(1, 40, n),
+            "month": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, n), "D"),
+        }
+    )
+    df.loc[df.index[::7], "price"] = np.nan
+    if duplicates:
+        df = pd.concat([df, df.head(duplicates)], ignore_index=True)
+    return df
+
+
+class TestExactMetrics:
+    def test_arrow_matches_pandas_below_threshold(self):
+        table = pa.Table.from_pandas(_frame(2_000, duplicates=5), preserve_index=False)
+
+        arrow = ArrowMetricsEngine().compute(table)
+        exact = PandasMetricsEngine().compute(table)
+
+        assert not arrow.duplicates_estimated
+        assert (arrow.rows, arrow.null_count, arrow.duplicate_count) == (
+            exact.rows,
+            exact.null_count,
+            exact.duplicate_count,
+        )
+        assert [c.distinct_count for c in arrow.columns] == [
+            c.distinct_count for c in exact.columns
+        ]
+        assert arrow.duplicate_count == 5
+
+    def test_min_max_per_column(self):
+        df = pd.DataFrame(
+            {"price": [3.0, None, 1.0], "town": ["b", "a", None], "ok": [True, False, True]}
+        )
+
+        columns = {
+            c.name: c for c in ArrowMetricsEngine().compute(pa.Table.from_pandas(df)).columns
+        }
+
+        assert (columns["price"].min_value, columns["price"].max_value) == (1.0, 3.0)
+        assert (columns["town"].min_value, columns["town"].max_value) == ("a", "b")
+        assert columns["ok"].min_value is None
+        assert columns["price"].null_count == 1
+
+    def test_pandas_engine_accepts_unconvertible_frames(self):
+        df = pd.DataFrame({"mixed": pd.Series([1, "a", 1], dtype=object)})
+
+        metrics = PandasMetricsEngine().compute_frame(df)
+
+        assert (metrics.rows, metrics.duplicate_count, metrics.null_percentage) == (3, 1, 0.0)
+
+
+class TestSketchedMetrics:
+    def test_sketches_above_threshold(self):
+        df = _frame(20_000, duplicates=50)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        metrics = ArrowMetricsEngine(exact_max_rows=1_000).compute(table)
+        columns = {c.name: c for c in metrics.columns}
+
+        assert metrics.duplicates_estimated
+        assert metrics.duplicate_count == int(df.duplicated().sum())
+        assert metrics.null_count == int(df.isnull().sum().sum())
+        assert columns["town"].distinct_count == 2
+        assert columns["price"].distinct_count == pytest.approx(df["price"].nunique(), rel=0.03)
+        assert columns["month"].min_value.startswith(str(df["month"].min().date()))
+
+    def test_hll_estimate_accuracy(self):
+        hashes = pd.util.hash_array(np.arange(200_000, dtype=np.int64))
+
+        assert hll_estimate(hashes) == pytest.approx(200_000, rel=0.03)
+        assert hll_estimate(hashes[:100]) == pytest.approx(100, abs=2)
+        assert hll_estimate(np.array([], dtype=np.uint64)) == 0
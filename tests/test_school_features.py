@@ -1,10 +1,12 @@
-"""Tests for utils/school_features.py and utils/geo.py (haversine)."""
+"""Tests for utils/school_features.py and utils/geo.py (haversine kernels)."""
 
+import numpy as np
 import pandas as pd
 import pytest
+from sklearn.metrics.pairwise import haversine_distances
 
 from egg_n_bacon_housing.utils import school_features
-from egg_n_bacon_housing.utils.geo import haversine_distance
+from egg_n_bacon_housing.utils.geo import EARTH_RADIUS_M, haversine_distance, haversine_many
 
 pytestmark = pytest.mark.unit
 
@@ -30,6 +32,58 @@ class TestHaversineDistance:
         assert dist == pytest.approx(29900.0, rel=0.05)
 
 
+def _reference_matrix(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Pairwise distances (metres) from scikit-learn's independent haversine."""
+    first = np.radians(np.column_stack([np.atleast_1d(lat1), np.atleast_1d(lon1)]))
+    second = np.radians(np.column_stack([np.atleast_1d(lat2), np.atleast_1d(lon2)]))
+    return haversine_distances(first, second) * EARTH_RADIUS_M
+
+
+class TestHaversineMany:
+    def test_matches_reference_elementwise(self):
+        rng = np.random.default_rng(0)
+        lat1, lat2 = rng.uniform(1.2, 1.5, (2, 500))
+        lon1, lon2 = rng.uniform(103.6, 104.0, (2, 500))
+
+        result = haversine_many(lat1, lon1, lat2, lon2)
+
+        assert result.dtype == np.float64
+        np.testing.assert_allclose(
+            result, np.diag(_reference_matrix(lat1, lon1, lat2, lon2)), rtol=1e-9
+        )
+
+    def test_pairwise_matrix_via_broadcasting(self):
+        lat1 = np.array([1.30, 1.35, 1.40])
+        lon1 = np.array([103.80, 103.85, 103.90])
+        lat2 = np.array([1.28, 1.44])
+        lon2 = np.array([103.86, 103.78])
+
+        matrix = haversine_many(lat1[:, None], lon1[:, None], lat2[None, :], lon2[None, :])
+
+        assert matrix.shape == (3, 2)
+        np.testing.assert_allclose(matrix, _reference_matrix(lat1, lon1, lat2, lon2), rtol=1e-9)
+
+    def test_scalar_against_array(self):
+        result = haversine_many(1.3521, 103.8198, [1.3521, 1.2816], [103.8198, 103.8636])
+        expected = _reference_matrix(1.3521, 103.8198, [1.3521, 1.2816], [103.8198, 103.8636])
+        assert result[0] == pytest.approx(0.0, abs=1e-6)
+        np.testing.assert_allclose(result, expected[0], rtol=1e-9, atol=1e-6)
+
+    def test_scalar_kernel_matches_reference(self):
+        dist = haversine_distance(1.2816, 103.8636, 1.2494, 103.8303)
+        assert dist == pytest.approx(
+            _reference_matrix(1.2816, 103.8636, 1.2494, 103.8303)[0, 0], rel=1e-9
+        )
+
+    def test_nan_coordinates_propagate(self):
+        result = haversine_many([1.3, np.nan], [103.8, 103.8], [1.31, 1.31], [103.8, 103.8])
+        assert np.isfinite(result[0])
+        assert np.isnan(result[1])
+
+    def test_antipodal_is_finite(self):
+        assert haversine_many(0.0, 0.0, 0.0, 180.0) == pytest.approx(20015115.0, rel=0.01)
+
+
 class TestCalculateAccessibilityScore:
     def test_zero_distance_returns_quality_normalized(self):
         score = school_features.calculate_accessibility_score(0, 8.0)
@@ -255,3 +309,118 @@ class TestCalculateSchoolFeatures:
         props = pd.DataFrame([{"lat": 1.3501, "lon": 103.8201}])
         result = school_features.calculate_school_features(props, schools)
         assert result["nearest_schoolPRIMARY_dist"].iloc[0] < 100
+
+
+def _make_synthetic_schools(n_per_level: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for level in school_features.SCHOOL_LEVELS:
+        for i in range(n_per_level):
+            rows.append(
+                {
+                    "school_name": f"{level.split()[0]} SCHOOL {i}",
+                    "latitude": rng.uniform(1.25, 1.45),
+                    "longitude": rng.uniform(103.65, 104.0),
+                    "mainlevel_code": level,
+                    "type_code": rng.choice(["GOV", "GOV-AIDED"]),
+                    "dgp_code": rng.choice(["NORTH", "EAST", "WEST"]),
+                    "zone_code": rng.choice(["Z1", "Z2"]),
+                    "nature_code": "CO-ED",
+                    "mrt_desc": f"MRT {i}",
+                    "sap_ind": ("Yes", "No", None)[rng.integers(3)],
+                    "autonomous_ind": rng.choice(["Yes", "No"]),
+                    "gifted_ind": ("Yes", "No", None)[rng.integers(3)],
+                    "ip_ind": rng.choice(["Yes", "No"]),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def _make_synthetic_tiers(n_per_level: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    primary = pd.DataFrame(
+        {
+            "school_name": [f"PRIMARY SCHOOL {i}" for i in range(0, n_per_level, 2)],
+            "gep": "Yes",
+            "sap": "No",
+            "tier": 1,
+            "popularity_p2b": "High",
+        }
+    )
+    secondary = pd.DataFrame(
+        {
+            "school_name": [f"SECONDARY SCHOOL {i}" for i in range(0, n_per_level, 3)],
+            "ip": "Yes",
+            "sap": "Yes",
+            "autonomous": "No",
+            "tier": 2,
+            "ip_cutoff_2026": "6-8",
+        }
+    )
+    return primary, secondary
+
+
+def _make_synthetic_properties(n_locations: int, repeats: int = 3, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(1.27, 1.43, n_locations)
+    lon = rng.uniform(103.68, 103.98, n_locations)
+    props = pd.DataFrame({"lat": np.repeat(lat, repeats), "lon": np.repeat(lon, repeats)})
+    props["id"] = np.arange(len(props))
+    props.loc[props.index[::50], ["lat", "lon"]] = np.nan
+    return props.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def _assert_same_school_features(batched: pd.DataFrame, loop: pd.DataFrame) -> None:
+    """Batched output is float-typed where the reference loop leaves object columns."""
+    assert list(batched.columns) == list(loop.columns)
+    dist_cols = [c for c in loop.columns if c.startswith("nearest_school") and c.endswith("_dist")]
+    loop = loop.assign(**{c: pd.to_numeric(loop[c]) for c in dist_cols})
+    pd.testing.assert_frame_equal(batched, loop, check_dtype=False, rtol=1e-9)
+
+
+class TestBatchedSchoolFeatures:
+    @pytest.fixture(autouse=True)
+    def _tiers(self, monkeypatch):
+        tiers = _make_synthetic_tiers(40)
+        monkeypatch.setattr(school_features, "load_school_tiers", lambda: tiers)
+
+    def test_vectorized_accessibility_matches_scalar(self):
+        distances = np.array([0.0, -5.0, 150.0, 999.0, 2000.0, 3500.0])
+        qualities = np.array([8.0, 3.0, 10.0, 0.0, 5.0, 9.0])
+        expected = [
+            school_features.calculate_accessibility_score(d, q)
+            for d, q in zip(distances, qualities, strict=True)
+        ]
+        result = school_features.calculate_accessibility_scores(distances, qualities)
+        np.testing.assert_allclose(result, expected)
+
+    def test_batched_matches_reference_loop(self):
+        schools = _make_synthetic_schools(40)
+        props = _make_synthetic_properties(300)
+
+        batched = school_features.calculate_school_features(props, schools)
+        loop = school_features.calculate_school_features(props, schools, batched=False)
+
+        _assert_same_school_features(batched, loop)
+        assert (batched["schoolPRIMARY_count2km"] > 0).any()
+        assert (batched["school_primary_quality_score"] > 0).any()
+
+    def test_batched_handles_properties_without_coordinates(self):
+        schools = _make_synthetic_schools(5)
+        props = pd.DataFrame({"lat": [np.nan, 1.35], "lon": [np.nan, 103.82]})
+
+        result = school_features.calculate_school_features(props, schools)
+
+        assert result.loc[0, "school_within_2km"] == 0
+        assert result.loc[0, "school_accessibility_score"] == 0.0
+        assert pd.isna(result.loc[0, "nearest_schoolPRIMARY_name"])
+        assert result.loc[1, "nearest_schoolPRIMARY_dist"] > 0
+
+    @pytest.mark.slow
+    def test_batched_matches_reference_loop_at_scale(self):
+        schools = _make_synthetic_schools(150)
+        props = _make_synthetic_properties(1500, repeats=2)
+
+        batched = school_features.calculate_school_features(props, schools)
+        loop = school_features.calculate_school_features(props, schools, batched=False)
+
+        _assert_same_school_features(batched, loop)
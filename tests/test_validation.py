@@ -0,0 +1,231 @@
+"""Tests for the columnar schema validator (utils/validation.py)."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Annotated, Literal
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import BaseModel, Field, field_validator
+
+from egg_n_bacon_housing.schemas.clean_models import HCleanHDBTransaction, HCleanTransactionBase
+from egg_n_bacon_housing.utils import validation
+from egg_n_bacon_housing.utils.validation import (
+    REJECTION_REASON_COLUMN,
+    _validate_rows,
+    columnar_validate,
+    compile_field_checks,
+    validate_schema,
+    validation_plan,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class Tenure(Enum):
+    FREEHOLD = "freehold"
+    LEASEHOLD = "leasehold"
+
+
+class Listing(BaseModel):
+    storeys: int
+    price: Annotated[float, Field(gt=0, le=10)] | None = None
+    name: str
+    sold_at: datetime | None = None
+    kind: Literal["hdb", "condo"] | None = None
+    tenure: Tenure | None = None
+    code: Annotated[str, Field(max_length=3)] | None = None
+
+
+def _mixed_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "storeys": pd.Series([1, 2.0, "3", 1.5, "x", True, None, 4], dtype=object),
+            "price": pd.Series([1.0, -1.0, "2", 11.0, None, float("inf"), 3, 5], dtype=object),
+            "name": pd.Series(["a", 1, "b", "c", "d", "e", "f", None], dtype=object),
+            "sold_at": pd.Series(
+                ["2024-01-15", "2024-01", datetime(2024, 1, 1), None, 1_700_000_000, "x", 0, 1],
+                dtype=object,
+            ),
+            "kind": ["hdb", "condo", "ec", None, "hdb", "hdb", "condo", "hdb"],
+            "tenure": ["freehold", "leasehold", "99 years", None, None, None, None, None],
+            "code": ["abc", "abcd", None, None, None, None, None, None],
+        }
+    )
+
+
+class TestCompileFieldChecks:
+    def test_unwraps_optional_annotated_constraints(self):
+        checks = {c.name: c for c in compile_field_checks(HCleanHDBTransaction)}
+
+        assert (checks["price"].kind, checks["price"].bounds) == ("float", (("gt", 0),))
+        assert checks["lat"].nullable and checks["lat"].bounds == (("ge", -90), ("le", 90))
+        assert checks["transaction_date"].kind == "datetime"
+        assert checks["remaining_lease_months"].kind == "int"
+        assert checks["town"].required and not checks["town"].nullable
+
+    def test_choices_and_unsupported_constraints(self):
+        checks = {c.name: c for c in compile_field_checks(Listing)}
+
+        assert checks["kind"].choices == ("hdb", "condo")
+        assert checks["tenure"].choices == ("freehold", "leasehold")
+        assert checks["code"].kind == "other"
+
+
+class TestValidationPlan:
+    def test_plan_is_built_once_per_model(self):
+        plan = validation_plan(HCleanHDBTransaction)
+
+        assert validation_plan(HCleanHDBTransaction) is plan
+        assert plan.rows_adapter is plan.rows_adapter
+        assert "transaction_date" in plan.required and "lat" not in plan.required
+        assert not plan.row_validation
+
+    def test_null_masks_cover_present_fields_only(self):
+        df = pd.DataFrame({"name": ["a", None], "price": [1.0, None], "extra": [None, None]})
+
+        masks = validation_plan(Listing).null_masks(df)
+
+        assert set(masks) == {"name", "price"}
+        assert masks["name"].tolist() == [False, True]
+
+
+class TestColumnarValidate:
+    def test_matches_row_by_row_pydantic(self):
+        df = _mixed_frame()
+
+        valid, reasons = columnar_validate(df, Listing)
+        expected, _ = _validate_rows(df, Listing)
+
+        assert valid.tolist() == expected.tolist()
+        assert list(reasons.index) == list(df.index[~valid])
+
+    def test_reasons_name_every_failing_field(self):
+        df = pd.DataFrame({"storeys": [1, 2], "price": [-1.0, 2.0], "name": [5, "ok"]})
+
+        valid, reasons = columnar_validate(df, Listing)
+
+        assert valid.tolist() == [False, True]
+        assert reasons.loc[0] == (
+            "price: Input should be greater than 0 [input_value=-1.0]; "
+            "name: Input should be a valid string [input_value=5]"
+        )
+
+    def test_missing_required_column_rejects_every_row(self):
+        valid, reasons = columnar_validate(pd.DataFrame({"storeys": [1, 2]}), Listing)
+
+        assert not valid.any()
+        assert (reasons == "name: Field required").all()
+
+
+class TestValidateSchema:
+    def test_split_preserves_columns_and_index(self):
+        df = pd.DataFrame(
+            {"storeys": [1, 2, 3], "name": ["a", "b", "c"], "price": [1.0, 0.0, 2.0], "x": 7},
+            index=[10, 11, 12],
+        )
+
+        valid_df, quarantine_df = validate_schema(df, Listing, "listing")
+
+        assert valid_df.index.tolist() == [10, 12]
+        assert "x" in valid_df.columns
+        assert quarantine_df["price"].tolist() == [0.0]
+        assert quarantine_df[REJECTION_REASON_COLUMN].str.startswith("price:").all()
+
+    def test_custom_validators_use_row_validation(self):
+        class Upper(BaseModel):
+            name: str
+
+            @field_validator("name")
+            @classmethod
+            def _upper(cls, value: str) -> str:
+                if value != value.upper():
+                    raise ValueError("must be upper case")
+                return value
+
+        valid_df, quarantine_df = validate_schema(
+            pd.DataFrame({"name": ["A", "b"]}), Upper, "upper"
+        )
+
+        assert valid_df["name"].tolist() == ["A"]
+        assert "must be upper case" in quarantine_df[REJECTION_REASON_COLUMN].iloc[0]
+
+    def test_full_hdb_frame_is_vectorized(self):
+        n = 200_000
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "transaction_date": pd.Timestamp("2020-01-01"),
+                "price": rng.uniform(-1, 1e6, n),
+                "property_type": "hdb",
+                "town": "BEDOK",
+                "flat_type": "4 ROOM",
+                "block": "1",
+                "street_name": "BEDOK NTH AVE 1",
+                "floor_area_sqm": 90.0,
+                "floor_area_sqft": 968.0,
+                "remaining_lease_months": rng.integers(0, 1000, n),
+            }
+        )
+
+        valid_df, quarantine_df = validate_schema(df, HCleanHDBTransaction, "hdb")
+
+        assert len(valid_df) == int((df["price"] > 0).sum())
+        assert len(valid_df) + len(quarantine_df) == n
+
+
+class TestParallelValidation:
+    @pytest.fixture
+    def parallel(self, monkeypatch):
+        monkeypatch.setattr(validation, "PARALLEL_MIN_ROWS", 1)
+        monkeypatch.setattr(validation.os, "cpu_count", lambda: 4)
+
+    def _transactions(self) -> pd.DataFrame:
+        n = 40
+        return pd.DataFrame(
+            {
+                "transaction_date": pd.date_range("2020-01-01", periods=n),
+                "price": [float(i % 7 - 1) for i in range(n)],
+                "lat": [95.0 if i % 11 == 0 else 1.3 for i in range(n)],
+                "property_type": ["hdb"] * n,
+                "extra": range(n),
+            },
+            index=range(100, 100 + n),
+        )
+
+    @pytest.mark.slow
+    def test_process_pool_matches_in_process_split(self, parallel):
+        df = self._transactions()
+
+        serial_valid, serial_quarantine = validate_schema(df, HCleanTransactionBase, "tx")
+        valid_df, quarantine_df = validate_schema(df, HCleanTransactionBase, "tx", workers=2)
+
+        pd.testing.assert_frame_equal(valid_df, serial_valid)
+        pd.testing.assert_frame_equal(quarantine_df, serial_quarantine)
+        assert "extra" in valid_df.columns
+
+    def test_unpicklable_model_validates_in_process(self, parallel, monkeypatch):
+        class Local(BaseModel):
+            price: Annotated[float, Field(gt=0)]
+
+        def _no_pool(*args, **kwargs):
+            raise AssertionError("process pool should not start")
+
+        monkeypatch.setattr(validation, "ProcessPoolExecutor", _no_pool)
+
+        valid_df, quarantine_df = validate_schema(
+            pd.DataFrame({"price": [1.0, -1.0]}), Local, "local", workers=2
+        )
+
+        assert valid_df["price"].tolist() == [1.0]
+        assert len(quarantine_df) == 1
+
+    def test_workers_capped_by_cpu_count(self, monkeypatch):
+        monkeypatch.setattr(validation, "PARALLEL_MIN_ROWS", 1)
+        monkeypatch.setattr(validation.os, "cpu_count", lambda: 1)
+        monkeypatch.setattr(validation, "_validate_parallel", pytest.fail)
+
+        valid_df, _ = validate_schema(self._transactions(), HCleanTransactionBase, "tx", workers=8)
+
+        assert not valid_df.empty
@@ -6,6 +6,13 @@ import pandas as pd
 import pytest
 
 from egg_n_bacon_housing.schemas.feature_models import HFeatureTransaction, Town360
+from egg_n_bacon_housing.utils import validation_gateway
+from egg_n_bacon_housing.utils.partitioned_parquet import (
+    drop_partitions,
+    list_partitions,
+    read_partitions,
+    write_partitions,
+)
 from egg_n_bacon_housing.utils.validation_gateway import (
     validate_and_quarantine,
     vectorized_precheck,
@@ -99,6 +106,15 @@ class TestVectorizedPrecheck:
         assert "gt 0" in issue_text
         assert "lat" in issue_text
 
+    def test_detects_bounds_on_optional_annotated_fields(self):
+        """Bounds nested in Optional[Annotated[...]] come from the validation plan."""
+        df = pd.DataFrame({"psf": [500.0, -1.0, None], "remaining_lease_years": [1.0, 2.0, -3.0]})
+        issues = vectorized_precheck(df, HFeatureTransaction, "test")
+        assert issues == [
+            "  psf: 1 values violate gt 0",
+            "  remaining_lease_years: 1 values violate ge 0",
+        ]
+
     def test_clean_data_no_issues(self):
         """Clean data produces no issues."""
         df = pd.DataFrame({"town": ["A", "B", "C"], "annual_value_3_room": [100.0, 200.0, 300.0]})
@@ -131,3 +147,62 @@ class TestVectorizedPrecheck:
         assert len(result) == 15_000
         assert any("pre-check" in r.message.lower() for r in caplog.records)
         assert any("annual_value_3_room" in r.message for r in caplog.records)
+
+
+class TestPartitionedOutput:
+    """validate_and_quarantine with partition_col writes a hive-partitioned dataset."""
+
+    def test_writes_and_replaces_only_written_partitions(self, tmp_path):
+        df = pd.DataFrame({"town": ["A", "B", "C"], "month": ["2024-01", "2024-01", "2024-02"]})
+
+        validate_and_quarantine(
+            df, Town360, "towns", layer_dir=tmp_path, filename="towns", partition_col="month"
+        )
+        validate_and_quarantine(
+            df.iloc[:1],
+            Town360,
+            "towns",
+            layer_dir=tmp_path,
+            filename="towns",
+            partition_col="month",
+        )
+
+        dataset = tmp_path / "towns"
+        assert list_partitions(dataset, "month") == ["2024-01", "2024-02"]
+        result = read_partitions(dataset, "month").sort_values("town")
+        assert result["town"].tolist() == ["A", "C"]
+
+    def test_partition_values_are_path_safe(self, tmp_path):
+        df = pd.DataFrame({"x": [1, 2], "key": ["a/b", "c d"]})
+
+        write_partitions(df, tmp_path, "key")
+        drop_partitions(tmp_path, "key", ["c d"])
+
+        assert list_partitions(tmp_path, "key") == ["a/b"]
+        assert read_partitions(tmp_path, "key")["x"].tolist() == [1]
+
+
+class TestValidationWorkers:
+    def test_configured_workers_reach_validate_schema(self, tmp_path, monkeypatch):
+        seen = []
+
+        def _validate(df, model_cls, entity_name, workers=1):
+            seen.append(workers)
+            return df, pd.DataFrame()
+
+        monkeypatch.setattr(validation_gateway, "validate_schema", _validate)
+        validation_gateway.configure(validation_workers=3)
+        try:
+            df = pd.DataFrame({"town": ["A"]})
+            validate_and_quarantine(df, Town360, "t", layer_dir=tmp_path, filename="t.parquet")
+            validate_and_quarantine(
+                df, Town360, "t", layer_dir=tmp_path, filename="t.parquet", workers=2
+            )
+        finally:
+            validation_gateway.configure()
+
+        assert seen == [3, 2]
+
+    def test_rejects_non_positive_workers(self):
+        with pytest.raises(ValueError, match="validation_workers"):
+            validation_gateway.configure(validation_workers=0)